@@ -28,6 +28,7 @@ Sk.Debugger = function(filename, output_callback) {
     this.output_callback = output_callback;
     this.step_mode = false;
     this.filename = filename;
+    this.update_breakpoint_files();
 };
 
 Sk.Debugger.prototype.print = function(txt) {
@@ -54,10 +55,31 @@ Sk.Debugger.prototype.move_down_the_stack = function() {
 
 Sk.Debugger.prototype.enable_step_mode = function() {
     this.step_mode = true;
+    this.update_breakpoint_files();
 };
 
 Sk.Debugger.prototype.disable_step_mode = function() {
     this.step_mode = false;
+    this.update_breakpoint_files();
+};
+
+// Only the compiled breakpoint checks in files with an enabled breakpoint
+// need to call check_breakpoints(), unless we are stepping through every
+// line.  See Sk.misceval.setBreakpointFiles().
+Sk.Debugger.prototype.update_breakpoint_files = function() {
+    if (this.step_mode === true) {
+        Sk.misceval.setBreakpointFiles(null);
+        return;
+    }
+
+    var filenames = [];
+    for (var key in this.dbg_breakpoints) {
+        if (hasOwnProperty(this.dbg_breakpoints, key) &&
+            this.dbg_breakpoints[key].enabled === true) {
+            filenames.push(this.dbg_breakpoints[key].filename);
+        }
+    }
+    Sk.misceval.setBreakpointFiles(filenames);
 };
 
 Sk.Debugger.prototype.get_suspension_stack = function() {
@@ -91,6 +113,7 @@ Sk.Debugger.prototype.check_breakpoints = function(filename, lineno, colno, glob
         if (hasOwnProperty(this.tmp_breakpoints, key)) {
             delete this.dbg_breakpoints[key];
             delete this.tmp_breakpoints[key];
+            this.update_breakpoint_files();
             return true;
         }
         
@@ -116,6 +139,7 @@ Sk.Debugger.prototype.disable_breakpoint = function(filename, lineno, colno) {
     
     if (hasOwnProperty(this.dbg_breakpoints, key)) {
         this.dbg_breakpoints[key].enabled = false;
+        this.update_breakpoint_files();
     }
 };
 
@@ -124,6 +148,7 @@ Sk.Debugger.prototype.enable_breakpoint = function(filename, lineno, colno) {
     
     if (hasOwnProperty(this.dbg_breakpoints, key)) {
         this.dbg_breakpoints[key].enabled = true;
+        this.update_breakpoint_files();
     }
 };
 
@@ -131,6 +156,7 @@ Sk.Debugger.prototype.clear_breakpoint = function(filename, lineno, colno) {
     var key = this.generate_breakpoint_key(filename, lineno, colno);
     if (hasOwnProperty(this.dbg_breakpoints, key)) {
         delete this.dbg_breakpoints[key];
+        this.update_breakpoint_files();
         return null;
     } else {
         return "Invalid breakpoint specified: " + filename + " line: " + lineno;
@@ -140,6 +166,7 @@ Sk.Debugger.prototype.clear_breakpoint = function(filename, lineno, colno) {
 Sk.Debugger.prototype.clear_all_breakpoints = function() {
     this.dbg_breakpoints = {};
     this.tmp_breakpoints = {};
+    this.update_breakpoint_files();
 };
 
 Sk.Debugger.prototype.set_ignore_count = function(filename, lineno, colno, count) {
@@ -162,6 +189,7 @@ Sk.Debugger.prototype.set_condition = function(filename, lineno, colno, lhs, con
     
     bp.condition = new Sk.Condition(lhs, cond, rhs);
     this.dbg_breakpoints[key] = bp;
+    this.update_breakpoint_files();
 };
 
 Sk.Debugger.prototype.print_suspension_info = function(suspension) {
@@ -205,6 +233,7 @@ Sk.Debugger.prototype.add_breakpoint = function(filename, lineno, colno, tempora
     if (temporary) {
         this.tmp_breakpoints[key] = true;
     }
+    this.update_breakpoint_files();
 };
 
 Sk.Debugger.prototype.suspension_handler = function(susp) {
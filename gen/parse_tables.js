@@ -228,1581 +228,220 @@ number2symbol:
  341: 'yield_arg',
  342: 'yield_expr',
  343: 'yield_stmt'},
-dfas:
-{256: [[[[1, 1], [2, 1], [3, 2]], [[0, 1]], [[2, 1]]],
-       {2: 1,
-        4: 1,
-        5: 1,
-        6: 1,
-        7: 1,
-        8: 1,
-        9: 1,
-        10: 1,
-        11: 1,
-        12: 1,
-        13: 1,
-        14: 1,
-        15: 1,
-        16: 1,
-        17: 1,
-        18: 1,
-        19: 1,
-        20: 1,
-        21: 1,
-        22: 1,
-        23: 1,
-        24: 1,
-        25: 1,
-        26: 1,
-        27: 1,
-        28: 1,
-        29: 1,
-        30: 1,
-        31: 1,
-        32: 1,
-        33: 1,
-        34: 1,
-        35: 1,
-        36: 1,
-        37: 1,
-        38: 1,
-        39: 1,
-        40: 1,
-        41: 1,
-        42: 1,
-        43: 1}],
- 257: [[[[44, 1]], [[45, 0], [0, 1]]],
-       {6: 1,
-        7: 1,
-        9: 1,
-        11: 1,
-        12: 1,
-        19: 1,
-        22: 1,
-        25: 1,
-        29: 1,
-        30: 1,
-        33: 1,
-        35: 1,
-        38: 1,
-        43: 1}],
- 258: [[[[46, 1]], [[47, 0], [0, 1]]],
-       {6: 1,
-        7: 1,
-        8: 1,
-        9: 1,
-        11: 1,
-        12: 1,
-        19: 1,
-        22: 1,
-        25: 1,
-        29: 1,
-        30: 1,
-        33: 1,
-        35: 1,
-        38: 1,
-        43: 1}],
- 259: [[[[48, 1]], [[49, 2]], [[50, 3], [0, 2]], [[49, 4]], [[0, 4]]],
-       {48: 1}],
- 260: [[[[51, 1]], [[52, 2], [0, 1]], [[51, 1], [0, 2]]],
-       {6: 1,
-        7: 1,
-        8: 1,
-        9: 1,
-        11: 1,
-        12: 1,
-        14: 1,
-        15: 1,
-        19: 1,
-        22: 1,
-        25: 1,
-        29: 1,
-        30: 1,
-        33: 1,
-        35: 1,
-        38: 1,
-        43: 1,
-        53: 1}],
- 261: [[[[49, 1], [15, 2], [53, 2]],
-        [[50, 2], [54, 3], [0, 1]],
-        [[49, 3]],
-        [[0, 3]]],
-       {6: 1,
-        7: 1,
-        8: 1,
-        9: 1,
-        11: 1,
-        12: 1,
-        14: 1,
-        15: 1,
-        19: 1,
-        22: 1,
-        25: 1,
-        29: 1,
-        30: 1,
-        33: 1,
-        35: 1,
-        38: 1,
-        43: 1,
-        53: 1}],
- 262: [[[[55, 1]], [[30, 0], [43, 0], [0, 1]]],
-       {6: 1,
-        7: 1,
-        9: 1,
-        11: 1,
-        12: 1,
-        19: 1,
-        22: 1,
-        25: 1,
-        29: 1,
-        30: 1,
-        33: 1,
-        35: 1,
-        38: 1,
-        43: 1}],
- 263: [[[[24, 1]], [[49, 2]], [[52, 3], [0, 2]], [[49, 4]], [[0, 4]]],
-       {24: 1}],
- 264: [[[[10, 1]], [[56, 2]], [[0, 2]]], {10: 1}],
- 265: [[[[10, 1]], [[57, 2], [56, 2], [58, 2]], [[0, 2]]], {10: 1}],
- 266: [[[[6, 1],
-         [25, 1],
-         [33, 1],
-         [9, 1],
-         [11, 1],
-         [12, 2],
-         [35, 3],
-         [38, 4],
-         [19, 1],
-         [7, 5]],
-        [[0, 1]],
-        [[59, 1], [60, 6]],
-        [[61, 1], [62, 7], [63, 7]],
-        [[64, 1], [63, 8]],
-        [[7, 5], [0, 5]],
-        [[59, 1]],
-        [[61, 1]],
-        [[64, 1]]],
-       {6: 1, 7: 1, 9: 1, 11: 1, 12: 1, 19: 1, 25: 1, 33: 1, 35: 1, 38: 1}],
- 267: [[[[29, 1], [65, 2]], [[65, 2]], [[66, 2], [0, 2]]],
-       {6: 1,
-        7: 1,
-        9: 1,
-        11: 1,
-        12: 1,
-        19: 1,
-        25: 1,
-        29: 1,
-        33: 1,
-        35: 1,
-        38: 1}],
- 268: [[[[67, 1],
-         [68, 1],
-         [69, 1],
-         [70, 1],
-         [71, 1],
-         [72, 1],
-         [73, 1],
-         [74, 1],
-         [75, 1],
-         [76, 1],
-         [77, 1],
-         [78, 1],
-         [79, 1]],
-        [[0, 1]]],
-       {67: 1,
-        68: 1,
-        69: 1,
-        70: 1,
-        71: 1,
-        72: 1,
-        73: 1,
-        74: 1,
-        75: 1,
-        76: 1,
-        77: 1,
-        78: 1,
-        79: 1}],
- 269: [[[[39, 1]], [[0, 1]]], {39: 1}],
- 270: [[[[13, 1]],
-        [[25, 2]],
-        [[48, 3], [35, 4]],
-        [[80, 5]],
-        [[61, 6], [81, 7]],
-        [[0, 5]],
-        [[48, 3]],
-        [[61, 6]]],
-       {13: 1}],
- 271: [[[[10, 1], [34, 2]],
-        [[34, 2]],
-        [[82, 3]],
-        [[83, 4]],
-        [[84, 5]],
-        [[85, 6], [0, 5]],
-        [[0, 6]]],
-       {10: 1, 34: 1}],
- 272: [[[[37, 1]], [[86, 2]], [[85, 3], [0, 2]], [[0, 3]]], {37: 1}],
- 273: [[[[87, 1], [54, 1]], [[0, 1]]], {10: 1, 34: 1, 37: 1}],
- 274: [[[[88, 1],
-         [89, 1],
-         [8, 2],
-         [90, 1],
-         [88, 1],
-         [83, 1],
-         [91, 1],
-         [92, 3],
-         [93, 1],
-         [94, 1]],
-        [[0, 1]],
-        [[83, 1]],
-        [[8, 1], [0, 3]]],
-       {8: 1, 83: 1, 88: 1, 89: 1, 90: 1, 91: 1, 92: 1, 93: 1, 94: 1}],
- 275: [[[[95, 1]], [[96, 0], [0, 1]]],
-       {6: 1,
-        7: 1,
-        9: 1,
-        11: 1,
-        12: 1,
-        19: 1,
-        22: 1,
-        25: 1,
-        29: 1,
-        30: 1,
-        33: 1,
-        35: 1,
-        38: 1,
-        43: 1}],
- 276: [[[[97, 1],
-         [98, 1],
-         [58, 1],
-         [99, 1],
-         [57, 1],
-         [100, 1],
-         [56, 1],
-         [101, 1],
-         [102, 1]],
-        [[0, 1]]],
-       {4: 1, 10: 1, 13: 1, 20: 1, 21: 1, 34: 1, 37: 1, 41: 1, 42: 1}],
- 277: [[[[40, 1]], [[0, 1]]], {40: 1}],
- 278: [[[[17, 1]], [[0, 1]]], {17: 1}],
- 279: [[[[103, 1]], [[56, 2], [104, 2], [99, 2]], [[0, 2]]], {41: 1}],
- 280: [[[[41, 1]],
-        [[105, 2]],
-        [[2, 4], [35, 3]],
-        [[61, 5], [81, 6]],
-        [[0, 4]],
-        [[2, 4]],
-        [[61, 5]]],
-       {41: 1}],
- 281: [[[[106, 1]], [[106, 1], [0, 1]]], {41: 1}],
- 282: [[[[27, 1]], [[82, 2]], [[0, 2]]], {27: 1}],
- 283: [[[[49, 1], [107, 2], [53, 3]],
-        [[48, 4], [54, 5], [52, 6], [0, 1]],
-        [[54, 5], [52, 6], [0, 2]],
-        [[95, 7]],
-        [[49, 7]],
-        [[0, 5]],
-        [[49, 8], [107, 8], [0, 6]],
-        [[54, 5], [52, 9], [0, 7]],
-        [[52, 6], [0, 8]],
-        [[49, 10], [53, 11], [0, 9]],
-        [[48, 12]],
-        [[95, 13]],
-        [[49, 13]],
-        [[52, 9], [0, 13]]],
-       {6: 1,
-        7: 1,
-        8: 1,
-        9: 1,
-        11: 1,
-        12: 1,
-        14: 1,
-        15: 1,
-        19: 1,
-        22: 1,
-        25: 1,
-        29: 1,
-        30: 1,
-        33: 1,
-        35: 1,
-        38: 1,
-        43: 1,
-        53: 1}],
- 284: [[[[105, 1]], [[108, 2], [0, 1]], [[25, 3]], [[0, 3]]], {25: 1}],
- 285: [[[[109, 1]], [[52, 0], [0, 1]]], {25: 1}],
- 286: [[[[25, 1]], [[110, 0], [0, 1]]], {25: 1}],
- 287: [[[[25, 1]], [[0, 1]]], {25: 1}],
- 288: [[[[111, 1]], [[2, 1], [112, 2]], [[0, 2]]],
-       {6: 1,
-        7: 1,
-        8: 1,
-        9: 1,
-        11: 1,
-        12: 1,
-        14: 1,
-        19: 1,
-        22: 1,
-        25: 1,
-        29: 1,
-        30: 1,
-        33: 1,
-        35: 1,
-        38: 1,
-        43: 1}],
- 289: [[[[113, 1]],
-        [[49, 2], [0, 1]],
-        [[108, 3], [52, 3], [0, 2]],
-        [[49, 4]],
-        [[0, 4]]],
-       {113: 1}],
- 290: [[[[114, 1]], [[115, 0], [0, 1]]],
-       {6: 1,
-        7: 1,
-        9: 1,
-        11: 1,
-        12: 1,
-        19: 1,
-        22: 1,
-        25: 1,
-        29: 1,
-        30: 1,
-        33: 1,
-        35: 1,
-        38: 1,
-        43: 1}],
- 291: [[[[116, 1]],
-        [[117, 2], [50, 3], [118, 4], [0, 1]],
-        [[111, 4], [62, 4]],
-        [[116, 5], [62, 5]],
-        [[0, 4]],
-        [[50, 3], [0, 5]]],
-       {6: 1,
-        7: 1,
-        8: 1,
-        9: 1,
-        11: 1,
-        12: 1,
-        14: 1,
-        15: 1,
-        19: 1,
-        22: 1,
-        25: 1,
-        29: 1,
-        30: 1,
-        33: 1,
-        35: 1,
-        38: 1,
-        43: 1}],
- 292: [[[[95, 1], [107, 1]], [[52, 2], [0, 1]], [[95, 1], [107, 1], [0, 2]]],
-       {6: 1,
-        7: 1,
-        9: 1,
-        11: 1,
-        12: 1,
-        15: 1,
-        19: 1,
-        22: 1,
-        25: 1,
-        29: 1,
-        30: 1,
-        33: 1,
-        35: 1,
-        38: 1,
-        43: 1}],
- 293: [[[[119, 2], [30, 1], [22, 1], [43, 1]], [[120, 2]], [[0, 2]]],
-       {6: 1,
-        7: 1,
-        9: 1,
-        11: 1,
-        12: 1,
-        19: 1,
-        22: 1,
-        25: 1,
-        29: 1,
-        30: 1,
-        33: 1,
-        35: 1,
-        38: 1,
-        43: 1}],
- 294: [[[[2, 0], [112, 1], [121, 0]], [[0, 1]]],
-       {2: 1,
-        4: 1,
-        5: 1,
-        6: 1,
-        7: 1,
-        8: 1,
-        9: 1,
-        10: 1,
-        11: 1,
-        12: 1,
-        13: 1,
-        14: 1,
-        15: 1,
-        16: 1,
-        17: 1,
-        18: 1,
-        19: 1,
-        20: 1,
-        21: 1,
-        22: 1,
-        23: 1,
-        24: 1,
-        25: 1,
-        26: 1,
-        27: 1,
-        28: 1,
-        29: 1,
-        30: 1,
-        31: 1,
-        32: 1,
-        33: 1,
-        34: 1,
-        35: 1,
-        36: 1,
-        37: 1,
-        38: 1,
-        39: 1,
-        40: 1,
-        41: 1,
-        42: 1,
-        43: 1,
-        112: 1}],
- 295: [[[[122, 1], [123, 1], [124, 1], [125, 1], [126, 1]], [[0, 1]]],
-       {5: 1, 23: 1, 31: 1, 39: 1, 40: 1}],
- 296: [[[[34, 1]],
-        [[82, 2]],
-        [[83, 3]],
-        [[111, 4]],
-        [[48, 5]],
-        [[80, 6]],
-        [[127, 7], [0, 6]],
-        [[48, 8]],
-        [[80, 9]],
-        [[0, 9]]],
-       {34: 1}],
- 297: [[[[4, 1]],
-        [[25, 2]],
-        [[128, 3]],
-        [[48, 4], [129, 5]],
-        [[80, 6]],
-        [[49, 7]],
-        [[0, 6]],
-        [[48, 4]]],
-       {4: 1}],
- 298: [[[[26, 1]], [[25, 2]], [[52, 1], [0, 2]]], {26: 1}],
- 299: [[[[37, 1]],
-        [[49, 2]],
-        [[48, 3]],
-        [[80, 4]],
-        [[127, 5], [130, 1], [0, 4]],
-        [[48, 6]],
-        [[80, 7]],
-        [[0, 7]]],
-       {37: 1}],
- 300: [[[[25, 1]], [[108, 2], [0, 1]], [[25, 3]], [[0, 3]]], {25: 1}],
- 301: [[[[131, 1]], [[52, 2], [0, 1]], [[131, 1], [0, 2]]], {25: 1}],
- 302: [[[[36, 1]],
-        [[105, 2], [19, 3], [110, 3]],
-        [[32, 4]],
-        [[105, 2], [19, 3], [32, 4], [110, 3]],
-        [[132, 5], [15, 5], [35, 6]],
-        [[0, 5]],
-        [[132, 7]],
-        [[61, 5]]],
-       {36: 1}],
- 303: [[[[32, 1]], [[133, 2]], [[0, 2]]], {32: 1}],
- 304: [[[[134, 1], [135, 1]], [[0, 1]]], {32: 1, 36: 1}],
- 305: [[[[14, 1]], [[48, 2], [136, 3]], [[49, 4]], [[48, 2]], [[0, 4]]],
-       {14: 1}],
- 306: [[[[14, 1]], [[48, 2], [136, 3]], [[86, 4]], [[48, 2]], [[0, 4]]],
-       {14: 1}],
- 307: [[[[18, 1]], [[25, 2]], [[52, 1], [0, 2]]], {18: 1}],
- 308: [[[[8, 1], [137, 2]], [[46, 2]], [[0, 2]]],
-       {6: 1,
-        7: 1,
-        8: 1,
-        9: 1,
-        11: 1,
-        12: 1,
-        19: 1,
-        22: 1,
-        25: 1,
-        29: 1,
-        30: 1,
-        33: 1,
-        35: 1,
-        38: 1,
-        43: 1}],
- 309: [[[[138, 1]], [[139, 0], [0, 1]]],
-       {6: 1,
-        7: 1,
-        8: 1,
-        9: 1,
-        11: 1,
-        12: 1,
-        19: 1,
-        22: 1,
-        25: 1,
-        29: 1,
-        30: 1,
-        33: 1,
-        35: 1,
-        38: 1,
-        43: 1}],
- 310: [[[[35, 1]], [[61, 2], [140, 3]], [[0, 2]], [[61, 2]]], {35: 1}],
- 311: [[[[28, 1]], [[0, 1]]], {28: 1}],
- 312: [[[[141, 1]], [[53, 2], [0, 1]], [[120, 3]], [[0, 3]]],
-       {6: 1,
-        7: 1,
-        9: 1,
-        11: 1,
-        12: 1,
-        19: 1,
-        25: 1,
-        29: 1,
-        33: 1,
-        35: 1,
-        38: 1}],
- 313: [[[[16, 1]],
-        [[49, 2], [142, 3], [0, 1]],
-        [[52, 4], [0, 2]],
-        [[49, 5]],
-        [[49, 2], [0, 4]],
-        [[52, 6], [0, 5]],
-        [[49, 7]],
-        [[52, 8], [0, 7]],
-        [[49, 7], [0, 8]]],
-       {16: 1}],
- 314: [[[[5, 1]],
-        [[49, 2], [0, 1]],
-        [[36, 3], [52, 3], [0, 2]],
-        [[49, 4]],
-        [[52, 5], [0, 4]],
-        [[49, 6]],
-        [[0, 6]]],
-       {5: 1}],
- 315: [[[[23, 1]], [[111, 2], [0, 1]], [[0, 2]]], {23: 1}],
- 316: [[[[143, 1]], [[144, 0], [142, 0], [0, 1]]],
-       {6: 1,
-        7: 1,
-        9: 1,
-        11: 1,
-        12: 1,
-        19: 1,
-        22: 1,
-        25: 1,
-        29: 1,
-        30: 1,
-        33: 1,
-        35: 1,
-        38: 1,
-        43: 1}],
- 317: [[[[145, 1]], [[2, 2], [146, 3]], [[0, 2]], [[145, 1], [2, 2]]],
-       {5: 1,
-        6: 1,
-        7: 1,
-        8: 1,
-        9: 1,
-        11: 1,
-        12: 1,
-        14: 1,
-        15: 1,
-        16: 1,
-        17: 1,
-        18: 1,
-        19: 1,
-        22: 1,
-        23: 1,
-        24: 1,
-        25: 1,
-        26: 1,
-        27: 1,
-        28: 1,
-        29: 1,
-        30: 1,
-        31: 1,
-        32: 1,
-        33: 1,
-        35: 1,
-        36: 1,
-        38: 1,
-        39: 1,
-        40: 1,
-        43: 1}],
- 318: [[[[48, 1]], [[49, 2], [0, 1]], [[0, 2]]], {48: 1}],
- 319: [[[[147, 1],
-         [148, 1],
-         [149, 1],
-         [150, 1],
-         [151, 1],
-         [152, 1],
-         [153, 1],
-         [154, 1],
-         [155, 1],
-         [156, 1]],
-        [[0, 1]]],
-       {5: 1,
-        6: 1,
-        7: 1,
-        8: 1,
-        9: 1,
-        11: 1,
-        12: 1,
-        14: 1,
-        15: 1,
-        16: 1,
-        17: 1,
-        18: 1,
-        19: 1,
-        22: 1,
-        23: 1,
-        24: 1,
-        25: 1,
-        26: 1,
-        27: 1,
-        28: 1,
-        29: 1,
-        30: 1,
-        31: 1,
-        32: 1,
-        33: 1,
-        35: 1,
-        36: 1,
-        38: 1,
-        39: 1,
-        40: 1,
-        43: 1}],
- 320: [[[[15, 1]], [[95, 2]], [[0, 2]]], {15: 1}],
- 321: [[[[1, 1], [3, 1]], [[0, 1]]],
-       {4: 1,
-        5: 1,
-        6: 1,
-        7: 1,
-        8: 1,
-        9: 1,
-        10: 1,
-        11: 1,
-        12: 1,
-        13: 1,
-        14: 1,
-        15: 1,
-        16: 1,
-        17: 1,
-        18: 1,
-        19: 1,
-        20: 1,
-        21: 1,
-        22: 1,
-        23: 1,
-        24: 1,
-        25: 1,
-        26: 1,
-        27: 1,
-        28: 1,
-        29: 1,
-        30: 1,
-        31: 1,
-        32: 1,
-        33: 1,
-        34: 1,
-        35: 1,
-        36: 1,
-        37: 1,
-        38: 1,
-        39: 1,
-        40: 1,
-        41: 1,
-        42: 1,
-        43: 1}],
- 322: [[[[49, 1], [48, 2]],
-        [[48, 2], [0, 1]],
-        [[49, 3], [157, 4], [0, 2]],
-        [[157, 4], [0, 3]],
-        [[0, 4]]],
-       {6: 1,
-        7: 1,
-        8: 1,
-        9: 1,
-        11: 1,
-        12: 1,
-        14: 1,
-        19: 1,
-        22: 1,
-        25: 1,
-        29: 1,
-        30: 1,
-        33: 1,
-        35: 1,
-        38: 1,
-        43: 1,
-        48: 1}],
- 323: [[[[158, 1]], [[52, 2], [0, 1]], [[158, 1], [0, 2]]],
-       {6: 1,
-        7: 1,
-        8: 1,
-        9: 1,
-        11: 1,
-        12: 1,
-        14: 1,
-        19: 1,
-        22: 1,
-        25: 1,
-        29: 1,
-        30: 1,
-        33: 1,
-        35: 1,
-        38: 1,
-        43: 1,
-        48: 1}],
- 324: [[[[1, 1], [2, 2]],
-        [[0, 1]],
-        [[159, 3]],
-        [[121, 4]],
-        [[160, 1], [121, 4]]],
-       {2: 1,
-        5: 1,
-        6: 1,
-        7: 1,
-        8: 1,
-        9: 1,
-        11: 1,
-        12: 1,
-        14: 1,
-        15: 1,
-        16: 1,
-        17: 1,
-        18: 1,
-        19: 1,
-        22: 1,
-        23: 1,
-        24: 1,
-        25: 1,
-        26: 1,
-        27: 1,
-        28: 1,
-        29: 1,
-        30: 1,
-        31: 1,
-        32: 1,
-        33: 1,
-        35: 1,
-        36: 1,
-        38: 1,
-        39: 1,
-        40: 1,
-        43: 1}],
- 325: [[[[120, 1]], [[161, 0], [15, 0], [162, 0], [41, 0], [163, 0], [0, 1]]],
-       {6: 1,
-        7: 1,
-        9: 1,
-        11: 1,
-        12: 1,
-        19: 1,
-        22: 1,
-        25: 1,
-        29: 1,
-        30: 1,
-        33: 1,
-        35: 1,
-        38: 1,
-        43: 1}],
- 326: [[[[84, 1], [164, 2]],
-        [[37, 3], [0, 1]],
-        [[0, 2]],
-        [[84, 4]],
-        [[127, 5]],
-        [[49, 2]]],
-       {6: 1,
-        7: 1,
-        8: 1,
-        9: 1,
-        11: 1,
-        12: 1,
-        14: 1,
-        19: 1,
-        22: 1,
-        25: 1,
-        29: 1,
-        30: 1,
-        33: 1,
-        35: 1,
-        38: 1,
-        43: 1}],
- 327: [[[[165, 1], [84, 1]], [[0, 1]]],
-       {6: 1,
-        7: 1,
-        8: 1,
-        9: 1,
-        11: 1,
-        12: 1,
-        14: 1,
-        19: 1,
-        22: 1,
-        25: 1,
-        29: 1,
-        30: 1,
-        33: 1,
-        35: 1,
-        38: 1,
-        43: 1}],
- 328: [[[[49, 1]], [[52, 2], [0, 1]], [[49, 1], [0, 2]]],
-       {6: 1,
-        7: 1,
-        8: 1,
-        9: 1,
-        11: 1,
-        12: 1,
-        14: 1,
-        19: 1,
-        22: 1,
-        25: 1,
-        29: 1,
-        30: 1,
-        33: 1,
-        35: 1,
-        38: 1,
-        43: 1}],
- 329: [[[[49, 1], [107, 1]],
-        [[54, 2], [52, 3], [0, 1]],
-        [[0, 2]],
-        [[49, 4], [107, 4], [0, 3]],
-        [[52, 3], [0, 4]]],
-       {6: 1,
-        7: 1,
-        8: 1,
-        9: 1,
-        11: 1,
-        12: 1,
-        14: 1,
-        15: 1,
-        19: 1,
-        22: 1,
-        25: 1,
-        29: 1,
-        30: 1,
-        33: 1,
-        35: 1,
-        38: 1,
-        43: 1}],
- 330: [[[[49, 1], [107, 1]], [[52, 2], [0, 1]], [[49, 1], [107, 1], [0, 2]]],
-       {6: 1,
-        7: 1,
-        8: 1,
-        9: 1,
-        11: 1,
-        12: 1,
-        14: 1,
-        15: 1,
-        19: 1,
-        22: 1,
-        25: 1,
-        29: 1,
-        30: 1,
-        33: 1,
-        35: 1,
-        38: 1,
-        43: 1}],
- 331: [[[[25, 1]], [[48, 2], [0, 1]], [[49, 3]], [[0, 3]]], {25: 1}],
- 332: [[[[35, 1], [110, 2], [38, 3]],
-        [[61, 4], [81, 5]],
-        [[25, 4]],
-        [[166, 6]],
-        [[0, 4]],
-        [[61, 4]],
-        [[64, 4]]],
-       {35: 1, 38: 1, 110: 1}],
- 333: [[[[20, 1]],
-        [[48, 2]],
-        [[80, 3]],
-        [[167, 4], [168, 5]],
-        [[48, 6]],
-        [[48, 7]],
-        [[80, 8]],
-        [[80, 9]],
-        [[167, 4], [127, 10], [168, 5], [0, 8]],
-        [[0, 9]],
-        [[48, 11]],
-        [[80, 12]],
-        [[168, 5], [0, 12]]],
-       {20: 1}],
- 334: [[[[15, 1], [169, 2], [53, 3]],
-        [[169, 4], [52, 5], [0, 1]],
-        [[50, 6], [52, 7], [0, 2]],
-        [[169, 8]],
-        [[52, 5], [0, 4]],
-        [[169, 9], [53, 3], [0, 5]],
-        [[49, 10]],
-        [[15, 11], [169, 2], [53, 3], [0, 7]],
-        [[52, 12], [0, 8]],
-        [[50, 13], [52, 5], [0, 9]],
-        [[52, 7], [0, 10]],
-        [[169, 14], [52, 15], [0, 11]],
-        [[0, 12]],
-        [[49, 4]],
-        [[52, 15], [0, 14]],
-        [[169, 16], [53, 3], [0, 15]],
-        [[50, 17], [52, 15], [0, 16]],
-        [[49, 14]]],
-       {15: 1, 25: 1, 53: 1}],
- 335: [[[[15, 1], [53, 2], [170, 3]],
-        [[170, 5], [52, 4], [0, 1]],
-        [[170, 6]],
-        [[50, 7], [52, 8], [0, 3]],
-        [[53, 2], [170, 9], [0, 4]],
-        [[52, 4], [0, 5]],
-        [[52, 10], [0, 6]],
-        [[49, 11]],
-        [[15, 12], [53, 2], [170, 3], [0, 8]],
-        [[50, 13], [52, 4], [0, 9]],
-        [[0, 10]],
-        [[52, 8], [0, 11]],
-        [[52, 15], [170, 14], [0, 12]],
-        [[49, 5]],
-        [[52, 15], [0, 14]],
-        [[53, 2], [170, 16], [0, 15]],
-        [[50, 17], [52, 15], [0, 16]],
-        [[49, 14]]],
-       {15: 1, 25: 1, 53: 1}],
- 336: [[[[25, 1]], [[0, 1]]], {25: 1}],
- 337: [[[[21, 1]],
-        [[49, 2]],
-        [[48, 3]],
-        [[80, 4]],
-        [[127, 5], [0, 4]],
-        [[48, 6]],
-        [[80, 7]],
-        [[0, 7]]],
-       {21: 1}],
- 338: [[[[49, 1]], [[108, 2], [0, 1]], [[95, 3]], [[0, 3]]],
-       {6: 1,
-        7: 1,
-        8: 1,
-        9: 1,
-        11: 1,
-        12: 1,
-        14: 1,
-        19: 1,
-        22: 1,
-        25: 1,
-        29: 1,
-        30: 1,
-        33: 1,
-        35: 1,
-        38: 1,
-        43: 1}],
- 339: [[[[42, 1]], [[171, 2]], [[48, 3], [52, 1]], [[80, 4]], [[0, 4]]],
-       {42: 1}],
- 340: [[[[172, 1]], [[173, 0], [0, 1]]],
-       {6: 1,
-        7: 1,
-        9: 1,
-        11: 1,
-        12: 1,
-        19: 1,
-        22: 1,
-        25: 1,
-        29: 1,
-        30: 1,
-        33: 1,
-        35: 1,
-        38: 1,
-        43: 1}],
- 341: [[[[111, 2], [36, 1]], [[49, 2]], [[0, 2]]],
-       {6: 1,
-        7: 1,
-        8: 1,
-        9: 1,
-        11: 1,
-        12: 1,
-        14: 1,
-        19: 1,
-        22: 1,
-        25: 1,
-        29: 1,
-        30: 1,
-        33: 1,
-        35: 1,
-        36: 1,
-        38: 1,
-        43: 1}],
- 342: [[[[31, 1]], [[174, 2], [0, 1]], [[0, 2]]], {31: 1}],
- 343: [[[[62, 1]], [[0, 1]]], {31: 1}]},
-states:
-[[[[1, 1], [2, 1], [3, 2]], [[0, 1]], [[2, 1]]],
- [[[44, 1]], [[45, 0], [0, 1]]],
- [[[46, 1]], [[47, 0], [0, 1]]],
- [[[48, 1]], [[49, 2]], [[50, 3], [0, 2]], [[49, 4]], [[0, 4]]],
- [[[51, 1]], [[52, 2], [0, 1]], [[51, 1], [0, 2]]],
- [[[49, 1], [15, 2], [53, 2]],
-  [[50, 2], [54, 3], [0, 1]],
-  [[49, 3]],
-  [[0, 3]]],
- [[[55, 1]], [[30, 0], [43, 0], [0, 1]]],
- [[[24, 1]], [[49, 2]], [[52, 3], [0, 2]], [[49, 4]], [[0, 4]]],
- [[[10, 1]], [[56, 2]], [[0, 2]]],
- [[[10, 1]], [[57, 2], [56, 2], [58, 2]], [[0, 2]]],
- [[[6, 1],
-   [25, 1],
-   [33, 1],
-   [9, 1],
-   [11, 1],
-   [12, 2],
-   [35, 3],
-   [38, 4],
-   [19, 1],
-   [7, 5]],
-  [[0, 1]],
-  [[59, 1], [60, 6]],
-  [[61, 1], [62, 7], [63, 7]],
-  [[64, 1], [63, 8]],
-  [[7, 5], [0, 5]],
-  [[59, 1]],
-  [[61, 1]],
-  [[64, 1]]],
- [[[29, 1], [65, 2]], [[65, 2]], [[66, 2], [0, 2]]],
- [[[67, 1],
-   [68, 1],
-   [69, 1],
-   [70, 1],
-   [71, 1],
-   [72, 1],
-   [73, 1],
-   [74, 1],
-   [75, 1],
-   [76, 1],
-   [77, 1],
-   [78, 1],
-   [79, 1]],
-  [[0, 1]]],
- [[[39, 1]], [[0, 1]]],
- [[[13, 1]],
-  [[25, 2]],
-  [[48, 3], [35, 4]],
-  [[80, 5]],
-  [[61, 6], [81, 7]],
-  [[0, 5]],
-  [[48, 3]],
-  [[61, 6]]],
- [[[10, 1], [34, 2]],
-  [[34, 2]],
-  [[82, 3]],
-  [[83, 4]],
-  [[84, 5]],
-  [[85, 6], [0, 5]],
-  [[0, 6]]],
- [[[37, 1]], [[86, 2]], [[85, 3], [0, 2]], [[0, 3]]],
- [[[87, 1], [54, 1]], [[0, 1]]],
- [[[88, 1],
-   [89, 1],
-   [8, 2],
-   [90, 1],
-   [88, 1],
-   [83, 1],
-   [91, 1],
-   [92, 3],
-   [93, 1],
-   [94, 1]],
-  [[0, 1]],
-  [[83, 1]],
-  [[8, 1], [0, 3]]],
- [[[95, 1]], [[96, 0], [0, 1]]],
- [[[97, 1],
-   [98, 1],
-   [58, 1],
-   [99, 1],
-   [57, 1],
-   [100, 1],
-   [56, 1],
-   [101, 1],
-   [102, 1]],
-  [[0, 1]]],
- [[[40, 1]], [[0, 1]]],
- [[[17, 1]], [[0, 1]]],
- [[[103, 1]], [[56, 2], [104, 2], [99, 2]], [[0, 2]]],
- [[[41, 1]],
-  [[105, 2]],
-  [[2, 4], [35, 3]],
-  [[61, 5], [81, 6]],
-  [[0, 4]],
-  [[2, 4]],
-  [[61, 5]]],
- [[[106, 1]], [[106, 1], [0, 1]]],
- [[[27, 1]], [[82, 2]], [[0, 2]]],
- [[[49, 1], [107, 2], [53, 3]],
-  [[48, 4], [54, 5], [52, 6], [0, 1]],
-  [[54, 5], [52, 6], [0, 2]],
-  [[95, 7]],
-  [[49, 7]],
-  [[0, 5]],
-  [[49, 8], [107, 8], [0, 6]],
-  [[54, 5], [52, 9], [0, 7]],
-  [[52, 6], [0, 8]],
-  [[49, 10], [53, 11], [0, 9]],
-  [[48, 12]],
-  [[95, 13]],
-  [[49, 13]],
-  [[52, 9], [0, 13]]],
- [[[105, 1]], [[108, 2], [0, 1]], [[25, 3]], [[0, 3]]],
- [[[109, 1]], [[52, 0], [0, 1]]],
- [[[25, 1]], [[110, 0], [0, 1]]],
- [[[25, 1]], [[0, 1]]],
- [[[111, 1]], [[2, 1], [112, 2]], [[0, 2]]],
- [[[113, 1]],
-  [[49, 2], [0, 1]],
-  [[108, 3], [52, 3], [0, 2]],
-  [[49, 4]],
-  [[0, 4]]],
- [[[114, 1]], [[115, 0], [0, 1]]],
- [[[116, 1]],
-  [[117, 2], [50, 3], [118, 4], [0, 1]],
-  [[111, 4], [62, 4]],
-  [[116, 5], [62, 5]],
-  [[0, 4]],
-  [[50, 3], [0, 5]]],
- [[[95, 1], [107, 1]], [[52, 2], [0, 1]], [[95, 1], [107, 1], [0, 2]]],
- [[[119, 2], [30, 1], [22, 1], [43, 1]], [[120, 2]], [[0, 2]]],
- [[[2, 0], [112, 1], [121, 0]], [[0, 1]]],
- [[[122, 1], [123, 1], [124, 1], [125, 1], [126, 1]], [[0, 1]]],
- [[[34, 1]],
-  [[82, 2]],
-  [[83, 3]],
-  [[111, 4]],
-  [[48, 5]],
-  [[80, 6]],
-  [[127, 7], [0, 6]],
-  [[48, 8]],
-  [[80, 9]],
-  [[0, 9]]],
- [[[4, 1]],
-  [[25, 2]],
-  [[128, 3]],
-  [[48, 4], [129, 5]],
-  [[80, 6]],
-  [[49, 7]],
-  [[0, 6]],
-  [[48, 4]]],
- [[[26, 1]], [[25, 2]], [[52, 1], [0, 2]]],
- [[[37, 1]],
-  [[49, 2]],
-  [[48, 3]],
-  [[80, 4]],
-  [[127, 5], [130, 1], [0, 4]],
-  [[48, 6]],
-  [[80, 7]],
-  [[0, 7]]],
- [[[25, 1]], [[108, 2], [0, 1]], [[25, 3]], [[0, 3]]],
- [[[131, 1]], [[52, 2], [0, 1]], [[131, 1], [0, 2]]],
- [[[36, 1]],
-  [[105, 2], [19, 3], [110, 3]],
-  [[32, 4]],
-  [[105, 2], [19, 3], [32, 4], [110, 3]],
-  [[132, 5], [15, 5], [35, 6]],
-  [[0, 5]],
-  [[132, 7]],
-  [[61, 5]]],
- [[[32, 1]], [[133, 2]], [[0, 2]]],
- [[[134, 1], [135, 1]], [[0, 1]]],
- [[[14, 1]], [[48, 2], [136, 3]], [[49, 4]], [[48, 2]], [[0, 4]]],
- [[[14, 1]], [[48, 2], [136, 3]], [[86, 4]], [[48, 2]], [[0, 4]]],
- [[[18, 1]], [[25, 2]], [[52, 1], [0, 2]]],
- [[[8, 1], [137, 2]], [[46, 2]], [[0, 2]]],
- [[[138, 1]], [[139, 0], [0, 1]]],
- [[[35, 1]], [[61, 2], [140, 3]], [[0, 2]], [[61, 2]]],
- [[[28, 1]], [[0, 1]]],
- [[[141, 1]], [[53, 2], [0, 1]], [[120, 3]], [[0, 3]]],
- [[[16, 1]],
-  [[49, 2], [142, 3], [0, 1]],
-  [[52, 4], [0, 2]],
-  [[49, 5]],
-  [[49, 2], [0, 4]],
-  [[52, 6], [0, 5]],
-  [[49, 7]],
-  [[52, 8], [0, 7]],
-  [[49, 7], [0, 8]]],
- [[[5, 1]],
-  [[49, 2], [0, 1]],
-  [[36, 3], [52, 3], [0, 2]],
-  [[49, 4]],
-  [[52, 5], [0, 4]],
-  [[49, 6]],
-  [[0, 6]]],
- [[[23, 1]], [[111, 2], [0, 1]], [[0, 2]]],
- [[[143, 1]], [[144, 0], [142, 0], [0, 1]]],
- [[[145, 1]], [[2, 2], [146, 3]], [[0, 2]], [[145, 1], [2, 2]]],
- [[[48, 1]], [[49, 2], [0, 1]], [[0, 2]]],
- [[[147, 1],
-   [148, 1],
-   [149, 1],
-   [150, 1],
-   [151, 1],
-   [152, 1],
-   [153, 1],
-   [154, 1],
-   [155, 1],
-   [156, 1]],
-  [[0, 1]]],
- [[[15, 1]], [[95, 2]], [[0, 2]]],
- [[[1, 1], [3, 1]], [[0, 1]]],
- [[[49, 1], [48, 2]],
-  [[48, 2], [0, 1]],
-  [[49, 3], [157, 4], [0, 2]],
-  [[157, 4], [0, 3]],
-  [[0, 4]]],
- [[[158, 1]], [[52, 2], [0, 1]], [[158, 1], [0, 2]]],
- [[[1, 1], [2, 2]], [[0, 1]], [[159, 3]], [[121, 4]], [[160, 1], [121, 4]]],
- [[[120, 1]], [[161, 0], [15, 0], [162, 0], [41, 0], [163, 0], [0, 1]]],
- [[[84, 1], [164, 2]],
-  [[37, 3], [0, 1]],
-  [[0, 2]],
-  [[84, 4]],
-  [[127, 5]],
-  [[49, 2]]],
- [[[165, 1], [84, 1]], [[0, 1]]],
- [[[49, 1]], [[52, 2], [0, 1]], [[49, 1], [0, 2]]],
- [[[49, 1], [107, 1]],
-  [[54, 2], [52, 3], [0, 1]],
-  [[0, 2]],
-  [[49, 4], [107, 4], [0, 3]],
-  [[52, 3], [0, 4]]],
- [[[49, 1], [107, 1]], [[52, 2], [0, 1]], [[49, 1], [107, 1], [0, 2]]],
- [[[25, 1]], [[48, 2], [0, 1]], [[49, 3]], [[0, 3]]],
- [[[35, 1], [110, 2], [38, 3]],
-  [[61, 4], [81, 5]],
-  [[25, 4]],
-  [[166, 6]],
-  [[0, 4]],
-  [[61, 4]],
-  [[64, 4]]],
- [[[20, 1]],
-  [[48, 2]],
-  [[80, 3]],
-  [[167, 4], [168, 5]],
-  [[48, 6]],
-  [[48, 7]],
-  [[80, 8]],
-  [[80, 9]],
-  [[167, 4], [127, 10], [168, 5], [0, 8]],
-  [[0, 9]],
-  [[48, 11]],
-  [[80, 12]],
-  [[168, 5], [0, 12]]],
- [[[15, 1], [169, 2], [53, 3]],
-  [[169, 4], [52, 5], [0, 1]],
-  [[50, 6], [52, 7], [0, 2]],
-  [[169, 8]],
-  [[52, 5], [0, 4]],
-  [[169, 9], [53, 3], [0, 5]],
-  [[49, 10]],
-  [[15, 11], [169, 2], [53, 3], [0, 7]],
-  [[52, 12], [0, 8]],
-  [[50, 13], [52, 5], [0, 9]],
-  [[52, 7], [0, 10]],
-  [[169, 14], [52, 15], [0, 11]],
-  [[0, 12]],
-  [[49, 4]],
-  [[52, 15], [0, 14]],
-  [[169, 16], [53, 3], [0, 15]],
-  [[50, 17], [52, 15], [0, 16]],
-  [[49, 14]]],
- [[[15, 1], [53, 2], [170, 3]],
-  [[170, 5], [52, 4], [0, 1]],
-  [[170, 6]],
-  [[50, 7], [52, 8], [0, 3]],
-  [[53, 2], [170, 9], [0, 4]],
-  [[52, 4], [0, 5]],
-  [[52, 10], [0, 6]],
-  [[49, 11]],
-  [[15, 12], [53, 2], [170, 3], [0, 8]],
-  [[50, 13], [52, 4], [0, 9]],
-  [[0, 10]],
-  [[52, 8], [0, 11]],
-  [[52, 15], [170, 14], [0, 12]],
-  [[49, 5]],
-  [[52, 15], [0, 14]],
-  [[53, 2], [170, 16], [0, 15]],
-  [[50, 17], [52, 15], [0, 16]],
-  [[49, 14]]],
- [[[25, 1]], [[0, 1]]],
- [[[21, 1]],
-  [[49, 2]],
-  [[48, 3]],
-  [[80, 4]],
-  [[127, 5], [0, 4]],
-  [[48, 6]],
-  [[80, 7]],
-  [[0, 7]]],
- [[[49, 1]], [[108, 2], [0, 1]], [[95, 3]], [[0, 3]]],
- [[[42, 1]], [[171, 2]], [[48, 3], [52, 1]], [[80, 4]], [[0, 4]]],
- [[[172, 1]], [[173, 0], [0, 1]]],
- [[[111, 2], [36, 1]], [[49, 2]], [[0, 2]]],
- [[[31, 1]], [[174, 2], [0, 1]], [[0, 2]]],
- [[[62, 1]], [[0, 1]]]],
-labels:
-[[0, 'EMPTY'],
- [317, null],
- [4, null],
- [276, null],
- [1, 'def'],
- [1, 'raise'],
- [1, 'True'],
- [3, null],
- [1, 'not'],
- [1, 'null'],
- [55, null],
- [2, null],
- [25, null],
- [1, 'class'],
- [1, 'lambda'],
- [16, null],
- [1, 'print'],
- [1, 'debugger'],
- [1, 'nonlocal'],
- [52, null],
- [1, 'try'],
- [1, 'while'],
- [31, null],
- [1, 'return'],
- [1, 'assert'],
- [1, null],
- [1, 'global'],
- [1, 'del'],
- [1, 'pass'],
- [54, null],
- [15, null],
- [1, 'yield'],
- [1, 'import'],
- [1, 'False'],
- [1, 'for'],
- [7, null],
- [1, 'from'],
- [1, 'if'],
- [9, null],
- [1, 'break'],
- [1, 'continue'],
- [49, null],
- [1, 'with'],
- [14, null],
- [316, null],
- [19, null],
- [308, null],
- [1, 'and'],
- [11, null],
- [326, null],
- [22, null],
- [261, null],
- [12, null],
- [35, null],
- [271, null],
- [325, null],
- [297, null],
- [339, null],
- [296, null],
- [26, null],
- [283, null],
- [8, null],
- [342, null],
- [329, null],
- [10, null],
- [266, null],
- [332, null],
- [45, null],
- [38, null],
- [40, null],
- [50, null],
- [46, null],
- [41, null],
- [42, null],
- [36, null],
- [43, null],
- [48, null],
- [44, null],
- [37, null],
- [39, null],
- [324, null],
- [260, null],
- [292, null],
- [1, 'in'],
- [309, null],
- [273, null],
- [327, null],
- [272, null],
- [28, null],
- [21, null],
- [27, null],
- [29, null],
- [1, 'is'],
- [30, null],
- [20, null],
- [290, null],
- [274, null],
- [333, null],
- [299, null],
- [270, null],
- [337, null],
- [279, null],
- [265, null],
- [281, null],
- [264, null],
- [286, null],
- [280, null],
- [320, null],
- [1, 'as'],
- [284, null],
- [23, null],
- [328, null],
- [0, null],
- [1, 'except'],
- [340, null],
- [18, null],
- [330, null],
- [268, null],
- [259, null],
- [312, null],
- [293, null],
- [321, null],
- [269, null],
- [277, null],
- [314, null],
- [315, null],
- [343, null],
- [1, 'else'],
- [310, null],
- [51, null],
- [1, 'elif'],
- [300, null],
- [301, null],
- [285, null],
- [303, null],
- [302, null],
- [335, null],
- [275, null],
- [258, null],
- [1, 'or'],
- [334, null],
- [267, null],
- [34, null],
- [262, null],
- [33, null],
- [319, null],
- [13, null],
- [295, null],
- [263, null],
- [291, null],
- [311, null],
- [307, null],
- [313, null],
- [282, null],
- [298, null],
- [304, null],
- [278, null],
- [318, null],
- [322, null],
- [5, null],
- [6, null],
- [47, null],
- [17, null],
- [24, null],
- [305, null],
- [306, null],
- [323, null],
- [289, null],
- [1, 'finally'],
- [331, null],
- [336, null],
- [338, null],
- [257, null],
- [32, null],
- [341, null]],
+dfaStates:
+new Uint16Array([
+0, 3, 5, 7, 12, 15, 19, 21, 26, 29, 32, 41, 44, 46, 48, 56,
+63, 67, 69, 73, 75, 77, 79, 81, 84, 91, 93, 96, 110, 114, 116, 118,
+120, 123, 128, 130, 136, 139, 142, 144, 146, 156, 164, 167, 175, 179, 182, 190,
+193, 195, 200, 205, 208, 211, 213, 217, 219, 223, 232, 239, 242, 244, 248, 251,
+253, 256, 258, 263, 266, 271, 273, 279, 281, 284, 289, 292, 296, 303, 316, 334,
+352, 354, 362, 366, 371, 373, 376, 379, 381]),
+stateArcs:
+new Uint16Array([
+0, 3, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 12, 13, 14, 15,
+18, 20, 21, 21, 22, 24, 25, 26, 27, 28, 28, 29, 30, 30, 31, 34,
+34, 44, 47, 49, 51, 51, 52, 53, 54, 55, 57, 58, 59, 72, 72, 73,
+73, 74, 75, 77, 79, 80, 81, 82, 82, 84, 85, 86, 87, 88, 89, 89,
+90, 91, 92, 92, 94, 94, 104, 104, 105, 106, 107, 108, 117, 117, 118, 118,
+119, 119, 120, 123, 123, 124, 125, 127, 129, 129, 130, 131, 132, 133, 134, 135,
+135, 138, 141, 142, 144, 145, 145, 147, 149, 150, 152, 153, 154, 155, 156, 157,
+158, 159, 159, 160, 161, 162, 163, 164, 164, 165, 167, 167, 168, 169, 171, 172,
+172, 173, 174, 175, 178, 178, 180, 182, 183, 185, 186, 188, 192, 193, 193, 196,
+196, 201, 201, 202, 203, 204, 205, 206, 207, 208, 209, 210, 210, 211, 212, 213,
+215, 216, 217, 218, 218, 219, 220, 221, 222, 223, 224, 225, 227, 228, 229, 229,
+230, 231, 232, 232, 233, 234, 235, 236, 239, 243, 244, 247, 247, 248, 249, 250,
+251, 251, 253, 253, 254, 256, 257, 258, 258, 259, 261, 262, 263, 263, 264, 265,
+266, 268, 269, 269, 270, 271, 272, 274, 275, 275, 276, 276, 277, 278, 279, 279,
+280, 282, 283, 284, 285, 286, 287, 288, 289, 290, 291, 293, 294, 295, 296, 296,
+297, 298, 298, 299, 301, 302, 304, 306, 306, 307, 308, 308, 318, 318, 319, 320,
+320, 322, 322, 324, 325, 327, 328, 328, 329, 330, 331, 333, 333, 334, 335, 337,
+338, 343, 345, 346, 346, 347, 348, 349, 351, 351, 352, 353, 354, 356, 358, 358,
+360, 361, 363, 364, 366, 367, 368, 369, 369, 372, 374, 375, 376, 377, 377, 378,
+379, 380, 381, 383, 384, 385, 386, 387, 390, 390, 391, 392, 393, 396, 398, 400,
+401, 402, 405, 406, 408, 409, 410, 412, 414, 414, 415, 417, 418, 420, 421, 424,
+426, 428, 429, 430, 433, 434, 436, 437, 438, 440, 442, 442, 443, 445, 446, 448,
+449, 450, 450, 451, 452, 453, 454, 455, 456, 457, 457, 458, 459, 460, 460, 461,
+462, 464, 465, 465, 466, 467, 469, 470, 470, 471, 472, 472, 473, 473]),
+stateFlags:
+new Uint8Array([
+0, 3, 0, 0, 1, 0, 1, 0, 0, 1, 0, 3, 0, 1, 1, 0,
+1, 0, 3, 0, 1, 0, 0, 1, 0, 3, 0, 0, 3, 0, 0, 3,
+0, 0, 0, 0, 3, 1, 0, 0, 0, 0, 0, 1, 0, 3, 0, 3,
+0, 0, 0, 0, 0, 0, 0, 3, 0, 0, 0, 0, 0, 1, 3, 0,
+0, 1, 3, 0, 3, 0, 3, 0, 1, 0, 1, 0, 3, 0, 3, 0,
+3, 0, 0, 3, 0, 0, 0, 0, 3, 0, 0, 0, 1, 0, 0, 3,
+0, 1, 0, 1, 0, 3, 1, 1, 1, 1, 0, 0, 0, 1, 0, 1,
+0, 3, 0, 1, 0, 1, 0, 3, 0, 0, 3, 0, 1, 1, 0, 3,
+0, 1, 0, 1, 3, 0, 0, 1, 0, 1, 1, 0, 0, 3, 0, 3,
+0, 3, 0, 0, 0, 0, 0, 0, 1, 0, 0, 3, 0, 0, 0, 0,
+0, 0, 0, 3, 0, 0, 1, 0, 0, 0, 0, 1, 0, 0, 3, 0,
+1, 0, 3, 0, 1, 1, 0, 0, 0, 0, 0, 3, 0, 0, 0, 0,
+3, 0, 3, 0, 0, 0, 0, 3, 0, 0, 0, 0, 3, 0, 0, 1,
+0, 0, 3, 0, 1, 0, 0, 0, 3, 0, 3, 0, 1, 0, 3, 0,
+1, 1, 0, 1, 1, 0, 1, 1, 0, 1, 1, 0, 1, 0, 3, 0,
+1, 3, 0, 1, 0, 0, 0, 3, 0, 1, 3, 0, 3, 0, 0, 3,
+0, 3, 0, 1, 1, 1, 3, 0, 1, 1, 0, 3, 0, 0, 0, 0,
+1, 0, 1, 3, 0, 0, 0, 0, 3, 0, 1, 1, 0, 1, 3, 1,
+1, 0, 1, 1, 0, 1, 0, 3, 0, 0, 0, 0, 0, 3, 0, 0,
+0, 0, 0, 0, 0, 0, 0, 1, 3, 0, 0, 1, 0, 1, 1, 0,
+0, 1, 1, 1, 1, 1, 1, 1, 3, 1, 1, 0, 1, 0, 0, 1,
+1, 0, 0, 1, 1, 1, 1, 1, 1, 1, 3, 1, 1, 0, 1, 0,
+0, 3, 0, 0, 0, 0, 1, 0, 0, 3, 0, 1, 0, 3, 0, 0,
+0, 0, 3, 0, 1, 0, 0, 3, 0, 1, 3, 0, 3]),
+arcLabels:
+new Uint16Array([
+1, 2, 3, 1, 44, 45, 46, 47, 48, 49, 50, 49, 51, 52, 51, 49,
+53, 20, 54, 50, 49, 55, 5, 6, 32, 49, 52, 49, 43, 56, 43, 56,
+57, 58, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 59, 60, 61, 60,
+62, 63, 64, 14, 61, 62, 64, 8, 65, 65, 66, 67, 68, 69, 70, 71,
+72, 73, 74, 75, 76, 77, 78, 79, 23, 41, 12, 9, 48, 80, 61, 81,
+61, 48, 43, 37, 37, 82, 83, 84, 85, 35, 86, 85, 54, 87, 88, 89,
+90, 91, 92, 93, 93, 83, 4, 94, 83, 4, 95, 96, 97, 98, 58, 99,
+57, 56, 100, 101, 102, 24, 34, 103, 100, 56, 104, 42, 105, 9, 1, 80,
+61, 61, 1, 106, 106, 21, 82, 49, 53, 107, 48, 54, 52, 95, 54, 52,
+49, 49, 107, 54, 52, 52, 49, 53, 48, 95, 49, 52, 105, 108, 12, 109,
+52, 12, 110, 12, 111, 1, 112, 113, 49, 108, 52, 49, 114, 115, 116, 117,
+118, 50, 59, 111, 59, 116, 50, 95, 107, 52, 95, 107, 5, 6, 7, 119,
+120, 1, 121, 112, 122, 123, 124, 125, 126, 37, 82, 83, 111, 48, 81, 127,
+48, 81, 40, 12, 128, 129, 48, 49, 81, 48, 30, 12, 52, 35, 49, 48,
+81, 130, 127, 48, 81, 12, 108, 12, 131, 52, 131, 29, 110, 15, 105, 110,
+15, 105, 28, 28, 20, 9, 132, 132, 61, 28, 133, 134, 135, 19, 136, 48,
+48, 49, 19, 136, 48, 48, 86, 31, 12, 52, 4, 137, 46, 138, 139, 9,
+140, 61, 61, 22, 141, 53, 120, 33, 49, 142, 52, 49, 49, 52, 49, 52,
+49, 26, 49, 29, 52, 49, 52, 49, 25, 111, 143, 144, 142, 145, 146, 1,
+145, 1, 48, 49, 147, 148, 149, 150, 151, 152, 153, 154, 155, 156, 20, 95,
+2, 3, 49, 48, 48, 49, 157, 157, 158, 52, 158, 2, 1, 159, 121, 121,
+160, 120, 20, 42, 161, 162, 163, 84, 164, 35, 84, 127, 49, 84, 165, 49,
+52, 49, 49, 107, 54, 52, 49, 107, 52, 49, 107, 52, 49, 107, 12, 48,
+49, 9, 10, 110, 80, 61, 166, 12, 61, 62, 38, 48, 81, 167, 168, 48,
+48, 81, 81, 167, 127, 168, 48, 81, 168, 169, 20, 53, 50, 52, 169, 52,
+169, 49, 169, 20, 53, 52, 169, 53, 52, 52, 169, 52, 50, 52, 52, 169,
+53, 49, 50, 52, 49, 170, 20, 53, 50, 52, 170, 52, 170, 49, 170, 20,
+53, 52, 170, 53, 52, 52, 170, 52, 50, 52, 52, 170, 53, 49, 50, 52,
+49, 12, 36, 49, 48, 81, 127, 48, 81, 49, 108, 95, 39, 171, 52, 48,
+81, 172, 173, 29, 111, 49, 27, 174, 59]),
+arcTargets:
+new Uint16Array([
+1, 1, 2, 1, 4, 3, 6, 5, 8, 9, 10, 11, 13, 14, 13, 16,
+17, 17, 18, 17, 18, 20, 19, 19, 22, 23, 24, 25, 27, 28, 30, 31,
+31, 31, 33, 34, 35, 36, 36, 37, 36, 36, 36, 36, 38, 38, 36, 39,
+36, 40, 36, 37, 36, 36, 36, 42, 43, 43, 43, 45, 45, 45, 45, 45,
+45, 45, 45, 45, 45, 45, 45, 45, 47, 49, 50, 51, 52, 53, 54, 55,
+54, 52, 57, 58, 58, 59, 60, 61, 62, 64, 65, 66, 68, 68, 70, 70,
+70, 70, 70, 70, 70, 70, 71, 72, 70, 70, 74, 73, 76, 76, 76, 76,
+76, 76, 76, 76, 76, 78, 80, 82, 83, 83, 83, 85, 86, 87, 88, 89,
+90, 90, 88, 92, 92, 94, 95, 97, 98, 99, 100, 101, 102, 103, 101, 102,
+103, 104, 104, 101, 105, 102, 106, 107, 108, 109, 109, 105, 111, 112, 113, 115,
+114, 117, 116, 119, 121, 121, 122, 124, 125, 126, 126, 127, 129, 128, 131, 132,
+133, 134, 132, 132, 135, 135, 134, 137, 137, 138, 137, 137, 140, 140, 140, 141,
+141, 142, 142, 143, 145, 145, 145, 145, 145, 147, 148, 149, 150, 151, 152, 153,
+154, 155, 157, 158, 159, 160, 161, 162, 163, 161, 165, 166, 165, 168, 169, 170,
+171, 168, 172, 173, 174, 176, 177, 178, 180, 181, 180, 183, 184, 184, 185, 184,
+184, 185, 186, 186, 187, 188, 187, 189, 187, 191, 192, 194, 194, 196, 197, 198,
+198, 199, 201, 202, 203, 203, 204, 206, 207, 206, 209, 210, 210, 212, 211, 214,
+215, 216, 216, 218, 220, 221, 222, 224, 225, 226, 227, 228, 225, 229, 230, 231,
+230, 233, 234, 235, 235, 236, 237, 238, 240, 241, 243, 242, 242, 245, 246, 247,
+245, 247, 249, 250, 252, 252, 252, 252, 252, 252, 252, 252, 252, 252, 254, 255,
+257, 257, 259, 260, 260, 261, 262, 262, 264, 265, 264, 267, 268, 269, 270, 270,
+267, 272, 271, 271, 271, 271, 271, 274, 275, 276, 277, 278, 275, 280, 280, 282,
+283, 282, 285, 285, 286, 287, 288, 288, 287, 290, 290, 291, 290, 290, 293, 294,
+295, 297, 298, 299, 300, 301, 302, 301, 301, 301, 304, 305, 306, 307, 308, 309,
+310, 311, 312, 307, 313, 308, 314, 315, 308, 317, 318, 319, 320, 321, 322, 323,
+324, 325, 317, 326, 319, 323, 327, 319, 328, 321, 329, 330, 331, 323, 330, 332,
+319, 322, 333, 330, 329, 335, 336, 337, 338, 339, 340, 341, 342, 343, 335, 344,
+337, 341, 345, 337, 346, 339, 347, 348, 349, 341, 348, 350, 337, 340, 351, 348,
+347, 353, 355, 356, 357, 358, 359, 360, 361, 363, 364, 365, 367, 368, 367, 369,
+370, 372, 371, 374, 375, 375, 377, 378, 380]),
+labelTypes:
+new Uint16Array([
+0, 4, 317, 276, 1, 14, 15, 31, 54, 7, 9, 25, 1, 2, 3, 52,
+1, 1, 1, 1, 16, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 49, 55, 316, 19, 308, 1,
+11, 326, 22, 261, 12, 35, 271, 325, 297, 339, 296, 342, 329, 8, 10, 283,
+26, 266, 332, 36, 37, 38, 50, 39, 40, 41, 42, 43, 44, 45, 46, 48,
+260, 324, 292, 1, 309, 273, 327, 272, 20, 21, 27, 30, 29, 28, 1, 290,
+274, 299, 337, 333, 270, 279, 265, 281, 264, 286, 280, 320, 1, 284, 23, 328,
+0, 1, 340, 18, 330, 259, 268, 312, 293, 321, 269, 277, 315, 314, 343, 1,
+310, 51, 1, 300, 301, 285, 303, 302, 335, 275, 258, 1, 334, 267, 34, 262,
+33, 319, 13, 291, 282, 311, 295, 304, 298, 307, 263, 313, 278, 318, 322, 5,
+6, 17, 24, 47, 305, 306, 323, 289, 1, 331, 336, 338, 257, 32, 341]),
+firstSets:
+new Int32Array([
+-14, 4095, 0, 0, 0, 0, 524256, 0, 0, 0, 0, 0, 524272, 0, 0, 0,
+0, 0, 0, 65536, 0, 0, 0, 0, 2097136, 2097152, 0, 0, 0, 0, 2097136, 2097152,
+0, 0, 0, 0, 524256, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0,
+0, 2048, 0, 0, 0, 0, 0, 2048, 0, 0, 0, 0, 523776, 0, 0, 0,
+0, 0, 524032, 0, 0, 0, 0, 0, 0, 0, 65528, 0, 0, 0, 8388608, 0,
+0, 0, 0, 0, 0, 512, 0, 0, 0, 0, 0, 2080, 0, 0, 0, 0,
+0, 8, 0, 0, 0, 0, 0, 2088, 0, 0, 0, 0, 16, 0, 2131230720, 0,
+0, 0, 524256, 0, 0, 0, 0, 0, 0, 4088, 0, 0, 0, 0, 16777216, 0,
+0, 0, 0, 0, 0, 4, 0, 0, 0, 0, 0, 1024, 0, 0, 0, 0,
+0, 1024, 0, 0, 0, 0, 0, 1024, 0, 0, 0, 0, 2097152, 0, 0, 0,
+0, 0, 2097136, 2097152, 0, 0, 0, 0, 4096, 0, 0, 0, 0, 0, 4096, 0,
+0, 0, 0, 0, 4096, 0, 0, 0, 0, 0, 4096, 0, 0, 0, 0, 0,
+1048560, 0, 0, 0, 0, 0, 0, 0, 0, 131072, 0, 0, 524256, 0, 0, 0,
+0, 0, 2097136, 0, 0, 0, 0, 0, 1572832, 0, 0, 0, 0, 0, 524256, 0,
+0, 0, 0, 0, -14, 4095, 0, 65536, 0, 0, 260046848, 0, 0, 0, 0, 0,
+0, 32, 0, 0, 0, 0, 0, 256, 0, 0, 0, 0, 1073741824, 0, 0, 0,
+0, 0, 0, 8, 0, 0, 0, 0, 4096, 0, 0, 0, 0, 0, 4096, 0,
+0, 0, 0, 0, 536870912, 0, 0, 0, 0, 0, 268435456, 0, 0, 0, 0, 0,
+805306368, 0, 0, 0, 0, 0, 524288, 0, 0, 0, 0, 0, 524288, 0, 0, 0,
+0, 0, -2147483648, 0, 0, 0, 0, 0, 524272, 0, 0, 0, 0, 0, 524272, 0,
+0, 0, 0, 0, 512, 0, 0, 0, 0, 0, 4194304, 0, 0, 0, 0, 0,
+524032, 0, 0, 0, 0, 0, 0, 2, 0, 0, 0, 0, 67108864, 0, 0, 0,
+0, 0, 33554432, 0, 0, 0, 0, 0, 524256, 0, 0, 0, 0, 0, -16, 7,
+0, 0, 0, 0, 0, 65536, 0, 0, 0, 0, -16, 7, 0, 0, 0, 0,
+1048576, 0, 0, 0, 0, 0, -16, 4095, 0, 0, 0, 0, 1048560, 65536, 0, 0,
+0, 0, 1048560, 65536, 0, 0, 0, 0, -14, 7, 0, 0, 0, 0, 524256, 0,
+0, 0, 0, 0, 1048560, 0, 0, 0, 0, 0, 1048560, 0, 0, 0, 0, 0,
+1048560, 0, 0, 0, 0, 0, 2097136, 0, 0, 0, 0, 0, 2097136, 0, 0, 0,
+0, 0, 4096, 0, 0, 0, 0, 0, 1536, 0, 0, 16384, 0, 0, 0, 64,
+0, 0, 0, 0, 1052672, 2097152, 0, 0, 0, 0, 1052672, 2097152, 0, 0, 0, 0,
+4096, 0, 0, 0, 0, 0, 0, 16, 0, 0, 0, 0, 1048560, 0, 0, 0,
+0, 0, 0, 128, 0, 0, 0, 0, 524256, 0, 0, 0, 0, 0, 537919472, 0,
+0, 0, 0, 0, 134217728, 0, 0, 0, 0, 0, 134217728, 0, 0, 0, 0, 0]),
+firstSetWords: 6,
 keywords:
-{'False': 33,
- 'null': 9,
- 'True': 6,
+{'False': 18,
+ 'None': 16,
+ 'True': 17,
  'and': 47,
  'as': 108,
- 'assert': 24,
- 'break': 39,
- 'class': 13,
- 'continue': 40,
- 'debugger': 17,
- 'def': 4,
- 'del': 27,
+ 'assert': 32,
+ 'break': 23,
+ 'class': 41,
+ 'continue': 24,
+ 'debugger': 34,
+ 'def': 40,
+ 'del': 21,
  'elif': 130,
  'else': 127,
  'except': 113,
  'finally': 168,
- 'for': 34,
- 'from': 36,
- 'global': 26,
- 'if': 37,
- 'import': 32,
+ 'for': 37,
+ 'from': 29,
+ 'global': 30,
+ 'if': 35,
+ 'import': 28,
  'in': 83,
- 'is': 92,
- 'lambda': 14,
- 'nonlocal': 18,
- 'not': 8,
+ 'is': 94,
+ 'lambda': 19,
+ 'nonlocal': 31,
+ 'not': 4,
  'or': 139,
- 'pass': 28,
- 'print': 16,
- 'raise': 5,
- 'return': 23,
- 'try': 20,
- 'while': 21,
- 'with': 42,
- 'yield': 31},
-tokens:
-{0: 112,
- 1: 25,
- 2: 11,
- 3: 7,
- 4: 2,
- 5: 159,
- 6: 160,
- 7: 35,
- 8: 61,
- 9: 38,
- 10: 64,
- 11: 48,
- 12: 52,
- 13: 146,
- 14: 43,
- 15: 30,
- 16: 15,
- 17: 162,
- 18: 115,
- 19: 45,
- 20: 94,
- 21: 89,
- 22: 50,
- 23: 110,
- 24: 163,
- 25: 12,
- 26: 59,
- 27: 90,
- 28: 88,
- 29: 91,
- 30: 93,
- 31: 22,
- 32: 173,
- 33: 144,
- 34: 142,
- 35: 53,
- 36: 74,
- 37: 78,
- 38: 68,
- 39: 79,
- 40: 69,
- 41: 72,
- 42: 73,
- 43: 75,
- 44: 77,
- 45: 67,
- 46: 71,
- 47: 161,
- 48: 76,
- 49: 41,
- 50: 70,
- 51: 129,
- 52: 19,
- 54: 29,
- 55: 10},
+ 'pass': 22,
+ 'print': 33,
+ 'raise': 26,
+ 'return': 25,
+ 'try': 38,
+ 'while': 36,
+ 'with': 39,
+ 'yield': 27},
+tokenLabels:
+new Uint16Array([
+112, 12, 13, 14, 1, 159, 160, 9, 61, 10, 62, 48, 52, 146, 5, 6,
+20, 161, 115, 45, 88, 89, 50, 110, 162, 11, 64, 90, 93, 92, 91, 7,
+173, 144, 142, 53, 67, 68, 69, 71, 72, 73, 74, 75, 76, 77, 78, 163,
+79, 42, 70, 129, 15, 0, 8, 43]),
 start: 256
 };
@@ -736,6 +736,29 @@ Sk.abstr.objectFormat = function (obj, format_spec) {
     return result;
 };
 
+/**
+ * The JS string of format(obj, formatSpec), where formatSpec is a JS
+ * string, as needed for each replacement field of an f-string.  With an
+ * empty formatSpec, a str, int or float (but not an instance of a
+ * subclass, which might override __format__) formats as str(obj) does,
+ * so this skips looking up and calling __format__.
+ *
+ * @param {pyObject} obj
+ * @param {string} formatSpec
+ * @returns {string}
+ */
+Sk.abstr.objectFormatJs = function (obj, formatSpec) {
+    if (formatSpec === "") {
+        const type = obj.ob$type;
+        if (type === Sk.builtin.str) {
+            return obj.v;
+        } else if (type === Sk.builtin.int_ || type === Sk.builtin.float_) {
+            return obj.tp$str().v;
+        }
+    }
+    return Sk.abstr.objectFormat(obj, new Sk.builtin.str(formatSpec)).v;
+};
+
 /**
  * 
  * @param {pyObject} obj 
@@ -1040,6 +1063,38 @@ let fixReserved = (x) => {
     return x;
 };
 
+/**
+ * Define proto[name] to be the descriptor returned by make(), but only call
+ * make() when proto[name] is first looked up.  A given program looks up few
+ * of the many methods of the builtin types, so deferring the construction of
+ * their descriptors shortens start-up.  Assigning to proto[name] (or to the
+ * same name on an object inheriting from proto) behaves as for a plain data
+ * property.
+ *
+ * @param {Object} proto
+ * @param {string} name
+ * @param {function(): Object} make
+ */
+function defineLazyDescriptor(proto, name, make) {
+    const materialise = () => {
+        const descr = make();
+        Object.defineProperty(proto, name, { value: descr, writable: true, enumerable: true, configurable: true });
+        return descr;
+    };
+    Object.defineProperty(proto, name, {
+        get: materialise,
+        set(value) {
+            // Replace this accessor before assigning, so that later
+            // assignments (e.g. to "args" by every exception's constructor)
+            // are ordinary property stores rather than calls of it.
+            materialise();
+            this[name] = value;
+        },
+        enumerable: true,
+        configurable: true,
+    });
+}
+
 /**
  * @param {FunctionConstructor} klass 
  * @param {Object=} getsets 
@@ -1052,7 +1107,7 @@ Sk.abstr.setUpGetSets = function (klass, getsets) {
     getsets = getsets || klass_proto.tp$getsets || {};
     Object.entries(getsets).forEach(([getset_name, getset_def]) => {
         getset_def.$name = getset_name;
-        klass_proto[fixReserved(getset_name)] = new Sk.builtin.getset_descriptor(klass, getset_def);
+        defineLazyDescriptor(klass_proto, fixReserved(getset_name), () => new Sk.builtin.getset_descriptor(klass, getset_def));
     });
     Object.defineProperty(klass_proto, "tp$getsets", { value: null, writable: true });
 };
@@ -1070,7 +1125,7 @@ Sk.abstr.setUpMethods = function (klass, methods) {
     methods = methods || klass_proto.tp$methods || {};
     Object.entries(methods).forEach(([method_name, method_def]) => {
         method_def.$name = method_name;
-        klass_proto[fixReserved(method_name)] = new Sk.builtin.method_descriptor(klass, method_def);
+        defineLazyDescriptor(klass_proto, fixReserved(method_name), () => new Sk.builtin.method_descriptor(klass, method_def));
     });
     Object.defineProperty(klass_proto, "tp$methods", { value: null, writable: true });
 };
@@ -1088,7 +1143,7 @@ Sk.abstr.setUpClassMethods = function (klass, methods) {
     methods = methods || klass_proto.tp$classmethods || {};
     Object.entries(methods).forEach(([method_name, method_def]) => {
         method_def.$name = method_name;
-        klass_proto[fixReserved(method_name)] = new Sk.builtin.classmethod_descriptor(klass, method_def);
+        defineLazyDescriptor(klass_proto, fixReserved(method_name), () => new Sk.builtin.classmethod_descriptor(klass, method_def));
     });
     Object.defineProperty(klass_proto, "tp$classmethods", { value: null, writable: true });
 };
@@ -1205,7 +1260,7 @@ Sk.abstr.setUpSlots = function (klass, slots) {
         const slot_def = Sk.slots[dunder_name];
         // we do this here because in the generic.wrapperCall methods the wrapped_func
         // the wrapped func should have a $name property and a $flags property (for minArgs)
-        proto[dunder_name] = new Sk.builtin.wrapper_descriptor(klass, slot_def, wrapped_func);
+        defineLazyDescriptor(proto, dunder_name, () => new Sk.builtin.wrapper_descriptor(klass, slot_def, wrapped_func));
     }
 
     function set_up_slot(dunder_name, wrapped_func) {
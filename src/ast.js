@@ -298,7 +298,12 @@ function astForPytchYield(n) {
                                          Sk.astnodes.Load,
                                          l, c);
     var call = new Sk.astnodes.Call(attr, null, null, l, c);
-    return new Sk.astnodes.Expr(call, l, c);
+    var stmt = new Sk.astnodes.Expr(call, l, c);
+
+    // Mark the statement so later passes can tell it from a call the user
+    // wrote themselves.
+    stmt.$isPytchAutoYield = true;
+    return stmt;
 }
 
 function astForCompOp (c, n) {
@@ -3277,14 +3282,32 @@ function astForStmt (c, n) {
     }
 };
 
-Sk.astFromParse = function (n, filename, c_flags) {
-    var j;
+/**
+ * Append the AST of the given top-level stmt, or of each of its simple
+ * statements, to the given list.
+ */
+function astForTopLevelStmt (c, n, stmts) {
     var num;
+    var j;
+    REQ(n, SYM.stmt);
+    num = numStmts(n);
+    if (num === 1) {
+        stmts.push(astForStmt(c, n));
+    }
+    else {
+        n = CHILD(n, 0);
+        REQ(n, SYM.simple_stmt);
+        for (j = 0; j < num; ++j) {
+            stmts.push(astForStmt(c, CHILD(n, j * 2)));
+        }
+    }
+}
+
+Sk.astFromParse = function (n, filename, c_flags) {
     var ch;
     var i;
     var c = new Compiling("utf-8", filename, c_flags);
     var stmts = [];
-    var k = 0;
     switch (n.type) {
         case SYM.file_input:
             for (i = 0; i < NCH(n) - 1; ++i) {
@@ -3292,18 +3315,7 @@ Sk.astFromParse = function (n, filename, c_flags) {
                 if (ch.type === TOK.T_NEWLINE) {
                     continue;
                 }
-                REQ(ch, SYM.stmt);
-                num = numStmts(ch);
-                if (num === 1) {
-                    stmts[k++] = astForStmt(c, ch);
-                }
-                else {
-                    ch = CHILD(ch, 0);
-                    REQ(ch, SYM.simple_stmt);
-                    for (j = 0; j < num; ++j) {
-                        stmts[k++] = astForStmt(c, CHILD(ch, j * 2));
-                    }
-                }
+                astForTopLevelStmt(c, ch, stmts);
             }
             return new Sk.astnodes.Module(stmts);
         case SYM.eval_input:
@@ -3315,6 +3327,35 @@ Sk.astFromParse = function (n, filename, c_flags) {
     }
 };
 
+/**
+ * Parse the given source to the AST of a module, as Sk.astFromParse() of
+ * the result of Sk.parse() would, but converting each top-level statement
+ * as soon as it has been parsed, so that the CST of the whole module is
+ * never held at once.  As for Sk.parse(), firstLineno is the number of the
+ * first line of the source, if it is not the start of its file.
+ */
+Sk.parseToAst = function (filename, source, firstLineno) {
+    // (The parser never sets any flags.)
+    var c = new Compiling("utf-8", filename, 0);
+    var stmts = [];
+    var error = null;
+    Sk.parse(filename, source, function (n) {
+        if (error === null) {
+            try {
+                astForTopLevelStmt(c, n, stmts);
+            } catch (err) {
+                error = err;
+            }
+        }
+    }, firstLineno);
+    // Only now, so that an error from the parser comes first, as it does
+    // when the whole CST is built before converting any of it.
+    if (error !== null) {
+        throw error;
+    }
+    return new Sk.astnodes.Module(stmts);
+};
+
 Sk.astDump = function (node) {
     var spaces = function (n) // todo; blurgh
     {
@@ -3398,4 +3439,5 @@ Sk.astDump = function (node) {
 };
 
 Sk.exportSymbol("Sk.astFromParse", Sk.astFromParse);
+Sk.exportSymbol("Sk.parseToAst", Sk.parseToAst);
 Sk.exportSymbol("Sk.astDump", Sk.astDump);
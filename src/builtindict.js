@@ -544,6 +544,7 @@ function reassignGlobLoc(dict, obj) {
 
 
 Sk.setupObjects = function (py3) {
+    Sk.globalsVersion++;
     if (py3) {
         Sk.builtins["filter"] = Sk.builtin.filter_;
         Sk.builtins["map"] = Sk.builtin.map_;
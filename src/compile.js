@@ -28,6 +28,25 @@ function Compiler (filename, st, flags, canSuspend, sourceCodeForAnnotation) {
 
     this.allUnits = [];
 
+    // FunctionDef nodes known not to be able to suspend; see
+    // suspension_analysis.js.
+    this.nonSuspendingFunctions = new Set();
+
+    // Whether to emit source map markers in place of $currLineNo and
+    // $currColNo updates; see source_maps.js.
+    this.sourceMap = false;
+
+    // Whether any breakpoint check has been emitted, so the module needs
+    // the record for its file; see Sk.misceval.breakpointFile().
+    this.hasBreakpointChecks = false;
+
+    // With the "incrementalCompile" option, what was kept from the last
+    // compilation of the file, from Sk.incrementalCompilation.moduleAst(),
+    // and what else the code of its functions depends on; see
+    // codeObjectReuse().
+    this.incremental = null;
+    this.incrementalContext = null;
+
     this.source = sourceCodeForAnnotation ? sourceCodeForAnnotation.split("\n") : false;
 }
 
@@ -55,6 +74,9 @@ function CompilerUnit () {
     this.localtemps = [];
     this.tempsToSave = [];
 
+    // temporaries known to hold a Python bool (see _isKnownBool())
+    this.boolTemps = new Set();
+
     this.blocknum = 0;
     this.blocks = [];
     this.curblock = 0;
@@ -75,6 +97,20 @@ function CompilerUnit () {
     this.exceptBlocks = [];
     // state of where to go on a return
     this.finallyBlocks = [];
+    // number of enclosing "try" bodies
+    this.tryDepth = 0;
+
+    // with a source map: the index of this unit in allUnits, the Python
+    // location being compiled, and the location at the start of each block
+    // (flattened)
+    this.mapScopeIndex = -1;
+    this.mapLineno = 0;
+    this.mapColno = 0;
+    this.blockLocations = [];
+
+    // the code of this unit, and of those within it, if already compiled
+    // (see Compiler.prototype.codeObjectReuse)
+    this.precompiledCode = null;
 }
 
 CompilerUnit.prototype.activateScope = function () {
@@ -101,7 +137,11 @@ Compiler.prototype.annotateSource = function (ast) {
     var i;
     var col_offset;
     var lineno;
-    if (this.source) {
+    if (this.sourceMap) {
+        this.u.mapLineno = ast.lineno;
+        this.u.mapColno = ast.col_offset;
+        this._markLocation();
+    } else if (this.source) {
         lineno = ast.lineno;
         col_offset = ast.col_offset;
         out("\n//\n// line ", lineno, ":\n// ", this.getSourceLine(lineno), "\n// ");
@@ -115,6 +155,19 @@ Compiler.prototype.annotateSource = function (ast) {
     }
 };
 
+/**
+ * With a source map, emit a marker for the current Python location into
+ * the current block, unless the last one there was already for it.
+ */
+Compiler.prototype._markLocation = function () {
+    var block = this.u.blocks[this.u.curblock];
+    var marker = Sk.sourceMaps.locationMarker(this.u.mapLineno, this.u.mapColno);
+    if (block._mapMarker !== marker) {
+        out(marker);
+        block._mapMarker = marker;
+    }
+};
+
 Compiler.prototype.gensym = function (hint) {
     hint = hint || "";
     hint = "$" + hint;
@@ -212,20 +265,44 @@ Compiler.prototype._gr = function (hint, rest) {
     return v;
 };
 
+/**
+ * Emit code, before entering a loop, restarting the calibration of the
+ * countdown to the next clock read; see Sk.misceval.checkTimeLimits().
+ */
+Compiler.prototype.outputLoopEntry = function () {
+    var canYield = Sk.yieldLimit !== null && this.u.canSuspend;
+    if (Sk.clockCheckBudget && (Sk.execLimit !== null || canYield)) {
+        out("Sk.misceval.restartClockCheckStride();");
+    }
+};
+
 /**
  * Function to test if an interrupt should occur if the program has been running for too long.
  * This function is executed at every test/branch operation.
  */
 Compiler.prototype.outputInterruptTest = function () { // Added by RNL
     var output = "";
-    if (Sk.execLimit !== null || Sk.yieldLimit !== null && this.u.canSuspend) {
-        output += "var $dateNow = Date.now();";
-        if (Sk.execLimit !== null) {
-            output += "if ($dateNow - Sk.execStart > Sk.execLimit) {throw new Sk.builtin.TimeoutError(Sk.timeoutMsg())}";
-        }
-        if (Sk.yieldLimit !== null && this.u.canSuspend) {
-            output += "if (!$waking && ($dateNow - Sk.lastYield > Sk.yieldLimit)) {";
-            output += "var $susp = $saveSuspension({data: {type: 'Sk.yield'}, resume: function() {}}, '"+this.filename+"',$currLineNo,$currColNo);";
+    var canYield = Sk.yieldLimit !== null && this.u.canSuspend;
+    if (Sk.execLimit !== null || canYield) {
+        if (Sk.clockCheckBudget) {
+            // Only read the clock when the countdown runs out; see
+            // Sk.misceval.checkTimeLimits().
+            if (canYield) {
+                output += "if (--Sk.misceval.clockCheckCountdown < 0 && !$waking && Sk.misceval.checkTimeLimits(true)) {";
+            } else {
+                output += "if (--Sk.misceval.clockCheckCountdown < 0) {Sk.misceval.checkTimeLimits(false);}";
+            }
+        } else {
+            output += "var $dateNow = Date.now();";
+            if (Sk.execLimit !== null) {
+                output += "if ($dateNow - Sk.execStart > Sk.execLimit) {throw new Sk.builtin.TimeoutError(Sk.timeoutMsg())}";
+            }
+            if (canYield) {
+                output += "if (!$waking && ($dateNow - Sk.lastYield > Sk.yieldLimit)) {";
+            }
+        }
+        if (canYield) {
+            output += "var $susp = $saveSuspension({data: {type: 'Sk.yield'}, resume: function() {}}, '"+this.filename+"'," + this.outputCurrentLocation() + ");";
             output += "$susp.$blk = $blk;";
             output += "$susp.optional = true;";
             output += "return $susp;";
@@ -237,7 +314,43 @@ Compiler.prototype.outputInterruptTest = function () { // Added by RNL
     return output;
 };
 
+/**
+ * Output a breakpoint check for the given statement: if Sk.breakpoints()
+ * says so, make an optional suspension of the given type, resuming in a
+ * new block which becomes the current one.  Sk.breakpoints() is only
+ * called while the module's file is active (see
+ * Sk.misceval.breakpointFile()).
+ */
+Compiler.prototype.outputBreakpointCheck = function (s, suspType) {
+    var debugBlock = this.newBlock("debug breakpoint for line "+s.lineno);
+    out("if ($breakpointFile.active && Sk.breakpoints('"+this.filename+"',"+s.lineno+","+s.col_offset+")) {",
+        "var $susp = $saveSuspension({data: {type: '"+suspType+"'}, resume: function() {}}, '"+this.filename+"',"+s.lineno+","+s.col_offset+");",
+        "$susp.$blk = "+debugBlock+";",
+        "$susp.optional = true;",
+        "return $susp;",
+        "}");
+    this._jump(debugBlock);
+    this.setBlock(debugBlock);
+    this.u.doesSuspend = true;
+    this.hasBreakpointChecks = true;
+};
+
+/**
+ * Whether the given compiled expression is known to be a Python bool, so
+ * that testing it needs no call to Sk.misceval.isTrue().
+ */
+Compiler.prototype._isKnownBool = function (test) {
+    return (Sk.foldConstants
+            && (test === "Sk.builtin.bool.true$"
+                || test === "Sk.builtin.bool.false$"
+                || this.u.boolTemps.has(test)));
+};
+
 Compiler.prototype._jumpfalse = function (test, block) {
+    if (this._isKnownBool(test)) {
+        out("if(", test, "===Sk.builtin.bool.false$){/*test failed */$blk=", block, ";continue;}");
+        return;
+    }
     var cond = this._gr("jfalse", "(", test, "===false||!Sk.misceval.isTrue(", test, "))");
     out("if(", cond, "){/*test failed */$blk=", block, ";continue;}");
 };
@@ -251,10 +364,63 @@ Compiler.prototype._jumpnotundef = function (test, block) {
 };
 
 Compiler.prototype._jumptrue = function (test, block) {
+    if (this._isKnownBool(test)) {
+        out("if(", test, "===Sk.builtin.bool.true$){/*test passed */$blk=", block, ";continue;}");
+        return;
+    }
     var cond = this._gr("jtrue", "(", test, "===true||Sk.misceval.isTrue(", test, "))");
     out("if(", cond, "){/*test passed */$blk=", block, ";continue;}");
 };
 
+// JS operators computing the same as the Python operator, for operands
+// which are both floats, or both ints small enough to be JS numbers.
+var inlineNumberBinOps = {
+    "Add": "+",
+    "Sub": "-",
+    "Mult": "*",
+};
+
+var inlineNumberCompareOps = {
+    "Eq": "===",
+    "NotEq": "!==",
+    "Lt": "<",
+    "LtE": "<=",
+    "Gt": ">",
+    "GtE": ">=",
+};
+
+/**
+ * JS condition for whether the given compiled operands are both exact
+ * floats, or both exact ints whose values are JS numbers (not JSBI).
+ */
+function sameSimpleNumberType(left, right) {
+    return [left, ".constructor===", right, ".constructor&&(",
+            left, ".constructor===Sk.builtin.float_||",
+            left, ".constructor===Sk.builtin.int_&&typeof ", left, ".v===\"number\"&&typeof ", right, ".v===\"number\")"].join("");
+}
+
+/**
+ * Compile a binary operation on the given compiled operands.  For
+ * operators in inlineNumberBinOps, emit an inline fast path for when
+ * both operands are floats, or both ints with a result small enough to
+ * stay a JS number; otherwise call Sk.abstr.numberBinOp() (or
+ * numberInplaceBinOp()).
+ */
+Compiler.prototype._binop = function (hint, left, right, op, inplace) {
+    var opname = op.prototype._astname;
+    var generic = (inplace ? "Sk.abstr.numberInplaceBinOp(" : "Sk.abstr.numberBinOp(") + left + "," + right + ",'" + opname + "')";
+    var jsop = inlineNumberBinOps[opname];
+    if (!Sk.inlineNumberOps || jsop === undefined) {
+        return this._gr(hint, generic);
+    }
+    var value = left + ".v" + jsop + right + ".v";
+    var result = this._gr(hint, "null");
+    out("if(", sameSimpleNumberType(left, right), "&&(", left, ".constructor===Sk.builtin.float_||Sk.builtin.int_.withinThreshold(", value, "))){",
+        result, "=new ", left, ".constructor(", value, ");",
+        "}else{", result, "=", generic, ";}");
+    return result;
+};
+
 Compiler.prototype._jump = function (block) {
     if (this.u.blocks[this.u.curblock]._next === null) {
         out("$blk=", block, ";");
@@ -262,6 +428,34 @@ Compiler.prototype._jump = function (block) {
     }
 };
 
+/**
+ * The line and column being run, as JS arguments: with a source map,
+ * those where the current block starts.
+ */
+Compiler.prototype.outputCurrentLocation = function () {
+    if (this.sourceMap) {
+        var scope = this.u.mapScopeIndex;
+        return "$srcmap.blockLineno(" + scope + ",$blk),$srcmap.blockColno(" + scope + ",$blk)";
+    }
+    return "$currLineNo,$currColNo";
+};
+
+/**
+ * Code for a catch handler of the given unit to add the current frame to
+ * the traceback of "err".
+ *
+ * @param {CompilerUnit} unit
+ * @param {boolean=} resuming whether the handler is for errors while
+ * resuming a suspension
+ */
+Compiler.prototype.outputTracebackPush = function (unit, resuming) {
+    if (this.sourceMap) {
+        return ("err.traceback.push(Sk.sourceMaps.tracebackEntry(err,$srcmap," + unit.mapScopeIndex + ",$blk,'" +
+                this.filename + "',$exc.length>0" + (resuming ? ",true" : "") + "));");
+    }
+    return "err.traceback.push({lineno: $currLineNo, colno: $currColNo, filename: '"+this.filename+"'});";
+};
+
 /**
  * @param {Object=} e Object with keys 'lineno' and 'col_offset'
  */
@@ -269,11 +463,20 @@ Compiler.prototype._checkSuspension = function(e) {
     var retblk;
     if (this.u.canSuspend) {
 
+        if (this.sourceMap && e) {
+            // This is where a resumed frame will be reported to be.
+            this.u.mapLineno = e.lineno;
+            this.u.mapColno = e.col_offset;
+        }
         retblk = this.newBlock("function return or resume suspension");
         this._jump(retblk);
         this.setBlock(retblk);
 
-        e = e || {lineno: "$currLineNo", col_offset: "$currColNo"};
+        if (!e) {
+            e = (this.sourceMap
+                 ? {lineno: this.u.mapLineno, col_offset: this.u.mapColno}
+                 : {lineno: "$currLineNo", col_offset: "$currColNo"});
+        }
 
         out ("if ($ret && $ret.$isSuspension) { return $saveSuspension($ret,'"+this.filename+"',"+e.lineno+","+e.col_offset+"); }");
 
@@ -528,6 +731,7 @@ Compiler.prototype.ccompgen = function (type, tmpname, generators, genIndex, val
     var nexti;
     var n;
 
+    this.outputLoopEntry();
     this._jump(start);
     this.setBlock(start);
 
@@ -661,19 +865,36 @@ Compiler.prototype.ccompare = function (e) {
         } else if (op === Sk.astnodes.IsNot) {
             out("$ret = ", cur, "!==", rhs, ";");
         } else{
+            const jsop = Sk.inlineNumberOps ? inlineNumberCompareOps[op.prototype._astname] : undefined;
+            if (jsop !== undefined) {
+                out("if(", sameSimpleNumberType(cur, rhs), "){$ret=", cur, ".v", jsop, rhs, ".v;}else{");
+            }
             out("$ret = Sk.misceval.richCompareBool(", cur, ",", rhs, ",'", op.prototype._astname, "', true);");
+            if (jsop !== undefined) {
+                out("}");
+            }
             this._checkSuspension(e);
         }
-        out(fres, "=Sk.builtin.bool($ret);");
-        this._jumpfalse("$ret", done);
+        if (Sk.foldConstants) {
+            // $ret is a JS boolean here.
+            out(fres, "=$ret?Sk.builtin.bool.true$:Sk.builtin.bool.false$;");
+            out("if(!$ret){$blk=", done, ";continue;}");
+        } else {
+            out(fres, "=Sk.builtin.bool($ret);");
+            this._jumpfalse("$ret", done);
+        }
         cur = rhs;
     }
     this._jump(done);
     this.setBlock(done);
+    this.u.boolTemps.add(fres);
     return fres;
 };
 
 Compiler.prototype.ccall = function (e) {
+    if (e.func.constructor === Sk.astnodes.Attribute && Sk.cacheAttributes && Sk.fastMethodCalls) {
+        return this.cmethodcall(e);
+    }
     var func = this.vexpr(e.func);
     var kwarray = null;
     // Okay, here's the deal. We have some set of positional args
@@ -701,6 +922,42 @@ Compiler.prototype.ccall = function (e) {
     return this._gr("call", "$ret");
 };
 
+/**
+ * Compile a call "obj.name(...)".  When the site's attribute cache (see
+ * _loadAttr()) shows that "name" is a Python function found in the class
+ * of obj, and not shadowed by an instance attribute, call the function
+ * directly with obj prepended to the arguments, rather than creating a
+ * bound method object only for its tp$call() to unwrap it again.
+ * Otherwise, load the attribute and call it as normal.
+ */
+Compiler.prototype.cmethodcall = function (e) {
+    var attr = e.func;
+    var obj = this.vexpr(attr.value);
+    var mname = this._attrNameConstant(attr);
+    var cache = this._attrCache(mname);
+    var hit = Sk.countAttributeCacheHits ? "(++Sk.generic.attrCacheStats.hits," + obj + ")" : obj;
+    var self = this._gr("mself", "(", obj, ".ob$type===", cache, ".type&&", cache, ".version===", cache, ".cell.v&&",
+                        cache, ".isMethod&&", obj, ".$d.entries[", cache, ".hash]===undefined)?", hit, ":undefined");
+    out("$ret = (", self, "!==undefined)?", cache, ".descr:Sk.generic.getAttrCached(", obj, ",", mname, ",", cache, ",true);");
+    this._checkSuspension(attr);
+    this._checkAttrFound(obj, mname);
+    var func = this._gr("lattr", "$ret");
+
+    var positionalArgs = this.cunpackstarstoarray(e.args, !Sk.__future__.python3);
+    var keywordArgs = this.cunpackkwstoarray(e.keywords, func);
+    var argsWithSelf = (positionalArgs.charAt(0) === "[")
+        ? "[" + self + (positionalArgs === "[]" ? "" : ",") + positionalArgs.substring(1)
+        : "[" + self + "].concat(" + positionalArgs + ")";
+
+    out("$ret = (", self, "!==undefined)?", func, ".tp$call(", argsWithSelf, ",", keywordArgs, "):",
+        "(", func, ".tp$call)?", func, ".tp$call(", positionalArgs, ",", keywordArgs, ") : ",
+        "Sk.misceval.applyOrSuspend(", func, ",undefined,undefined,", keywordArgs, ",", positionalArgs, ");");
+
+    this._checkSuspension(e);
+
+    return this._gr("call", "$ret");
+};
+
 Compiler.prototype.cslice = function (s) {
     var step;
     var high;
@@ -791,24 +1048,41 @@ Compiler.prototype.cboolop = function (e) {
     end = this.newBlock("end of boolop");
     s = e.values;
     n = s.length;
+    var allBools = true;
     for (i = 0; i < n; ++i) {
         expres = this.vexpr(s[i]);
         if (i === 0) {
             retval = this._gr("boolopsucc", expres);
         }
         out(retval, "=", expres, ";");
+        allBools = allBools && this._isKnownBool(expres);
         jtype.call(this, expres, end);
     }
     this._jump(end);
     this.setBlock(end);
+    if (allBools) {
+        this.u.boolTemps.add(retval);
+    }
     return retval;
 };
 
 
+/**
+ * With the "fastFStrings" option, an f-string is compiled to one JS string
+ * concatenation of its literal parts and the JS strings of its formatted
+ * values (see Sk.abstr.objectFormatJs()), so that only the final str is
+ * made.  The values are formatted in order, each into a temp, as the
+ * formatting might call Python code.  (A JoinedStr can also be a bytes
+ * literal, which is left to sq$concat.)
+ */
 Compiler.prototype.cjoinedstr = function (e) {
     let ret;
     Sk.asserts.assert(e instanceof Sk.astnodes.JoinedStr);
 
+    if (Sk.fastFStrings && e.values.every(isFStringPart)) {
+        return this._gr("joinedstr", "new Sk.builtin.str(", this._joinedStrJs(e), ")");
+    }
+
     for (let s of e.values) {
         let v = this.vexpr(s);
         if (!ret) {
@@ -825,7 +1099,40 @@ Compiler.prototype.cjoinedstr = function (e) {
     return ret;
 };
 
-Compiler.prototype.cformattedvalue = function(e) {
+function isFStringPart(e) {
+    return (e instanceof Sk.astnodes.Str) || (e instanceof Sk.astnodes.FormattedValue);
+}
+
+/**
+ * A JS expression for the JS string of the given JoinedStr, all of whose
+ * parts are literal strs or FormattedValues.
+ */
+Compiler.prototype._joinedStrJs = function (e) {
+    const parts = [];
+    for (let s of e.values) {
+        if (s instanceof Sk.astnodes.Str) {
+            const text = s.s.$jsstr();
+            if (text !== "") {
+                parts.push(getJsLiteralForString(text));
+            }
+        } else {
+            Sk.asserts.assert(s instanceof Sk.astnodes.FormattedValue);
+            parts.push(this._formattedValueJs(s));
+        }
+    }
+    return (parts.length === 0) ? "\"\"" : parts.join("+");
+};
+
+/**
+ * A temp holding the JS string of the given FormattedValue.
+ */
+Compiler.prototype._formattedValueJs = function (e) {
+    let value = this._convertedValue(e);
+    let formatSpec = (e.format_spec ? this._joinedStrJs(e.format_spec) : "\"\"");
+    return this._gr("formatted", "Sk.abstr.objectFormatJs(", value, ",", formatSpec, ")");
+};
+
+Compiler.prototype._convertedValue = function (e) {
     let value = this.vexpr(e.value);
     switch (e.conversion) {
         case "s":
@@ -838,6 +1145,11 @@ Compiler.prototype.cformattedvalue = function(e) {
             value = this._gr("value", "Sk.builtin.repr(",value,")");
             break;
     }
+    return value;
+};
+
+Compiler.prototype.cformattedvalue = function(e) {
+    let value = this._convertedValue(e);
     let formatSpec = (e.format_spec ? this.vexpr(e.format_spec) : "Sk.builtin.str.$emptystr");
     return this._gr("formatted", "Sk.abstr.objectFormat("+value+","+formatSpec+")");
 };
@@ -877,7 +1189,7 @@ function getJsLiteralForString(s) {
  *                  (already vexpr'ed, so we can evaluate it once and reuse for both load and store ops)
  */
 Compiler.prototype.vexpr = function (e, data, augvar, augsubs) {
-    var mangled, mname;
+    var mname;
     var val;
     var result;
     var nStr; // used for preserving signs for floats (zeros)
@@ -890,9 +1202,13 @@ Compiler.prototype.vexpr = function (e, data, augvar, augsubs) {
         case Sk.astnodes.BoolOp:
             return this.cboolop(e);
         case Sk.astnodes.BinOp:
-            return this._gr("binop", "Sk.abstr.numberBinOp(", this.vexpr(e.left), ",", this.vexpr(e.right), ",'", e.op.prototype._astname, "')");
+            return this._binop("binop", this.vexpr(e.left), this.vexpr(e.right), e.op, false);
         case Sk.astnodes.UnaryOp:
-            return this._gr("unaryop", "Sk.abstr.numberUnaryOp(", this.vexpr(e.operand), ",'", e.op.prototype._astname, "')");
+            result = this._gr("unaryop", "Sk.abstr.numberUnaryOp(", this.vexpr(e.operand), ",'", e.op.prototype._astname, "')");
+            if (e.op === Sk.astnodes.Not) {
+                this.u.boolTemps.add(result);
+            }
+            return result;
         case Sk.astnodes.Lambda:
             return this.clambda(e);
         case Sk.astnodes.IfExp:
@@ -955,24 +1271,17 @@ Compiler.prototype.vexpr = function (e, data, augvar, augsubs) {
             if (e.ctx !== Sk.astnodes.AugLoad && e.ctx !== Sk.astnodes.AugStore) {
                 val = this.vexpr(e.value);
             }
-            mangled = e.attr["$r"]().v;
-            mangled = mangled.substring(1, mangled.length - 1);
-            mangled = mangleName(this.u.private_, new Sk.builtin.str(mangled)).v;
-            mname = this.makeConstant("new Sk.builtin.str('" + mangled + "')");
+            mname = this._attrNameConstant(e);
             switch (e.ctx) {
                 case Sk.astnodes.AugLoad:
-                    out("$ret = ", augvar, ".tp$getattr(", mname, ", true);");
+                    this._loadAttr(augvar, mname);
                     this._checkSuspension(e);
-                    out("\nif ($ret === undefined) {");
-                    out("\nthrow new Sk.builtin.AttributeError(", augvar, ".sk$attrError() + \" has no attribute '\" + ", mname,".$jsstr() + \"'\");");
-                    out("\n};");
+                    this._checkAttrFound(augvar, mname);
                     return this._gr("lattr", "$ret");
                 case Sk.astnodes.Load:
-                    out("$ret = ", val, ".tp$getattr(", mname, ", true);");
+                    this._loadAttr(val, mname);
                     this._checkSuspension(e);
-                    out("\nif ($ret === undefined) {");
-                    out("\nthrow new Sk.builtin.AttributeError(", val, ".sk$attrError() + \" has no attribute '\" + ", mname,".$jsstr() + \"'\");");
-                    out("\n};");
+                    this._checkAttrFound(val, mname);
                     return this._gr("lattr", "$ret");
                 case Sk.astnodes.AugStore:
                     // To be more correct, we shouldn't sattr() again if the in-place update worked.
@@ -980,12 +1289,12 @@ Compiler.prototype.vexpr = function (e, data, augvar, augsubs) {
                     // so this will never *not* execute. But it could, if Sk.abstr.numberInplaceBinOp were fixed.
                     out("$ret = undefined;");
                     out("if(", data, "!==undefined){");
-                    out("$ret = ",augvar, ".tp$setattr(", mname, ",", data, ", true);");
+                    this._storeAttr(augvar, mname, data);
                     out("}");
                     this._checkSuspension(e);
                     break;
                 case Sk.astnodes.Store:
-                    out("$ret = ", val, ".tp$setattr(", mname, ",", data, ", true);");
+                    this._storeAttr(val, mname, data);
                     this._checkSuspension(e);
                     break;
                 case Sk.astnodes.Del:
@@ -1125,7 +1434,7 @@ Compiler.prototype.caugassign = function (s) {
             auge = new Sk.astnodes.Attribute(e.value, e.attr, Sk.astnodes.AugLoad, e.lineno, e.col_offset);
             aug = this.vexpr(auge, undefined, to);
             val = this.vexpr(s.value);
-            res = this._gr("inplbinopattr", "Sk.abstr.numberInplaceBinOp(", aug, ",", val, ",'", s.op.prototype._astname, "')");
+            res = this._binop("inplbinopattr", aug, val, s.op, true);
             auge.ctx = Sk.astnodes.AugStore;
             return this.vexpr(auge, res, to);
         case Sk.astnodes.Subscript:
@@ -1135,13 +1444,13 @@ Compiler.prototype.caugassign = function (s) {
             auge = new Sk.astnodes.Subscript(e.value, augsub, Sk.astnodes.AugLoad, e.lineno, e.col_offset);
             aug = this.vexpr(auge, undefined, to, augsub);
             val = this.vexpr(s.value);
-            res = this._gr("inplbinopsubscr", "Sk.abstr.numberInplaceBinOp(", aug, ",", val, ",'", s.op.prototype._astname, "')");
+            res = this._binop("inplbinopsubscr", aug, val, s.op, true);
             auge.ctx = Sk.astnodes.AugStore;
             return this.vexpr(auge, res, to, augsub);
         case Sk.astnodes.Name:
             to = this.nameop(e.id, Sk.astnodes.Load);
             val = this.vexpr(s.value);
-            res = this._gr("inplbinop", "Sk.abstr.numberInplaceBinOp(", to, ",", val, ",'", s.op.prototype._astname, "')");
+            res = this._binop("inplbinop", to, val, s.op, true);
             return this.nameop(e.id, Sk.astnodes.Store, res);
         default:
             Sk.asserts.fail("unhandled case in augassign");
@@ -1157,6 +1466,11 @@ Compiler.prototype.exprConstant = function (e) {
             return Sk.misceval.isTrue(e.n) ? 1 : 0;
         case Sk.astnodes.Str:
             return Sk.misceval.isTrue(e.s) ? 1 : 0;
+        case Sk.astnodes.NameConstant:
+            if (Sk.foldConstants) {
+                return Sk.misceval.isTrue(e.value) ? 1 : 0;
+            }
+            return -1;
         case Sk.astnodes.Name:
         // todo; do __debug__ test here if opt
         default:
@@ -1164,16 +1478,52 @@ Compiler.prototype.exprConstant = function (e) {
     }
 };
 
+/**
+ * Compile the pytch.yield_until_next_frame() call inserted at the start of
+ * loop bodies in Pytch programs (see astForPytchYield() in ast.js).  If a
+ * Pytch thread is running and its active LoopIterationBatchingState has
+ * credits left, spend one directly; yield_until_next_frame() would only do
+ * the same.  Otherwise, fall back to the real call, which yields or, at
+ * module top level, counts loop iterations during import.
+ */
+Compiler.prototype.cpytchautoyield = function (s) {
+    var callblk = this.newBlock("pytch auto-yield call");
+    var doneblk = this.newBlock("after pytch auto-yield");
+    var state = this._gr("loopstate", "Sk.pytch.executing_thread");
+    out("if (", state, "==null || (", state, "=", state, ".active_loop_iteration_batching_state).credits===0) {",
+        "$blk=", callblk, "; continue;}");
+    out(state, ".credits-=1;");
+    this._jump(doneblk);
+    this.setBlock(callblk);
+    this.vexpr(s.value);
+    this._jump(doneblk);
+    this.setBlock(doneblk);
+};
+
 Compiler.prototype.newBlock = function (name) {
     var ret = this.u.blocknum++;
     this.u.blocks[ret] = [];
     this.u.blocks[ret]._name = name || "<unnamed>";
     this.u.blocks[ret]._next = null;
+    if (this.sourceMap) {
+        this.u.blocks[ret]._mapMarker = null;
+        this.u.blockLocations.push(this.u.mapLineno, this.u.mapColno);
+    }
     return ret;
 };
 Compiler.prototype.setBlock = function (n) {
     Sk.asserts.assert(n >= 0 && n < this.u.blocknum);
     this.u.curblock = n;
+    if (this.sourceMap) {
+        // Code for the current location may now be added to a block which
+        // was started elsewhere, and may follow any other code in the
+        // output; it needs its own marker.
+        if (this.u.blocks[n].length === 0) {
+            this.u.blockLocations[2 * n] = this.u.mapLineno;
+            this.u.blockLocations[2 * n + 1] = this.u.mapColno;
+        }
+        this._markLocation();
+    }
 };
 
 Compiler.prototype.pushBreakBlock = function (n) {
@@ -1245,15 +1595,28 @@ Compiler.prototype.outputLocals = function (unit) {
     return "";
 };
 
+/**
+ * The helpers with which a unit saves its state into a suspension, and
+ * restores it on resuming.
+ *
+ * With the "reuseSuspensionFrames" option, an activation which is resumed
+ * keeps the suspension it was resumed from in $suspFrame, and if it
+ * suspends again, refills that instead of making a new one, with a new
+ * resume closure and $tmps object.
+ */
 Compiler.prototype.outputSuspensionHelpers = function (unit) {
     var i, t;
     var localSaveCode = [];
     var localsToSave = unit.localnames.concat(unit.tempsToSave);
     var seenTemps = {};
     var hasCell = unit.ste.blockType === Sk.SYMTAB_CONSTS.FunctionBlock && unit.ste.childHasFree;
+    var reuseFrame = Sk.reuseSuspensionFrames && !Sk.debugging;
+    var resumeCode = "susp.resume=function(){"+unit.scopename+".$wakingSuspension=susp; return "+unit.scopename+"("+(unit.ste.generator?"$gen":"")+"); };";
     var output = (localsToSave.length > 0 ? ("var " + localsToSave.join(",") + ";") : "") +
+                 (reuseFrame ? "var $suspFrame;" : "") +
                  "var $wakeFromSuspension = function() {" +
                     "var susp = "+unit.scopename+".$wakingSuspension; "+unit.scopename+".$wakingSuspension = undefined;" +
+                    (reuseFrame ? "$suspFrame=susp;" : "") +
                     "$blk=susp.$blk; $loc=susp.$loc; $gbl=susp.$gbl; $exc=susp.$exc; $err=susp.$err; $postfinally=susp.$postfinally;" +
                     "$currLineNo=susp.$lineno; $currColNo=susp.$colno; Sk.lastYield=Date.now();" +
                     (hasCell?"$cell=susp.$cell;":"");
@@ -1266,12 +1629,14 @@ Compiler.prototype.outputSuspensionHelpers = function (unit) {
         }
     }
 
-    output +=  "try { $ret=susp.child.resume(); } catch(err) { if (!(err instanceof Sk.builtin.BaseException)) { err = new Sk.builtin.ExternalError(err); } err.traceback.push({lineno: $currLineNo, colno: $currColNo, filename: '"+this.filename+"'}); if($exc.length>0) { $err=err; $blk=$exc.pop(); } else { throw err; } }" +
+    output +=  "try { $ret=susp.child.resume(); } catch(err) { if (!(err instanceof Sk.builtin.BaseException)) { err = new Sk.builtin.ExternalError(err); } " + this.outputTracebackPush(unit, true) + " if($exc.length>0) { $err=err; $blk=$exc.pop(); } else { throw err; } }" +
                 "};";
 
     output += "var $saveSuspension = function($child, $filename, $lineno, $colno) {" +
-                "var susp = new Sk.misceval.Suspension(); susp.child=$child;" +
-                "susp.resume=function(){"+unit.scopename+".$wakingSuspension=susp; return "+unit.scopename+"("+(unit.ste.generator?"$gen":"")+"); };" +
+                (reuseFrame
+                 ? ("var susp=$suspFrame; if (susp===undefined) { susp=$suspFrame=new Sk.misceval.Suspension();" + resumeCode + "susp.$tmps={}; }")
+                 : ("var susp = new Sk.misceval.Suspension();" + resumeCode)) +
+                "susp.child=$child;" +
                 "susp.data=susp.child.data;susp.$blk=$blk;susp.$loc=$loc;susp.$gbl=$gbl;susp.$exc=$exc;susp.$err=$err;susp.$postfinally=$postfinally;" +
                 "susp.$filename=$filename;susp.$lineno=$lineno;susp.$colno=$colno;" +
                 "susp.optional=susp.child.optional;" +
@@ -1281,18 +1646,26 @@ Compiler.prototype.outputSuspensionHelpers = function (unit) {
     for (i = 0; i < localsToSave.length; i++) {
         t = localsToSave[i];
         if (seenTemps[t]===undefined) {
-            localSaveCode.push("\"" + t + "\":" + t);
+            localSaveCode.push(reuseFrame ? ("$tmps." + t + "=" + t + ";") : ("\"" + t + "\":" + t));
             seenTemps[t]=true;
         }
     }
-    output +=   "susp.$tmps={" + localSaveCode.join(",") + "};" +
-                "return susp;" +
+    if (reuseFrame) {
+        output += (localSaveCode.length > 0 ? "var $tmps=susp.$tmps;" + localSaveCode.join("") : "");
+    } else {
+        output += "susp.$tmps={" + localSaveCode.join(",") + "};";
+    }
+    output +=   "return susp;" +
               "};";
 
     return output;
 };
 
 Compiler.prototype.outputAllUnits = function () {
+    return this.outputUnits(this.allUnits);
+};
+
+Compiler.prototype.outputUnits = function (units) {
     var i;
     var blocks;
     var unit;
@@ -1300,8 +1673,15 @@ Compiler.prototype.outputAllUnits = function () {
     var ret = "";
     var block;
     var generatedBlocks;
-    for (j = 0; j < this.allUnits.length; ++j) {
-        unit = this.allUnits[j];
+    for (j = 0; j < units.length; ++j) {
+        unit = units[j];
+        if (unit.precompiledCode !== null) {
+            ret += unit.precompiledCode;
+            continue;
+        }
+        if (this.sourceMap) {
+            ret += Sk.sourceMaps.helperMarker;
+        }
         ret += unit.prefixCode;
         ret += this.outputLocals(unit);
         if (unit.doesSuspend) {
@@ -1309,6 +1689,9 @@ Compiler.prototype.outputAllUnits = function () {
         }
         ret += unit.varDeclsCode;
         ret += unit.switchCode;
+        if (this.sourceMap) {
+            ret += Sk.sourceMaps.scopeMarker(unit.mapScopeIndex);
+        }
         blocks = unit.blocks;
         generatedBlocks = Object.create(null);
         for (i = 0; i < blocks.length; ++i) {
@@ -1334,6 +1717,9 @@ Compiler.prototype.outputAllUnits = function () {
                 }
             }
         }
+        if (this.sourceMap) {
+            ret += Sk.sourceMaps.helperMarker;
+        }
         ret += unit.suffixCode;
     }
     return ret;
@@ -1389,21 +1775,12 @@ Compiler.prototype.cwhile = function (s) {
         }
     } else {
         top = this.newBlock("while test");
+        this.outputLoopEntry();
         this._jump(top);
         this.setBlock(top);
 
         if ((Sk.debugging || Sk.killableWhile) && this.u.canSuspend) {
-            var suspType = "Sk.delay";
-            var debugBlock = this.newBlock("debug breakpoint for line "+s.lineno);
-            out("if (Sk.breakpoints('"+this.filename+"',"+s.lineno+","+s.col_offset+")) {",
-                "var $susp = $saveSuspension({data: {type: '"+suspType+"'}, resume: function() {}}, '"+this.filename+"',"+s.lineno+","+s.col_offset+");",
-                "$susp.$blk = "+debugBlock+";",
-                "$susp.optional = true;",
-                "return $susp;",
-                "}");
-            this._jump(debugBlock);
-            this.setBlock(debugBlock);
-            this.u.doesSuspend = true;
+            this.outputBreakpointCheck(s, "Sk.delay");
         }
 
         next = this.newBlock("after while");
@@ -1411,7 +1788,9 @@ Compiler.prototype.cwhile = function (s) {
         body = this.newBlock("while body");
 
         this.annotateSource(s);
-        this._jumpfalse(this.vexpr(s.test), orelse ? orelse : next);
+        if (constant !== 1 || !Sk.foldConstants) {
+            this._jumpfalse(this.vexpr(s.test), orelse ? orelse : next);
+        }
         this._jump(body);
 
         this.pushBreakBlock(next);
@@ -1436,6 +1815,82 @@ Compiler.prototype.cwhile = function (s) {
     }
 };
 
+// Names whose calls can read the values of local variables.
+var localsReadingFunctions = new Set(["locals", "vars", "eval", "exec"]);
+
+/**
+ * If the given "for" statement is "for <name> in range(<args>)", return
+ * the range(...) call, whose loop can be lowered to count with JS
+ * numbers while "range" is the builtin.
+ */
+Compiler.prototype._nativeRangeCall = function (s) {
+    var call = s.iter;
+    if (!Sk.nativeRangeLoops
+        || !Sk.__future__.python3
+        || s.target.constructor !== Sk.astnodes.Name
+        || call.constructor !== Sk.astnodes.Call
+        || call.func.constructor !== Sk.astnodes.Name
+        || call.func.id.v !== "range"
+        || (call.keywords && call.keywords.length > 0)
+        || call.args.length < 1 || call.args.length > 3
+        || call.args.some((arg) => arg.constructor === Sk.astnodes.Starred)) {
+        return null;
+    }
+    return call;
+};
+
+/**
+ * Whether nothing can see the loop variable of the given "for" statement
+ * while its body runs, so a native range loop need only store it (as an
+ * int) when the loop ends.  It must be a plain local, not mentioned in
+ * the body, and no exception from the body can be caught in this scope.
+ */
+Compiler.prototype._loopTargetUnobserved = function (s) {
+    var name = s.target.id.v;
+    var mangled = fixReserved(mangleName(this.u.private_, s.target.id).v);
+    var mentioned = function (node) {
+        if (node == null || typeof node !== "object") {
+            return false;
+        }
+        if (Array.isArray(node)) {
+            return node.some(mentioned);
+        }
+        if (node.constructor === Sk.astnodes.Name) {
+            return node.id.v === name || localsReadingFunctions.has(node.id.v);
+        }
+        if (node._fields != null) {
+            for (var i = 1; i < node._fields.length; i += 2) {
+                if (mentioned(node._fields[i](node))) {
+                    return true;
+                }
+            }
+        }
+        return false;
+    };
+    return (!Sk.debugging
+            && this.u.ste.blockType === Sk.SYMTAB_CONSTS.FunctionBlock
+            && !this.u.ste.generator
+            && this.u.ste.getScope(mangled) === Sk.SYMTAB_CONSTS.LOCAL
+            && this.u.tryDepth === 0
+            && this.u.finallyBlocks.length === 0
+            && !mentioned(s.body));
+};
+
+// A variable for loop state which must survive suspensions.
+Compiler.prototype._loopStateVar = function (hint, value) {
+    var v;
+    if (this.u.ste.generator) {
+        // if we're in a generator, we have to store the state to a local
+        // so it's preserved (as we cross blocks here and assume it survives)
+        v = "$loc." + this.gensym(hint);
+        out(v, "=", value, ";");
+    } else {
+        v = this._gr(hint, value);
+        this.u.tempsToSave.push(v); // Save it across suspensions
+    }
+    return v;
+};
+
 Compiler.prototype.cfor = function (s) {
     var target;
     var nexti;
@@ -1445,46 +1900,70 @@ Compiler.prototype.cfor = function (s) {
     var cleanup = this.newBlock("for cleanup");
     var end = this.newBlock("for end");
 
-    this.pushBreakBlock(end);
+    // For "for i in range(...)", rangeLoop holds the state of a native
+    // counting loop if "range" is the builtin, or undefined if the range
+    // object must be made and iterated over as usual.  If nothing can see
+    // the loop variable during the loop, it is only stored at the end.
+    var rangeCall = this._nativeRangeCall(s);
+    var rangeLoop = null;
+    var storeAtEnd = (rangeCall !== null && this._loopTargetUnobserved(s));
+    var storeLast;
+    var afterBreak;
+
+    if (storeAtEnd) {
+        afterBreak = this.newBlock("for break");
+        this.pushBreakBlock(afterBreak);
+    } else {
+        this.pushBreakBlock(end);
+    }
     this.pushContinueBlock(start);
 
     // get the iterator
-    toiter = this.vexpr(s.iter);
-    if (this.u.ste.generator) {
-        // if we're in a generator, we have to store the iterator to a local
-        // so it's preserved (as we cross blocks here and assume it survives)
-        iter = "$loc." + this.gensym("iter");
-        out(iter, "=Sk.abstr.iter(", toiter, ");");
+    if (rangeCall !== null) {
+        var rangeFunc = this.vexpr(rangeCall.func);
+        var rangeArgs = "[" + rangeCall.args.map((arg) => this.vexpr(arg)).join(",") + "]";
+        rangeLoop = this._loopStateVar("rangeloop", "Sk.builtin.range_.nativeLoop(" + rangeFunc + "," + rangeArgs + ")");
+        out("$ret = (", rangeLoop, "===undefined)?Sk.misceval.callsimOrSuspendArray(", rangeFunc, ",", rangeArgs, "):undefined;");
+        this._checkSuspension(rangeCall);
+        iter = this._loopStateVar("iter", "(" + rangeLoop + "===undefined)?Sk.abstr.iter($ret):undefined");
     } else {
-        iter = this._gr("iter", "Sk.abstr.iter(", toiter, ")");
-        this.u.tempsToSave.push(iter); // Save it across suspensions
+        toiter = this.vexpr(s.iter);
+        iter = this._loopStateVar("iter", "Sk.abstr.iter(" + toiter + ")");
     }
 
+    this.outputLoopEntry();
     this._jump(start);
 
     this.setBlock(start);
 
     // load targets
-    out ("$ret = Sk.abstr.iternext(", iter,(this.u.canSuspend?", true":", false"),");");
+    if (rangeLoop !== null) {
+        out("$ret = (", rangeLoop, "!==undefined)?(", rangeLoop, ".advance()?",
+            (storeAtEnd ? "true" : "new Sk.builtin.int_(" + rangeLoop + ".last)"), ":undefined):",
+            "Sk.abstr.iternext(", iter, (this.u.canSuspend?", true":", false"), ");");
+    } else {
+        out ("$ret = Sk.abstr.iternext(", iter,(this.u.canSuspend?", true":", false"),");");
+    }
 
     this._checkSuspension(s);
 
     nexti = this._gr("next", "$ret");
     this._jumpundef(nexti, cleanup); // todo; this should be handled by StopIteration
-    target = this.vexpr(s.target, nexti);
+    if (storeAtEnd) {
+        out("if (", rangeLoop, "===undefined) {");
+        target = this.vexpr(s.target, nexti);
+        out("}");
+        storeLast = () => {
+            out("if (", rangeLoop, "!==undefined&&", rangeLoop, ".last!==undefined) {");
+            this.vexpr(s.target, "new Sk.builtin.int_(" + rangeLoop + ".last)");
+            out("}");
+        };
+    } else {
+        target = this.vexpr(s.target, nexti);
+    }
 
     if ((Sk.debugging || Sk.killableFor) && this.u.canSuspend) {
-        var suspType = "Sk.delay";
-        var debugBlock = this.newBlock("debug breakpoint for line "+s.lineno);
-        out("if (Sk.breakpoints('"+this.filename+"',"+s.lineno+","+s.col_offset+")) {",
-            "var $susp = $saveSuspension({data: {type: '"+suspType+"'}, resume: function() {}}, '"+this.filename+"',"+s.lineno+","+s.col_offset+");",
-            "$susp.$blk = "+debugBlock+";",
-            "$susp.optional = true;",
-            "return $susp;",
-            "}");
-        this._jump(debugBlock);
-        this.setBlock(debugBlock);
-        this.u.doesSuspend = true;
+        this.outputBreakpointCheck(s, "Sk.delay");
     }
 
     // execute body
@@ -1493,10 +1972,19 @@ Compiler.prototype.cfor = function (s) {
     // jump to top of loop
     this._jump(start);
 
+    if (storeAtEnd) {
+        this.setBlock(afterBreak);
+        storeLast();
+        this._jump(end);
+    }
+
     this.setBlock(cleanup);
     this.popContinueBlock();
     this.popBreakBlock();
 
+    if (storeAtEnd) {
+        storeLast();
+    }
     this.vseqstmt(s.orelse);
     this._jump(end);
 
@@ -1537,13 +2025,21 @@ Compiler.prototype.craise = function (s) {
         // TODO TODO TODO set cause appropriately
         // (and perhaps traceback for py2 if we care before it gets fully deprecated)
 
-        out("if (", exc, " instanceof Sk.builtin.BaseException) {throw ",exc,";} else {throw new Sk.builtin.TypeError('exceptions must derive from BaseException');};");
+        out("if (", exc, " instanceof Sk.builtin.BaseException) {", this.outputCaptureStack(exc), "throw ",exc,";} else {throw new Sk.builtin.TypeError('exceptions must derive from BaseException');};");
     } else {
         // re-raise
-        out("throw $err;");
+        out(this.outputCaptureStack("$err"), "throw $err;");
     }
 };
 
+/**
+ * With a source map, code to have an exception about to be raised record
+ * the stack as it is now, for its traceback entries.
+ */
+Compiler.prototype.outputCaptureStack = function (exc) {
+    return this.sourceMap ? "Sk.sourceMaps.captureStack(" + exc + ");" : "";
+};
+
 Compiler.prototype.outputFinallyCascade = function (thisFinally) {
     var nextFinally;
 
@@ -1628,7 +2124,9 @@ Compiler.prototype.ctry = function (s) {
     if (handlers.length != 0) {
         this.setupExcept(handlers[0]);
     }
+    this.u.tryDepth++;
     this.vseqstmt(s.body);
+    this.u.tryDepth--;
     if (handlers.length != 0) {
         this.endExcept();
     }
@@ -1649,7 +2147,7 @@ Compiler.prototype.ctry = function (s) {
             // var isinstance = this.nameop(new Sk.builtin.str("isinstance"), Load));
             // var check = this._gr('call', "Sk.misceval.callsimArray(", isinstance, ", [$err, ", handlertype, "])");
 
-            check = this._gr("instance", "Sk.misceval.isTrue(Sk.builtin.isinstance($err, ", handlertype, "))");
+            check = this._gr("instance", "Sk.misceval.exceptionMatches($err, ", handlertype, ")");
             this._jumpfalse(check, next);
         }
 
@@ -1957,7 +2455,12 @@ Compiler.prototype.buildcodeobj = function (n, coname, decorator_list, args, cal
     //
     // enter the new scope, and create the first block
     //
-    scopename = this.enterScope(coname, n, n.lineno, this.canSuspend);
+    scopename = this.enterScope(coname, n, n.lineno, this.canSuspend && !this.nonSuspendingFunctions.has(n));
+
+    const reuse = this.codeObjectReuse(n, class_for_super);
+    if (reuse !== null && reuse.code !== null) {
+        scopename = this.u.scopename = reuse.code.scopename;
+    }
 
     isGenerator = this.u.ste.generator;
     hasFree = this.u.ste.hasFree;
@@ -2157,13 +2660,18 @@ Compiler.prototype.buildcodeobj = function (n, coname, decorator_list, args, cal
     this.u.switchCode = "while(true){try{";
     this.u.switchCode += this.outputInterruptTest();
     this.u.switchCode += "switch($blk){";
-    this.u.suffixCode = "} }catch(err){ if (!(err instanceof Sk.builtin.BaseException)) { err = new Sk.builtin.ExternalError(err); } err.traceback.push({lineno: $currLineNo, colno: $currColNo, filename: '"+this.filename+"'}); if ($exc.length>0) { $err = err; $blk=$exc.pop(); continue; } else { throw err; }} }});";
+    this.u.suffixCode = "} }catch(err){ if (!(err instanceof Sk.builtin.BaseException)) { err = new Sk.builtin.ExternalError(err); } " + this.outputTracebackPush(this.u) + " if ($exc.length>0) { $err = err; $blk=$exc.pop(); continue; } else { throw err; }} }});";
 
     //
     // jump back to the handler so it can do the main actual work of the
-    // function
+    // function, unless that is already done
     //
-    callback.call(this, scopename);
+    if (reuse !== null && reuse.code !== null) {
+        this.u.precompiledCode = reuse.code.text;
+        this.hasBreakpointChecks = this.hasBreakpointChecks || reuse.code.hasBreakpointChecks;
+    } else {
+        callback.call(this, scopename);
+    }
 
     //
     // get a list of all the argument names (used to attach to the code
@@ -2185,6 +2693,9 @@ Compiler.prototype.buildcodeobj = function (n, coname, decorator_list, args, cal
     // and exit the code object scope
     //
     this.exitScope();
+    if (reuse !== null && reuse.code === null) {
+        this.keepCode(reuse, scopename);
+    }
 
     //
     // attach the default values we evaluated at the beginning to the code
@@ -2438,6 +2949,7 @@ Compiler.prototype.cgenexpgen = function (generators, genIndex, elt) {
         iter = "$loc." + this.gensym("iter");
         out(iter, "=", "Sk.abstr.iter(", toiter, ");");
     }
+    this.outputLoopEntry();
     this._jump(start);
     this.setBlock(start);
 
@@ -2528,7 +3040,7 @@ Compiler.prototype.cclass = function (s) {
     this.u.switchCode += "while(true){try{";
     this.u.switchCode += this.outputInterruptTest();
     this.u.switchCode += "switch($blk){";
-    this.u.suffixCode = "}}catch(err){ if (!(err instanceof Sk.builtin.BaseException)) { err = new Sk.builtin.ExternalError(err); } err.traceback.push({lineno: $currLineNo, colno: $currColNo, filename: '"+this.filename+"'}); if ($exc.length>0) { $err = err; $blk=$exc.pop(); continue; } else { throw err; }}}";
+    this.u.suffixCode = "}}catch(err){ if (!(err instanceof Sk.builtin.BaseException)) { err = new Sk.builtin.ExternalError(err); } " + this.outputTracebackPush(this.u) + " if ($exc.length>0) { $err = err; $blk=$exc.pop(); continue; } else { throw err; }}}";
     this.u.suffixCode += "}).call(null, $cell);});";
 
     this.u.private_ = s.name;
@@ -2592,22 +3104,12 @@ Compiler.prototype.vstmt = function (s, class_for_super) {
     var i;
     var val;
     var n;
-    var debugBlock;
     this.u.lineno = s.lineno;
     this.u.linenoSet = false;
     this.u.localtemps = [];
 
     if (Sk.debugging && this.u.canSuspend) {
-        debugBlock = this.newBlock("debug breakpoint for line "+s.lineno);
-        out("if (Sk.breakpoints('"+this.filename+"',"+s.lineno+","+s.col_offset+")) {",
-            "var $susp = $saveSuspension({data: {type: 'Sk.debug'}, resume: function() {}}, '"+this.filename+"',"+s.lineno+","+s.col_offset+");",
-            "$susp.$blk = " + debugBlock + ";",
-            "$susp.optional = true;",
-            "return $susp;",
-            "}");
-        this._jump(debugBlock);
-        this.setBlock(debugBlock);
-        this.u.doesSuspend = true;
+        this.outputBreakpointCheck(s, "Sk.debug");
     }
 
     this.annotateSource(s);
@@ -2669,7 +3171,11 @@ Compiler.prototype.vstmt = function (s, class_for_super) {
         case Sk.astnodes.Global:
             break;
         case Sk.astnodes.Expr:
-            this.vexpr(s.value);
+            if (s.$isPytchAutoYield) {
+                this.cpytchautoyield(s);
+            } else {
+                this.vexpr(s.value);
+            }
             break;
         case Sk.astnodes.Pass:
             break;
@@ -2801,12 +3307,14 @@ Compiler.prototype.nameop = function (name, ctx, dataToStore) {
             switch (ctx) {
                 case Sk.astnodes.Load:
                     // can't be || for loc.x = 0 or null
-                    return this._gr("loadname", mangled, "!==undefined?", mangled, ":Sk.misceval.loadname('", mangledNoPre, "',$gbl);");
+                    return this._gr("loadname", mangled, "!==undefined?", mangled, ":", this._loadGlobal(mangledNoPre), ";");
                 case Sk.astnodes.Store:
                     out(mangled, "=", dataToStore, ";");
+                    this._bumpGlobalsVersion();
                     break;
                 case Sk.astnodes.Del:
                     out("delete ", mangled, ";");
+                    this._bumpGlobalsVersion();
                     break;
                 case Sk.astnodes.Param:
                     return mangled;
@@ -2817,12 +3325,14 @@ Compiler.prototype.nameop = function (name, ctx, dataToStore) {
         case OP_GLOBAL:
             switch (ctx) {
                 case Sk.astnodes.Load:
-                    return this._gr("loadgbl", "Sk.misceval.loadname('", mangledNoPre, "',$gbl)");
+                    return this._gr("loadgbl", this._loadGlobal(mangledNoPre));
                 case Sk.astnodes.Store:
                     out("$gbl.", mangledNoPre, "=", dataToStore, ";");
+                    out("Sk.globalsVersion++;");
                     break;
                 case Sk.astnodes.Del:
-                    out("delete $gbl.", mangledNoPre);
+                    out("delete $gbl.", mangledNoPre, ";");
+                    out("Sk.globalsVersion++;");
                     break;
                 default:
                     Sk.asserts.fail("unhandled case in name op_global");
@@ -2846,6 +3356,104 @@ Compiler.prototype.nameop = function (name, ctx, dataToStore) {
     }
 };
 
+/**
+ * JS expression looking up the given (mangled) name in the globals and
+ * then the builtins.  With the "cacheGlobalLoads" option, the result is
+ * kept in a cache shared by all loads of that name in the current scope,
+ * and re-used while Sk.globalsVersion is unchanged.
+ */
+Compiler.prototype._loadGlobal = function (name) {
+    if (!Sk.cacheGlobalLoads) {
+        return "Sk.misceval.loadname('" + name + "',$gbl)";
+    }
+    var cache = this.makeConstant("Sk.misceval.newGlobalCache('" + name + "')");
+    return ("(" + cache + ".version===Sk.globalsVersion?" + cache + ".value:"
+            + "Sk.misceval.loadnameCached('" + name + "',$gbl," + cache + "))");
+};
+
+/**
+ * Emit code noting a change to a module's globals, if the current scope's
+ * names are globals.  Class bodies have their own namespace.
+ */
+Compiler.prototype._bumpGlobalsVersion = function () {
+    if (this.u.ste.blockType === Sk.SYMTAB_CONSTS.ModuleBlock) {
+        out("Sk.globalsVersion++;");
+    }
+};
+
+/**
+ * Make (or re-use) the constant holding the mangled name of the given
+ * Attribute node's attribute, as a Python str.
+ */
+Compiler.prototype._attrNameConstant = function (e) {
+    var mangled = e.attr["$r"]().v;
+    mangled = mangled.substring(1, mangled.length - 1);
+    mangled = mangleName(this.u.private_, new Sk.builtin.str(mangled)).v;
+    return this.makeConstant("new Sk.builtin.str('" + mangled + "')");
+};
+
+/**
+ * Emit code throwing AttributeError if the attribute load just done
+ * found nothing.
+ */
+Compiler.prototype._checkAttrFound = function (obj, mname) {
+    out("\nif ($ret === undefined) {");
+    out("\nthrow new Sk.builtin.AttributeError(", obj, ".sk$attrError() + \" has no attribute '\" + ", mname,".$jsstr() + \"'\");");
+    out("\n};");
+};
+
+/**
+ * Make a new inline cache for one attribute access site; unlike
+ * makeConstant(), never shared with other sites.
+ */
+Compiler.prototype._attrCache = function (mname) {
+    var cache = this.u.scopename + "." + this.gensym("attrcache");
+    this.u.consts[cache] = "Sk.generic.newAttrCache(" + mname + ")";
+    return cache;
+};
+
+// JS condition which holds when the given cache is valid for the given
+// object and the object's instance dict has the attribute, leaving its
+// dict entry in $ret.
+function attrCacheHitTest(obj, cache) {
+    return (obj + ".ob$type===" + cache + ".type&&" + cache + ".version===" + cache + ".cell.v&&"
+            + cache + ".inDict&&($ret=" + obj + ".$d.entries[" + cache + ".hash])!==undefined");
+}
+
+/**
+ * Emit code setting $ret to the value of the attribute, or undefined if
+ * there is no such attribute (or a suspension).  With the
+ * "cacheAttributes" option, the site's inline cache gives instance dict
+ * attributes without calling tp$getattr(); see Sk.generic.getAttrCached.
+ */
+Compiler.prototype._loadAttr = function (obj, mname) {
+    if (!Sk.cacheAttributes) {
+        out("$ret = ", obj, ".tp$getattr(", mname, ", true);");
+        return;
+    }
+    var cache = this._attrCache(mname);
+    var hit = Sk.countAttributeCacheHits ? "(++Sk.generic.attrCacheStats.hits,$ret[1])" : "$ret[1]";
+    out("$ret = (", attrCacheHitTest(obj, cache), ")?", hit,
+        ":Sk.generic.getAttrCached(", obj, ",", mname, ",", cache, ",true);");
+};
+
+/**
+ * Emit code storing the given value as the attribute, leaving $ret as
+ * undefined or a suspension.  With the "cacheAttributes" option, the
+ * site's inline cache allows replacing an existing instance dict entry
+ * directly; see Sk.generic.setAttrCached.
+ */
+Compiler.prototype._storeAttr = function (obj, mname, data) {
+    if (!Sk.cacheAttributes) {
+        out("$ret = ", obj, ".tp$setattr(", mname, ",", data, ", true);");
+        return;
+    }
+    var cache = this._attrCache(mname);
+    var count = Sk.countAttributeCacheHits ? "++Sk.generic.attrCacheStats.hits;" : "";
+    out("if(", attrCacheHitTest(obj, cache), "){", count, "$ret[1]=", data, ";$ret=undefined;}",
+        "else{$ret = Sk.generic.setAttrCached(", obj, ",", mname, ",", data, ",", cache, ",true);}");
+};
+
 /**
  * @param {Sk.builtin.str} name
  * @param {Object} key
@@ -2859,6 +3467,7 @@ Compiler.prototype.enterScope = function (name, key, lineno, canSuspend) {
     u.name = name;
     u.firstlineno = lineno;
     u.canSuspend = canSuspend || false;
+    u.mapLineno = lineno;
 
     if (this.u && this.u.private_) {
         u.private_ = this.u.private_;
@@ -2866,6 +3475,7 @@ Compiler.prototype.enterScope = function (name, key, lineno, canSuspend) {
 
     this.stack.push(this.u);
     this.allUnits.push(u);
+    u.mapScopeIndex = this.allUnits.length - 1;
     scopeName = this.gensym("scope");
     u.scopename = scopeName;
 
@@ -2877,6 +3487,70 @@ Compiler.prototype.enterScope = function (name, key, lineno, canSuspend) {
     return scopeName;
 };
 
+/**
+ * With the "incrementalCompile" option, for a function just entered by
+ * buildcodeobj() which Sk.incrementalCompilation.moduleAst() found to be a
+ * unit: what its code depends on ("key"), and its code as kept from an
+ * earlier compilation if that depended on the same ("code", otherwise
+ * null).  That code is then used in place of compiling the function's
+ * body.  Otherwise null.
+ *
+ * The key covers the function's position in the file, the names its code
+ * is compiled with (as for private name mangling and super()), and what
+ * the code depends on from outside the function's text (see
+ * Sk.incrementalCompilation.functionSignature()).
+ */
+Compiler.prototype.codeObjectReuse = function (n, class_for_super) {
+    if (this.incremental === null) {
+        return null;
+    }
+    const unit = this.incremental.functionUnits.get(n);
+    if (unit === undefined) {
+        return null;
+    }
+    const key = [
+        this.incrementalContext,
+        n.lineno,
+        n.col_offset,
+        this.u.private_ === null ? "" : this.u.private_.v,
+        class_for_super ? class_for_super.v : "",
+        this.u.canSuspend,
+        Sk.incrementalCompilation.functionSignature(n, this.st, this.nonSuspendingFunctions),
+    ].join("\n");
+    const code = (unit.code !== null && unit.code.key === key) ? unit.code : null;
+    const reuse = {
+        unit: unit,
+        key: key,
+        code: code,
+        firstUnit: this.allUnits.length - 1,
+        hadBreakpointChecks: this.hasBreakpointChecks,
+    };
+    if (code === null) {
+        // (To find whether this function's code has any.)
+        this.hasBreakpointChecks = false;
+    }
+    return reuse;
+};
+
+/**
+ * Keep the code just compiled for the function found by
+ * codeObjectReuse(), for later compilations, and use it as is in this one.
+ */
+Compiler.prototype.keepCode = function (reuse, scopename) {
+    const units = this.allUnits.splice(reuse.firstUnit);
+    const code = {
+        key: reuse.key,
+        scopename: scopename,
+        text: this.outputUnits(units),
+        hasBreakpointChecks: this.hasBreakpointChecks,
+    };
+    units[0].precompiledCode = code.text;
+    this.allUnits.push(units[0]);
+    reuse.unit.code = code;
+    this.incremental.file.gensymHighWater = Sk.gensymcount;
+    this.hasBreakpointChecks = this.hasBreakpointChecks || reuse.hadBreakpointChecks;
+};
+
 Compiler.prototype.exitScope = function () {
     var mangled;
     var prev = this.u;
@@ -2996,7 +3670,7 @@ Compiler.prototype.cmod = function (mod) {
     this.u.switchCode += this.outputInterruptTest();
     this.u.switchCode += "switch($blk){";
     this.u.suffixCode = "}";
-    this.u.suffixCode += "}catch(err){ if (!(err instanceof Sk.builtin.BaseException)) { err = new Sk.builtin.ExternalError(err); } err.traceback.push({lineno: $currLineNo, colno: $currColNo, filename: '"+this.filename+"'}); if ($exc.length>0) { $err = err; $blk=$exc.pop(); continue; } else { throw err; }} } });";
+    this.u.suffixCode += "}catch(err){ if (!(err instanceof Sk.builtin.BaseException)) { err = new Sk.builtin.ExternalError(err); } " + this.outputTracebackPush(this.u) + " if ($exc.length>0) { $err = err; $blk=$exc.pop(); continue; } else { throw err; }} } });";
 
     // Note - this change may need to be adjusted for all the other instances of
     // switchCode and suffixCode in this file.  Not knowing how to test those
@@ -3021,6 +3695,9 @@ Compiler.prototype.cmod = function (mod) {
     }
     this.exitScope();
 
+    if (this.hasBreakpointChecks) {
+        this.result.push("var $breakpointFile=Sk.misceval.breakpointFile('" + this.filename + "');");
+    }
     this.result.push(this.outputAllUnits());
     return modf;
 };
@@ -3045,16 +3722,49 @@ Sk.compile = function (source, filename, mode, canSuspend) {
     var savedPytchThreadingFlag = Sk.pytchThreading;
     Sk.pytchThreading = false;
 
-    var parse = Sk.parse(filename, source);
-    var ast = Sk.astFromParse(parse.cst, filename, parse.flags);
+    var parse;
+    var parseFlags = 0;  // (as from Sk.parse(), which never sets any)
+    var ast;
+    var incremental = null;
+    if (Sk.incrementalCompile) {
+        incremental = Sk.incrementalCompilation.moduleAst(filename, source);
+    }
+    if (incremental !== null) {
+        ast = incremental.ast;
+    } else if (Sk.streamingAst) {
+        ast = Sk.parseToAst(filename, source);
+    } else {
+        parse = Sk.parse(filename, source);
+        parseFlags = parse.flags;
+        ast = Sk.astFromParse(parse.cst, filename, parse.flags);
+    }
     // console.log(JSON.stringify(ast, undefined, 2));
 
+    if (Sk.foldConstants) {
+        Sk.foldConstantExpressions(ast);
+    }
+
+    if (Sk.pytchThreading && Sk.elidePytchLoopYields) {
+        Sk.elideBoundedLoopYields(ast);
+    }
+
     // compilers flags, later we can add other ones too
     var flags = {};
-    flags.cf_flags = parse.flags;
+    flags.cf_flags = parseFlags;
 
     var st = Sk.symboltable(ast, filename);
     var c = new Compiler(filename, st, flags.cf_flags, canSuspend, source); // todo; CO_xxx
+    // (Code containing something which looks like a marker keeps to the
+    // usual line number updates.)
+    c.sourceMap = (Sk.sourceMapLineNumbers && !Sk.debugging
+                   && source.indexOf(Sk.sourceMaps.markerPrefix) === -1);
+    if (incremental !== null && !c.sourceMap) {
+        c.incremental = incremental;
+        c.incrementalContext = Sk.incrementalCompilation.codeContext(filename, canSuspend);
+    }
+    if (canSuspend && Sk.inferNonSuspendingFunctions && !Sk.debugging) {
+        c.nonSuspendingFunctions = Sk.findNonSuspendingFunctions(ast, st);
+    }
     var funcname = c.cmod(ast);
 
     // Restore the global __future__ flags
@@ -3063,7 +3773,11 @@ Sk.compile = function (source, filename, mode, canSuspend) {
     // Restore the global pytchThreading flag.
     Sk.pytchThreading = savedPytchThreadingFlag;
 
-    var ret = `var $compiledmod = function() {${c.result.join("")}\nreturn ${funcname};}();\n$compiledmod;`;
+    var body = c.result.join("");
+    if (c.sourceMap) {
+        body = Sk.sourceMaps.wrapModuleCode(body, c.allUnits.map((u) => u.blockLocations));
+    }
+    var ret = `var $compiledmod = function() {${body}\nreturn ${funcname};}();\n$compiledmod;`;
 
     return {
         funcname: "$compiledmod",
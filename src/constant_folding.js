@@ -0,0 +1,336 @@
+/**
+ * @description
+ * The compiler turns every operator into a call to the runtime, even when
+ * all its operands are literals, e.g., "2.0 * 3.14159" or "'abc' + 'def'".
+ * Sk.foldConstantExpressions() rewrites such expressions in a module's
+ * AST into the literal they evaluate to, working bottom-up so that nested
+ * constant expressions fold completely.  It handles:
+ *
+ *   - arithmetic and bitwise operators on int and float literals;
+ *   - concatenation and repetition of str literals;
+ *   - comparisons between number literals, or between str literals;
+ *   - "not", "and", "or", and conditional expressions whose outcome
+ *     is decided by a literal; and
+ *   - "not not x" used as the test of an "if", "while", "assert",
+ *     conditional expression, or comprehension "if", where it is
+ *     equivalent to plain "x".
+ *
+ * The values are computed with the same runtime functions the compiled
+ * code would call, so give the same results.  Anything which raises an
+ * exception (e.g., "1 / 0") is left alone so that it raises at run time,
+ * and results which would be very large (e.g., "10 ** 10 ** 10" or
+ * "'x' * 100000") are not computed.
+ *
+ * Statements are never removed here, since the symbol table must still
+ * see everything (a function whose only "yield" is under "if False" is
+ * still a generator).  Instead, the compiler does not emit code for
+ * branches whose test has become a literal; see exprConstant().
+ *
+ * The pass, and the related simplifications in the compiler, can be
+ * turned off with the "foldConstants" option to Sk.configure().
+ */
+
+/**
+ * Folded int results with more digits than this, and folded str results
+ * longer than this, are left as expressions.
+ */
+Sk.maxFoldedIntDigits = 40;
+Sk.maxFoldedStrLength = 4096;
+
+(function () {
+    const astnodes = Sk.astnodes;
+
+    const foldableBinOps = new Set([
+        astnodes.Add, astnodes.Sub, astnodes.Mult, astnodes.Div, astnodes.FloorDiv,
+        astnodes.Mod, astnodes.Pow, astnodes.LShift, astnodes.RShift,
+        astnodes.BitOr, astnodes.BitXor, astnodes.BitAnd,
+    ]);
+
+    const foldableUnaryOps = new Set([astnodes.UAdd, astnodes.USub, astnodes.Invert]);
+
+    const foldableCmpOps = new Set([
+        astnodes.Eq, astnodes.NotEq, astnodes.Lt, astnodes.LtE, astnodes.Gt, astnodes.GtE,
+    ]);
+
+    // In Python 2 mode, the meaning of "/" and the overflow of int into
+    // long depend on flags which the compiler only sees later, so we only
+    // fold numbers in Python 3 mode.
+    const numberValue = (e) => {
+        if (!(e instanceof astnodes.Num) || !Sk.__future__.python3) {
+            return null;
+        }
+        const n = e.n;
+        const isIntOrFloat = ((n instanceof Sk.builtin.int_ && !(n instanceof Sk.builtin.lng))
+                              || n instanceof Sk.builtin.float_);
+        return isIntOrFloat ? n : null;
+    };
+
+    const strValue = (e) => ((e instanceof astnodes.Str) ? e.s : null);
+
+    // The value of a literal expression, for deciding truthiness, or
+    // undefined if the expression is not a literal.
+    const literalValue = (e) => {
+        switch (e.constructor) {
+            case astnodes.Num:
+                return e.n;
+            case astnodes.Str:
+                return e.s;
+            case astnodes.NameConstant:
+                return e.value;
+            default:
+                return undefined;
+        }
+    };
+
+    const nDigits = (n) => n.v.toString().replace("-", "").length;
+    const nBits = (n) => n.v.toString(2).replace("-", "").length;
+
+    // Whether computing "left op right" might produce an unreasonably
+    // large value, so should be left until run time.
+    const resultMightBeHuge = (left, op, right) => {
+        const bothInts = (left instanceof Sk.builtin.int_ && right instanceof Sk.builtin.int_);
+        if (!bothInts) {
+            return false;
+        }
+        const maxBits = Sk.maxFoldedIntDigits * 4;
+        switch (op) {
+            case astnodes.Pow:
+                return (nDigits(right) > 3 || nBits(left) * Math.abs(right.v) > maxBits);
+            case astnodes.LShift:
+                return (nDigits(right) > 3 || nBits(left) + right.v > maxBits);
+            default:
+                return false;
+        }
+    };
+
+    const numberNode = (n, like) => {
+        if (n instanceof Sk.builtin.float_) {
+            if (!isFinite(n.v)) {
+                return null;
+            }
+        } else if (n instanceof Sk.builtin.int_ && !(n instanceof Sk.builtin.bool)) {
+            if (nDigits(n) > Sk.maxFoldedIntDigits) {
+                return null;
+            }
+        } else {
+            return null;
+        }
+        return new astnodes.Num(n, like.lineno, like.col_offset);
+    };
+
+    const boolNode = (b, like) => new astnodes.NameConstant(b ? Sk.builtin.bool.true$ : Sk.builtin.bool.false$,
+                                                             like.lineno, like.col_offset);
+
+    // Call the given function, returning null if it raises.
+    const attempt = (fun) => {
+        try {
+            return fun();
+        } catch (e) {
+            return null;
+        }
+    };
+
+    const foldBinOp = (e) => {
+        if (!foldableBinOps.has(e.op)) {
+            return e;
+        }
+        const opname = e.op.prototype._astname;
+
+        const left = numberValue(e.left);
+        const right = numberValue(e.right);
+        if (left !== null && right !== null) {
+            if (resultMightBeHuge(left, e.op, right)) {
+                return e;
+            }
+            const result = attempt(() => Sk.abstr.numberBinOp(left, right, opname));
+            return (result !== null && numberNode(result, e)) || e;
+        }
+
+        const lstr = strValue(e.left);
+        if (lstr === null) {
+            return e;
+        }
+        if (e.op === astnodes.Add) {
+            const rstr = strValue(e.right);
+            if (rstr !== null && lstr.v.length + rstr.v.length <= Sk.maxFoldedStrLength) {
+                return new astnodes.Str(new Sk.builtin.str(lstr.v + rstr.v), e.lineno, e.col_offset);
+            }
+        }
+        if (e.op === astnodes.Mult
+            && right instanceof Sk.builtin.int_
+            && typeof right.v === "number"
+            && lstr.v.length * right.v <= Sk.maxFoldedStrLength) {
+            const result = attempt(() => Sk.abstr.numberBinOp(lstr, right, opname));
+            if (result instanceof Sk.builtin.str) {
+                return new astnodes.Str(result, e.lineno, e.col_offset);
+            }
+        }
+        return e;
+    };
+
+    const foldUnaryOp = (e) => {
+        if (e.op === astnodes.Not) {
+            const value = literalValue(e.operand);
+            return (value === undefined) ? e : boolNode(!Sk.misceval.isTrue(value), e);
+        }
+        const operand = numberValue(e.operand);
+        if (operand === null || !foldableUnaryOps.has(e.op)) {
+            return e;
+        }
+        const result = attempt(() => Sk.abstr.numberUnaryOp(operand, e.op.prototype._astname));
+        return (result !== null && numberNode(result, e)) || e;
+    };
+
+    const foldCompare = (e) => {
+        const operands = [e.left].concat(e.comparators);
+        if (!e.ops.every((op) => foldableCmpOps.has(op))) {
+            return e;
+        }
+        let values = operands.map(numberValue);
+        if (values.some((v) => v === null)) {
+            values = operands.map(strValue);
+            if (values.some((v) => v === null)) {
+                return e;
+            }
+        }
+        const result = attempt(() => e.ops.every(
+            (op, i) => Sk.misceval.richCompareBool(values[i], values[i + 1], op.prototype._astname)
+        ));
+        return (result === null) ? e : boolNode(result, e);
+    };
+
+    // "x and y" gives x if x is falsy, otherwise y; "x or y" gives x if x
+    // is truthy, otherwise y.  So a leading literal either decides the
+    // result or can be dropped.
+    const foldBoolOp = (e) => {
+        const decidingTruth = (e.op === astnodes.Or);
+        let values = e.values;
+        while (values.length > 1) {
+            const value = literalValue(values[0]);
+            if (value === undefined) {
+                break;
+            }
+            if (Sk.misceval.isTrue(value) === decidingTruth) {
+                if (affectsScopes(values.slice(1))) {
+                    break;
+                }
+                return values[0];
+            }
+            values = values.slice(1);
+        }
+        if (values.length === 1) {
+            return values[0];
+        }
+        e.values = values;
+        return e;
+    };
+
+    // Whether dropping the given expression would change the scopes the
+    // symbol table finds, or whether the enclosing function is a
+    // generator.
+    const affectsScopes = (node) => {
+        if (node == null || typeof node !== "object") {
+            return false;
+        }
+        if (Array.isArray(node)) {
+            return node.some(affectsScopes);
+        }
+        switch (node.constructor) {
+            case astnodes.Yield:
+            case astnodes.YieldFrom:
+            case astnodes.Await:
+            case astnodes.Lambda:
+            case astnodes.ListComp:
+            case astnodes.SetComp:
+            case astnodes.DictComp:
+            case astnodes.GeneratorExp:
+                return true;
+        }
+        if (node._fields != null) {
+            for (let i = 1; i < node._fields.length; i += 2) {
+                if (affectsScopes(node._fields[i](node))) {
+                    return true;
+                }
+            }
+        }
+        return false;
+    };
+
+    const foldIfExp = (e) => {
+        const value = literalValue(e.test);
+        if (value === undefined) {
+            return e;
+        }
+        const [kept, dropped] = Sk.misceval.isTrue(value) ? [e.body, e.orelse] : [e.orelse, e.body];
+        return affectsScopes(dropped) ? e : kept;
+    };
+
+    // Where only the truthiness of an expression matters, "not not x" is
+    // the same as "x".
+    const simplifyTest = (e) => {
+        while (e instanceof astnodes.UnaryOp
+               && e.op === astnodes.Not
+               && e.operand instanceof astnodes.UnaryOp
+               && e.operand.op === astnodes.Not) {
+            e = e.operand.operand;
+        }
+        return e;
+    };
+
+    const fold = (node) => {
+        switch (node.constructor) {
+            case astnodes.BinOp:
+                return foldBinOp(node);
+            case astnodes.UnaryOp:
+                return foldUnaryOp(node);
+            case astnodes.Compare:
+                return foldCompare(node);
+            case astnodes.BoolOp:
+                return foldBoolOp(node);
+            case astnodes.IfExp:
+                node.test = simplifyTest(node.test);
+                return foldIfExp(node);
+            case astnodes.If:
+            case astnodes.While:
+            case astnodes.Assert:
+                node.test = simplifyTest(node.test);
+                return node;
+            case astnodes.comprehension:
+                if (node.ifs != null) {
+                    node.ifs = node.ifs.map(simplifyTest);
+                }
+                return node;
+            default:
+                return node;
+        }
+    };
+
+    const visit = (node) => {
+        if (node == null || typeof node !== "object") {
+            return node;
+        }
+        if (Array.isArray(node)) {
+            for (let i = 0; i < node.length; ++i) {
+                node[i] = visit(node[i]);
+            }
+            return node;
+        }
+        if (node._fields == null) {
+            return node;
+        }
+        for (let i = 0; i < node._fields.length; i += 2) {
+            const field = node._fields[i];
+            node[field] = visit(node[field]);
+        }
+        return fold(node);
+    };
+
+    /**
+     * Fold the constant expressions of the given module AST, in place.
+     */
+    Sk.foldConstantExpressions = function (mod) {
+        visit(mod);
+    };
+})();
+
+Sk.exportSymbol("Sk.foldConstantExpressions", Sk.foldConstantExpressions);
@@ -10,6 +10,9 @@
  *
  * output: Replacable output redirection (called from print, etc.).
  * read: Replacable function to load modules with (called via import, etc.)
+ * loadStdlibChunk: Replacable function to load one chunk of a split standard
+ * library (see Sk.loadStdlibChunk).
+ * stdlibChunkBase: Base URL from which the default loadStdlibChunk fetches.
  * sysargv: Setable to emulate arguments to the script. Should be an array of JS
  * strings.
  * syspath: Setable to emulate PYTHONPATH environment variable (for finding
@@ -18,6 +21,62 @@
  * fileopen: Optional function to call any time a file is opened
  * filewrite: Optional function to call when writing to a file
  * pytchThreading: Add a call to pytch.yield_until_next_frame() into strategic points in the AST.
+ * elidePytchLoopYields: Boolean (default true) - whether to drop the
+ * pytch.yield_until_next_frame() call from small loops whose iterations
+ * cannot be observed (see pytch_loop_yields.js).
+ * foldConstants: Boolean (default true) - whether to replace constant
+ * expressions with their values at compile time, and drop branches whose
+ * test is constant (see constant_folding.js).
+ * inlineNumberOps: Boolean (default true) - whether to compile +, -, *, and
+ * comparisons with an inline fast path for int and float operands.
+ * cacheGlobalLoads: Boolean (default true) - whether compiled code keeps
+ * the results of global and builtin name lookups in inline caches, valid
+ * until a global is next rebound (see Sk.globalsVersion).
+ * cacheAttributes: Boolean (default true) - whether compiled code keeps
+ * inline caches for attribute loads and stores on instances of Python
+ * classes (see Sk.generic.getAttrCached).
+ * fastMethodCalls: Boolean (default true) - whether calls "obj.name(...)"
+ * of methods of Python classes skip making a bound method object; only
+ * has an effect with cacheAttributes.
+ * countAttributeCacheHits: Boolean (default false) - whether compiled code
+ * counts the hits of its attribute caches in Sk.generic.attrCacheStats;
+ * for measuring hit rates, at some cost in speed.
+ * nativeRangeLoops: Boolean (default true) - whether "for i in range(...)"
+ * loops count with JS numbers, rather than iterating over a range object,
+ * while "range" is the builtin (see Compiler.prototype.cfor).
+ * inferNonSuspendingFunctions: Boolean (default true) - whether to compile
+ * functions which provably cannot suspend without suspension support (see
+ * suspension_analysis.js).
+ * sourceMapLineNumbers: Boolean (default false) - whether compiled code
+ * leaves out its per-statement updates of $currLineNo and $currColNo, and
+ * instead the line of each traceback entry is found, when needed, from
+ * the JS stack and a map of the generated code (see source_maps.js).
+ * Creating an exception then costs more, as it captures the JS stack.
+ * reuseSuspensionFrames: Boolean (default true) - whether a function which
+ * suspends again after being resumed refills the suspension it was resumed
+ * from, rather than making a new one (see
+ * Compiler.prototype.outputSuspensionHelpers).
+ * clockCheckBudget: Boolean (default true) - whether compiled code reads
+ * the clock, to check execLimit and yieldLimit, only once its countdown of
+ * possible checks runs out, rather than at every check (see
+ * Sk.misceval.checkTimeLimits).
+ * fastFStrings: Boolean (default true) - whether f-strings are built from
+ * the JS strings of their parts, making one str at the end, and format
+ * plain str, int and float values without calling __format__ (see
+ * Compiler.prototype.cjoinedstr).
+ * yieldDutyCycle: Number (default 0.8, at least 0 and less than 1) - the
+ * least fraction of its time which code run by Sk.misceval.asyncToPromise
+ * should spend executing rather than yielded to the event loop; yields
+ * which come too soon after the last one are skipped to keep to it (see
+ * Sk.misceval.yieldStats).  With 0, every yield gives way.
+ * streamingAst: Boolean (default true) - whether Sk.compile converts each
+ * top-level statement to its AST as soon as it has been parsed, rather
+ * than parsing the whole module to a CST first (see Sk.parseToAst).
+ * incrementalCompile: Boolean (default false) - whether Sk.compile keeps
+ * the AST of each top-level statement and class member of a file, and the
+ * code of each top-level function and method, for the next compilation of
+ * the same file, which then parses and compiles only what has changed
+ * (see incremental_compile.js).
  *
  * Any variables that aren't set will be left alone.
  */
@@ -124,11 +183,14 @@ Sk.python3 = {
         current_live_project: do_nothing_project,
         on_exception: do_nothing,
         executing_thread: null,
+        TigerPython_worker: null,
     };
 })();
 
 Sk.configure = function (options) {
     "use strict";
+    const endTrace = Sk.startupTrace.begin("configure");
+
     Sk.output = options["output"] || Sk.output;
     Sk.asserts.assert(typeof Sk.output === "function");
 
@@ -141,6 +203,12 @@ Sk.configure = function (options) {
     Sk.read = options["read"] || Sk.read;
     Sk.asserts.assert(typeof Sk.read === "function");
 
+    Sk.loadStdlibChunk = options["loadStdlibChunk"] || Sk.loadStdlibChunk;
+    Sk.asserts.assert(typeof Sk.loadStdlibChunk === "function");
+
+    Sk.stdlibChunkBase = options["stdlibChunkBase"] || Sk.stdlibChunkBase;
+    Sk.asserts.assert(typeof Sk.stdlibChunkBase === "string");
+
     Sk.nonreadopen = options["nonreadopen"] || false;
     Sk.asserts.assert(typeof Sk.nonreadopen === "boolean");
 
@@ -153,6 +221,88 @@ Sk.configure = function (options) {
     Sk.pytchThreading = options["pytchThreading"] || false;
     Sk.asserts.assert(typeof Sk.pytchThreading === "boolean");
 
+    Sk.elidePytchLoopYields = (options["elidePytchLoopYields"] !== undefined
+                               ? options["elidePytchLoopYields"]
+                               : true);
+    Sk.asserts.assert(typeof Sk.elidePytchLoopYields === "boolean");
+
+    Sk.foldConstants = (options["foldConstants"] !== undefined
+                        ? options["foldConstants"]
+                        : true);
+    Sk.asserts.assert(typeof Sk.foldConstants === "boolean");
+
+    Sk.inlineNumberOps = (options["inlineNumberOps"] !== undefined
+                          ? options["inlineNumberOps"]
+                          : true);
+    Sk.asserts.assert(typeof Sk.inlineNumberOps === "boolean");
+
+    Sk.cacheGlobalLoads = (options["cacheGlobalLoads"] !== undefined
+                           ? options["cacheGlobalLoads"]
+                           : true);
+    Sk.asserts.assert(typeof Sk.cacheGlobalLoads === "boolean");
+
+    Sk.cacheAttributes = (options["cacheAttributes"] !== undefined
+                          ? options["cacheAttributes"]
+                          : true);
+    Sk.asserts.assert(typeof Sk.cacheAttributes === "boolean");
+
+    Sk.fastMethodCalls = (options["fastMethodCalls"] !== undefined
+                          ? options["fastMethodCalls"]
+                          : true);
+    Sk.asserts.assert(typeof Sk.fastMethodCalls === "boolean");
+
+    Sk.countAttributeCacheHits = (options["countAttributeCacheHits"] !== undefined
+                                  ? options["countAttributeCacheHits"]
+                                  : false);
+    Sk.asserts.assert(typeof Sk.countAttributeCacheHits === "boolean");
+
+    Sk.nativeRangeLoops = (options["nativeRangeLoops"] !== undefined
+                           ? options["nativeRangeLoops"]
+                           : true);
+    Sk.asserts.assert(typeof Sk.nativeRangeLoops === "boolean");
+
+    Sk.inferNonSuspendingFunctions = (options["inferNonSuspendingFunctions"] !== undefined
+                                      ? options["inferNonSuspendingFunctions"]
+                                      : true);
+    Sk.asserts.assert(typeof Sk.inferNonSuspendingFunctions === "boolean");
+
+    Sk.sourceMapLineNumbers = (options["sourceMapLineNumbers"] !== undefined
+                               ? options["sourceMapLineNumbers"]
+                               : false);
+    Sk.asserts.assert(typeof Sk.sourceMapLineNumbers === "boolean");
+
+    Sk.reuseSuspensionFrames = (options["reuseSuspensionFrames"] !== undefined
+                                ? options["reuseSuspensionFrames"]
+                                : true);
+    Sk.asserts.assert(typeof Sk.reuseSuspensionFrames === "boolean");
+
+    Sk.clockCheckBudget = (options["clockCheckBudget"] !== undefined
+                           ? options["clockCheckBudget"]
+                           : true);
+    Sk.asserts.assert(typeof Sk.clockCheckBudget === "boolean");
+
+    Sk.fastFStrings = (options["fastFStrings"] !== undefined
+                       ? options["fastFStrings"]
+                       : true);
+    Sk.asserts.assert(typeof Sk.fastFStrings === "boolean");
+
+    Sk.yieldDutyCycle = (options["yieldDutyCycle"] !== undefined
+                         ? options["yieldDutyCycle"]
+                         : 0.8);
+    Sk.asserts.assert(typeof Sk.yieldDutyCycle === "number"
+                      && Sk.yieldDutyCycle >= 0
+                      && Sk.yieldDutyCycle < 1);
+
+    Sk.streamingAst = (options["streamingAst"] !== undefined
+                       ? options["streamingAst"]
+                       : true);
+    Sk.asserts.assert(typeof Sk.streamingAst === "boolean");
+
+    Sk.incrementalCompile = (options["incrementalCompile"] !== undefined
+                             ? options["incrementalCompile"]
+                             : false);
+    Sk.asserts.assert(typeof Sk.incrementalCompile === "boolean");
+
     Sk.timeoutMsg = options["timeoutMsg"] || Sk.timeoutMsg;
     Sk.asserts.assert(typeof Sk.timeoutMsg === "function");
     Sk.exportSymbol("Sk.timeoutMsg", Sk.timeoutMsg);
@@ -276,6 +426,8 @@ Sk.configure = function (options) {
     Sk.setupDunderMethods(Sk.__future__.python3);
     Sk.setupObjects(Sk.__future__.python3);
     Sk.token.setupTokens(Sk.__future__.python3);
+
+    endTrace();
 };
 
 Sk.exportSymbol("Sk.configure", Sk.configure);
@@ -320,16 +472,89 @@ Sk.output = function (x) {};
 
 /*
  * Replaceable function to load modules with (called via import, etc.)
- * todo; this should be an async api
+ *
+ * If the standard library was built split into chunks (see
+ * "wrapmodules.js builtin-split"), a file not yet loaded is fetched
+ * along with the rest of its chunk, and a Suspension is returned.
  */
-Sk.read = function (x) {
+Sk.readBuiltinFile = function (x) {
     if (Sk.builtinFiles === undefined) {
         throw "skulpt-stdlib.js has not been loaded";
-    } else if (Sk.builtinFiles.files[x] === undefined) {
-        throw "File not found: '" + x + "'";
     }
-    return Sk.builtinFiles.files[x];
+    const files = Sk.builtinFiles.files;
+    if (files[x] !== undefined) {
+        return files[x];
+    }
+    const failStubs = Sk.builtinFiles.failStubs;
+    if (failStubs !== undefined && failStubs[x] !== undefined) {
+        return 'import _sk_fail; _sk_fail._("' + failStubs[x] + '")';
+    }
+    const chunks = Sk.builtinFiles.chunks;
+    if (chunks !== undefined && chunks[x] !== undefined) {
+        return Sk.misceval.promiseToSuspension(Sk.fetchStdlibChunk(chunks[x]).then(() => files[x]));
+    }
+    throw "File not found: '" + x + "'";
+};
+Sk.read = Sk.readBuiltinFile;
+
+/*
+ * Base URL of the chunks of a split standard library.
+ */
+Sk.stdlibChunkBase = "stdlib/";
+
+/*
+ * Replaceable function to load one chunk of a split standard library.
+ * Should return a Promise resolving to an object of the form
+ * { files: { <path>: <contents>, ... } }.
+ */
+Sk.loadStdlibChunk = function (chunkName) {
+    return Sk.global["fetch"](Sk.stdlibChunkBase + chunkName + ".json").then((response) => {
+        if (!response.ok) {
+            throw new Error("could not fetch stdlib chunk '" + chunkName + "': " + response.status);
+        }
+        return response.json();
+    });
+};
+
+Sk.stdlibChunkPromises = new Map();
+
+/*
+ * Return a Promise which resolves once the named chunk of the standard
+ * library has been merged into Sk.builtinFiles.  Each chunk is only
+ * fetched once, however many of its files are asked for while it is in
+ * flight; a failed fetch is forgotten so that it can be retried.
+ */
+Sk.fetchStdlibChunk = function (chunkName) {
+    let promise = Sk.stdlibChunkPromises.get(chunkName);
+    if (promise === undefined) {
+        promise = Sk.loadStdlibChunk(chunkName).then(
+            (chunk) => {
+                Object.assign(Sk.builtinFiles.files, chunk.files);
+            },
+            (err) => {
+                Sk.stdlibChunkPromises.delete(chunkName);
+                throw err;
+            }
+        );
+        Sk.stdlibChunkPromises.set(chunkName, promise);
+    }
+    return promise;
+};
+Sk.exportSymbol("Sk.fetchStdlibChunk", Sk.fetchStdlibChunk);
+
+/*
+ * Fetch the given chunks of a split standard library, by default those
+ * in its manifest's prefetch list.  Resolves immediately if the standard
+ * library is not split.
+ */
+Sk.prefetchStdlib = function (chunkNames) {
+    if (Sk.builtinFiles === undefined || Sk.builtinFiles.chunks === undefined) {
+        return Promise.resolve();
+    }
+    chunkNames = chunkNames || Sk.builtinFiles.prefetch || [];
+    return Promise.all(chunkNames.map(Sk.fetchStdlibChunk));
 };
+Sk.exportSymbol("Sk.prefetchStdlib", Sk.prefetchStdlib);
 
 /*
  * Setable to emulate arguments to the script. Should be array of JS strings.
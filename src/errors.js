@@ -26,6 +26,9 @@ const BaseException = Sk.abstr.buildNativeClass("BaseException", {
         this.cause = null;
         this.context = null;
         this.$d = new Sk.builtin.dict();
+        if (Sk.sourceMapLineNumbers) {
+            Sk.sourceMaps.captureStack(this);
+        }
     },
     slots: /**@lends {BaseException}*/ {
         tp$getattr: Sk.generic.getAttr,
@@ -99,7 +102,12 @@ function BaseExc_new(args, kws) {
 
 function BaseExc_init(args, kws) {
     Sk.abstr.checkNoKwargs(Sk.abstr.typeName(this), kws);
-    this.args = new Sk.builtin.tuple(args.slice(0));
+    // Called with the same arguments as BaseExc_new, just after it, when
+    // Python code calls an exception class; keep the tuple it made.
+    const current = this.args.v;
+    if (current.length !== args.length || current.some((arg, i) => arg !== args[i])) {
+        this.args = new Sk.builtin.tuple(args.slice(0));
+    }
 }
 
 function BaseExc_str() {
@@ -398,6 +406,9 @@ Sk.builtin.ExternalError = Sk.abstr.buildNativeClass("ExternalError", {
             }
         }
         Exception.apply(this, args);
+        if (Sk.sourceMapLineNumbers && this.nativeError instanceof Error) {
+            Sk.sourceMaps.captureStack(this, this.nativeError);
+        }
     },
     base: Exception,
 });
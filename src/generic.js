@@ -112,6 +112,200 @@ Sk.generic.setAttr = function __setattr__(pyName, value, canSuspend) {
 };
 Sk.exportSymbol("Sk.generic.setAttr", Sk.generic.setAttr);
 
+/**
+ * @description
+ * Inline caches for attribute loads and stores on instances of Python
+ * classes.  Each "obj.name" site in compiled code has its own cache
+ * (see newAttrCache()), recording what getAttr()/setAttr() found in
+ * the type of the object last seen there: the class attribute (if any)
+ * and whether it is a data descriptor.  While later objects have the
+ * same type, the site can go straight to the instance dict entry
+ * without the MRO lookup.
+ *
+ * A cache entry is valid while the version of its attribute name is
+ * unchanged.  A class's attributes change only via type.tp$setattr(),
+ * which calls invalidateAttrCaches() with the name being changed, so
+ * setting "Base.name" invalidates "name" caches for all classes,
+ * including subclasses of Base.  Changing one of the dunders which
+ * govern attribute access (e.g., "__getattr__" or "__set__")
+ * invalidates every cache.
+ *
+ * For calls "obj.name(...)", compiled code also uses the cache to find
+ * when "name" is a Python function in the class, not shadowed in the
+ * instance dict, so can be called with obj as its first argument without
+ * making a bound method (see Compiler.prototype.cmethodcall).
+ *
+ * Compiled code only calls getAttrCached() or setAttrCached() when its
+ * inline check of the cache fails; these helpers count such calls in
+ * Sk.generic.attrCacheStats as hits (cache valid, but the instance
+ * dict alone did not provide the answer) and misses (cache refilled).
+ * Accesses to objects of other types, which are not cached, are not
+ * counted.
+ * The inline hits are only counted if the "countAttributeCacheHits"
+ * option was set when compiling.
+ */
+Sk.generic.attrCacheStats = { hits: 0, misses: 0 };
+
+/**
+ * Reset the counts in Sk.generic.attrCacheStats, returning the old ones.
+ */
+Sk.generic.resetAttrCacheStats = function () {
+    const stats = Sk.generic.attrCacheStats;
+    Sk.generic.attrCacheStats = { hits: 0, misses: 0 };
+    return stats;
+};
+
+// Version cells, keyed by mangled attribute name.
+const attrVersionCells = Object.create(null);
+
+const attrAccessDunders = new Set([
+    "__getattribute__", "__getattr__", "__setattr__", "__delattr__",
+    "__get__", "__set__", "__delete__",
+]);
+
+function attrVersionCell(jsName) {
+    let cell = attrVersionCells[jsName];
+    if (cell === undefined) {
+        cell = attrVersionCells[jsName] = { v: 0 };
+    }
+    return cell;
+}
+
+/**
+ * @function
+ *
+ * @param {Sk.builtin.str} pyName
+ *
+ * @description
+ * Make an empty inline cache for accesses to the named attribute.
+ */
+Sk.generic.newAttrCache = function (pyName) {
+    return {
+        type: undefined,
+        version: -1,
+        cell: attrVersionCell(pyName.$mangled),
+        hash: pyName.$savedKeyHash,
+        generic: false,
+        inDict: false,
+        isMethod: false,
+        descr: undefined,
+        getter: undefined,
+        setter: undefined,
+    };
+};
+
+/**
+ * @function
+ *
+ * @param {string} jsName mangled name of the class attribute being changed
+ *
+ * @description
+ * Invalidate the inline caches which might depend on the given class
+ * attribute.
+ */
+Sk.generic.invalidateAttrCaches = function (jsName) {
+    if (attrAccessDunders.has(jsName)) {
+        for (let name in attrVersionCells) {
+            attrVersionCells[name].v++;
+        }
+    } else {
+        attrVersionCell(jsName).v++;
+    }
+};
+
+// Only instances of Python classes using the default getattr/setattr, and
+// with an instance dict, have their attribute accesses cached.  For other
+// types, the cache just records that tp$getattr/tp$setattr must be used.
+function fillAttrCache(cache, obj, pyName, slot, generic) {
+    const type = obj.ob$type;
+    cache.type = type;
+    cache.version = cache.cell.v;
+    cache.generic = !(type.sk$klass !== undefined && obj[slot] === generic && obj.$d instanceof Sk.builtin.dict);
+    if (cache.generic) {
+        cache.inDict = cache.isMethod = false;
+        cache.descr = cache.getter = cache.setter = undefined;
+        return;
+    }
+    const descr = type.$typeLookup(pyName);
+    cache.descr = descr;
+    cache.getter = (descr != null) ? descr.tp$descr_get : undefined;
+    cache.setter = (descr != null) ? descr.tp$descr_set : undefined;
+    Sk.generic.attrCacheStats.misses++;
+}
+
+/**
+ * @function
+ *
+ * @param {pyObject} obj
+ * @param {Sk.builtin.str} pyName
+ * @param {Object} cache as made by newAttrCache()
+ * @param {boolean=} canSuspend
+ *
+ * @description
+ * As obj.tp$getattr(pyName, canSuspend), but using and maintaining the
+ * given cache.
+ *
+ * @return {Sk.builtin.object|undefined}
+ */
+Sk.generic.getAttrCached = function (obj, pyName, cache, canSuspend) {
+    const type = obj.ob$type;
+    if (type !== cache.type || cache.version !== cache.cell.v) {
+        fillAttrCache(cache, obj, pyName, "tp$getattr", Sk.generic.getAttr);
+        cache.inDict = !cache.generic && (cache.getter === undefined || cache.setter === undefined);
+        cache.isMethod = cache.inDict && cache.descr instanceof Sk.builtin.func;
+    } else if (!cache.generic) {
+        Sk.generic.attrCacheStats.hits++;
+    }
+    if (cache.generic) {
+        return obj.tp$getattr(pyName, canSuspend);
+    }
+    if (cache.inDict) {
+        const item = obj.$d.entries[cache.hash];
+        if (item !== undefined) {
+            return item[1];
+        }
+        if (cache.getter === undefined) {
+            return cache.descr;
+        }
+    }
+    return cache.getter.call(cache.descr, obj, type, canSuspend);
+};
+
+/**
+ * @function
+ *
+ * @param {pyObject} obj
+ * @param {Sk.builtin.str} pyName
+ * @param {Sk.builtin.object} value
+ * @param {Object} cache as made by newAttrCache()
+ * @param {boolean=} canSuspend
+ *
+ * @description
+ * As obj.tp$setattr(pyName, value, canSuspend), but using and
+ * maintaining the given cache.  Deletion is not supported.
+ */
+Sk.generic.setAttrCached = function (obj, pyName, value, cache, canSuspend) {
+    const type = obj.ob$type;
+    if (type !== cache.type || cache.version !== cache.cell.v) {
+        fillAttrCache(cache, obj, pyName, "tp$setattr", Sk.generic.setAttr);
+        cache.inDict = !cache.generic && !cache.setter;
+    } else if (!cache.generic) {
+        Sk.generic.attrCacheStats.hits++;
+    }
+    if (cache.generic) {
+        return obj.tp$setattr(pyName, value, canSuspend);
+    }
+    if (cache.inDict) {
+        return obj.$d.mp$ass_subscript(pyName, value);
+    }
+    return cache.setter.call(cache.descr, obj, value, canSuspend);
+};
+
+Sk.exportSymbol("Sk.generic.newAttrCache", Sk.generic.newAttrCache);
+Sk.exportSymbol("Sk.generic.invalidateAttrCaches", Sk.generic.invalidateAttrCaches);
+Sk.exportSymbol("Sk.generic.getAttrCached", Sk.generic.getAttrCached);
+Sk.exportSymbol("Sk.generic.setAttrCached", Sk.generic.setAttrCached);
+
 /**
  * @method
  *
@@ -131,8 +131,14 @@ Sk.importModuleInternal_ = function (name, dumpJS, modname, suppliedPyBody, rela
             return topLevelModuleToReturn || prev;
         }
         // not in sys.modules, continue
-
-        return Sk.misceval.chain(undefined, function() {
+        // Record the import however it ends, including by raising.
+        const endTrace = Sk.startupTrace.begin("import:" + modname);
+        const endTraceAndRethrow = (err) => {
+            endTrace();
+            throw err;
+        };
+
+        return Sk.misceval.tryCatch(() => Sk.misceval.chain(undefined, function() {
             var codeAndPath, co, googClosure;
             var searchFileName = name;
             var result;
@@ -322,6 +328,8 @@ Sk.importModuleInternal_ = function (name, dumpJS, modname, suppliedPyBody, rela
                 }
             }
 
+            endTrace();
+
             // Some builtin modules replace their globals entirely.
             // For their benefit, we copy over any of the standard
             // dunder-values they didn't supply.
@@ -356,7 +364,7 @@ Sk.importModuleInternal_ = function (name, dumpJS, modname, suppliedPyBody, rela
             //print("name", name, "modname", modname, "returning leaf");
             // otherwise we return the actual module that we just imported
             return module;
-        });
+        }), endTraceAndRethrow);
     });
 
     return canSuspend ? ret : Sk.misceval.retryOptionalSuspensionOrThrow(ret);
@@ -371,11 +379,53 @@ Sk.importModule = function (name, dumpJS, canSuspend) {
     return Sk.importModuleInternal_(name, dumpJS, undefined, undefined, undefined, false, canSuspend);
 };
 
+/**
+ * Names of the modules which Sk.importMain() and Sk.importMainWithBody()
+ * leave in sys.modules, or null if they should start from an empty
+ * sys.modules.  Set by Sk.preserveCurrentModules().
+ */
+Sk.preservedModuleNames = null;
+
+/**
+ * Arrange for the modules currently in sys.modules to be kept, rather
+ * than re-imported, by subsequent calls to Sk.importMain() and
+ * Sk.importMainWithBody().  A long-lived VM can therefore import (say)
+ * pytch once and then run many programs, each seeing a fresh set of its
+ * own modules.  Any state the programs give the kept modules is shared.
+ */
+Sk.preserveCurrentModules = function () {
+    Sk.preservedModuleNames = new Set(Sk.sysmodules.$items().map(([name, module]) => name.v));
+};
+
+/**
+ * Undo the effect of Sk.preserveCurrentModules().
+ */
+Sk.forgetPreservedModules = function () {
+    Sk.preservedModuleNames = null;
+};
+
+/**
+ * Remove from sys.modules all modules but those preserved by
+ * Sk.preserveCurrentModules().  The sys.modules dict is emptied in place
+ * if some modules are preserved, since "sys" might be among them.
+ */
+Sk.resetSysModules = function () {
+    if (Sk.preservedModuleNames === null) {
+        Sk.sysmodules = new Sk.builtin.dict([]);
+        return;
+    }
+    Sk.sysmodules.$items().forEach(([name, module]) => {
+        if (!Sk.preservedModuleNames.has(name.v)) {
+            Sk.sysmodules.pop$item(name);
+        }
+    });
+};
+
 Sk.importMain = function (name, dumpJS, canSuspend) {
     Sk.dateSet = false;
     Sk.filesLoaded = false;
     // Added to reset imports
-    Sk.sysmodules = new Sk.builtin.dict([]);
+    Sk.resetSysModules();
     Sk.realsyspath = undefined;
 
     Sk.resetCompiler();
@@ -398,7 +448,7 @@ Sk.importMainWithBody = function (name, dumpJS, body, canSuspend) {
     Sk.dateSet = false;
     Sk.filesLoaded = false;
     // Added to reset imports
-    Sk.sysmodules = new Sk.builtin.dict([]);
+    Sk.resetSysModules();
     Sk.realsyspath = undefined;
 
     Sk.resetCompiler();
@@ -528,6 +578,7 @@ Sk.builtin.__import__ = function (name, globals, locals, fromlist, level) {
 };
 
 Sk.importStar = function (module, loc, global) {
+    Sk.globalsVersion++;
     var __all__ = module.tp$getattr(new Sk.builtin.str("__all__"));
 
     if (__all__) {
@@ -549,6 +600,9 @@ Sk.importStar = function (module, loc, global) {
 };
 
 Sk.exportSymbol("Sk.importMain", Sk.importMain);
+Sk.exportSymbol("Sk.preserveCurrentModules", Sk.preserveCurrentModules);
+Sk.exportSymbol("Sk.forgetPreservedModules", Sk.forgetPreservedModules);
+Sk.exportSymbol("Sk.resetSysModules", Sk.resetSysModules);
 Sk.exportSymbol("Sk.importMainWithBody", Sk.importMainWithBody);
 Sk.exportSymbol("Sk.importBuiltinWithBody", Sk.importBuiltinWithBody);
 Sk.exportSymbol("Sk.builtin.__import__", Sk.builtin.__import__);
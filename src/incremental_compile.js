@@ -0,0 +1,400 @@
+/**
+ * @description
+ * Recompiling a file after a small edit without redoing all of it.
+ *
+ * With the "incrementalCompile" option, Sk.compile() splits the source of
+ * a file into units: each top-level statement (with its decorators, and
+ * any "else", "elif", "except" or "finally" clauses), except that a
+ * multi-line class is split into its header and one unit per statement of
+ * its body.  Sk.incrementalCompilation.moduleAst() parses each unit on its
+ * own, and keeps its AST, keyed by the hash of the unit's text, for the
+ * next compilation of the same file.  A unit whose text is unchanged, even
+ * if it has moved up or down the file, then reuses the AST kept for it
+ * (copied, since the later passes change the AST in place, and with its
+ * line numbers moved), and only changed units are parsed.
+ *
+ * A function which is a unit (a top-level def, or a method of a top-level
+ * class) also keeps the JavaScript compiled for it and anything within it
+ * (see Compiler.prototype.codeObjectReuse).  That code depends on more
+ * than the text of the function: on its line numbers, on the scopes the
+ * symbol table finds for it, on whether the suspension analysis found it
+ * cannot suspend, on which of its loops keep their Pytch yields, and on
+ * the compile options.  It is reused only when all of those are as when
+ * it was compiled; otherwise it is compiled again.  The module code, and
+ * everything not in such a function, is compiled afresh each time, and
+ * the symbol table and the passes over the AST are always run over the
+ * whole module, since they are cheap compared to compiling.
+ *
+ * If anything in the file fails to tokenize or parse, or Sk.compile()
+ * compiles with source maps, it compiles the whole file as usual, so that
+ * errors, and the generated code, are as without the option.
+ */
+
+(function () {
+    const tokens = Sk.token.tokens;
+
+    // Keywords starting a clause which continues the statement before it.
+    const continuationKeywords = new Set(["else", "elif", "except", "finally"]);
+
+    // Options affecting the code generated for a function, other than
+    // execLimit and yieldLimit, where only whether they are set matters.
+    const codeOptions = [
+        "debugging", "killableWhile", "killableFor", "foldConstants",
+        "maxFoldedIntDigits", "maxFoldedStrLength", "elidePytchLoopYields",
+        "maxElidedLoopYieldIterations", "inlineNumberOps", "cacheGlobalLoads",
+        "cacheAttributes", "fastMethodCalls", "countAttributeCacheHits",
+        "nativeRangeLoops", "inferNonSuspendingFunctions",
+        "reuseSuspensionFrames", "clockCheckBudget", "fastFStrings",
+    ];
+
+    /**
+     * What was kept from the last compilation of one file.
+     *
+     * @constructor
+     * @param {string} futureFlags As from futureSignature()
+     */
+    function FileRecord(futureFlags) {
+        this.futureFlags = futureFlags;
+        // Unit records by kind, Pytch threading state and text hash; see
+        // unitKey().
+        this.units = new Map();
+        // Names made by Compiler.prototype.gensym() for code kept in the
+        // unit records are numbered below this.
+        this.gensymHighWater = 0;
+    }
+
+    /**
+     * One unit of a file, and its AST as parsed where the unit started on
+     * line "lineno".  The AST is never changed.
+     *
+     * @constructor
+     */
+    function UnitRecord(text, lineno, stmts) {
+        this.text = text;
+        this.lineno = lineno;
+        this.stmts = stmts;
+        // For a function: its compiled code, and what it depends on; see
+        // Compiler.prototype.codeObjectReuse.
+        this.code = null;
+    }
+
+    const files = new Map();
+
+    const futureSignature = () => {
+        const flags = [];
+        for (const name in Sk.__future__) {
+            flags.push(name + "=" + Sk.__future__[name]);
+        }
+        return flags.join(",");
+    };
+
+    // As in Sk.parse().
+    const readline = (lines) => {
+        let i = 0;
+        return () => {
+            if (i === lines.length) {
+                throw new Sk.builtin.Exception("EOF");
+            }
+            return lines[i++] + "\n";
+        };
+    };
+
+    /**
+     * The statements of the source which start at indentation depth 0 or
+     * 1, as {lineno, depth, first} objects, where "first" is the text of
+     * the statement's first token.
+     */
+    const statementStarts = (filename, lines) => {
+        const starts = [];
+        let depth = 0;
+        let atStart = true;
+        Sk._tokenize(filename, readline(lines), "utf-8", (tokenInfo) => {
+            switch (tokenInfo.type) {
+                case tokens.T_NEWLINE:
+                    atStart = true;
+                    break;
+                case tokens.T_INDENT:
+                    ++depth;
+                    break;
+                case tokens.T_DEDENT:
+                    --depth;
+                    break;
+                case tokens.T_NL:
+                case tokens.T_COMMENT:
+                case tokens.T_ENCODING:
+                case tokens.T_ENDMARKER:
+                    break;
+                default:
+                    if (atStart && depth <= 1) {
+                        starts.push({
+                            lineno: tokenInfo.start[0],
+                            depth: depth,
+                            first: tokenInfo.string,
+                        });
+                    }
+                    atStart = false;
+            }
+        });
+        return starts;
+    };
+
+    /**
+     * Group the given statement starts, all at one depth, into units, as
+     * {lineno, endLineno, keyword, keywordLineno} objects; a unit ends
+     * where the next one starts, or at endLineno.  The keyword is the
+     * first token of the unit's first statement which is not a decorator.
+     */
+    const groupUnits = (starts, endLineno) => {
+        const units = [];
+        let decorating = false;
+        for (const start of starts) {
+            const last = units[units.length - 1];
+            if (last !== undefined && (decorating || continuationKeywords.has(start.first))) {
+                if (last.keyword === null && start.first !== "@") {
+                    last.keyword = start.first;
+                    last.keywordLineno = start.lineno;
+                }
+            } else {
+                if (last !== undefined) {
+                    last.endLineno = start.lineno;
+                }
+                units.push({
+                    lineno: start.lineno,
+                    endLineno: endLineno,
+                    keyword: (start.first === "@") ? null : start.first,
+                    keywordLineno: start.lineno,
+                });
+            }
+            decorating = (start.first === "@");
+        }
+        return units;
+    };
+
+    const unitKey = (kind, text) => (
+        kind + ":" + (Sk.pytchThreading ? "1" : "0") + ":" + Sk.sourceHash(text)
+    );
+
+    /**
+     * A copy of the given AST (from a unit record), with its line numbers
+     * moved by lineDelta.  (Those of the expressions in f-strings are not
+     * moved, as they count from the start of the expression; see
+     * fstring_compile_expr() in ast.js.)
+     */
+    const copyAst = (node, lineDelta) => {
+        if (Array.isArray(node)) {
+            return node.map((child) => copyAst(child, lineDelta));
+        }
+        if (node === null || typeof node !== "object" || node._astname === undefined) {
+            return node;
+        }
+        const copy = Object.create(Object.getPrototypeOf(node));
+        const isFormattedValue = (node instanceof Sk.astnodes.FormattedValue);
+        for (const field of Object.keys(node)) {
+            const fieldDelta = (isFormattedValue && field === "value") ? 0 : lineDelta;
+            copy[field] = copyAst(node[field], fieldDelta);
+        }
+        if (typeof copy.lineno === "number") {
+            copy.lineno += lineDelta;
+        }
+        return copy;
+    };
+
+    /**
+     * Building the AST of one version of a file, from the unit records of
+     * the last compilation of it where the units are unchanged.
+     *
+     * @constructor
+     */
+    function Compilation(filename, lines, lastFile) {
+        this.filename = filename;
+        this.lines = lines;
+        this.lastFile = lastFile;
+        this.file = new FileRecord(futureSignature());
+        if (lastFile !== undefined) {
+            this.file.gensymHighWater = lastFile.gensymHighWater;
+        }
+        // Unit records of functions, by the FunctionDef in this module's
+        // AST.
+        this.functionUnits = new Map();
+    }
+
+    Compilation.prototype.text = function (lineno, endLineno) {
+        return this.lines.slice(lineno - 1, endLineno - 1).join("\n") + "\n";
+    };
+
+    /**
+     * The record for the given unit, parsing it with parse(text, lineno)
+     * if it is not known.
+     */
+    Compilation.prototype.unitRecord = function (kind, text, lineno, parse) {
+        const key = unitKey(kind, text);
+        let record = this.file.units.get(key);
+        if (record === undefined && this.lastFile !== undefined) {
+            record = this.lastFile.units.get(key);
+        }
+        if (record !== undefined && record.text === text) {
+            this.file.units.set(key, record);
+            return record;
+        }
+        const pytchThreading = Sk.pytchThreading;
+        record = new UnitRecord(text, lineno, parse(text, lineno));
+        // (A unit which turns Pytch threading on is parsed every time, so
+        // that it does so.)
+        if (Sk.pytchThreading === pytchThreading) {
+            this.file.units.set(key, record);
+        }
+        return record;
+    };
+
+    /** The statements of the given record, as for a unit at "lineno". */
+    Compilation.prototype.stmts = function (record, lineno) {
+        const stmts = copyAst(record.stmts, lineno - record.lineno);
+        if (stmts.length === 1 && stmts[0] instanceof Sk.astnodes.FunctionDef) {
+            this.functionUnits.set(stmts[0], record);
+        }
+        return stmts;
+    };
+
+    Compilation.prototype.topLevelStmts = function (lineno, endLineno) {
+        const text = this.text(lineno, endLineno);
+        const record = this.unitRecord("module", text, lineno, (text, lineno) => (
+            Sk.parseToAst(this.filename, text, lineno).body
+        ));
+        return this.stmts(record, lineno);
+    };
+
+    Compilation.prototype.classStmt = function (unit, members) {
+        const headerText = this.text(unit.lineno, members[0].lineno);
+        const indent = /^\s*/.exec(this.lines[members[0].lineno - 1])[0];
+        const header = this.unitRecord("class", headerText, unit.lineno, (text, lineno) => (
+            Sk.parseToAst(this.filename, text + indent + "pass\n", lineno).body
+        ));
+        const classDef = this.stmts(header, unit.lineno)[0];
+        classDef.body = [];
+        for (const member of members) {
+            const text = this.text(member.lineno, member.endLineno);
+            const record = this.unitRecord("member", text, member.lineno, (text, lineno) => (
+                Sk.parseToAst(this.filename, "class _:\n" + text, lineno - 1).body[0].body
+            ));
+            classDef.body.push(...this.stmts(record, member.lineno));
+        }
+        return classDef;
+    };
+
+    /** The AST of the module, or null if it needs parsing as a whole. */
+    Compilation.prototype.moduleAst = function () {
+        const starts = statementStarts(this.filename, this.lines);
+        if (starts.length > 0 && starts[0].depth !== 0) {
+            // (An indented first statement, which is a syntax error.)
+            return null;
+        }
+        const endLineno = this.lines.length + 1;
+        const body = [];
+        for (const unit of groupUnits(starts.filter((s) => s.depth === 0), endLineno)) {
+            const members = (unit.keyword === "class"
+                             ? groupUnits(starts.filter((s) => (s.depth === 1
+                                                                && s.lineno > unit.keywordLineno
+                                                                && s.lineno < unit.endLineno)),
+                                          unit.endLineno)
+                             : []);
+            if (members.length > 0) {
+                body.push(this.classStmt(unit, members));
+            } else {
+                body.push(...this.topLevelStmts(unit.lineno, unit.endLineno));
+            }
+        }
+        return new Sk.astnodes.Module(body);
+    };
+
+    Sk.incrementalCompilation = {};
+
+    /**
+     * For Sk.compile(): the AST of the given source, built from the units
+     * kept from the last compilation of the same file where they are
+     * unchanged.  The result also has the unit records of the functions
+     * which may reuse their code ("functionUnits"), and the record of this
+     * compilation ("file").  If the source does not parse, null; the
+     * caller should then compile it as usual.
+     *
+     * As for Sk.parseToAst(), this may turn on Sk.pytchThreading.
+     */
+    Sk.incrementalCompilation.moduleAst = function (filename, source) {
+        let lastFile = files.get(filename);
+        if (lastFile !== undefined && lastFile.futureFlags !== futureSignature()) {
+            lastFile = undefined;
+        }
+        const pytchThreading = Sk.pytchThreading;
+        const compilation = new Compilation(filename, source.split("\n"), lastFile);
+        let ast;
+        try {
+            ast = compilation.moduleAst();
+        } catch (err) {
+            if (!(err instanceof Sk.builtin.SyntaxError)) {
+                throw err;
+            }
+            ast = null;
+        }
+        if (ast === null) {
+            files.delete(filename);
+            Sk.pytchThreading = pytchThreading;
+            return null;
+        }
+        files.set(filename, compilation.file);
+        Sk.gensymcount = Math.max(Sk.gensymcount, compilation.file.gensymHighWater);
+        return { ast: ast, functionUnits: compilation.functionUnits, file: compilation.file };
+    };
+
+    /**
+     * What, other than the function itself, the code compiled for a
+     * function of the given file depends on, once its AST is built.
+     */
+    Sk.incrementalCompilation.codeContext = function (filename, canSuspend) {
+        return JSON.stringify([
+            filename,
+            !!canSuspend,
+            futureSignature(),
+            Sk.pytchThreading,
+            Sk.execLimit !== null,
+            Sk.yieldLimit !== null,
+            codeOptions.map((name) => Sk[name]),
+        ]);
+    };
+
+    const scopeSignature = (ste) => [
+        JSON.stringify(ste.symFlags), ste.generator, ste.hasFree, ste.childHasFree,
+    ].join();
+
+    /**
+     * What the code compiled for the given function (or anything within
+     * it) depends on from the symbol table, the suspension analysis, and
+     * the passes changing the AST (folding constants and eliding Pytch
+     * loop yields).
+     */
+    Sk.incrementalCompilation.functionSignature = function (n, st, nonSuspendingFunctions) {
+        const parts = [];
+        const visit = (node) => {
+            if (Array.isArray(node)) {
+                node.forEach(visit);
+                return;
+            }
+            if (node === null || typeof node !== "object" || node._astname === undefined) {
+                return;
+            }
+            parts.push(node._astname);
+            if (node.scopeId !== undefined) {
+                parts.push(scopeSignature(st.getStsForAst(node)));
+            }
+            if (nonSuspendingFunctions.has(node)) {
+                parts.push("nonsuspending");
+            }
+            if (node.$isPytchAutoYield === true) {
+                parts.push("yield");
+            }
+            for (const field of Object.keys(node)) {
+                visit(node[field]);
+            }
+        };
+        visit(n);
+        return parts.join("\n");
+    };
+})();
@@ -418,8 +418,10 @@ var $builtinmodule = function (name) {
         }
 
         async async_init() {
+            const endTrace = Sk.startupTrace.begin("asset-load");
             await this.async_load_appearances();
             await this.async_load_sounds();
+            endTrace();
         }
 
         get n_appearances() {
@@ -964,6 +966,13 @@ var $builtinmodule = function (name) {
             this.callable_name = js_getattr(py_callable, Sk.builtin.str.$name);
 
             this.loop_iteration_batching_states = [new LoopIterationBatchingState(1)];
+
+            // The last element of loop_iteration_batching_states.  Compiled
+            // code spends this state's credits directly, only calling
+            // pytch.yield_until_next_frame() when there are none left; see
+            // Compiler.cpytchautoyield().
+            this.active_loop_iteration_batching_state
+                = this.loop_iteration_batching_states[0];
         }
 
         is_running() {
@@ -1006,7 +1015,9 @@ var $builtinmodule = function (name) {
         should_wake() {
             switch (this.state) {
             case Thread.State.AWAITING_THREAD_GROUP_COMPLETION:
-                return (! this.sleeping_on.has_live_threads());
+                // The awaited thread group tells the project when it has
+                // finished; see ThreadGroup.release_waiters().
+                return false;
 
             case Thread.State.AWAITING_PASSAGE_OF_TIME:
                 this.sleeping_on -= 1;
@@ -1060,6 +1071,15 @@ var $builtinmodule = function (name) {
             }
         }
 
+        // Wake this thread, which was waiting for the given thread-group to
+        // finish, unless it has since stopped waiting for that group (for
+        // example, by being culled).
+        wake_on_completion_of(thread_group) {
+            if (this.state === Thread.State.AWAITING_THREAD_GROUP_COMPLETION
+                && this.sleeping_on === thread_group)
+                this.wake();
+        }
+
         maybe_cull() {
             if (! this.actor_instance.py_object_is_registered) {
                 this.state = Thread.State.ZOMBIE;
@@ -1082,6 +1102,7 @@ var $builtinmodule = function (name) {
                 if (syscall_args.wait) {
                     this.state = Thread.State.AWAITING_THREAD_GROUP_COMPLETION;
                     this.sleeping_on = new_thread_group;
+                    new_thread_group.add_waiter(this);
                 }
 
                 return [new_thread_group];
@@ -1252,16 +1273,13 @@ var $builtinmodule = function (name) {
         }
 
         should_yield() {
-            let active_loop_yield_state
-                = this.loop_iteration_batching_states[
-                    this.loop_iteration_batching_states.length - 1];
-
-            return active_loop_yield_state.should_yield();
+            return this.active_loop_iteration_batching_state.should_yield();
         }
 
         push_loop_iterations_per_frame(iterations_per_frame) {
-            this.loop_iteration_batching_states.push(
-                new LoopIterationBatchingState(iterations_per_frame));
+            const state = new LoopIterationBatchingState(iterations_per_frame);
+            this.loop_iteration_batching_states.push(state);
+            this.active_loop_iteration_batching_state = state;
         }
 
         pop_loop_iterations_per_frame() {
@@ -1275,6 +1293,9 @@ var $builtinmodule = function (name) {
                     "cannot pop the base LoopIterationBatchingState");
 
             this.loop_iteration_batching_states.pop();
+            this.active_loop_iteration_batching_state
+                = this.loop_iteration_batching_states[
+                    this.loop_iteration_batching_states.length - 1];
         }
 
         info() {
@@ -1343,6 +1364,13 @@ var $builtinmodule = function (name) {
         constructor(label) {
             this.label = label;
             this.threads = [];
+
+            // Threads in state AWAITING_THREAD_GROUP_COMPLETION waiting for
+            // this group to finish.  Rather than each waiting thread asking
+            // every frame whether this group still has live threads, the
+            // group hands its waiters to the project, to be woken at the
+            // start of the next frame, once its last thread has finished.
+            this.waiters = [];
         }
 
         create_thread(py_callable, py_arg, parent_project) {
@@ -1361,6 +1389,20 @@ var $builtinmodule = function (name) {
             return (this.threads.length > 0);
         }
 
+        add_waiter(thread) {
+            // A group with no threads (e.g., a broadcast with no receivers)
+            // will never finish a thread, so is already complete.
+            if (this.has_live_threads())
+                this.waiters.push(thread);
+            else
+                thread.parent_project.enqueue_thread_to_wake(thread, this);
+        }
+
+        release_waiters() {
+            this.waiters.forEach(t => t.parent_project.enqueue_thread_to_wake(t, this));
+            this.waiters = [];
+        }
+
         maybe_wake_threads() {
             this.threads.forEach(t => t.maybe_wake());
         }
@@ -1376,6 +1418,8 @@ var $builtinmodule = function (name) {
 
             if (this.has_live_threads())
                 new_thread_groups.push(this);
+            else
+                this.release_waiters();
 
             return new_thread_groups;
         }
@@ -1670,6 +1714,153 @@ var $builtinmodule = function (name) {
     }
 
 
+    ////////////////////////////////////////////////////////////////////////////////
+    //
+    // ProjectSnapshot: The state of a built Project, typically taken right
+    // after import, which can later be restored to give a project in the same
+    // pristine state without recompiling the program and re-registering its
+    // actors.
+    //
+    // The snapshot records the contents of every mutable Python object
+    // reachable from the project's module globals, its actor classes, and its
+    // actor instances.  Restoring writes those contents back into the very
+    // same objects, so object identities (and hence aliasing) are preserved,
+    // and the cost is proportional to the size of the recorded state.  The
+    // insides of functions and of modules other than the project's own are
+    // not recorded.  Nor are threads; restoring kills all running threads.
+
+    const is_dunder_name = (name) => (name.startsWith("__") && name.endsWith("__"));
+
+    class ProjectSnapshot {
+        constructor(project) {
+            this.actor_instances = project.actors.map(a => a.instances.slice());
+            this.draw_layer_instances = project.draw_layer_groups.map(
+                dlg => dlg.instances.slice());
+            this.object_attribute_watchers = project.object_attribute_watchers.slice();
+
+            // Map from object to record of its saved contents.
+            this.saved_contents = new Map();
+
+            let roots = [];
+            const mod = project.$containingModule;
+            if (mod != null) {
+                this.saved_contents.set(mod, { module_attrs: Object.assign({}, mod.$d) });
+                roots.push(...Object.values(mod.$d));
+            }
+            project.actors.forEach(actor => {
+                roots.push(actor.py_cls);
+                actor.instances.forEach(i => roots.push(i.py_object));
+            });
+
+            this.record_reachable(roots);
+        }
+
+        record_reachable(roots) {
+            let to_visit = roots.slice();
+            const visit = (obj) => to_visit.push(obj);
+
+            while (to_visit.length > 0) {
+                const obj = to_visit.pop();
+                if (obj == null || typeof obj !== "object" && typeof obj !== "function")
+                    continue;
+                if (this.saved_contents.has(obj))
+                    continue;
+                if (obj instanceof Sk.builtin.module || obj instanceof Sk.builtin.func)
+                    continue;
+
+                let saved = {};
+
+                if (obj instanceof Sk.builtin.list) {
+                    saved.list_items = obj.v.slice();
+                    saved.list_items.forEach(visit);
+                } else if (obj instanceof Sk.builtin.tuple) {
+                    obj.v.forEach(visit);
+                } else if (obj instanceof Sk.builtin.dict) {
+                    saved.dict_copy = obj.dict$copy();
+                    saved.dict_copy.$items().forEach(([k, v]) => { visit(k); visit(v); });
+                } else if (obj instanceof Sk.builtin.set) {
+                    visit(obj.v);
+                } else if (Sk.builtin.checkClass(obj)) {
+                    // Only user-defined classes have mutable attributes.
+                    if (obj.sk$klass === undefined)
+                        continue;
+                    const proto = obj.prototype;
+                    saved.class_attrs = {};
+                    Object.keys(proto).forEach(name => {
+                        if (! is_dunder_name(name)) {
+                            saved.class_attrs[name] = proto[name];
+                            visit(proto[name]);
+                        }
+                    });
+                }
+
+                if (obj.$d instanceof Sk.builtin.dict)
+                    visit(obj.$d);
+                if (obj.$s instanceof Array && obj.$s.length > 0) {
+                    saved.slot_values = obj.$s.slice();
+                    saved.slot_values.forEach(visit);
+                }
+
+                this.saved_contents.set(obj, saved);
+            }
+        }
+
+        restore_contents(obj, saved) {
+            if (saved.module_attrs !== undefined) {
+                const $d = obj.$d;
+                Object.keys($d).forEach(name => {
+                    if (! saved.module_attrs.hasOwnProperty(name))
+                        delete $d[name];
+                });
+                Object.assign($d, saved.module_attrs);
+                Sk.globalsVersion++;
+            }
+            if (saved.list_items !== undefined)
+                obj.v = saved.list_items.slice();
+            if (saved.dict_copy !== undefined) {
+                // Copy again, so the snapshot can be restored more than once.
+                const copy = saved.dict_copy.dict$copy();
+                obj.entries = copy.entries;
+                obj.buckets = copy.buckets;
+                obj.size = copy.size;
+                obj.$version++;
+            }
+            if (saved.class_attrs !== undefined) {
+                // These writes bypass tp$setattr, so invalidate the attribute
+                // caches it would have.
+                const proto = obj.prototype;
+                Object.keys(proto).forEach(name => {
+                    if (! is_dunder_name(name) && ! saved.class_attrs.hasOwnProperty(name)) {
+                        delete proto[name];
+                        Sk.generic.invalidateAttrCaches(name);
+                    }
+                });
+                Object.keys(saved.class_attrs).forEach(name => {
+                    if (proto[name] !== saved.class_attrs[name]) {
+                        proto[name] = saved.class_attrs[name];
+                        Sk.generic.invalidateAttrCaches(name);
+                    }
+                });
+            }
+            if (saved.slot_values !== undefined)
+                obj.$s = saved.slot_values.slice();
+        }
+
+        restore_into(project) {
+            project.actors.forEach((actor, idx) => {
+                actor.instances = this.actor_instances[idx].slice();
+                actor.instances.forEach(i => { i.py_object_is_registered = true; });
+            });
+            project.draw_layer_groups.forEach((dlg, idx) => {
+                dlg.instances = this.draw_layer_instances[idx].slice();
+            });
+            project.object_attribute_watchers = this.object_attribute_watchers.slice();
+
+            this.saved_contents.forEach((saved, obj) => this.restore_contents(obj, saved));
+        }
+    }
+
+
     ////////////////////////////////////////////////////////////////////////////////
     //
     // Javascript-level "Project" class
@@ -1680,6 +1871,11 @@ var $builtinmodule = function (name) {
             this.actors = [];
             this.thread_groups = [];
 
+            // Threads whose awaited thread-group has finished, each with
+            // that thread-group, as [thread, thread_group] pairs.  These
+            // threads are woken at the start of the next frame.
+            this.threads_to_wake = [];
+
             // Queue of yet-to-be-answered questions; the one at the front of
             // the queue should either: be being asked by the VM's client; or have
             // received an answer from the VM's client.
@@ -1712,6 +1908,13 @@ var $builtinmodule = function (name) {
                 new DrawLayerGroup(),  // Sprites
                 new DrawLayerGroup(),  // Text (one day)
             ];
+
+            // State recorded by take_snapshot(), if it has been called.
+            this.snapshot = null;
+
+            // Whether one_frame() has yet been called, so that the first
+            // call can be recorded in Sk.startupTrace.
+            this.has_run_first_frame = false;
         }
 
         actor_by_class_name(cls_name) {
@@ -1879,10 +2082,16 @@ var $builtinmodule = function (name) {
         }
 
         one_frame() {
+            if (! this.has_run_first_frame) {
+                this.has_run_first_frame = true;
+                return Sk.startupTrace.time("first-frame", () => this.one_frame());
+            }
+
             this.launch_keypress_handlers();
             this.launch_mouse_click_handlers();
 
             this.thread_groups.forEach(tg => tg.maybe_cull_threads());
+            this.wake_enqueued_threads();
             this.thread_groups.forEach(tg => tg.maybe_wake_threads());
 
             let new_thread_groups = map_concat(tg => tg.one_frame(),
@@ -1921,9 +2130,38 @@ var $builtinmodule = function (name) {
             return project_state;
         }
 
+        enqueue_thread_to_wake(thread, thread_group) {
+            this.threads_to_wake.push([thread, thread_group]);
+        }
+
+        wake_enqueued_threads() {
+            const threads_to_wake = this.threads_to_wake;
+            this.threads_to_wake = [];
+            threads_to_wake.forEach(([t, tg]) => t.wake_on_completion_of(tg));
+        }
+
+        /** Record the current state of the project (see ProjectSnapshot),
+         * replacing any previous snapshot.  Typically called right after the
+         * project is built, before any threads have been launched. */
+        take_snapshot() {
+            this.snapshot = new ProjectSnapshot(this);
+        }
+
+        /** Return the project to the state recorded by the most recent call
+         * to take_snapshot(), stopping all threads, sounds, and questions,
+         * and deleting all clones created since then. */
+        restore_snapshot() {
+            if (this.snapshot == null)
+                throw Error("no snapshot to restore");
+
+            this.kill_all_threads_and_extras();
+            this.snapshot.restore_into(this);
+        }
+
         kill_all_threads_and_extras() {
             this.object_attribute_watchers = [];
             this.thread_groups = [];
+            this.threads_to_wake = [];
             this.unanswered_questions = [];
             Sk.pytch.sound_manager.stop_all_performances();
         }
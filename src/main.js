@@ -5,6 +5,9 @@
 // Order is important!
 
 require("./util.js");
+require("./startup_trace.js");
+
+const endLoadBuiltins = Sk.startupTrace.begin("load:builtins");
 
 // Global support functions
 Sk.global["strftime"] = require("strftime");
@@ -71,6 +74,9 @@ require("./filter.js");
 require("./map.js");
 require("./reversed.js");
 require("./zip.js");
+endLoadBuiltins();
+
+const endLoadCompiler = Sk.startupTrace.begin("load:compiler");
 require("./token.js");
 require("./tokenize.js");
 require("../gen/parse_tables.js");
@@ -78,7 +84,15 @@ require("./parser.js");
 require("../gen/astnodes.js");
 require("./ast.js");
 require("./symtable.js");
+require("./constant_folding.js");
+require("./pytch_loop_yields.js");
+require("./suspension_analysis.js");
+require("./source_maps.js");
+require("./incremental_compile.js");
 require("./compile.js");
+endLoadCompiler();
+
+const endLoadSupport = Sk.startupTrace.begin("load:support");
 require("./import.js");
 require("./timsort.js");
 require("./super.js");
@@ -87,5 +101,6 @@ require("./builtindict.js");
 require("./constants.js");
 require("./pytchsupport.js");
 require("./tigerpython-parser.js");
+endLoadSupport();
 
 /* jshint ignore:end */
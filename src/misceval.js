@@ -76,6 +76,141 @@ Sk.misceval.retryOptionalSuspensionOrThrow = function (susp, message) {
 };
 Sk.exportSymbol("Sk.misceval.retryOptionalSuspensionOrThrow", Sk.misceval.retryOptionalSuspensionOrThrow);
 
+/**
+ * Whether the exception "err" is matched by the class (or tuple of classes)
+ * "type" of an "except" clause.  Usually "type" is a class of which "err" is
+ * an instance, which instanceof confirms without the checks of isinstance().
+ *
+ * @param {Sk.builtin.BaseException} err
+ * @param {*} type
+ * @return {boolean}
+ */
+Sk.misceval.exceptionMatches = function (err, type) {
+    if (typeof type === "function" && err instanceof type) {
+        return true;
+    }
+    return Sk.builtin.isinstance(err, type) === Sk.builtin.bool.true$;
+};
+Sk.exportSymbol("Sk.misceval.exceptionMatches", Sk.misceval.exceptionMatches);
+
+/**
+ * @description
+ * With the "clockCheckBudget" option, compiled code does not read the clock
+ * at each point where Sk.execLimit or Sk.yieldLimit might have run out (the
+ * start of each function, and each jump between blocks, including every
+ * loop iteration).  Instead it counts down Sk.misceval.clockCheckCountdown,
+ * and calls Sk.misceval.checkTimeLimits() when that goes negative.
+ *
+ * Each call sets the countdown to a stride calibrated so that the clock
+ * is read about every clockCheckIntervalMs: doubled if the last stride
+ * took less time than that, scaled down if it took more, and back to 1 if
+ * it took far more.
+ *
+ * A stride is only a count of checks, so one calibrated on cheap
+ * iterations would let as many slow ones run without reading the clock.
+ * Compiled code therefore restarts the calibration from a stride of 1
+ * each time it enters a loop (see restartClockCheckStride()), and a loop
+ * with slow iterations never earns a long stride.
+ */
+Sk.misceval.clockCheckCountdown = 0;
+
+const clockCheckIntervalMs = 2;
+const maxClockCheckStride = 1024;
+let clockCheckStride = 1;
+let lastClockCheck = 0;
+
+/**
+ * Throw a TimeoutError if Sk.execLimit has run out, and report whether the
+ * caller should yield because Sk.yieldLimit has.
+ *
+ * @param {boolean} canYield whether the caller would yield
+ * @return {boolean}
+ */
+Sk.misceval.checkTimeLimits = function (canYield) {
+    const now = Date.now();
+    const elapsed = now - lastClockCheck;
+    lastClockCheck = now;
+    if (elapsed < clockCheckIntervalMs) {
+        clockCheckStride = Math.min(2 * clockCheckStride, maxClockCheckStride);
+    } else if (elapsed > 8 * clockCheckIntervalMs) {
+        clockCheckStride = 1;
+    } else if (elapsed > 2 * clockCheckIntervalMs) {
+        clockCheckStride = Math.max(Math.floor(clockCheckStride * clockCheckIntervalMs / elapsed), 1);
+    }
+
+    if (Sk.execLimit !== null && now - Sk.execStart > Sk.execLimit) {
+        throw new Sk.builtin.TimeoutError(Sk.timeoutMsg());
+    }
+    if (Sk.yieldLimit !== null && now - Sk.lastYield > Sk.yieldLimit) {
+        if (canYield) {
+            Sk.misceval.clockCheckCountdown = clockCheckStride;
+            return true;
+        }
+        // Check again at the next opportunity, which might be able to.
+        Sk.misceval.clockCheckCountdown = 0;
+        return false;
+    }
+    Sk.misceval.clockCheckCountdown = clockCheckStride;
+    return false;
+};
+Sk.exportSymbol("Sk.misceval.checkTimeLimits", Sk.misceval.checkTimeLimits);
+
+/**
+ * Restart the calibration of the countdown from a stride of 1, so that
+ * the next check reads the clock.  Called by compiled code on entering a
+ * loop, whose iterations might cost far more than those the current
+ * stride was calibrated on.
+ */
+Sk.misceval.restartClockCheckStride = function () {
+    clockCheckStride = 1;
+    Sk.misceval.clockCheckCountdown = 0;
+};
+Sk.exportSymbol("Sk.misceval.restartClockCheckStride", Sk.misceval.restartClockCheckStride);
+
+/**
+ * @description
+ * With the "debugging" option (or "killableWhile" or "killableFor"),
+ * compiled code has a breakpoint check at the start of each statement (or
+ * loop iteration), which calls Sk.breakpoints() and suspends if that says
+ * to.  Each module looks up the record for its file once, with
+ * Sk.misceval.breakpointFile(), and its checks only call Sk.breakpoints()
+ * while that record is "active".
+ *
+ * Every file is active unless something, such as Sk.Debugger, which knows
+ * where the breakpoints are, restricts the checks to the files which have
+ * any, with Sk.misceval.setBreakpointFiles().
+ */
+const breakpointFiles = new Map();
+let breakpointFilesFilter = null;
+
+/**
+ * @param {string} filename
+ * @return {{active: boolean}}
+ */
+Sk.misceval.breakpointFile = function (filename) {
+    let record = breakpointFiles.get(filename);
+    if (record === undefined) {
+        record = { active: breakpointFilesFilter === null || breakpointFilesFilter.has(filename) };
+        breakpointFiles.set(filename, record);
+    }
+    return record;
+};
+Sk.exportSymbol("Sk.misceval.breakpointFile", Sk.misceval.breakpointFile);
+
+/**
+ * Limit the breakpoint checks which call Sk.breakpoints() to those in the
+ * given files, or, if null, lift that limit.
+ *
+ * @param {Iterable<string>|null} filenames
+ */
+Sk.misceval.setBreakpointFiles = function (filenames) {
+    breakpointFilesFilter = (filenames === null) ? null : new Set(filenames);
+    for (const [filename, record] of breakpointFiles) {
+        record.active = breakpointFilesFilter === null || breakpointFilesFilter.has(filename);
+    }
+};
+Sk.exportSymbol("Sk.misceval.setBreakpointFiles", Sk.misceval.setBreakpointFiles);
+
 /**
  * @description
  * Check if the given object is valid to use as an index. Only ints, or if the object has an `__index__` method.
@@ -687,6 +822,51 @@ Sk.misceval.loadname = function (name, other) {
 };
 Sk.exportSymbol("Sk.misceval.loadname", Sk.misceval.loadname);
 
+/**
+ * Incremented whenever a name is bound or unbound in any module's
+ * globals, or in the builtins, so that an inline cache of a global name
+ * lookup (see loadnameCached()) is valid while this is unchanged.
+ *
+ * Compiled code increments it on module-level and "global" assignments
+ * and deletions; Python-level changes to a module's attributes go through
+ * Sk.builtin.module.tp$setattr, which also increments it.  JavaScript
+ * code which changes a module's $d directly, or Sk.builtins, after
+ * Python code has started running, must increment it too.
+ *
+ * @type {number}
+ */
+Sk.globalsVersion = 0;
+
+/**
+ * @function
+ * @description
+ * Create an empty cache for the compiled code of one or more loads of the
+ * given global name.
+ * @param {string} name
+ */
+Sk.misceval.newGlobalCache = function (name) {
+    return { name: name, version: -1, value: undefined };
+};
+
+/**
+ * @function
+ * @description
+ * As for loadname(), but also remember the result in the given cache,
+ * valid until Sk.globalsVersion next changes.  Compiled code only calls
+ * this when the cache is out of date.
+ * @param {string} name
+ * @param {Object} other generally globals
+ * @param {Object} cache as made by newGlobalCache()
+ */
+Sk.misceval.loadnameCached = function (name, other, cache) {
+    const v = Sk.misceval.loadname(name, other);
+    cache.version = Sk.globalsVersion;
+    cache.value = v;
+    return v;
+};
+Sk.exportSymbol("Sk.misceval.newGlobalCache", Sk.misceval.newGlobalCache);
+Sk.exportSymbol("Sk.misceval.loadnameCached", Sk.misceval.loadnameCached);
+
 /**
  *
  * Notes on necessity for 'call()':
@@ -883,6 +1063,65 @@ Sk.misceval.apply = function (func, kwdict, varargseq, kws, args) {
 };
 Sk.exportSymbol("Sk.misceval.apply", Sk.misceval.apply);
 
+/**
+ * @description
+ * How much of their time the programs run by Sk.misceval.asyncToPromise()
+ * have spent executing, and how much yielded to the event loop (at "Sk.yield"
+ * and "Sk.delay" suspensions) or waiting for Promises (at "Sk.promise"
+ * suspensions, and those a handler deals with).  A yield which comes before
+ * the program has executed for long enough, given how long its last yield
+ * took, to keep to the "yieldDutyCycle" option is skipped, i.e., batched
+ * with the next one, and counted in "batchedYields" rather than "yields".
+ * Times are in ms.
+ */
+Sk.misceval.yieldStats = {
+    executingMs: 0,
+    yieldedMs: 0,
+    yields: 0,
+    batchedYields: 0,
+};
+
+Sk.misceval.resetYieldStats = function () {
+    Sk.misceval.yieldStats.executingMs = 0;
+    Sk.misceval.yieldStats.yieldedMs = 0;
+    Sk.misceval.yieldStats.yields = 0;
+    Sk.misceval.yieldStats.batchedYields = 0;
+};
+Sk.exportSymbol("Sk.misceval.resetYieldStats", Sk.misceval.resetYieldStats);
+
+const yieldClock = (function () {
+    const performance = Sk.global["performance"];
+    return ((performance !== undefined && typeof performance.now === "function")
+            ? () => performance.now()
+            : () => Date.now());
+}());
+
+/**
+ * Call the given function from a new task of the event loop, after any
+ * pending input and rendering.  Browsers (and workers) run a message
+ * posted to a MessageChannel sooner than a setTimeout(), or the
+ * setImmediate() polyfill, which posts to the whole window; under Node, a
+ * MessageChannel would keep the process alive, and setImmediate() is
+ * native anyway.
+ */
+const scheduleMacrotask = (function () {
+    const MessageChannel = Sk.global["MessageChannel"];
+    const isNode = (typeof process !== "undefined"
+                    && process.versions != null
+                    && process.versions.node != null);
+    if (isNode || typeof MessageChannel !== "function") {
+        return (fn) => Sk.global["setImmediate"](fn);
+    }
+
+    const pending = [];
+    const channel = new MessageChannel();
+    channel.port1.onmessage = () => pending.shift()();
+    return (fn) => {
+        pending.push(fn);
+        channel.port2.postMessage(null);
+    };
+}());
+
 /**
  * Wraps anything that can return an Sk.misceval.Suspension, and returns a
  * JS Promise with the result. Also takes an object map of suspension handlers:
@@ -910,6 +1149,9 @@ Sk.exportSymbol("Sk.misceval.apply", Sk.misceval.apply);
  * (Note: do *not* call asyncToPromise() in a suspension handler; this will
  * create a new Promise object for each such suspension that occurs)
  *
+ * Unhandled "Sk.yield" and "Sk.delay" suspensions give way to the event
+ * loop, if the "yieldDutyCycle" option allows (see Sk.misceval.yieldStats).
+ *
  * asyncToPromise() returns a Promise that will be resolved with the final
  * return value, or rejected with an exception if one is thrown.
  *
@@ -918,75 +1160,114 @@ Sk.exportSymbol("Sk.misceval.apply", Sk.misceval.apply);
  */
 Sk.misceval.asyncToPromise = function (suspendablefn, suspHandlers) {
     return new Promise(function (resolve, reject) {
-        try {
-            var r = suspendablefn();
-
-            (function handleResponse(r) {
-                try {
-                    // jsh*nt insists these be defined outside the loop
-                    var resume = function () {
-                        try {
-                            handleResponse(r.resume());
-                        } catch (e) {
-                            reject(e);
-                        }
-                    };
-                    var resumeWithData = function resolved(x) {
-                        try {
-                            r.data["result"] = x;
-                            resume();
-                        } catch (e) {
-                            reject(e);
-                        }
-                    };
-                    var resumeWithError = function rejected(e) {
-                        try {
-                            r.data["error"] = e;
-                            resume();
-                        } catch (ex) {
-                            reject(ex);
-                        }
-                    };
+        // The suspension being waited on.  The functions which resume it
+        // are made once, here, rather than for each suspension.
+        var r;
+        // When execution last started and stopped (to yield to the event
+        // loop, or wait for a Promise), and how long the last yield took.
+        var resumedAt = yieldClock();
+        var yieldedAt;
+        var lastYieldMs = 0;
+
+        var stopExecuting = function () {
+            yieldedAt = yieldClock();
+            Sk.misceval.yieldStats.executingMs += yieldedAt - resumedAt;
+        };
+        var startExecuting = function () {
+            resumedAt = yieldClock();
+            Sk.misceval.yieldStats.yieldedMs += resumedAt - yieldedAt;
+            return resumedAt - yieldedAt;
+        };
 
-                    while (r instanceof Sk.misceval.Suspension) {
-                        var handler = suspHandlers && (suspHandlers[r.data["type"]] || suspHandlers["*"]);
+        var resume = function () {
+            try {
+                handleResponse(r.resume());
+            } catch (e) {
+                reject(e);
+            }
+        };
+        var resumeAfterYield = function () {
+            lastYieldMs = startExecuting();
+            resume();
+        };
+        var resumeFromHandler = function (x) {
+            startExecuting();
+            handleResponse(x);
+        };
+        var resumeWithData = function resolved(x) {
+            try {
+                startExecuting();
+                r.data["result"] = x;
+                resume();
+            } catch (e) {
+                reject(e);
+            }
+        };
+        var resumeWithError = function rejected(e) {
+            try {
+                startExecuting();
+                r.data["error"] = e;
+                resume();
+            } catch (ex) {
+                reject(ex);
+            }
+        };
 
-                        if (handler) {
-                            var handlerPromise = handler(r);
-                            if (handlerPromise) {
-                                handlerPromise.then(handleResponse, reject);
-                                return;
-                            }
+        var handleResponse = function (result) {
+            try {
+                r = result;
+                while (r instanceof Sk.misceval.Suspension) {
+                    var handler = suspHandlers && (suspHandlers[r.data["type"]] || suspHandlers["*"]);
+
+                    if (handler) {
+                        var handlerPromise = handler(r);
+                        if (handlerPromise) {
+                            stopExecuting();
+                            handlerPromise.then(resumeFromHandler, reject);
+                            return;
                         }
+                    }
 
-                        if (r.data["type"] == "Sk.promise") {
-                            r.data["promise"].then(resumeWithData, resumeWithError);
-                            return;
-                        } else if (r.data["type"] == "Sk.yield") {
-                            // Assumes all yields are optional, as Sk.setTimeout might
-                            // not be able to yield.
-                            //Sk.setTimeout(resume, 0);
-                            Sk.global["setImmediate"](resume);
-                            return;
-                        } else if (r.data["type"] == "Sk.delay") {
-                            //Sk.setTimeout(resume, 1);
-                            Sk.global["setImmediate"](resume);
-                            return;
-                        } else if (r.optional) {
-                            // Unhandled optional suspensions just get
-                            // resumed immediately, and we go around the loop again.
+                    var type = r.data["type"];
+                    if (type == "Sk.promise") {
+                        stopExecuting();
+                        r.data["promise"].then(resumeWithData, resumeWithError);
+                        return;
+                    } else if (type == "Sk.yield" || type == "Sk.delay") {
+                        // Assumes all yields are optional, as Sk.setTimeout might
+                        // not be able to yield.  Give way to the event loop,
+                        // unless that would take more than our share of the
+                        // time, going by how long the last yield took.
+                        var dutyCycle = Sk.yieldDutyCycle;
+                        if (yieldClock() - resumedAt < lastYieldMs * dutyCycle / (1 - dutyCycle)) {
+                            Sk.misceval.yieldStats.batchedYields += 1;
                             r = r.resume();
                         } else {
-                            // Unhandled, non-optional suspension.
-                            throw new Sk.builtin.SuspensionError("Unhandled non-optional suspension of type '" + r.data["type"] + "'");
+                            Sk.misceval.yieldStats.yields += 1;
+                            stopExecuting();
+                            scheduleMacrotask(resumeAfterYield);
+                            return;
                         }
+                    } else if (r.optional) {
+                        // Unhandled optional suspensions just get
+                        // resumed immediately, and we go around the loop again.
+                        r = r.resume();
+                    } else {
+                        // Unhandled, non-optional suspension.
+                        throw new Sk.builtin.SuspensionError("Unhandled non-optional suspension of type '" + r.data["type"] + "'");
                     }
-
-                    resolve(r);
-                } catch (e) {
-                    reject(e);
                 }
-            })(r);
+
+                stopExecuting();
+                resolve(r);
+            } catch (e) {
+                stopExecuting();
+                reject(e);
+            }
+        };
+
+        try {
+            handleResponse(suspendablefn());
         } catch (e) {
             reject(e);
         }
@@ -39,7 +39,10 @@ Sk.builtin.module = Sk.abstr.buildNativeClass("module", {
                 return canSuspend ? res : Sk.misceval.retryOptionalSuspensionOrThrow(res);
             }
         },
-        tp$setattr: Sk.generic.setAttr,
+        tp$setattr(pyName, value, canSuspend) {
+            Sk.globalsVersion++;
+            return Sk.generic.setAttr.call(this, pyName, value, canSuspend);
+        },
         tp$new: Sk.generic.new,
         tp$init(args, kwargs) {
             const [name, doc] = Sk.abstr.copyKeywordsToNamedArgs("module", ["name", "doc"], args, kwargs, [Sk.builtin.none.none$]);
@@ -35,8 +35,58 @@ Parser.CO_FUTURE_DIVISON = 0x2000;
 Parser.CO_FUTURE_ABSOLUTE_IMPORT = 0x4000;
 Parser.CO_FUTURE_WITH_STATEMENT = 0x8000;
 
-Parser.prototype.setup = function (start) {
-    var stackentry;
+// Flags in the stateFlags table; see pgen/parser/grammar.py
+var FINAL_STATE = 1;
+var ACCEPT_ONLY_STATE = 2;
+
+/**
+ * The action for each state and label of the given grammar, as an array
+ * indexed by (state * number of labels + label): 0 for none, s + 1 to
+ * shift the token and go to state s, or -(a + 1) to push the symbol of
+ * arc a (because the label is in its first set).  As in lib2to3, where
+ * more than one arc from a state would do, the first one is taken.
+ *
+ * @param {Object} grammar
+ * @return {Int16Array}
+ */
+function actionTable (grammar) {
+    if (grammar.actions === undefined) {
+        var nLabels = grammar.labelTypes.length;
+        var nStates = grammar.stateFlags.length;
+        var words = grammar.firstSetWords;
+        var actions = new Int16Array(nStates * nLabels);
+        for (var state = 0; state < nStates; ++state) {
+            var row = state * nLabels;
+            for (var arc = grammar.stateArcs[state]; arc < grammar.stateArcs[state + 1]; ++arc) {
+                var label = grammar.arcLabels[arc];
+                var t = grammar.labelTypes[label];
+                if (t < 256) {
+                    if (actions[row + label] === 0) {
+                        actions[row + label] = grammar.arcTargets[arc] + 1;
+                    }
+                } else {
+                    var first = (t - 256) * words;
+                    for (var i = 0; i < nLabels; ++i) {
+                        if ((grammar.firstSets[first + (i >> 5)] & (1 << (i & 31))) !== 0
+                            && actions[row + i] === 0) {
+                            actions[row + i] = -(arc + 1);
+                        }
+                    }
+                }
+            }
+        }
+        grammar.actions = actions;
+    }
+    return grammar.actions;
+}
+
+/**
+ * @param {number=} start
+ * @param {function(Object)=} onTopLevelNode If given, called with each
+ * node completed as a child of the root, in place of adding it to the
+ * root's children
+ */
+Parser.prototype.setup = function (start, onTopLevelNode) {
     var newnode;
     start = start || this.grammar.start;
     //print("START:"+start);
@@ -46,114 +96,64 @@ Parser.prototype.setup = function (start) {
         type    : start,
         value   : null,
         context : null,
-        children: []
+        children: null
     };
-    stackentry =
-    {
-        dfa  : this.grammar.dfas[start],
-        state: 0,
-        node : newnode
-    };
-    this.stack = [stackentry];
+    this.actions = actionTable(this.grammar);
+    this.nLabels = this.grammar.labelTypes.length;
+    // The stack, as the state of each DFA on it, and the node being built
+    // with its children so far.  The lists of children are kept for reuse,
+    // each node getting a copy of just the right size once it is done,
+    // since most have only one child.
+    this.states = [this.grammar.dfaStates[start - 256]];
+    this.nodes = [newnode];
+    this.children = [[]];
+    this.onTopLevelNode = onTopLevelNode || null;
     this.used_names = {};
 };
 
-function findInDfa (a, obj) {
-    var i = a.length;
-    while (i--) {
-        if (a[i][0] === obj[0] && a[i][1] === obj[1]) {
-            return true;
-        }
-    }
-    return false;
-}
-
-
 // Add a token; return true if we're done
 Parser.prototype.addtoken = function (type, value, context) {
-    var errline, erroffset;
-    var itsfirst;
-    var itsdfa;
+    var grammar = this.grammar;
+    var states = this.states;
+    var ilabel = this.classify(type, value, context);
     var state;
-    var v;
+    var action;
+    var arc;
     var t;
-    var newstate;
-    var i;
-    var a;
-    var arcs;
-    var first;
-    var states;
-    var tp;
-    var ilabel = this.classify(type, value, context);
     //print("ilabel:"+ilabel);
 
-    OUTERWHILE:
     while (true) {
-        tp = this.stack[this.stack.length - 1];
-        states = tp.dfa[0];
-        first = tp.dfa[1];
-        arcs = states[tp.state];
-
-        // look for a state with this label
-        for (a = 0; a < arcs.length; ++a) {
-            i = arcs[a][0];
-            newstate = arcs[a][1];
-            t = this.grammar.labels[i][0];
-            v = this.grammar.labels[i][1];
-            if (ilabel === i) {
-                // look it up in the list of labels
-                Sk.asserts.assert(t < 256);
-                // shift a token; we're done with it
-                this.shift(type, value, newstate, context);
-                // pop while we are in an accept-only state
-                state = newstate;
-                //print("before:"+JSON.stringify(states[state]) + ":state:"+state+":"+JSON.stringify(states[state]));
-                /* jshint ignore:start */
-                while (states[state].length === 1
-                    && states[state][0][0] === 0
-                    && states[state][0][1] === state) {
-                    // states[state] == [(0, state)])
-                    this.pop();
-                    //print("in after pop:"+JSON.stringify(states[state]) + ":state:"+state+":"+JSON.stringify(states[state]));
-                    if (this.stack.length === 0) {
-                        // done!
-                        return true;
-                    }
-                    tp = this.stack[this.stack.length - 1];
-                    state = tp.state;
-                    states = tp.dfa[0];
-                    first = tp.dfa[1];
-                    //print(JSON.stringify(states), JSON.stringify(first));
-                    //print("bottom:"+JSON.stringify(states[state]) + ":state:"+state+":"+JSON.stringify(states[state]));
-                }
-                /* jshint ignore:end */
-                // done with this token
-                //print("DONE, return false");
-                return false;
-            } else if (t >= 256) {
-                itsdfa = this.grammar.dfas[t];
-                itsfirst = itsdfa[1];
-                if (itsfirst.hasOwnProperty(ilabel)) {
-                    // push a symbol
-                    this.push(t, this.grammar.dfas[t], newstate, context);
-                    continue OUTERWHILE;
+        state = states[states.length - 1];
+        action = this.actions[state * this.nLabels + ilabel];
+        if (action > 0) {
+            // shift a token; we're done with it
+            this.shift(type, value, action - 1, context);
+            // pop while we are in an accept-only state
+            state = action - 1;
+            while (grammar.stateFlags[state] & ACCEPT_ONLY_STATE) {
+                this.pop();
+                if (states.length === 0) {
+                    // done!
+                    return true;
                 }
+                state = states[states.length - 1];
             }
-        }
-
-        //print("findInDfa: " + JSON.stringify(arcs)+" vs. " + tp.state);
-        if (findInDfa(arcs, [0, tp.state])) {
-            // an accepting state, pop it and try somethign else
-            //print("WAA");
+            // done with this token
+            return false;
+        } else if (action < 0) {
+            // push a symbol
+            arc = -action - 1;
+            t = grammar.labelTypes[grammar.arcLabels[arc]];
+            this.push(t, grammar.dfaStates[t - 256], grammar.arcTargets[arc], context);
+        } else if (grammar.stateFlags[state] & FINAL_STATE) {
+            // an accepting state, pop it and try something else
             this.pop();
-            if (this.stack.length === 0) {
+            if (states.length === 0) {
                 throw new Sk.builtin.SyntaxError("too much input", this.filename);
             }
         } else {
             // no transition
-            errline = context[0][0];
-            erroffset = context[0][1];
-            throw new Sk.builtin.SyntaxError("bad input", this.filename, errline, erroffset);
+            throw new Sk.builtin.SyntaxError("bad input", this.filename, context[0][0], context[0][1]);
         }
     }
 };
@@ -175,7 +175,7 @@ Parser.prototype.classify = function (type, value, context) {
             return ilabel;
         }
     }
-    ilabel = this.grammar.tokens.hasOwnProperty(type) && this.grammar.tokens[type];
+    ilabel = (type < this.grammar.tokenLabels.length) && this.grammar.tokenLabels[type];
     if (!ilabel) {
         // throw new Sk.builtin.SyntaxError("bad token", type, value, context);
         // Questionable modification to put line number in position 2
@@ -195,71 +195,46 @@ Parser.prototype.classify = function (type, value, context) {
 
 // shift a token
 Parser.prototype.shift = function (type, value, newstate, context) {
-    var dfa = this.stack[this.stack.length - 1].dfa;
-    var state = this.stack[this.stack.length - 1].state;
-    var node = this.stack[this.stack.length - 1].node;
-    //print("context", context);
-    var newnode = {
+    this.children[this.nodes.length - 1].push({
         type      : type,
         value     : value,
         lineno    : context[0][0],         // throwing away end here to match cpython
         col_offset: context[0][1],
         children  : null
-    };
-    if (newnode) {
-        node.children.push(newnode);
-    }
-    this.stack[this.stack.length - 1] = {
-        dfa  : dfa,
-        state: newstate,
-        node : node
-    };
+    });
+    this.states[this.states.length - 1] = newstate;
 };
 
 // push a nonterminal
-Parser.prototype.push = function (type, newdfa, newstate, context) {
-    var dfa = this.stack[this.stack.length - 1].dfa;
-    var node = this.stack[this.stack.length - 1].node;
-    var newnode = {
+Parser.prototype.push = function (type, newstate, returnstate, context) {
+    this.states[this.states.length - 1] = returnstate;
+    this.states.push(newstate);
+    this.nodes.push({
         type      : type,
         value     : null,
         lineno    : context[0][0],      // throwing away end here to match cpython
         col_offset: context[0][1],
-        children  : []
-    };
-    this.stack[this.stack.length - 1] = {
-        dfa  : dfa,
-        state: newstate,
-        node : node
-    };
-    this.stack.push({
-        dfa  : newdfa,
-        state: 0,
-        node : newnode
+        children  : null
     });
+    if (this.children.length < this.nodes.length) {
+        this.children.push([]);
+    }
 };
 
-//var ac = 0;
-//var bc = 0;
-
 // pop a nonterminal
 Parser.prototype.pop = function () {
-    var node;
-    var pop = this.stack.pop();
-    var newnode = pop.node;
-    //print("POP");
-    if (newnode) {
-        //print("A", ac++, newnode.type);
-        //print("stacklen:"+this.stack.length);
-        if (this.stack.length !== 0) {
-            //print("B", bc++);
-            node = this.stack[this.stack.length - 1].node;
-            node.children.push(newnode);
-        } else {
-            //print("C");
-            this.rootnode = newnode;
-            this.rootnode.used_names = this.used_names;
-        }
+    var newnode = this.nodes.pop();
+    var children = this.children[this.nodes.length];
+    newnode.children = children.slice();
+    children.length = 0;
+    this.states.pop();
+    if (this.nodes.length === 1 && this.onTopLevelNode !== null) {
+        this.onTopLevelNode(newnode);
+    } else if (this.nodes.length !== 0) {
+        this.children[this.nodes.length - 1].push(newnode);
+    } else {
+        this.rootnode = newnode;
+        this.rootnode.used_names = this.used_names;
     }
 };
 
@@ -271,21 +246,32 @@ Parser.prototype.pop = function () {
  * @param {string} filename
  * @param {string=} style root of parse tree (optional)
  */
-function makeParser (filename, style) {
+function makeParser (filename, style, onTopLevelNode) {
     if (style === undefined) {
         style = "file_input";
     }
     var p = new Parser(filename, Sk.ParseTables);
     // for closure's benefit
     if (style === "file_input") {
-        p.setup(Sk.ParseTables.sym.file_input);
+        p.setup(Sk.ParseTables.sym.file_input, onTopLevelNode);
     } else {
         Sk.asserts.fail("todo;");
     }
     return p;
 }
 
-Sk.parse = function parse (filename, input) {
+/**
+ * Parse the given source into a CST.
+ *
+ * @param {string} filename
+ * @param {string} input
+ * @param {function(Object)=} onTopLevelStmt If given, called with the
+ * CST of each top-level statement as soon as it has been parsed; these
+ * are then not included in the returned CST.
+ * @param {number=} firstLineno The number of the first line of the input,
+ * if it is not the start of its file (default 1).
+ */
+Sk.parse = function parse (filename, input, onTopLevelStmt, firstLineno) {
     var T_COMMENT = Sk.token.tokens.T_COMMENT;
     var T_NL = Sk.token.tokens.T_NL;
     var T_OP = Sk.token.tokens.T_OP;
@@ -293,7 +279,7 @@ Sk.parse = function parse (filename, input) {
     var T_ENCODING = Sk.token.tokens.T_ENCODING;
 
     var endmarker_seen = false;
-    var parser = makeParser(filename);
+    var parser = makeParser(filename, "file_input", onTopLevelStmt);
 
     /**
      * takes a string splits it on '\n' and returns a function that returns
@@ -344,7 +330,7 @@ Sk.parse = function parse (filename, input) {
                 endmarker_seen = true;
             }
         }
-    });
+    }, firstLineno);
 
     if (!endmarker_seen) {
         throw new Sk.builtin.SyntaxError("incomplete input", this.filename);
@@ -114,7 +114,74 @@ class Grammar(object):
         print("start", self.start)
 
     def genjs(self):
+        """Return the JS for Sk.ParseTables.
+
+        Besides the symbol numbers and names, and the keyword labels,
+        the tables are flattened into typed arrays, so that the parser
+        looks everything up by integer index:
+
+        dfaStates  -- the states of the DFA for symbol 256 + i are
+                      dfaStates[i] to dfaStates[i + 1] - 1, the states
+                      of all the DFAs being numbered together;
+        stateArcs  -- the arcs from state s are stateArcs[s] to
+                      stateArcs[s + 1] - 1, in their order in "states",
+                      leaving out the (0, s) arcs of final states;
+        stateFlags -- for each state, FINAL_STATE if it is final, plus
+                      ACCEPT_ONLY_STATE if that is its only arc;
+        arcLabels,
+        arcTargets -- for each arc, its label and the state it leads to;
+        labelTypes -- for each label, its token or symbol number;
+        firstSets  -- for symbol 256 + i, a bit set of the labels in its
+                      first set, in words (32 labels each) from
+                      firstSetWords * i;
+        tokenLabels -- for each token number, its label, or 0.
+        """
         from pprint import pformat
+
+        def typed_array(kind, values):
+            lines = []
+            for i in range(0, len(values), 16):
+                lines.append(", ".join(str(v) for v in values[i:i + 16]))
+            return "new %s([\n%s])" % (kind, ",\n".join(lines))
+
+        symbols = sorted(self.number2symbol)
+        assert symbols == list(range(256, 256 + len(symbols)))
+        dfa_states = [0]
+        state_arcs = [0]
+        state_flags = []
+        arc_labels = []
+        arc_targets = []
+        for symbol in symbols:
+            states = self.dfas[symbol][0]
+            base = dfa_states[-1]
+            for index, arcs in enumerate(states):
+                flags = 0
+                for label, target in arcs:
+                    if label == 0:
+                        assert target == index
+                        flags |= FINAL_STATE
+                    else:
+                        arc_labels.append(label)
+                        arc_targets.append(base + target)
+                if arcs == [(0, index)]:
+                    flags |= ACCEPT_ONLY_STATE
+                state_flags.append(flags)
+                state_arcs.append(len(arc_labels))
+            dfa_states.append(base + len(states))
+
+        first_set_words = (len(self.labels) + 31) // 32
+        first_sets = []
+        for symbol in symbols:
+            words = [0] * first_set_words
+            for label in self.dfas[symbol][1]:
+                words[label // 32] |= 1 << (label % 32)
+            # As signed 32-bit ints, for the Int32Array.
+            first_sets.extend(w - (1 << 32) if w >= (1 << 31) else w for w in words)
+
+        token_labels = [0] * (max(self.tokens) + 1)
+        for tok, label in self.tokens.items():
+            token_labels[tok] = label
+
         return (
                 "Sk.ParseTables = {\n" +
                 "sym:\n" +
@@ -123,26 +190,45 @@ class Grammar(object):
                 "number2symbol:\n" +
                 pformat(self.number2symbol) +
                 ",\n" +
-                "dfas:\n" +
-                pformat(self.dfas) +
+                "dfaStates:\n" +
+                typed_array("Uint16Array", dfa_states) +
                 ",\n" +
-                "states:\n" +
-                pformat(self.states) +
+                "stateArcs:\n" +
+                typed_array("Uint16Array", state_arcs) +
                 ",\n" +
-                "labels:\n" +
-                pformat(self.labels) +
+                "stateFlags:\n" +
+                typed_array("Uint8Array", state_flags) +
+                ",\n" +
+                "arcLabels:\n" +
+                typed_array("Uint16Array", arc_labels) +
+                ",\n" +
+                "arcTargets:\n" +
+                typed_array("Uint16Array", arc_targets) +
+                ",\n" +
+                "labelTypes:\n" +
+                typed_array("Uint16Array", [t for t, _ in self.labels]) +
+                ",\n" +
+                "firstSets:\n" +
+                typed_array("Int32Array", first_sets) +
+                ",\n" +
+                "firstSetWords: " +
+                str(first_set_words) +
                 ",\n" +
                 "keywords:\n" +
                 pformat(self.keywords) +
                 ",\n" +
-                "tokens:\n" +
-                pformat(self.tokens) +
+                "tokenLabels:\n" +
+                typed_array("Uint16Array", token_labels) +
                 ",\n" +
                 "start: " +
                 str(self.start) +
                 "\n};\n"
-            # ick, tuple -> list and None -> null
-            ).replace("(", "[").replace(")", "]").replace("None", "null")
+            )
+
+
+# Flags in the stateFlags table
+FINAL_STATE = 1
+ACCEPT_ONLY_STATE = 2
 
 
 # Map from operator to number (since tokenize doesn't do this)
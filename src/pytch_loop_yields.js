@@ -0,0 +1,304 @@
+/**
+ * @description
+ * When a module does "import pytch", the AST builder inserts a call to
+ * pytch.yield_until_next_frame() as the first statement of every loop
+ * body (see astForPytchYield() in ast.js).  This gives Scratch-like
+ * behaviour, where each iteration of a loop is seen to happen on its own
+ * frame, but it costs a call and a suspension check on every iteration,
+ * even of loops whose iterations could not be seen by anyone.
+ *
+ * Sk.elideBoundedLoopYields() walks the AST of such a module and removes
+ * the inserted call from "for" loops which:
+ *
+ *   - iterate over a small literal range, e.g., range(3) or range(1, 9, 2),
+ *     or over a small literal tuple or list, e.g., (1, 2, 3); and
+ *   - have a body which only computes values and assigns them to local
+ *     names, using no function calls, and no attribute or subscript
+ *     assignments.
+ *
+ * Nothing outside the running thread can observe the intermediate states
+ * of such a loop, so running all its iterations within one frame does not
+ * change what the user sees.  "while" loops are never changed, since their
+ * condition might depend on state changed by other threads.
+ *
+ * The pass can be turned off with the "elidePytchLoopYields" option to
+ * Sk.configure().
+ */
+
+/**
+ * Loops of more than this many iterations keep their yields.
+ */
+Sk.maxElidedLoopYieldIterations = 16;
+
+(function () {
+    const astnodes = Sk.astnodes;
+
+    const isAutoYield = (stmt) => (stmt.$isPytchAutoYield === true);
+
+    const smallIntLiteral = (expr) => {
+        if (expr instanceof astnodes.Num && expr.n instanceof Sk.builtin.int_) {
+            return (typeof expr.n.v === "number") ? expr.n.v : null;
+        }
+        if (expr instanceof astnodes.UnaryOp && expr.op === astnodes.USub) {
+            const operand = smallIntLiteral(expr.operand);
+            return (operand === null) ? null : -operand;
+        }
+        return null;
+    };
+
+    const isConstant = (expr) => (
+        expr instanceof astnodes.Num
+        || expr instanceof astnodes.Str
+        || expr instanceof astnodes.NameConstant
+        || smallIntLiteral(expr) !== null
+    );
+
+    // Number of iterations a "for" loop over the given iterable makes, if
+    // this can be known from its literal form, otherwise null.
+    const literalIterationCount = (iter, rangeIsBuiltin) => {
+        if (iter instanceof astnodes.Tuple || iter instanceof astnodes.List) {
+            return iter.elts.every(isConstant) ? iter.elts.length : null;
+        }
+
+        if (rangeIsBuiltin
+            && iter instanceof astnodes.Call
+            && iter.func instanceof astnodes.Name
+            && iter.func.id.v === "range"
+            && (iter.keywords == null || iter.keywords.length === 0)
+            && iter.args != null
+            && iter.args.length >= 1
+            && iter.args.length <= 3) {
+            const args = iter.args.map(smallIntLiteral);
+            if (args.some((a) => a === null)) {
+                return null;
+            }
+            const [start, stop, step] = (args.length === 1) ? [0, args[0], 1] : [args[0], args[1], args[2] || 1];
+            if (step === 0) {
+                return null; // Leave range() to raise its ValueError.
+            }
+            const n = Math.ceil((stop - start) / step);
+            return Math.max(n, 0);
+        }
+
+        return null;
+    };
+
+    // Whether evaluating the given expression can only compute a value,
+    // rather than calling user code which might yield or make changes
+    // visible to other threads.  Operators and attribute reads might in
+    // principle invoke user code (e.g., __add__() or a property), but such
+    // code runs without auto-inserted yields of its own.
+    const isLightExpr = (expr) => {
+        if (expr == null) {
+            return true;
+        }
+        switch (expr.constructor) {
+            case astnodes.Num:
+            case astnodes.Str:
+            case astnodes.Bytes:
+            case astnodes.NameConstant:
+            case astnodes.Name:
+                return true;
+            case astnodes.Attribute:
+                return isLightExpr(expr.value);
+            case astnodes.Subscript:
+                return isLightExpr(expr.value) && isLightSlice(expr.slice);
+            case astnodes.BinOp:
+                return isLightExpr(expr.left) && isLightExpr(expr.right);
+            case astnodes.UnaryOp:
+                return isLightExpr(expr.operand);
+            case astnodes.BoolOp:
+                return expr.values.every(isLightExpr);
+            case astnodes.Compare:
+                return isLightExpr(expr.left) && expr.comparators.every(isLightExpr);
+            case astnodes.IfExp:
+                return isLightExpr(expr.test) && isLightExpr(expr.body) && isLightExpr(expr.orelse);
+            case astnodes.Tuple:
+            case astnodes.List:
+                return expr.elts.every(isLightExpr);
+            default:
+                return false;
+        }
+    };
+
+    const isLightSlice = (slice) => {
+        switch (slice.constructor) {
+            case astnodes.Index:
+                return isLightExpr(slice.value);
+            case astnodes.Slice:
+                return isLightExpr(slice.lower) && isLightExpr(slice.upper) && isLightExpr(slice.step);
+            default:
+                return false;
+        }
+    };
+
+    // Whether assigning to the given target only changes a name local to
+    // the running code.  "sharedNames" holds the names declared "global"
+    // or "nonlocal" in the enclosing function.
+    const isLocalTarget = (target, sharedNames) => {
+        if (target instanceof astnodes.Name) {
+            return !sharedNames.has(target.id.v);
+        }
+        if (target instanceof astnodes.Tuple || target instanceof astnodes.List) {
+            return target.elts.every((elt) => isLocalTarget(elt, sharedNames));
+        }
+        return false;
+    };
+
+    const isLightBody = (stmts, sharedNames) => (stmts == null || stmts.every((stmt) => isLightStmt(stmt, sharedNames)));
+
+    const isLightStmt = (stmt, sharedNames) => {
+        switch (stmt.constructor) {
+            case astnodes.Pass:
+            case astnodes.Break:
+            case astnodes.Continue:
+                return true;
+            case astnodes.Assign:
+                return stmt.targets.every((t) => isLocalTarget(t, sharedNames)) && isLightExpr(stmt.value);
+            case astnodes.AugAssign:
+                return isLocalTarget(stmt.target, sharedNames) && isLightExpr(stmt.value);
+            case astnodes.If:
+                return isLightExpr(stmt.test) && isLightBody(stmt.body, sharedNames) && isLightBody(stmt.orelse, sharedNames);
+            case astnodes.For:
+                // Inner loops have already been visited, so a light inner
+                // loop has already lost its yield.
+                return (
+                    !(stmt.body.length > 0 && isAutoYield(stmt.body[0]))
+                    && isLocalTarget(stmt.target, sharedNames)
+                    && isLightExpr(stmt.iter)
+                    && isLightBody(stmt.body, sharedNames)
+                    && isLightBody(stmt.orelse, sharedNames)
+                );
+            default:
+                return false;
+        }
+    };
+
+    // Names declared "global" or "nonlocal" directly within the given
+    // function body (not within nested functions or classes).
+    const sharedNamesOfBody = (stmts) => {
+        const names = new Set();
+        const visit = (stmt) => {
+            switch (stmt.constructor) {
+                case astnodes.Global:
+                case astnodes.Nonlocal:
+                    stmt.names.forEach((name) => names.add(name.v));
+                    break;
+                case astnodes.FunctionDef:
+                case astnodes.AsyncFunctionDef:
+                case astnodes.ClassDef:
+                    break;
+                default:
+                    childStatementLists(stmt).forEach((body) => body.forEach(visit));
+            }
+        };
+        stmts.forEach(visit);
+        return names;
+    };
+
+    const childStatementLists = (stmt) => immediateStatementLists(stmt).filter((body) => body != null);
+
+    const immediateStatementLists = (stmt) => {
+        switch (stmt.constructor) {
+            case astnodes.For:
+            case astnodes.AsyncFor:
+            case astnodes.While:
+            case astnodes.If:
+                return [stmt.body, stmt.orelse];
+            case astnodes.With:
+            case astnodes.AsyncWith:
+                return [stmt.body];
+            case astnodes.Try:
+                return [stmt.body, stmt.orelse, stmt.finalbody].concat(stmt.handlers.map((h) => h.body));
+            case astnodes.FunctionDef:
+            case astnodes.AsyncFunctionDef:
+            case astnodes.ClassDef:
+                return [stmt.body];
+            default:
+                return [];
+        }
+    };
+
+    // Whether the module might rebind "range", in which case we cannot
+    // tell how many iterations range(...) gives.
+    const moduleRebindsRange = (mod) => {
+        let found = false;
+        const visitExpr = (node) => {
+            if (found || node == null || typeof node !== "object") {
+                return;
+            }
+            if (Array.isArray(node)) {
+                node.forEach(visitExpr);
+                return;
+            }
+            if (node instanceof astnodes.Name && node.id.v === "range" && node.ctx !== astnodes.Load) {
+                found = true;
+                return;
+            }
+            if ((node instanceof astnodes.FunctionDef || node instanceof astnodes.ClassDef) && node.name.v === "range") {
+                found = true;
+                return;
+            }
+            if (node instanceof astnodes.arg && node.arg.v === "range") {
+                found = true;
+                return;
+            }
+            if (node instanceof astnodes.alias) {
+                const boundName = (node.asname != null ? node.asname : node.name).v;
+                if (boundName === "range" || boundName === "*") {
+                    found = true;
+                }
+                return;
+            }
+            if (node._fields != null) {
+                for (let i = 1; i < node._fields.length; i += 2) {
+                    visitExpr(node._fields[i](node));
+                }
+            }
+        };
+        visitExpr(mod.body);
+        return found;
+    };
+
+    /**
+     * Remove the auto-inserted pytch.yield_until_next_frame() call from
+     * the light, bounded "for" loops of the given module AST, in place.
+     */
+    Sk.elideBoundedLoopYields = function (mod) {
+        const rangeIsBuiltin = !moduleRebindsRange(mod);
+
+        const visitBody = (stmts, sharedNames) => {
+            stmts.forEach((stmt) => {
+                switch (stmt.constructor) {
+                    case astnodes.FunctionDef:
+                    case astnodes.AsyncFunctionDef:
+                        visitBody(stmt.body, sharedNamesOfBody(stmt.body));
+                        return;
+                    case astnodes.ClassDef:
+                        visitBody(stmt.body, new Set());
+                        return;
+                }
+
+                childStatementLists(stmt).forEach((body) => visitBody(body, sharedNames));
+
+                if (stmt instanceof astnodes.For && stmt.body.length > 0 && isAutoYield(stmt.body[0])) {
+                    const nIterations = literalIterationCount(stmt.iter, rangeIsBuiltin);
+                    if (nIterations !== null
+                        && nIterations <= Sk.maxElidedLoopYieldIterations
+                        && isLocalTarget(stmt.target, sharedNames)
+                        && isLightBody(stmt.body.slice(1), sharedNames)
+                        && isLightBody(stmt.orelse, sharedNames)) {
+                        stmt.body.shift();
+                        if (stmt.body.length === 0) {
+                            stmt.body.push(new astnodes.Pass(stmt.lineno, stmt.col_offset));
+                        }
+                    }
+                }
+            });
+        };
+
+        visitBody(mod.body, new Set());
+    };
+})();
+
+Sk.exportSymbol("Sk.elideBoundedLoopYields", Sk.elideBoundedLoopYields);
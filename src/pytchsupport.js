@@ -96,16 +96,22 @@ Sk.pytchsupport.module_has_Project_instance = (mod => {
  * Project.  Then make that project the 'current live' one.
  */
 Sk.pytchsupport.maybe_auto_configure_project = (async mod => {
-    // If the user has already made their own Project, leave it alone.
+    const pytch = Sk.pytchsupport.pytch_in_module(mod);
+    const pytch_Project = pytch.$d.Project;
+
+    // If the user has already made their own Project, leave it alone,
+    // other than telling it which module it lives in.
     //
-    // TODO: Set the "$containingModule" property?  Or decide we will
-    // stop supporting non-auto-config'd Pytch programs?
+    // TODO: Decide whether we will stop supporting non-auto-config'd
+    // Pytch programs?
     //
-    if (Sk.pytchsupport.module_has_Project_instance(mod))
+    if (Sk.pytchsupport.module_has_Project_instance(mod)) {
+        Object.values(mod.$d).forEach(obj => {
+            if (Sk.misceval.isTrue(Sk.builtin.isinstance(obj, pytch_Project)))
+                obj.js_project.$containingModule = mod;
+        });
         return;
-
-    const pytch = Sk.pytchsupport.pytch_in_module(mod);
-    const pytch_Project = pytch.$d.Project;
+    }
 
     // Create a Project instance by calling the class object.
     let py_project;
@@ -154,6 +160,96 @@ Sk.pytchsupport.maybe_auto_configure_project = (async mod => {
 });
 
 
+// Map from hash of code text to {code_text, analysis}, least recently used
+// first.
+const TigerPython_analyses = new Map();
+const N_TIGERPYTHON_ANALYSES_KEPT = 8;
+
+const TigerPython_errors = (code_text => {
+    try {
+        globalThis.TPyParser.rejectDeadCode = false;
+        return globalThis.TPyParser.findAllErrors(code_text);
+    } catch (tpy_err) {
+        // An empty list is handled as "no analysis".
+        console.log("TigerPython threw error", tpy_err);
+        return [];
+    }
+});
+
+// The worker is sent {id, code_text}, and replies {id, errors}.
+const TigerPython_workers_listened_to = new WeakSet();
+const TigerPython_requests = new Map();
+let next_TigerPython_request_id = 0;
+
+const TigerPython_errors_in_worker = ((worker, code_text) => {
+    if (! TigerPython_workers_listened_to.has(worker)) {
+        worker.addEventListener("message", event => {
+            const { id, errors } = event.data;
+            const request = TigerPython_requests.get(id);
+            if (request != null) {
+                TigerPython_requests.delete(id);
+                request.resolve(errors);
+            }
+        });
+        worker.addEventListener("error", event => {
+            console.log("TigerPython worker failed", event);
+            TigerPython_requests.forEach((request, id) => {
+                if (request.worker === worker) {
+                    TigerPython_requests.delete(id);
+                    request.resolve([]);
+                }
+            });
+        });
+        TigerPython_workers_listened_to.add(worker);
+    }
+
+    const id = next_TigerPython_request_id++;
+    return new Promise(resolve => {
+        TigerPython_requests.set(id, { worker, resolve });
+        worker.postMessage({ id, code_text });
+    });
+});
+
+
+/**
+ * TigerPython's analysis of code text with a syntax error.
+ *
+ * Return a promise of a TigerPythonSyntaxAnalysis, or of null if
+ * TigerPython finds no errors (or fails).  The analyses of the last few
+ * code texts are kept, so asking again for the same code is cheap.  If
+ * Sk.pytch.TigerPython_worker is set, the analysis is done there, off the
+ * main thread; it should be a Worker running "tigerpython-worker.js".
+ */
+Sk.pytchsupport.TigerPython_analysis = (code_text => {
+    const hash = Sk.sourceHash(code_text);
+    const kept = TigerPython_analyses.get(hash);
+    if (kept != null && kept.code_text === code_text) {
+        // Move it to the end, as the most recently used.
+        TigerPython_analyses.delete(hash);
+        TigerPython_analyses.set(hash, kept);
+        return kept.analysis;
+    }
+
+    const worker = Sk.pytch.TigerPython_worker;
+    const errors = ((worker != null)
+                    ? TigerPython_errors_in_worker(worker, code_text)
+                    : Promise.resolve(TigerPython_errors(code_text)));
+    const analysis = errors.then(errs => (
+        (errs.length > 0)
+            ? new Sk.pytchsupport.TigerPythonSyntaxAnalysis({ errors: errs })
+            : null
+    ));
+
+    TigerPython_analyses.set(hash, { code_text, analysis });
+    if (TigerPython_analyses.size > N_TIGERPYTHON_ANALYSES_KEPT) {
+        const oldest_hash = TigerPython_analyses.keys().next().value;
+        TigerPython_analyses.delete(oldest_hash);
+    }
+
+    return analysis;
+});
+
+
 /**
  * Import a module from code text, and auto-configure its project if it doesn't
  * explicitly define one already.
@@ -161,50 +257,45 @@ Sk.pytchsupport.maybe_auto_configure_project = (async mod => {
 Sk.pytchsupport.import_with_auto_configure = (async code_text => {
     let module;
     try {
+        Sk.startupTrace.resetBuild();
         Sk.pytch.sound_manager.reset();
         Sk.pytch.n_loop_iterations_during_import = 0;
         Sk.pytch.max_n_loop_iterations_during_import = 1000;
-        module = await Sk.misceval.asyncToPromise(
-            () => Sk.importMainWithBody("<stdin>", false, code_text, true));
+
+        // If the standard library is split into chunks, fetch those we're
+        // going to need concurrently rather than one by one during import.
+        await Sk.startupTrace.time("stdlib-prefetch", () => Sk.prefetchStdlib());
+
+        module = await Sk.startupTrace.time("import", () => Sk.misceval.asyncToPromise(
+            () => Sk.importMainWithBody("<stdin>", false, code_text, true)));
 
         // Throw error during "import" phase if code does not "import pytch".
         const ignoredResult = Sk.pytchsupport.pytch_in_module(module);
     } catch (err) {
-        // If we get a SyntaxError, see if Tiger Python can give us a
-        // more-useful explanation of the problem than "bad input".
+        // If we get a SyntaxError, Tiger Python might give us a more-useful
+        // explanation of the problem than "bad input".  It is slow, though,
+        // so report Skulpt's error now, and let the caller ask for that.
         const TigerPython_enabled = (! Sk.pytch._disable_TigerPython);
-        if (TigerPython_enabled && (err instanceof Sk.builtin.SyntaxError)) {
-            let errs = [];
-            try {
-                globalThis.TPyParser.rejectDeadCode = false;
-                errs = globalThis.TPyParser.findAllErrors(code_text);
-            } catch (tpy_err) {
-                // Leave "errs" as empty list to be correctly handled by next "if".
-                console.log("TigerPython threw error", tpy_err);
-            }
-
-            if (errs.length > 0) {
-                const innerError = new Sk.pytchsupport.TigerPythonSyntaxAnalysis({
-                    errors: errs,
-                });
-                throw new Sk.pytchsupport.PytchBuildError({
-                    phase: "import",
-                    phaseDetail: null,
-                    innerError,
-                });
-            }
-        }
-
-        throw new Sk.pytchsupport.PytchBuildError({
+        const details = {
             phase: "import",
             phaseDetail: null,
             innerError: err,
-        });
+        };
+        if (TigerPython_enabled && (err instanceof Sk.builtin.SyntaxError)) {
+            details.TigerPython_analysis = (
+                () => Sk.pytchsupport.TigerPython_analysis(code_text)
+            );
+        }
+
+        throw new Sk.pytchsupport.PytchBuildError(details);
     }
 
     // Other sorts of PytchBuildError might be thrown by the following; let them
     // propagate to our caller if so.
-    await Sk.pytchsupport.maybe_auto_configure_project(module);
+    await Sk.startupTrace.time(
+        "build-project",
+        () => Sk.pytchsupport.maybe_auto_configure_project(module)
+    );
 
     // Ensure other bits of the code (the motivating case being detection of
     // when we're showing a module attribute, i.e., global variable) can tell
@@ -309,7 +400,10 @@ Sk.pytchsupport.PytchAssetLoadError = Sk.abstr.buildNativeClass(
  *
  * The first arg args should be an object with fields "phase" (e.g.,
  * "import" or "register/register-actor"), "phaseDetail" (which can be
- * null), and "innerError".
+ * null), and "innerError".  If the innerError is a SyntaxError, it can
+ * also have "TigerPython_analysis", a function which returns a promise of
+ * TigerPython's analysis of the code (see
+ * Sk.pytchsupport.TigerPython_analysis).
  */
 Sk.pytchsupport.PytchBuildError = Sk.abstr.buildNativeClass(
     "PytchBuildError",
@@ -375,6 +469,7 @@ Sk.pytchsupport.TigerPythonSyntaxAnalysis = Sk.abstr.buildNativeClass(
     "module_has_Project_instance",
     "maybe_auto_configure_project",
     "import_with_auto_configure",
+    "TigerPython_analysis",
     //
     "PytchAssetLoadError",
     "PytchBuildError",
@@ -232,6 +232,69 @@ var reverserange_iter_ = Sk.abstr.buildIteratorClass("range_reverseiterator", {
     flags: { sk$unacceptableBase: true },
 });
 
+/**
+ * @constructor
+ * @param {number} start
+ * @param {number} stop
+ * @param {number} step
+ *
+ * @description
+ * The state of a "for ... in range(...)" loop which the compiler has
+ * lowered to count with JS numbers (see Compiler.prototype.cfor).  Each
+ * call to advance() moves to the next value, leaving it in "last".
+ */
+function RangeLoop(start, stop, step) {
+    this.i = start;
+    this.stop = stop;
+    this.step = step;
+    this.last = undefined;
+}
+
+RangeLoop.prototype.advance = function () {
+    const i = this.i;
+    if (this.step > 0 ? i < this.stop : i > this.stop) {
+        this.last = i;
+        this.i = i + this.step;
+        return true;
+    }
+    return false;
+};
+
+// Bounds and step no bigger than this keep the counter exact.
+const maxNativeLoopArg = Math.pow(2, 52);
+
+/**
+ * @description
+ * If func is the builtin range, and args are ints for which range(*args)
+ * would be valid and small enough to count exactly with JS numbers,
+ * return the state of a native loop over the values of range(*args).
+ * Otherwise return undefined, and the loop must call func and iterate
+ * over the result as normal.
+ *
+ * @param {*} func
+ * @param {Array} args
+ * @return {RangeLoop|undefined}
+ */
+Sk.builtin.range_.nativeLoop = function (func, args) {
+    if (func !== Sk.builtin.range_) {
+        return undefined;
+    }
+    for (let i = 0; i < args.length; i++) {
+        const arg = args[i];
+        if (arg.constructor !== Sk.builtin.int_ || typeof arg.v !== "number" || Math.abs(arg.v) > maxNativeLoopArg) {
+            return undefined;
+        }
+    }
+    if (args.length === 1) {
+        return new RangeLoop(0, args[0].v, 1);
+    }
+    const step = (args.length === 3) ? args[2].v : 1;
+    if (step === 0) {
+        return undefined;
+    }
+    return new RangeLoop(args[0].v, args[1].v, step);
+};
+
 function convertIfSafe(v) {
     if (JSBI.lessThan(v, JSBI.__MAX_SAFE) && JSBI.greaterThan(v, JSBI.__MIN_SAFE)) {
         return JSBI.toNumber(v);
@@ -0,0 +1,333 @@
+/**
+ * @description
+ * Line numbers for tracebacks without per-statement bookkeeping.
+ *
+ * Normally, compiled code stores the line and column of each statement in
+ * $currLineNo and $currColNo as it runs, and the catch handler of each
+ * scope adds them to the traceback of an exception passing through.  That
+ * is a pair of stores per statement, whether or not anything goes wrong.
+ *
+ * With the "sourceMapLineNumbers" option, the compiler instead emits a
+ * marker comment wherever the Python location changes, and Sk.compile()
+ * passes the generated code through Sk.sourceMaps.wrapModuleCode(), which
+ * turns the markers into a table from offsets in the generated code to
+ * Python locations, and embeds it at the end of that code.  The text of a
+ * marker comment is "@sm" followed by one of:
+ *
+ *   S<n>       the body of the scope with index <n> (in Compiler.allUnits)
+ *              starts here;
+ *   <l>,<c>    the code for line <l>, column <c> starts here;
+ *   H          what follows is not part of a scope body (e.g. suspension
+ *              helpers, or a catch handler).
+ *
+ * An exception captures the JS stack when it is created, and again when
+ * it is raised by a "raise" statement.  When the catch handler of a scope
+ * adds an entry to the traceback, the entry only notes which frame of that
+ * scope it is (the innermost, the next one out, etc.); if something reads
+ * the entry's "lineno" or "colno", the stack is parsed and the position of
+ * that frame looked up in the table.  Where that frame cannot be found
+ * (e.g. because it was resumed from a suspension, or the stack was cut
+ * short), the entry falls back to the location of the start of the block
+ * being run ($blk) when the exception arrived.
+ */
+
+(function () {
+    const markerPrefix = "/*@sm";
+    const markerRE = /\/\*@sm(H|S\d+|\d+,\d+)\*\//g;
+    const frameRE = /skulpt-compiled-(\d+)\.js:(\d+):(\d+)/;
+    const anchorText = "new Error()";
+
+    // How many JS frames an exception keeps; many more than the usual 10
+    // are needed to reach the Python frames of a deep traceback.
+    const stackDepth = 512;
+
+    let nextMapId = 0;
+
+    Sk.sourceMaps = {};
+
+    Sk.sourceMaps.markerPrefix = markerPrefix;
+    Sk.sourceMaps.helperMarker = markerPrefix + "H*/";
+
+    Sk.sourceMaps.scopeMarker = function (scopeIndex) {
+        return markerPrefix + "S" + scopeIndex + "*/";
+    };
+
+    Sk.sourceMaps.locationMarker = function (lineno, colOffset) {
+        return markerPrefix + lineno + "," + colOffset + "*/";
+    };
+
+    /**
+     * Build the table for the marked code "body" of a compiled module,
+     * and return that code with the table, and the anchors needed to line
+     * JS stack positions up with it, added.
+     *
+     * @param {string} body
+     * @param {Array<Array<number>>} blockLocations For each scope, the
+     * line and column at the start of each of its blocks, flattened
+     * @return {string}
+     */
+    Sk.sourceMaps.wrapModuleCode = function (body, blockLocations) {
+        const id = nextMapId++;
+        const head = "var $srcmapStart=" + anchorText + ";";
+        const code = head + body + "\nvar $srcmapEnd=" + anchorText + ";";
+
+        const lineStarts = [0];
+        for (let i = code.indexOf("\n"); i !== -1; i = code.indexOf("\n", i + 1)) {
+            lineStarts.push(i + 1);
+        }
+
+        const offsets = [];
+        const locations = [];
+        let scopeIndex = -1;
+        let match;
+        markerRE.lastIndex = 0;
+        while ((match = markerRE.exec(code)) !== null) {
+            const what = match[1];
+            offsets.push(match.index + match[0].length);
+            if (what === "H") {
+                scopeIndex = -1;
+                locations.push(-1, 0, 0);
+            } else if (what[0] === "S") {
+                scopeIndex = +what.substring(1);
+                locations.push(scopeIndex, 0, 0);
+            } else {
+                const comma = what.indexOf(",");
+                locations.push(scopeIndex, +what.substring(0, comma), +what.substring(comma + 1));
+            }
+        }
+
+        const table = {
+            id: id,
+            startAnchor: head.indexOf(anchorText),
+            endAnchor: code.lastIndexOf(anchorText),
+            lineStarts: lineStarts,
+            offsets: offsets,
+            locations: locations,
+            blockLocations: blockLocations,
+        };
+
+        return (code
+                + "\nvar $srcmap=new Sk.sourceMaps.SourceMap("
+                + JSON.stringify(table) + ",$srcmapStart,$srcmapEnd);"
+                + "\n//# sourceURL=skulpt-compiled-" + id + ".js\n");
+    };
+
+    /**
+     * Parse the frames of the given Error's stack which are in compiled
+     * code, as [mapId, line, column] triples, innermost first.
+     */
+    const stackFrames = function (error) {
+        if (error.$skFrames === undefined) {
+            const frames = [];
+            const stack = (typeof error.stack === "string") ? error.stack.split("\n") : [];
+            for (const line of stack) {
+                const match = frameRE.exec(line);
+                if (match !== null) {
+                    frames.push([+match[1], +match[2], +match[3]]);
+                }
+            }
+            error.$skFrames = frames;
+        }
+        return error.$skFrames;
+    };
+
+    /**
+     * @constructor
+     * @param {Object} table As built by Sk.sourceMaps.wrapModuleCode()
+     * @param {Error} startAnchor
+     * @param {Error} endAnchor
+     *
+     * The anchors are Errors created at known offsets in the generated
+     * code, from which the line and column at which that code starts
+     * within the script actually evaluated (which may have had text added
+     * in front of it) can be found.  If the end anchor is not then where
+     * it should be, the code has been rewritten somehow (e.g. beautified
+     * for dumpJS), and the map only gives block locations.
+     */
+    Sk.sourceMaps.SourceMap = function (table, startAnchor, endAnchor) {
+        Object.assign(this, table);
+        this.usable = false;
+        const start = stackFrames(startAnchor).find((f) => f[0] === this.id);
+        const end = stackFrames(endAnchor).find((f) => f[0] === this.id);
+        if (start !== undefined && end !== undefined) {
+            this.firstLine = start[1];
+            this.firstColumn = start[2] - this.startAnchor;
+            this.usable = (this.offsetAt(end[1], end[2]) === this.endAnchor);
+        }
+    };
+
+    Sk.sourceMaps.SourceMap.prototype.offsetAt = function (line, column) {
+        const lineIndex = line - this.firstLine;
+        if (lineIndex < 0 || lineIndex >= this.lineStarts.length) {
+            return -1;
+        }
+        return this.lineStarts[lineIndex] + column - (lineIndex === 0 ? this.firstColumn : 1);
+    };
+
+    /**
+     * The index of the last marker at or before the given offset, or -1.
+     */
+    Sk.sourceMaps.SourceMap.prototype.markerAt = function (offset) {
+        const offsets = this.offsets;
+        let lo = 0;
+        let hi = offsets.length;
+        while (lo < hi) {
+            const mid = (lo + hi) >>> 1;
+            if (offsets[mid] <= offset) {
+                lo = mid + 1;
+            } else {
+                hi = mid;
+            }
+        }
+        return lo - 1;
+    };
+
+    /**
+     * The [lineno, colno] of the "occurrence"th innermost frame of the
+     * given scope in the captured stack, or null if it is not there.
+     */
+    Sk.sourceMaps.SourceMap.prototype.frameLocation = function (captured, scopeIndex, occurrence) {
+        if (!this.usable) {
+            return null;
+        }
+        let seen = 0;
+        for (const frame of capturedFrames(captured)) {
+            if (frame[0] !== this.id) {
+                continue;
+            }
+            const marker = this.markerAt(this.offsetAt(frame[1], frame[2]));
+            if (marker === -1 || this.locations[3 * marker] !== scopeIndex) {
+                continue;
+            }
+            if (seen++ === occurrence) {
+                const lineno = this.locations[3 * marker + 1];
+                return lineno === 0 ? null : [lineno, this.locations[3 * marker + 2]];
+            }
+        }
+        return null;
+    };
+
+    Sk.sourceMaps.SourceMap.prototype.blockLineno = function (scopeIndex, blk) {
+        return this.blockLocations[scopeIndex][2 * blk];
+    };
+
+    Sk.sourceMaps.SourceMap.prototype.blockColno = function (scopeIndex, blk) {
+        return this.blockLocations[scopeIndex][2 * blk + 1];
+    };
+
+    /**
+     * Record the JS stack in the given exception, for the traceback entries
+     * its frames are about to add.  An ExternalError passes the JS error it
+     * wraps, whose stack has the frame in which that error was thrown; that
+     * frame's own catch handler is where the ExternalError is created.
+     *
+     * @param {Sk.builtin.BaseException} err
+     * @param {Error=} nativeError
+     */
+    Sk.sourceMaps.captureStack = function (err, nativeError) {
+        const limit = Error.stackTraceLimit;
+        Error.stackTraceLimit = stackDepth;
+        err.$jsStack = {
+            error: new Error(),
+            nativeError: nativeError,
+            frames: null,
+            occurrences: {},
+            handledKey: null,
+            handledOccurrence: -1,
+        };
+        Error.stackTraceLimit = limit;
+    };
+
+    const capturedFrames = function (captured) {
+        if (captured.frames === null) {
+            const frames = stackFrames(captured.error);
+            if (captured.nativeError !== undefined) {
+                const thrownIn = stackFrames(captured.nativeError)[0];
+                captured.frames = (thrownIn !== undefined) ? [thrownIn].concat(frames) : frames;
+            } else {
+                captured.frames = frames;
+            }
+        }
+        return captured.frames;
+    };
+
+    /**
+     * Make the traceback entry which the catch handler of a scope compiled
+     * with a source map adds for its frame.  The entry only records which
+     * frame of which scope it is, and the block being run; its "lineno"
+     * and "colno" are worked out when first read.
+     *
+     * @param {Sk.builtin.BaseException} err
+     * @param {Sk.sourceMaps.SourceMap} map
+     * @param {number} scopeIndex
+     * @param {number} blk The block being run when err arrived
+     * @param {string} filename
+     * @param {boolean} handled Whether the scope has a handler for err, so
+     * that the same frame may add another entry if it re-raises err
+     * @param {boolean=} resuming Whether err arrived while resuming a
+     * suspension, so the frame is not on the captured stack
+     */
+    Sk.sourceMaps.tracebackEntry = function (err, map, scopeIndex, blk, filename, handled, resuming) {
+        const captured = err.$jsStack;
+        let occurrence = -1;
+        if (captured !== undefined && !resuming) {
+            const key = map.id + ":" + scopeIndex;
+            if (captured.handledKey === key) {
+                occurrence = captured.handledOccurrence;
+            } else {
+                occurrence = captured.occurrences[key] || 0;
+                captured.occurrences[key] = occurrence + 1;
+            }
+            captured.handledKey = handled ? key : null;
+            captured.handledOccurrence = occurrence;
+        }
+        return new TracebackEntry(filename, captured, map, scopeIndex, blk, occurrence);
+    };
+
+    /**
+     * @constructor
+     */
+    const TracebackEntry = function (filename, captured, map, scopeIndex, blk, occurrence) {
+        this.filename = filename;
+        this.$captured = captured;
+        this.$map = map;
+        this.$scopeIndex = scopeIndex;
+        this.$blk = blk;
+        this.$occurrence = occurrence;
+        this.$location = null;
+    };
+
+    TracebackEntry.prototype.$resolve = function () {
+        if (this.$location === null) {
+            const map = this.$map;
+            const scopeIndex = this.$scopeIndex;
+            this.$location = ((this.$occurrence !== -1
+                               && map.frameLocation(this.$captured, scopeIndex, this.$occurrence))
+                              || [map.blockLineno(scopeIndex, this.$blk), map.blockColno(scopeIndex, this.$blk)]);
+        }
+        return this.$location;
+    };
+
+    TracebackEntry.prototype.toJSON = function () {
+        return { filename: this.filename, lineno: this.lineno, colno: this.colno };
+    };
+
+    Object.defineProperties(TracebackEntry.prototype, {
+        lineno: {
+            get() {
+                return this.$resolve()[0];
+            },
+            set(v) {
+                this.$resolve()[0] = v;
+            },
+        },
+        colno: {
+            get() {
+                return this.$resolve()[1];
+            },
+            set(v) {
+                this.$resolve()[1] = v;
+            },
+        },
+    });
+}());
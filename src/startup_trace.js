@@ -0,0 +1,112 @@
+/**
+ * @namespace Sk.startupTrace
+ *
+ * @description
+ * Timestamps of the phases of starting up Skulpt and a Pytch project:
+ * loading Skulpt itself (including construction of the builtin types),
+ * Sk.configure(), importing modules, building the project, loading its
+ * assets, and running its first frame.
+ *
+ * Each record is of the form {phase, start, end}, with times in
+ * milliseconds since this file was loaded.  A phase may be recorded more
+ * than once (e.g., "asset-load" once per actor), and phases may nest
+ * (e.g., "import:pytch" within "import:__main__").
+ */
+Sk.startupTrace = (() => {
+    const performance = Sk.global.performance;
+    const now = (performance !== undefined && typeof performance.now === "function")
+        ? () => performance.now()
+        : () => Date.now();
+
+    const origin = now();
+    let records = [];
+
+    const record = (phase, start, end) => {
+        records.push({ phase, start: start - origin, end: end - origin });
+    };
+
+    /**
+     * Start timing the given phase, returning a function which, when
+     * called, ends the phase and records it.  Calling that function again
+     * has no effect.
+     */
+    const begin = (phase) => {
+        const start = now();
+        let ended = false;
+        return () => {
+            if (!ended) {
+                ended = true;
+                record(phase, start, now());
+            }
+        };
+    };
+
+    /**
+     * Call fun(), recording the given phase as lasting until fun()
+     * returns or throws, or, if it returns a Promise, until that Promise
+     * settles.  Return what fun() returned.
+     */
+    const time = (phase, fun) => {
+        const end = begin(phase);
+        let result;
+        try {
+            result = fun();
+        } catch (err) {
+            end();
+            throw err;
+        }
+        if (result instanceof Promise) {
+            return result.then(
+                (value) => { end(); return value; },
+                (err) => { end(); throw err; }
+            );
+        }
+        end();
+        return result;
+    };
+
+    /**
+     * Return a copy of the records so far, in the order the phases ended,
+     * each with an added "duration" property.
+     */
+    const phases = () => records.map(
+        (r) => Object.assign({ duration: r.end - r.start }, r)
+    );
+
+    /**
+     * Return an object mapping each phase name to its total duration.
+     */
+    const summary = () => {
+        let totals = {};
+        records.forEach((r) => {
+            totals[r.phase] = (totals[r.phase] || 0) + (r.end - r.start);
+        });
+        return totals;
+    };
+
+    /**
+     * Forget all records.  Records of the phases of loading Skulpt itself
+     * are lost too.
+     */
+    const reset = () => {
+        records = [];
+    };
+
+    /**
+     * Forget the records of building and running earlier projects, keeping
+     * those of loading Skulpt and of the latest Sk.configure().  Called at
+     * the start of each build, so that the records do not grow for the
+     * life of a page which builds project after project.
+     */
+    const resetBuild = () => {
+        const configure = records.filter((r) => r.phase === "configure").pop();
+        records = records.filter((r) => r.phase.startsWith("load:"));
+        if (configure !== undefined) {
+            records.push(configure);
+        }
+    };
+
+    return { now, begin, time, phases, summary, reset, resetBuild };
+})();
+
+Sk.exportSymbol("Sk.startupTrace", Sk.startupTrace);
@@ -0,0 +1,315 @@
+/**
+ * @description
+ * In code compiled to be able to suspend, every call is followed by a
+ * check of whether it returned a suspension, and the function is split
+ * into a new resumable block there.  This is needed for functions which
+ * might (perhaps indirectly) reach a Pytch syscall, Sk.promiseToSuspension(),
+ * etc., but it makes the generated code larger and slower for functions
+ * which cannot.
+ *
+ * Sk.findNonSuspendingFunctions() finds the functions of a module which
+ * cannot suspend, so that Compiler.buildcodeobj() can compile them as for
+ * canSuspend=false.  A function qualifies if its body:
+ *
+ *   - has no loops, "with" statements, imports, nested functions, classes,
+ *     lambdas, comprehensions, "yield", or "await"; and
+ *   - only calls builtins known not to suspend, functions of the "math"
+ *     module, or other qualifying undecorated functions defined at the top
+ *     level of the same module; and
+ *   - uses no attributes, other than of the "math" module, and no
+ *     subscripts, since these might run a property getter, __getitem__,
+ *     etc., which suspends.
+ *
+ * Names are only trusted to mean a builtin, a module, or a top-level
+ * function if nothing else in the module binds that name.  If, despite
+ * all this, something called by such a function does suspend (e.g., an
+ * operator method which does), Sk.misceval.retryOptionalSuspensionOrThrow()
+ * in the non-suspending code completes optional suspensions and raises
+ * SuspensionError for others.
+ *
+ * The analysis can be turned off with the "inferNonSuspendingFunctions"
+ * option to Sk.configure().
+ */
+
+(function () {
+    const astnodes = Sk.astnodes;
+
+    // Builtins which never iterate over an argument, and only call back into
+    // Python code (e.g., a __repr__ or __index__ method) through calls
+    // which cannot suspend however the caller is compiled.  Not, e.g.,
+    // "len" or "sorted", which let a __len__ method or a generator suspend.
+    const nonSuspendingBuiltins = new Set([
+        "abs", "bin", "bool", "chr", "divmod", "float", "hash", "hex", "id",
+        "int", "isinstance", "issubclass", "oct", "ord", "pow", "range",
+        "repr", "round", "str", "type",
+        "ArithmeticError", "AssertionError", "AttributeError", "Exception",
+        "IndexError", "KeyError", "NotImplementedError", "RuntimeError",
+        "TypeError", "ValueError", "ZeroDivisionError",
+    ]);
+
+    const nonSuspendingModules = new Set(["math"]);
+
+    // Count, for each name, how many places in the module bind it, in any
+    // scope.  A wildcard import could bind anything, so is recorded as a
+    // binding of "*".
+    const bindingCounts = (mod) => {
+        const counts = new Map();
+        const bind = (name) => counts.set(name, (counts.get(name) || 0) + 1);
+
+        const visit = (node) => {
+            if (node == null || typeof node !== "object") {
+                return;
+            }
+            if (Array.isArray(node)) {
+                node.forEach(visit);
+                return;
+            }
+            switch (node.constructor) {
+                case astnodes.Name:
+                    if (node.ctx !== astnodes.Load) {
+                        bind(node.id.v);
+                    }
+                    return;
+                case astnodes.FunctionDef:
+                case astnodes.AsyncFunctionDef:
+                case astnodes.ClassDef:
+                    bind(node.name.v);
+                    break;
+                case astnodes.alias: {
+                    const bound = (node.asname != null ? node.asname : node.name).v;
+                    bind(bound === "*" ? "*" : bound.split(".")[0]);
+                    return;
+                }
+                case astnodes.arg:
+                    bind(node.arg.v);
+                    return;
+                case astnodes.ExceptHandler:
+                    if (node.name != null) {
+                        bind(node.name.v || node.name.id.v);
+                    }
+                    break;
+            }
+            if (node._fields != null) {
+                for (let i = 1; i < node._fields.length; i += 2) {
+                    visit(node._fields[i](node));
+                }
+            }
+        };
+
+        visit(mod.body);
+        return counts;
+    };
+
+    /**
+     * Return the Set of FunctionDef nodes of the given module AST which
+     * cannot suspend.  The "st" argument is the module's symbol table.
+     */
+    Sk.findNonSuspendingFunctions = function (mod, st) {
+        const counts = bindingCounts(mod);
+        if (counts.has("*")) {
+            return new Set();
+        }
+        const boundOnce = (name) => counts.get(name) === 1;
+
+        // Top-level functions, which calls by name can be resolved to, and
+        // "import math"-style imports.  (A call to a decorated function
+        // calls whatever the decorators returned, not its body.)
+        const topLevelFunctions = new Map();
+        const topLevelModules = new Set();
+        mod.body.forEach((stmt) => {
+            if (stmt instanceof astnodes.FunctionDef
+                && stmt.decorator_list.length === 0
+                && boundOnce(stmt.name.v)) {
+                topLevelFunctions.set(stmt.name.v, stmt);
+            }
+            if (stmt instanceof astnodes.Import) {
+                stmt.names.forEach((alias) => {
+                    const bound = (alias.asname != null ? alias.asname : alias.name).v;
+                    if (nonSuspendingModules.has(alias.name.v) && boundOnce(bound)) {
+                        topLevelModules.add(bound);
+                    }
+                });
+            }
+        });
+
+        // All FunctionDefs anywhere in the module are candidates.
+        const candidates = [];
+        const collect = (stmts) => stmts.forEach((stmt) => {
+            if (stmt instanceof astnodes.FunctionDef) {
+                candidates.push(stmt);
+            }
+            if (stmt.body instanceof Array) {
+                collect(stmt.body);
+            }
+            ["orelse", "finalbody"].forEach((field) => {
+                if (stmt[field] instanceof Array) {
+                    collect(stmt[field]);
+                }
+            });
+            if (stmt.handlers instanceof Array) {
+                stmt.handlers.forEach((h) => collect(h.body));
+            }
+        });
+        collect(mod.body);
+
+        // For each candidate whose body is acceptable, the top-level
+        // functions it calls; null for an unacceptable candidate.
+        const analyseCandidate = (fun) => {
+            const ste = st.getStsForAst(fun);
+            if (ste.generator) {
+                return null;
+            }
+
+            const isGlobalName = (name) => {
+                const scope = ste.getScope(name);
+                return (scope === Sk.SYMTAB_CONSTS.GLOBAL_IMPLICIT || scope === Sk.SYMTAB_CONSTS.GLOBAL_EXPLICIT);
+            };
+
+            const callees = new Set();
+
+            // Whether the given Attribute is of one of the modules known
+            // not to suspend, e.g., "math.pi".
+            const isModuleAttribute = (e) => (
+                e instanceof astnodes.Attribute
+                && e.value instanceof astnodes.Name
+                && topLevelModules.has(e.value.id.v)
+                && isGlobalName(e.value.id.v)
+            );
+
+            const callTargetOk = (call) => {
+                const func = call.func;
+                if (func instanceof astnodes.Name) {
+                    const name = func.id.v;
+                    if (!isGlobalName(name)) {
+                        return false;
+                    }
+                    if (!counts.has(name) && nonSuspendingBuiltins.has(name)) {
+                        // Key functions passed to min(), max(), or sorted()
+                        // might suspend.
+                        return (call.keywords == null || call.keywords.length === 0);
+                    }
+                    if (topLevelFunctions.has(name)) {
+                        callees.add(topLevelFunctions.get(name));
+                        return true;
+                    }
+                    return false;
+                }
+                return isModuleAttribute(func);
+            };
+
+            const exprOk = (e) => {
+                if (e == null) {
+                    return true;
+                }
+                switch (e.constructor) {
+                    case astnodes.Num:
+                    case astnodes.Str:
+                    case astnodes.Bytes:
+                    case astnodes.NameConstant:
+                    case astnodes.Ellipsis:
+                    case astnodes.Name:
+                        return true;
+                    case astnodes.Attribute:
+                        // Other attributes might be properties whose
+                        // getters or setters suspend.  (Likewise, a
+                        // Subscript, left to the default case, might call
+                        // a __getitem__ or __setitem__ which suspends.)
+                        return isModuleAttribute(e);
+                    case astnodes.BinOp:
+                        return exprOk(e.left) && exprOk(e.right);
+                    case astnodes.UnaryOp:
+                        return exprOk(e.operand);
+                    case astnodes.BoolOp:
+                        return e.values.every(exprOk);
+                    case astnodes.Compare:
+                        return exprOk(e.left) && e.comparators.every(exprOk);
+                    case astnodes.IfExp:
+                        return exprOk(e.test) && exprOk(e.body) && exprOk(e.orelse);
+                    case astnodes.Tuple:
+                    case astnodes.List:
+                    case astnodes.Set:
+                        return (e.elts || []).every(exprOk);
+                    case astnodes.Dict:
+                        return (e.keys || []).every(exprOk) && (e.values || []).every(exprOk);
+                    case astnodes.Starred:
+                        return exprOk(e.value);
+                    case astnodes.JoinedStr:
+                        return e.values.every(exprOk);
+                    case astnodes.FormattedValue:
+                        return exprOk(e.value) && exprOk(e.format_spec);
+                    case astnodes.Call:
+                        return (callTargetOk(e)
+                                && (e.args || []).every(exprOk)
+                                && (e.keywords || []).every((kw) => exprOk(kw.value)));
+                    default:
+                        return false;
+                }
+            };
+
+            const bodyOk = (stmts) => (stmts == null || stmts.every(stmtOk));
+
+            const stmtOk = (s) => {
+                switch (s.constructor) {
+                    case astnodes.Pass:
+                    case astnodes.Global:
+                    case astnodes.Nonlocal:
+                        return true;
+                    case astnodes.Expr:
+                        return exprOk(s.value);
+                    case astnodes.Return:
+                        return exprOk(s.value);
+                    case astnodes.Assign:
+                        return s.targets.every(exprOk) && exprOk(s.value);
+                    case astnodes.AugAssign:
+                        return exprOk(s.target) && exprOk(s.value);
+                    case astnodes.AnnAssign:
+                        return exprOk(s.target) && exprOk(s.value);
+                    case astnodes.Delete:
+                        return s.targets.every(exprOk);
+                    case astnodes.If:
+                        return exprOk(s.test) && bodyOk(s.body) && bodyOk(s.orelse);
+                    case astnodes.Raise:
+                        return exprOk(s.exc) && exprOk(s.cause);
+                    case astnodes.Assert:
+                        return exprOk(s.test) && exprOk(s.msg);
+                    case astnodes.Try:
+                        return (bodyOk(s.body)
+                                && s.handlers.every((h) => exprOk(h.type) && bodyOk(h.body))
+                                && bodyOk(s.orelse)
+                                && bodyOk(s.finalbody));
+                    default:
+                        return false;
+                }
+            };
+
+            return bodyOk(fun.body) ? callees : null;
+        };
+
+        const calleesOf = new Map();
+        candidates.forEach((fun) => {
+            const callees = analyseCandidate(fun);
+            if (callees !== null) {
+                calleesOf.set(fun, callees);
+            }
+        });
+
+        // Drop functions calling dropped functions until nothing changes.
+        let changed = true;
+        while (changed) {
+            changed = false;
+            calleesOf.forEach((callees, fun) => {
+                for (const callee of callees) {
+                    if (!calleesOf.has(callee)) {
+                        calleesOf.delete(fun);
+                        changed = true;
+                        break;
+                    }
+                }
+            });
+        }
+
+        return new Set(calleesOf.keys());
+    };
+})();
+
+Sk.exportSymbol("Sk.findNonSuspendingFunctions", Sk.findNonSuspendingFunctions);
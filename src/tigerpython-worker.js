@@ -0,0 +1,27 @@
+/**
+ * Worker to find TigerPython's analysis of code with a syntax error off
+ * the main thread (see Sk.pytchsupport.TigerPython_analysis).
+ *
+ * Each message is {id, code_text}; the reply is {id, errors}, with each
+ * error found as a plain object, as TigerPython reports it.
+ */
+
+/* global importScripts, TPyParser */
+importScripts("tigerpython-parser.js");
+
+self.onmessage = (event) => {
+    const { id, code_text } = event.data;
+    let errors = [];
+    try {
+        TPyParser.rejectDeadCode = false;
+        errors = TPyParser.findAllErrors(code_text).map((e) => ({
+            line: e.line,
+            offset: e.offset,
+            msg: e.msg,
+            code: e.code,
+        }));
+    } catch (tpy_err) {
+        console.log("TigerPython threw error", tpy_err);
+    }
+    self.postMessage({ id, errors });
+};
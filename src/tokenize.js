@@ -36,25 +36,11 @@ function group (x) {
     return "(" + args.join("|") + ")";
 }
 
-/** @param {...*} x */
-function any (x) {
-    return group.apply(null, arguments) + "*";
-}
-
 /** @param {...*} x */
 function maybe (x) {
     return group.apply(null, arguments) + "?";
 }
 
-var reRegExpChar = /[\\^$.*+?()[\]{}|]/g,
-    reHasRegExpChar = RegExp(reRegExpChar.source);
-
-function regexEscape(string) {
-    return (string && reHasRegExpChar.test(string))
-        ? string.replace(reRegExpChar, '\\$&')
-        : string;
-}
-
 /**
  * Iterable contains
  * @template T
@@ -92,6 +78,9 @@ const id_continue = id_start + Mn + Mc + Nd + Pc + Other_ID_Continue;
 
 const IDENTIFIER = "[" + id_start + "]+[" + id_continue + "]*"
 const IS_IDENTIFIER_REGEX = new RegExp("^" + IDENTIFIER + "$");
+const IS_ASCII_IDENTIFIER_REGEX = /^[A-Za-z_][A-Za-z0-9_]*$/;
+const ID_START_REGEX = new RegExp("[" + id_start + "]");
+const ID_CONTINUE_REGEX = new RegExp("[" + id_continue + "]");
 
 
 /**
@@ -101,29 +90,197 @@ const IS_IDENTIFIER_REGEX = new RegExp("^" + IDENTIFIER + "$");
  * @returns {boolean}
  */
 function isidentifier(str) {
+    if (IS_ASCII_IDENTIFIER_REGEX.test(str)) {
+        return true;
+    }
     var normalized = str.normalize('NFKC');
     return IS_IDENTIFIER_REGEX.test(normalized);
 }
 
 Sk.token.isIdentifier = isidentifier;
 
-/* we have to use string and ctor to be able to build patterns up. + on /.../
- * does something strange.
- * Note: we use unicode matching for names ("\w") but ascii matching for
- * number literals.
- *
- * I don't know if the comment above is still actually correct */
-var Whitespace = "[ \\f\\t]*";
-var Comment_ = "#[^\\r\\n]*";
-var Ignore = Whitespace + any("\\\\\\r?\\n" + Whitespace) + maybe(Comment_);
-var Name = IDENTIFIER; // this differs form tokenize.py (\w+) which isn't valid for python identifiers
-
-
+// ast.js checks float literals against this.
 var Exponent = "[eE][-+]?[0-9](?:_?[0-9])*";
 var Pointfloat = group("[0-9](?:_?[0-9])*\\.(?:[0-9](?:_?[0-9])*)?", "\\.[0-9](?:_?[0-9])*") + maybe(Exponent);
 var Expfloat = "[0-9](?:_?[0-9])*" + Exponent;
 var Floatnumber = group(Pointfloat, Expfloat);
-var Imagnumber = group("[0-9](?:_?[0-9])*[jJ]", Floatnumber + "[jJ]");
+
+/*
+ * The tokens within a line are found by scanning it character by
+ * character, rather than by matching the regexes of tokenize.py.  Each
+ * scan function below takes the line and the index at which to start,
+ * and returns the index just past what it matched, or -1 if nothing
+ * matched.  Each is named after the tokenize.py regex whose (JS)
+ * matches it finds; where that regex is an alternation, the first
+ * alternative to match wins, not the longest.
+ *
+ * Characters are classified by their code, and only non-ASCII ones are
+ * looked up in the Unicode tables.
+ */
+
+const CH_ID_START = 1;
+const CH_ID_CONTINUE = 2;
+const CH_HEX_DIGIT = 4;
+const CH_STRING_PREFIX = 8;
+
+const asciiClasses = new Uint8Array(128);
+(function () {
+    const mark = (chars, bits) => {
+        for (let i = 0; i < chars.length; ++i) {
+            asciiClasses[chars.charCodeAt(i)] |= bits;
+        }
+    };
+    mark("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz_", CH_ID_START | CH_ID_CONTINUE);
+    mark("0123456789", CH_ID_CONTINUE | CH_HEX_DIGIT);
+    mark("abcdefABCDEF", CH_HEX_DIGIT);
+    mark("bBfFrRuU", CH_STRING_PREFIX);
+}());
+
+// (Past the end of the line, charCodeAt() gives NaN, which is in no
+// class.)
+function isIdStart(code) {
+    if (code < 128) {
+        return (asciiClasses[code] & CH_ID_START) !== 0;
+    }
+    return code > 0 && ID_START_REGEX.test(String.fromCharCode(code));
+}
+
+function isIdContinue(code) {
+    if (code < 128) {
+        return (asciiClasses[code] & CH_ID_CONTINUE) !== 0;
+    }
+    return code > 0 && ID_CONTINUE_REGEX.test(String.fromCharCode(code));
+}
+
+function isStringPrefixChar(code) {
+    return code < 128 && (asciiClasses[code] & CH_STRING_PREFIX) !== 0;
+}
+
+function isDecDigit(code) {
+    return code >= 48 && code <= 57;
+}
+
+function isHexDigit(code) {
+    return code < 128 && (asciiClasses[code] & CH_HEX_DIGIT) !== 0;
+}
+
+function isOctDigit(code) {
+    return code >= 48 && code <= 55;
+}
+
+function isBinDigit(code) {
+    return code === 48 || code === 49;
+}
+
+function isZero(code) {
+    return code === 48;
+}
+
+// What "." in a JS regex does not match.
+function isLineTerminator(ch) {
+    return ch === "\n" || ch === "\r" || ch === "\u2028" || ch === "\u2029";
+}
+
+/**
+ * "[d](?:_?[d])*", or, if "leadingUnderscore", "(?:_?[d])+", where "d"
+ * is the digits recognised by "isDigit".
+ */
+function scanDigits(line, i, isDigit, leadingUnderscore) {
+    let j = i;
+    if (!leadingUnderscore) {
+        if (!isDigit(line.charCodeAt(j))) {
+            return -1;
+        }
+        j += 1;
+    }
+    while (true) {
+        const code = line.charCodeAt(j);
+        if (isDigit(code)) {
+            j += 1;
+        } else if (code === 95 /* "_" */ && isDigit(line.charCodeAt(j + 1))) {
+            j += 2;
+        } else {
+            break;
+        }
+    }
+    return (j === i) ? -1 : j;
+}
+
+// Exponent
+function scanExponent(line, i) {
+    const ch = line[i];
+    if (ch !== "e" && ch !== "E") {
+        return -1;
+    }
+    let j = i + 1;
+    if (line[j] === "-" || line[j] === "+") {
+        j += 1;
+    }
+    return scanDigits(line, j, isDecDigit, false);
+}
+
+// Floatnumber
+function scanFloat(line, i) {
+    let pointEnd = -1;
+    const intEnd = scanDigits(line, i, isDecDigit, false);
+    if (intEnd !== -1) {
+        if (line[intEnd] === ".") {
+            const fracEnd = scanDigits(line, intEnd + 1, isDecDigit, false);
+            pointEnd = (fracEnd !== -1) ? fracEnd : intEnd + 1;
+        }
+    } else if (line[i] === ".") {
+        pointEnd = scanDigits(line, i + 1, isDecDigit, false);
+    }
+    if (pointEnd !== -1) {
+        const expEnd = scanExponent(line, pointEnd);
+        return (expEnd !== -1) ? expEnd : pointEnd;
+    }
+    return (intEnd !== -1) ? scanExponent(line, intEnd) : -1;
+}
+
+function isImagSuffix(ch) {
+    return ch === "j" || ch === "J";
+}
+
+// Imagnumber.  Only the longest match of the number needs to be tried
+// with the "j"; any shorter one is followed by a digit, "_", "." or "e".
+function scanImag(line, i) {
+    const intEnd = scanDigits(line, i, isDecDigit, false);
+    if (intEnd !== -1 && isImagSuffix(line[intEnd])) {
+        return intEnd + 1;
+    }
+    const floatEnd = scanFloat(line, i);
+    return (floatEnd !== -1 && isImagSuffix(line[floatEnd])) ? floatEnd + 1 : -1;
+}
+
+// Intnumber, with Python 2's "L" suffix unless "python3", and
+// SilentOctnumber in place of Octnumber if "silentOctal".
+function scanInt(line, i, python3, silentOctal) {
+    const ch = line[i];
+    let j = -1;
+    if (ch === "0") {
+        const base = line[i + 1];
+        if (base === "x" || base === "X") {
+            j = scanDigits(line, i + 2, isHexDigit, true);
+        } else if (base === "b" || base === "B") {
+            j = scanDigits(line, i + 2, isBinDigit, true);
+        } else if (base === "o" || base === "O") {
+            j = scanDigits(line, i + 2, isOctDigit, true);
+        }
+        if (j === -1 && silentOctal) {
+            j = scanDigits(line, i + 1, isOctDigit, true);
+        }
+        if (j === -1) {
+            j = scanDigits(line, i, isZero, false);
+        }
+    } else if (ch >= "1" && ch <= "9") {
+        j = scanDigits(line, i, isDecDigit, false);
+    }
+    if (j !== -1 && !python3 && line[j] === "L") {
+        j += 1;
+    }
+    return j;
+}
 
 // Return the empty string, plus all of the valid string prefixes.
 function _all_string_prefixes() {
@@ -133,90 +290,235 @@ function _all_string_prefixes() {
         'fr', 'rf', 'Rb'];
 }
 
-// Note that since _all_string_prefixes includes the empty string,
-//  StringPrefix can be the empty string (making it optional).
-var StringPrefix = group.apply(null, _all_string_prefixes())
-
-// these regexes differ from python because .exec doesn't do the
-// same thing as .match in python. It's more like .search.
-// .match matches from the start of the string.
-// to get the same behaviour we can add a ^ to the start of the
-// regex
-// Tail end of ' string.
-var Single = "^[^'\\\\]*(?:\\\\.[^'\\\\]*)*'";
-// Tail end of " string.
-var Double = '^[^"\\\\]*(?:\\\\.[^"\\\\]*)*"';
-// Tail end of ''' string.
-var Single3 = "^[^'\\\\]*(?:(?:\\\\.|'(?!''))[^'\\\\]*)*'''";
-// Tail end of """ string.
-var Double3 = '^[^"\\\\]*(?:(?:\\\\.|"(?!""))[^"\\\\]*)*"""';
-var Triple = group(StringPrefix + "'''", StringPrefix + '"""');
-// Single-line ' or " string.
-var String_ = group(StringPrefix + "'[^\\n'\\\\]*(?:\\\\.[^\\n'\\\\]*)*'",
-                    StringPrefix + '"[^\\n"\\\\]*(?:\\\\.[^\\n"\\\\]*)*"');
-
-// Sorting in reverse order puts the long operators before their prefixes.
-// Otherwise if = came before ==, == would get recognized as two instances
-// of =.
-var EXACT_TOKENS_SORTED;
-var Special;
-var Funny;
+const string_prefixes = new Set(_all_string_prefixes());
+
+function isQuote(ch) {
+    return ch === "'" || ch === '"';
+}
+
+/**
+ * StringPrefix, followed by a quote; returns the index of the quote.
+ */
+function scanStringPrefix(line, i) {
+    let j = i;
+    while (j < i + 2 && isStringPrefixChar(line.charCodeAt(j))) {
+        j += 1;
+    }
+    return (isQuote(line[j]) && string_prefixes.has(line.substring(i, j))) ? j : -1;
+}
+
+// Triple
+function scanTriple(line, i) {
+    const q = scanStringPrefix(line, i);
+    if (q === -1) {
+        return -1;
+    }
+    const quote = line[q];
+    return (line[q + 1] === quote && line[q + 2] === quote) ? q + 3 : -1;
+}
+
+// ContStr: a single-line string, or the first line of one continued with
+// a backslash.
+function scanContStr(line, i) {
+    const q = scanStringPrefix(line, i);
+    if (q === -1) {
+        return -1;
+    }
+    const quote = line[q];
+    const max = line.length;
+    let j = q + 1;
+    while (j < max) {
+        const ch = line[j];
+        if (ch === quote) {
+            return j + 1;
+        } else if (ch === "\n") {
+            return -1;
+        } else if (ch === "\\") {
+            const next = line[j + 1];
+            if (next === "\n") {
+                return j + 2;
+            } else if (next === "\r") {
+                return (line[j + 2] === "\n") ? j + 3 : -1;
+            } else if (next === undefined || isLineTerminator(next)) {
+                return -1;
+            }
+            j += 2;
+        } else {
+            j += 1;
+        }
+    }
+    return -1;
+}
+
+/**
+ * The rest of a string, from index "i", where "quote" (three of them if
+ * "triple") ends it: tokenize.py's Single, Double, Single3 and Double3.
+ */
+function scanStringTail(line, i, quote, triple) {
+    const max = line.length;
+    let j = i;
+    while (j < max) {
+        const ch = line[j];
+        if (ch === quote) {
+            if (!triple) {
+                return j + 1;
+            }
+            if (line[j + 1] === quote && line[j + 2] === quote) {
+                return j + 3;
+            }
+            j += 1;
+        } else if (ch === "\\") {
+            const next = line[j + 1];
+            if (next === undefined || isLineTerminator(next)) {
+                return -1;
+            }
+            j += 2;
+        } else {
+            j += 1;
+        }
+    }
+    return -1;
+}
+
+// Name
+function scanName(line, i) {
+    if (!isIdStart(line.charCodeAt(i))) {
+        return -1;
+    }
+    let j = i + 1;
+    while (isIdContinue(line.charCodeAt(j))) {
+        j += 1;
+    }
+    return j;
+}
+
+// The operators, by their first character, longest first, so that e.g.
+// "==" is not recognised as two instances of "=".
+var operatorsByInitial;
 
 function setupTokens(py3) {
-    // recompute the above two lines
     // <> should be included in py2 mode
     if (py3) {
         delete Sk.token.EXACT_TOKEN_TYPES["<>"];
     } else {
         Sk.token.EXACT_TOKEN_TYPES["<>"] = Sk.token.tokens.T_NOTEQUAL;
     }
-    EXACT_TOKENS_SORTED = Object.keys(Sk.token.EXACT_TOKEN_TYPES).sort();
-    Special = group.apply(
-        this,
-        EXACT_TOKENS_SORTED.reverse().map(function (t) {
-            return regexEscape(t);
-        })
-    );
-    Funny = group("\\r?\\n", Special);
+    operatorsByInitial = {};
+    Object.keys(Sk.token.EXACT_TOKEN_TYPES).forEach(function (t) {
+        (operatorsByInitial[t[0]] || (operatorsByInitial[t[0]] = [])).push(t);
+    });
+    Object.keys(operatorsByInitial).forEach(function (initial) {
+        operatorsByInitial[initial].sort(function (a, b) { return b.length - a.length; });
+    });
 }
 setupTokens(true);
 
 Sk.token.setupTokens = setupTokens;
 
+// Special
+function scanOperator(line, i) {
+    const candidates = operatorsByInitial[line[i]];
+    if (candidates !== undefined) {
+        for (let k = 0; k < candidates.length; ++k) {
+            if (line.startsWith(candidates[k], i)) {
+                return i + candidates[k].length;
+            }
+        }
+    }
+    return -1;
+}
 
+/**
+ * PseudoExtras, Number, Funny, ContStr or Name, in that order, at index
+ * "i" (at the end of the line, the empty match of PseudoExtras' "$").
+ */
+function scanPseudoToken(line, i, python3, silentOctal) {
+    const max = line.length;
+    if (i === max) {
+        return i;
+    }
+    const ch = line[i];
+    const code = line.charCodeAt(i);
+    let j;
 
-// these aren't actually used
-// var PlainToken = group(Number_, Funny, String_, Name);
-// var Token = Ignore + PlainToken;
+    if (ch === "\\") {
+        if (line[i + 1] === "\n") {
+            return i + 2;
+        }
+        return (line[i + 1] === "\r" && line[i + 2] === "\n") ? i + 3 : -1;
+    } else if (ch === "#") {
+        j = i + 1;
+        while (j < max && line[j] !== "\n" && line[j] !== "\r") {
+            j += 1;
+        }
+        return j;
+    } else if (isDecDigit(code) || ch === ".") {
+        j = scanImag(line, i);
+        if (j === -1) {
+            j = scanFloat(line, i);
+        }
+        if (j === -1) {
+            j = scanInt(line, i, python3, silentOctal);
+        }
+        return (j !== -1) ? j : scanOperator(line, i);
+    } else if (ch === "\n") {
+        return i + 1;
+    } else if (ch === "\r") {
+        return (line[i + 1] === "\n") ? i + 2 : -1;
+    } else if (isQuote(ch) || isStringPrefixChar(code)) {
+        j = scanTriple(line, i);
+        if (j === -1) {
+            j = scanContStr(line, i);
+        }
+        return (j !== -1) ? j : scanName(line, i);
+    }
+    j = scanOperator(line, i);
+    return (j !== -1) ? j : scanName(line, i);
+}
 
-// First (or only) line of ' or " string.
-var ContStr = group(StringPrefix + "'[^\\n'\\\\]*(?:\\\\.[^\\n'\\\\]*)*" +
-                group("'", '\\\\\\r?\\n'),
-                StringPrefix + '"[^\\n"\\\\]*(?:\\\\.[^\\n"\\\\]*)*' +
-                group('"', '\\\\\\r?\\n'))
-var PseudoExtras = group('\\\\\\r?\\n|$', Comment_, Triple);
+function skipWhitespace(line, i) {
+    let ch = line[i];
+    while (ch === " " || ch === "\f" || ch === "\t") {
+        i += 1;
+        ch = line[i];
+    }
+    return i;
+}
 
-// For a given string prefix plus quotes, endpats maps it to a regex
-//  to match the remainder of that string. _prefix can be empty, for
-//  a normal single or triple quoted string (with no prefix).
-var endpats = {}
-var prefixes = _all_string_prefixes();
-for (let _prefix of prefixes) {
-    endpats[_prefix + "'"] = Single
-    endpats[_prefix + '"'] = Double
-    endpats[_prefix + "'''"] = Single3
-    endpats[_prefix + '"""'] = Double3
+/**
+ * The end of the token starting at index "pos", or -1 if none does.
+ *
+ * As with tokenize.py's PseudoToken regex, if nothing matches at "pos",
+ * the next match along the line gives the token's length (so that, e.g.,
+ * an unterminated string's quote starts a token as long as the name
+ * after it).  If only the end of the line matches, there is no token.
+ */
+function scanPseudoTokenFrom(line, pos, python3, silentOctal) {
+    const end = scanPseudoToken(line, pos, python3, silentOctal);
+    if (end !== -1) {
+        return end;
+    }
+    const max = line.length;
+    for (let i = pos + 1; i < max; ) {
+        const start = skipWhitespace(line, i);
+        const found = scanPseudoToken(line, start, python3, silentOctal);
+        if (found !== -1) {
+            return (found > start) ? pos + (found - start) : -1;
+        }
+        i = start + 1;
+    }
+    return -1;
 }
 
 // A set of all of the single and triple quoted string prefixes,
 //  including the opening quotes.
-let single_quoted = []
-let triple_quoted = []
-for (let t of prefixes) {
-    single_quoted.push(t + '"');
-    single_quoted.push(t + "'");
-    triple_quoted.push(t + '"""');
-    triple_quoted.push(t + "'''");
+const single_quoted = new Set();
+const triple_quoted = new Set();
+for (let t of _all_string_prefixes()) {
+    single_quoted.add(t + '"');
+    single_quoted.add(t + "'");
+    triple_quoted.add(t + '"""');
+    triple_quoted.add(t + "'''");
 }
 
 var tabsize = 8
@@ -227,36 +529,25 @@ var tabsize = 8
  * @param {function(): string} readline
  * @param {string} encoding
  * @param {function(TokenInfo): void} yield_
+ * @param {number=} firstLineno the number of the first line (default 1)
  */
-function _tokenize(filename, readline, encoding, yield_) {
-    // we make these regexes here because they can
-    // be changed by the configuration.
-    var LSuffix = !Sk.__future__.python3 ? '(?:L?)' : '';
-    var Hexnumber = '0[xX](?:_?[0-9a-fA-F])+' + LSuffix;
-    var Binnumber = '0[bB](?:_?[01])+' + LSuffix;
-    var Octnumber = '0([oO])(?:_?[0-7])+' + LSuffix;
-    var SilentOctnumber = '0([oO]?)(?:_?[0-7])+' + LSuffix;
-    var Decnumber = '(?:0(?:_?0)*|[1-9](?:_?[0-9])*)' + LSuffix;
-    var Intnumber = group(Hexnumber, Binnumber,
-                          (Sk.__future__.silent_octal_literal ? SilentOctnumber : Octnumber), Decnumber);
-    var Number_ = group(Imagnumber, Floatnumber, Intnumber);
-    var PseudoToken = Whitespace + group(PseudoExtras, Number_, Funny, ContStr, Name);
-
-    const PseudoTokenRegexp = new RegExp(PseudoToken);
-
-    var lnum = 0,
+function _tokenize(filename, readline, encoding, yield_, firstLineno) {
+    // These can be changed by the configuration.
+    var python3 = !!Sk.__future__.python3;
+    var silentOctal = !!Sk.__future__.silent_octal_literal;
+
+    var lnum = (firstLineno || 1) - 1,
         parenlev = 0,
         continued = 0,
-        numchars = '0123456789',
         contstr = '',
         needcont = 0,
         contline = null,
         indents = [0],
-        capos = null,
-        endprog = undefined,
+        endquote = undefined,
+        endtriple = false,
         strstart = undefined,
         end = undefined,
-        pseudomatch = undefined;
+        pseudoend = undefined;
 
     if (encoding !== undefined) {
         if (encoding == "utf-8-sig") {
@@ -292,10 +583,9 @@ function _tokenize(filename, readline, encoding, yield_) {
             if (!line) {
                 throw new TokenError("EOF in multi-line string", filename, strstart[0], strstart[1]);
             }
-            endprog.lastIndex = 0;
-            var endmatch = endprog.exec(line);
-            if (endmatch) {
-                pos = end = endmatch[0].length;
+            var endmatch = scanStringTail(line, 0, endquote, endtriple);
+            if (endmatch !== -1) {
+                pos = end = endmatch;
                 yield_(new TokenInfo(tokens.T_STRING, contstr + line.substring(0, end),
                        strstart, [lnum, end], contline + line));
                 contstr = '';
@@ -370,19 +660,12 @@ function _tokenize(filename, readline, encoding, yield_) {
 
         while (pos < max) {
             //console.log("pos:"+pos+":"+max);
-            // js regexes don't return any info about matches, other than the
-            // content. we'd like to put a \w+ before pseudomatch, but then we
-            // can't get any data
-            capos = line.charAt(pos);
-            while (capos === ' ' || capos === '\f' || capos === '\t') {
-                pos += 1;
-                capos = line.charAt(pos);
-            }
+            pos = skipWhitespace(line, pos);
 
-            pseudomatch = PseudoTokenRegexp.exec(line.substring(pos))
-            if (pseudomatch) {                                // scan for tokens
+            pseudoend = scanPseudoTokenFrom(line, pos, python3, silentOctal);
+            if (pseudoend !== -1) {                           // scan for tokens
                 var start = pos;
-                var end = start + pseudomatch[1].length;
+                var end = pseudoend;
                 var spos = [lnum, start];
                 var epos = [lnum, end];
                 var pos = end;
@@ -392,8 +675,9 @@ function _tokenize(filename, readline, encoding, yield_) {
 
                 var token = line.substring(start, end);
                 var initial = line[start];
+                var initialcode = line.charCodeAt(start);
                 //console.log("token:",token, "initial:",initial, start, end);
-                if (contains(numchars, initial) ||                 // ordinary number
+                if (isDecDigit(initialcode) ||                     // ordinary number
                     (initial == '.' && token != '.' && token != '...')) {
                     yield_(new TokenInfo(tokens.T_NUMBER, token, spos, epos, line));
                 } else if (contains('\r\n', initial)) {
@@ -405,11 +689,12 @@ function _tokenize(filename, readline, encoding, yield_) {
                 } else if (initial == '#') {
                     //assert not token.endswith("\n")
                     yield_(new TokenInfo(tokens.T_COMMENT, token, spos, epos, line));
-                } else if (contains(triple_quoted, token)) {
-                    endprog = RegExp(endpats[token]);
-                    endmatch = endprog.exec(line.substring(pos));
-                    if (endmatch) {                       // all on one line
-                        pos = endmatch[0].length + pos;
+                } else if (triple_quoted.has(token)) {
+                    endquote = token[token.length - 1];
+                    endtriple = true;
+                    endmatch = scanStringTail(line, pos, endquote, endtriple);
+                    if (endmatch !== -1) {                // all on one line
+                        pos = endmatch;
                         token = line.substring(start, pos);
                         yield_(new TokenInfo(tokens.T_STRING, token, spos, [lnum, pos], line));
                     } else {
@@ -428,20 +713,20 @@ function _tokenize(filename, readline, encoding, yield_) {
                 // Note that initial == token[:1].
                 // Also note that single quote checking must come after
                 //  triple quote checking (above).
-                } else if (contains(single_quoted, initial) ||
-                           contains(single_quoted, token.substring(0, 2)) ||
-                           contains(single_quoted, token.substring(0, 3))) {
+                } else if (single_quoted.has(initial) ||
+                           single_quoted.has(token.substring(0, 2)) ||
+                           single_quoted.has(token.substring(0, 3))) {
                     if (token[token.length - 1] == '\n') {                // continued string
                         strstart = [lnum, start];
                         // Again, using the first 3 chars of the
                         //  token. This is looking for the matching end
                         //  regex for the correct type of quote
-                        //  character. So it's really looking for
-                        //  endpats["'"] or endpats['"'], by trying to
-                        //  skip string prefix characters, if any.
-                        endprog = RegExp(endpats[initial] ||
-                                           endpats[token[1]] ||
-                                           endpats[token[2]]);
+                        //  character, by trying to skip string prefix
+                        //  characters, if any.
+                        endquote = (isQuote(initial) ? initial :
+                                    isQuote(token[1]) ? token[1] :
+                                    token[2]);
+                        endtriple = false;
                         contstr = line.substring(start);
                         needcont = 1;
                         contline = line;
@@ -450,7 +735,7 @@ function _tokenize(filename, readline, encoding, yield_) {
                         yield_(new TokenInfo(tokens.T_STRING, token, spos, epos, line));
                     }
 
-                } else if (isidentifier(initial)) {              // ordinary name
+                } else if (initialcode < 128 ? isIdStart(initialcode) : isidentifier(initial)) {  // ordinary name
                     yield_(new TokenInfo(tokens.T_NAME, token, spos, epos, line));
                 } else if (initial == '\\') {                  // continued stmt
                     continued = 1
@@ -332,6 +332,7 @@ function tp$setattr(pyName, value, canSuspend) {
     }
     // for delattr
     const jsName = pyName.$mangled;
+    Sk.generic.invalidateAttrCaches(jsName);
 
     if (value === undefined) {
         const proto = this.prototype;
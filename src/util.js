@@ -49,6 +49,23 @@ Sk.isArrayLike = function (object) {
     return false;
 };
 
+/**
+ * A 32-bit hash (FNV-1a) of the UTF-16 code units of the given source
+ * text, for remembering results per source.  Different texts can have the
+ * same hash, so a result found by hash should be checked against its text.
+ *
+ * @param {string} text
+ * @return {number}
+ */
+Sk.sourceHash = function (text) {
+    var hash = 0x811c9dc5;
+    for (var i = 0; i < text.length; ++i) {
+        hash ^= text.charCodeAt(i);
+        hash = Math.imul(hash, 0x01000193);
+    }
+    return hash >>> 0;
+};
+
 Sk.js_beautify = function (x) {
     return x;
 };
@@ -58,4 +75,5 @@ Sk.exportSymbol("Sk.global", Sk.global);
 Sk.exportSymbol("Sk.build", Sk.build);
 Sk.exportSymbol("Sk.exportSymbol", Sk.exportSymbol);
 Sk.exportSymbol("Sk.isArrayLike", Sk.isArrayLike);
+Sk.exportSymbol("Sk.sourceHash", Sk.sourceHash);
 Sk.exportSymbol("Sk.js_beautify", Sk.js_beautify);
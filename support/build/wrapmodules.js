@@ -22,6 +22,28 @@ const { minify } = require('terser');
  */
 const excludeFileName = "libexcludes.json";
 
+/**
+ * Chunks of the split standard library (see buildSplitStdlib() below)
+ * which a Pytch client will almost certainly need, and so should fetch
+ * eagerly via Sk.prefetchStdlib() rather than on first import.
+ */
+const pytchPrefetchChunks = [
+    "pytch",
+    "copy",
+    "types",
+    "re",
+    "math",
+    "random",
+    "time",
+];
+
+/**
+ * Matches the entire contents of a "not implemented in Skulpt" module,
+ * capturing the module name.  Such stubs are recorded by name in the
+ * core manifest of a split standard library rather than shipped as text.
+ */
+const skFailStubRegExp = /^import _sk_fail; _sk_fail\._\("([^"]*)"\)\s*$/;
+
 async function processDirectories(dirs, recursive, exts, ret, minifyjs, excludes) {
     await Promise.all(dirs.map(async (dir) => {
         let files = fs.readdirSync(dir);
@@ -80,6 +102,76 @@ async function buildJsonFile(name, dirs, exts, outfile, options) {
     console.log("Updated " + outfile + ".");
 }
 
+/**
+ * Name of the chunk which a file under "src/lib" belongs to: its
+ * top-level module or package name.  A module implemented in both JS
+ * and Python (e.g., "platform") gives one chunk holding both.
+ */
+function chunkNameOfFile(fullname) {
+    const topLevel = path.relative("src/lib", fullname).split("/")[0];
+    const ext = path.extname(topLevel);
+    return (ext === ".js" || ext === ".py") ? topLevel.slice(0, -ext.length) : topLevel;
+}
+
+
+/**
+ * Build a standard library which is split into a small core manifest,
+ * loaded like the monolithic "skulpt-stdlib.js", and one JSON chunk per
+ * top-level module or package of "src/lib", fetched on demand by the
+ * default Sk.read().  The manifest has the form
+ *
+ *     Sk.builtinFiles = {
+ *         files: { <path>: <contents>, ... },
+ *         chunks: { <path>: <chunk-name>, ... },
+ *         failStubs: { <path>: <module-name>, ... },
+ *         prefetch: [ <chunk-name>, ... ],
+ *     }
+ *
+ * and each chunk "<outdir>/<chunk-name>.json" is of the form
+ * { files: { <path>: <contents>, ... } }.
+ */
+async function buildSplitStdlib(coreDirs, libDir, exts, outfile, outdir, options) {
+    let ret = { files: {} };
+
+    await processDirectories(coreDirs.concat([libDir]), true, exts, ret, options.minifyjs, options.excludes);
+
+    let manifest = { files: {}, chunks: {}, failStubs: {}, prefetch: [] };
+    let chunks = {};
+
+    Object.keys(ret.files).sort().forEach((fullname) => {
+        const contents = ret.files[fullname];
+
+        if (!fullname.startsWith(libDir + "/")) {
+            manifest.files[fullname] = contents;
+            return;
+        }
+
+        const failMatch = skFailStubRegExp.exec(contents);
+        if (failMatch !== null) {
+            manifest.failStubs[fullname] = failMatch[1];
+            return;
+        }
+
+        const chunkName = chunkNameOfFile(fullname);
+        manifest.chunks[fullname] = chunkName;
+        (chunks[chunkName] || (chunks[chunkName] = { files: {} })).files[fullname] = contents;
+    });
+
+    manifest.prefetch = pytchPrefetchChunks.filter((chunkName) => chunks.hasOwnProperty(chunkName));
+
+    if (fs.existsSync(outdir)) {
+        fs.rmSync(outdir, { recursive: true });
+    }
+    fs.mkdirSync(outdir, { recursive: true });
+
+    Object.keys(chunks).forEach((chunkName) => {
+        fs.writeFileSync(path.join(outdir, chunkName + ".json"), JSON.stringify(chunks[chunkName]), 'utf8');
+    });
+
+    fs.writeFileSync(outfile, "Sk.builtinFiles=" + JSON.stringify(manifest), 'utf8');
+    console.log("Updated " + outfile + " and " + Object.keys(chunks).length + " chunks in " + outdir + ".");
+}
+
 async function main() {
     if (process.argv.includes("internal")) {
         // await buildJsonFile("internalPy", ["src"], [".py"], "src/internalpython.js");
@@ -101,6 +193,24 @@ async function main() {
             "dist/skulpt-stdlib.js",
             opts
         );
+    } else if (process.argv.includes("builtin-split")) {
+        let excludes = [];
+        if (fs.existsSync(excludeFileName)) {
+            excludes = JSON.parse(fs.readFileSync(excludeFileName));
+        }
+        let opts = {
+            minifyjs: true,
+            excludes: excludes
+        };
+
+        await buildSplitStdlib(
+            ["src/builtin"],
+            "src/lib",
+            [".js", ".py"],
+            "dist/skulpt-stdlib-core.js",
+            "dist/stdlib",
+            opts
+        );
     } else if (process.argv.includes("unit2")) {
         if (!fs.existsSync("support/tmp")) {
             fs.mkdirSync("support/tmp");
@@ -0,0 +1,386 @@
+// A pool of pre-warmed Skulpt VMs for evaluating many Pytch projects
+// concurrently under Node.
+//
+// Each VM runs in its own worker thread.  When the worker starts, it
+// loads Skulpt and imports "pytch", and then marks all modules then in
+// sys.modules as preserved (see Sk.preserveCurrentModules()).  Each job
+// therefore pays only for compiling and running the user's own program,
+// and the user's modules are thrown away after the job.
+//
+// Usage as a library:
+//
+//     const { VMPool } = require("./support/run/vm-pool.js");
+//     const pool = new VMPool({ size: 4, execLimit: 5000 });
+//     const result = await pool.evaluate(codeText, { nFrames: 60 });
+//     await pool.close();
+//
+// Usage from the command line, to evaluate some files and report
+// throughput:
+//
+//     node support/run/vm-pool.js [--size N] [--repeat K] FILE.py...
+
+const os = require("os");
+const fs = require("fs");
+const path = require("path");
+const { Worker, isMainThread, parentPort, workerData } = require("worker_threads");
+
+const repoRoot = path.resolve(__dirname, "../..");
+
+
+////////////////////////////////////////////////////////////////////////////////
+//
+// Main thread: the pool itself.
+
+class VMPool {
+    /**
+     * Options:
+     *
+     * size: number of worker threads (default: one per CPU)
+     * execLimit: default time limit in ms for a job (default: none)
+     * nFrames: default number of frames to run a project for (default: 60)
+     * environmentModule: optional path of a module exporting properties
+     *     to merge into each worker's Pytch environment, for example an
+     *     "async_load_image" which knows about real images
+     */
+    constructor(options = {}) {
+        this.size = options.size || os.cpus().length;
+        this.defaults = {
+            execLimit: options.execLimit || Number.POSITIVE_INFINITY,
+            nFrames: (options.nFrames != null) ? options.nFrames : 60,
+        };
+
+        this.pending_jobs = [];
+        this.idle_workers = [];
+        this.job_by_worker = new Map();
+        this.next_job_id = 1;
+        this.closed = false;
+
+        this.environmentModule = (options.environmentModule != null
+                                  ? path.resolve(options.environmentModule)
+                                  : null);
+
+        this.workers = [];
+        this.ready = Promise.all(
+            Array.from({ length: this.size }, () => this.spawn_worker())
+        );
+    }
+
+    /**
+     * Start a new worker, returning a Promise which resolves once it has
+     * warmed up and joined the idle workers.
+     */
+    spawn_worker() {
+        return new Promise((resolve, reject) => {
+            const worker = new Worker(__filename, {
+                workerData: { environmentModule: this.environmentModule },
+            });
+            let warmed_up = false;
+            worker.on("message", (msg) => {
+                if (msg.kind === "ready") {
+                    warmed_up = true;
+                    resolve();
+                    this.worker_became_idle(worker);
+                } else {
+                    this.job_completed(worker, msg.result);
+                }
+            });
+            worker.on("error", (err) => {
+                reject(err);
+                this.worker_failed(worker, err, warmed_up);
+            });
+            worker.on("exit", (code) => {
+                // Already handled if the exit was caused by an error.
+                if (!this.closed && this.workers.includes(worker)) {
+                    const err = new Error(`VMPool worker stopped with exit code ${code}`);
+                    reject(err);
+                    this.worker_failed(worker, err, warmed_up);
+                }
+            });
+            this.workers.push(worker);
+        });
+    }
+
+    /**
+     * Evaluate the given Python code text in the next free VM, returning
+     * a Promise which resolves to an object with properties:
+     *
+     * status: "ok"; "build-error" if the project could not be built;
+     *     "timeout" if the job ran out of time before running all frames;
+     *     or "internal-error" if evaluating the job failed unexpectedly
+     * stdout: everything the program printed
+     * errors: list of strings describing errors raised by the program
+     * nFramesRun: how many frames the project ran for
+     * elapsedMs: wall-clock time taken by the job within its worker
+     *
+     * The options "execLimit" and "nFrames" override the pool defaults.
+     */
+    evaluate(codeText, options = {}) {
+        if (this.closed)
+            return Promise.reject(new Error("VMPool is closed"));
+
+        return new Promise((resolve, reject) => {
+            this.pending_jobs.push({
+                id: this.next_job_id++,
+                codeText,
+                execLimit: options.execLimit || this.defaults.execLimit,
+                nFrames: (options.nFrames != null) ? options.nFrames : this.defaults.nFrames,
+                resolve,
+                reject,
+            });
+            this.dispatch();
+        });
+    }
+
+    dispatch() {
+        while (this.pending_jobs.length > 0 && this.idle_workers.length > 0) {
+            const worker = this.idle_workers.pop();
+            const job = this.pending_jobs.shift();
+            this.job_by_worker.set(worker, job);
+            worker.postMessage({
+                id: job.id,
+                codeText: job.codeText,
+                execLimit: job.execLimit,
+                nFrames: job.nFrames,
+            });
+        }
+    }
+
+    worker_became_idle(worker) {
+        this.idle_workers.push(worker);
+        this.dispatch();
+    }
+
+    job_completed(worker, result) {
+        const job = this.job_by_worker.get(worker);
+        this.job_by_worker.delete(worker);
+        job.resolve(result);
+        this.worker_became_idle(worker);
+    }
+
+    worker_failed(worker, err, warmed_up) {
+        const job = this.job_by_worker.get(worker);
+        if (job != null) {
+            this.job_by_worker.delete(worker);
+            job.reject(err);
+        }
+        this.workers = this.workers.filter(w => w !== worker);
+        this.idle_workers = this.idle_workers.filter(w => w !== worker);
+
+        // Replace a worker which crashed after warming up, so the pool
+        // keeps its size.  One which could not even warm up would most
+        // likely fail again, so is not replaced.
+        if (warmed_up && !this.closed) {
+            this.spawn_worker().catch(() => {});
+            return;
+        }
+
+        if (this.workers.length === 0) {
+            this.pending_jobs.forEach(job => job.reject(err));
+            this.pending_jobs = [];
+        }
+    }
+
+    /**
+     * Stop all workers.  Jobs not yet started are rejected.
+     */
+    async close() {
+        this.closed = true;
+        this.pending_jobs.forEach(job => job.reject(new Error("VMPool closed")));
+        this.pending_jobs = [];
+        await Promise.all(this.workers.map(w => w.terminate()));
+        this.workers = [];
+    }
+}
+
+
+////////////////////////////////////////////////////////////////////////////////
+//
+// Worker thread: one pre-warmed VM.
+
+const headless_pytch_environment = () => {
+    // Without a real renderer, every costume is a 1x1 image and every
+    // sound is silent and finishes immediately.
+    const async_load_image = (url) => Promise.resolve({ url, width: 1, height: 1 });
+
+    const silent_sound = (tag) => ({
+        tag,
+        launch_new_performance: (mix_bus_name) => ({ mix_bus_name, tag, has_ended: true }),
+    });
+
+    const sound_manager = {
+        async_load_sound: (tag, url) => Promise.resolve(silent_sound(tag)),
+        one_frame: () => {},
+        stop_all_performances: () => {},
+        reset: () => {},
+        set_mix_bus_gain: () => {},
+        get_mix_bus_gain: () => 1.0,
+    };
+
+    return { async_load_image, sound_manager };
+};
+
+// A PytchBuildError's own message is uninformative; include the phase
+// in which it happened and the underlying error.
+const describe_error = (err) => (
+    (err.innerError != null)
+        ? `${err} (phase "${err.phase}"): ${describe_error(err.innerError)}`
+        : err.toString()
+);
+
+const run_worker = async () => {
+    require("./require-skulpt").requireSkulpt(false, false);
+
+    let stdout = "";
+    let errors = [];
+
+    const extra_environment = (workerData.environmentModule != null
+                               ? require(workerData.environmentModule)
+                               : {});
+
+    Sk.configure({
+        __future__: Sk.python3,
+        read: (fname => fs.readFileSync(path.resolve(repoRoot, fname), { encoding: "utf8" })),
+        output: (text) => { stdout += text; },
+        pytch: Object.assign(
+            headless_pytch_environment(),
+            { on_exception: (err, context) => { errors.push(describe_error(err)); } },
+            extra_environment
+        ),
+    });
+
+    // Warm up: compile and import pytch (and everything it imports), and
+    // keep those modules for all jobs.
+    await Sk.misceval.asyncToPromise(
+        () => Sk.importMainWithBody("<stdin>", false, "import pytch\n", true)
+    );
+    Sk.sysmodules.pop$item(new Sk.builtin.str("__main__"));
+    Sk.preserveCurrentModules();
+
+    const evaluate = async (job) => {
+        stdout = "";
+        errors = [];
+        Sk.execLimit = job.execLimit;
+        Sk.execStart = Date.now();
+
+        const t0 = Date.now();
+        const out_of_time = () => (Date.now() - Sk.execStart > Sk.execLimit);
+
+        let project;
+        try {
+            const module = await Sk.pytchsupport.import_with_auto_configure(job.codeText);
+            const py_project = module.$d.project || module.$d.$auto_created_project;
+            project = py_project.js_project;
+        } catch (err) {
+            errors.push(describe_error(err));
+            project = null;
+        }
+
+        let status = (project === null ? "build-error" : "ok");
+        let nFramesRun = 0;
+        if (project !== null) {
+            project.on_green_flag_clicked();
+            while (nFramesRun < job.nFrames) {
+                if (out_of_time()) {
+                    status = "timeout";
+                    break;
+                }
+                project.one_frame();
+                ++nFramesRun;
+            }
+            project.kill_all_threads_and_extras();
+        }
+        const elapsedMs = Date.now() - t0;
+
+        return { status, stdout, errors, nFramesRun, elapsedMs };
+    };
+
+    // Forget the user's modules and project.
+    const reset = () => {
+        Sk.pytch.current_live_project = Sk.default_pytch_environment.current_live_project;
+        Sk.pytch.executing_thread = null;
+        Sk.resetSysModules();
+    };
+
+    parentPort.on("message", async (job) => {
+        const t0 = Date.now();
+        let result;
+        try {
+            result = await evaluate(job);
+        } catch (err) {
+            // Fail just this job rather than the whole worker.
+            result = {
+                status: "internal-error",
+                stdout,
+                errors: errors.concat([describe_error(err)]),
+                nFramesRun: 0,
+                elapsedMs: Date.now() - t0,
+            };
+        } finally {
+            reset();
+        }
+        parentPort.postMessage({ kind: "result", id: job.id, result });
+    });
+
+    parentPort.postMessage({ kind: "ready" });
+};
+
+
+////////////////////////////////////////////////////////////////////////////////
+//
+// Command-line use.
+
+const main = async () => {
+    const program = require("commander");
+
+    program
+        .option("-s, --size <n>", "number of workers", (x) => parseInt(x), os.cpus().length)
+        .option("-r, --repeat <n>", "evaluate each file this many times", (x) => parseInt(x), 1)
+        .option("-f, --frames <n>", "frames to run each project for", (x) => parseInt(x), 60)
+        .option("-l, --exec-limit <ms>", "time limit per job", (x) => parseInt(x))
+        .option("-q, --quiet", "only report throughput")
+        .parse(process.argv);
+
+    const codeTexts = program.args.map(fname => [fname, fs.readFileSync(fname, "utf8")]);
+    if (codeTexts.length === 0) {
+        console.log("error: must specify at least one Python file");
+        process.exit(1);
+    }
+
+    const pool = new VMPool({
+        size: program.size,
+        execLimit: program.execLimit,
+        nFrames: program.frames,
+    });
+
+    const t_start_boot = Date.now();
+    await pool.ready;
+    const t_start_jobs = Date.now();
+
+    let jobs = [];
+    for (let i = 0; i < program.repeat; ++i) {
+        codeTexts.forEach(([fname, codeText]) => {
+            jobs.push(pool.evaluate(codeText).then(result => {
+                if (!program.quiet)
+                    console.log(JSON.stringify(Object.assign({ fname }, result)));
+                return result;
+            }));
+        });
+    }
+    await Promise.all(jobs);
+    const t_end = Date.now();
+    await pool.close();
+
+    const jobs_seconds = (t_end - t_start_jobs) / 1000.0;
+    console.log(`${pool.size} workers booted in ${t_start_jobs - t_start_boot}ms;`
+                + ` ${jobs.length} jobs in ${jobs_seconds.toFixed(2)}s`
+                + ` (${(jobs.length / jobs_seconds).toFixed(1)} jobs/s)`);
+};
+
+
+if (!isMainThread) {
+    run_worker();
+} else if (require.main === module) {
+    main();
+}
+
+module.exports = { VMPool };
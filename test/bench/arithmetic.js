@@ -0,0 +1,57 @@
+/**
+ * Arithmetic microbenchmarks: time loops dominated by int and float
+ * operators and comparisons, compiled with and without the inline fast
+ * paths for numbers (the "inlineNumberOps" option).  The cases with
+ * mixed or big ints measure the cost of the fast-path checks when they
+ * fail.
+ *
+ *     node test/bench/arithmetic.js [--trials N] [--iterations N]
+ */
+
+const program = require("commander");
+const { runMicrobenchmarks } = require("./microbench");
+
+const loopCase = (label, setup, body) => ({ label, setup, body });
+
+const benchCases = (nIterations) => [
+    loopCase("int add", ["t = 0"], ["t = t + i"]),
+    loopCase("int sub/mult", ["t = 0"], ["t = (i - 3) * 2"]),
+    loopCase("float mult", ["x = 1.0"], ["x = x * 1.0000001"]),
+    loopCase("float add/sub", ["x = 0.0", "d = 0.5"], ["x = x + d - 0.25"]),
+    loopCase("int compare", ["t = 0"], ["if i < 500:", "    t += 1"]),
+    loopCase("float compare", ["t = 0", "x = 0.0"], ["x += 0.5", "if x >= 100.0:", "    t += 1"]),
+    loopCase("attribute aug-assign", ["p = Point()"], ["p.x += 1.5", "p.y -= 0.5"]),
+    loopCase("mixed int/float", ["x = 0.0"], ["x = x + i"]),
+    loopCase("big int", ["t = 2 ** 70"], ["t = t + i"]),
+].map(({ label, setup, body }) => ({
+    label,
+    code: [
+        "class Point:",
+        "    def __init__(self):",
+        "        self.x = 0.0",
+        "        self.y = 0.0",
+        "def run():",
+        ...setup.map((line) => "    " + line),
+        "    i = 0",
+        `    while i < ${nIterations}:`,
+        ...body.map((line) => "        " + line),
+        "        i += 1",
+        "run()",
+        "",
+    ].join("\n"),
+}));
+
+const configurations = [
+    { label: "generic", options: { inlineNumberOps: false } },
+    { label: "inline", options: { inlineNumberOps: true } },
+];
+
+program
+    .option("--trials <n>", "number of trials per case", (x) => parseInt(x, 10), 5)
+    .option("--iterations <n>", "loop iterations per trial", (x) => parseInt(x, 10), 200000)
+    .parse(process.argv);
+
+runMicrobenchmarks(benchCases(program.iterations), configurations, program.trials).catch((err) => {
+    console.log(err.toString());
+    process.exit(1);
+});
@@ -0,0 +1,91 @@
+/**
+ * Attribute-access microbenchmarks: time loops dominated by loads and
+ * stores of instance attributes and method calls, compiled without
+ * per-site inline caches (the "cacheAttributes" option), with them, and
+ * with them also used to call methods without making bound method
+ * objects (the "fastMethodCalls" option).  The "polymorphic" case
+ * sees objects of two classes at the same site, so measures the cost of
+ * cache misses.
+ *
+ * With --hit-rates, also run each case once with the caches counting
+ * their hits, and report the fraction of cacheable accesses which hit.
+ *
+ *     node test/bench/attributes.js [--trials N] [--iterations N] [--hit-rates]
+ */
+
+const program = require("commander");
+const { runMicrobenchmarks, configureSkulpt, timeOneRun } = require("./microbench");
+
+const benchCases = (nIterations) => [
+    { label: "instance load", body: ["t = p.x + p.y"] },
+    { label: "instance store", body: ["p.x = i", "p.y = i"] },
+    { label: "aug-assign", body: ["p.x += 1", "p.y -= 1"] },
+    { label: "method load", body: ["m = p.norm1"] },
+    { label: "method call", body: ["t = p.norm1()"] },
+    { label: "method call, args", body: ["p.move(1, -1)"] },
+    { label: "property load", body: ["t = p.total"] },
+    { label: "polymorphic", body: ["t = ps[i % 2].x"] },
+].map(({ label, body }) => ({
+    label,
+    code: [
+        "class Point:",
+        "    def __init__(self, x, y):",
+        "        self.x = x",
+        "        self.y = y",
+        "    def norm1(self):",
+        "        return abs(self.x) + abs(self.y)",
+        "    def move(self, dx, dy):",
+        "        self.x += dx",
+        "        self.y += dy",
+        "    @property",
+        "    def total(self):",
+        "        return self.x + self.y",
+        "class Point3(Point):",
+        "    def __init__(self, x, y, z):",
+        "        Point.__init__(self, x, y)",
+        "        self.z = z",
+        "def run():",
+        "    p = Point(1, 2)",
+        "    ps = [p, Point3(1, 2, 3)]",
+        "    t = 0",
+        "    i = 0",
+        `    while i < ${nIterations}:`,
+        ...body.map((line) => "        " + line),
+        "        i += 1",
+        "run()",
+        "",
+    ].join("\n"),
+}));
+
+const configurations = [
+    { label: "uncached", options: { cacheAttributes: false } },
+    { label: "bound calls", options: { cacheAttributes: true, fastMethodCalls: false } },
+    { label: "cached", options: { cacheAttributes: true, fastMethodCalls: true } },
+];
+
+async function reportHitRates(cases) {
+    console.log("\ncase".padEnd(21) + "hit rate".padStart(10));
+    configureSkulpt({ cacheAttributes: true, countAttributeCacheHits: true });
+    for (const benchCase of cases) {
+        Sk.generic.resetAttrCacheStats();
+        await timeOneRun(benchCase.code);
+        const { hits, misses } = Sk.generic.resetAttrCacheStats();
+        const rate = 100.0 * hits / (hits + misses);
+        console.log(benchCase.label.padEnd(20) + (rate.toFixed(2) + "%").padStart(10));
+    }
+}
+
+program
+    .option("--trials <n>", "number of trials per case", (x) => parseInt(x, 10), 5)
+    .option("--iterations <n>", "loop iterations per trial", (x) => parseInt(x, 10), 200000)
+    .option("--hit-rates", "also report the hit rate of the caches")
+    .parse(process.argv);
+
+const cases = benchCases(program.iterations);
+
+runMicrobenchmarks(cases, configurations, program.trials).then(
+    () => program.hitRates && reportHitRates(cases)
+).catch((err) => {
+    console.log(err.toString());
+    process.exit(1);
+});
@@ -0,0 +1,67 @@
+/**
+ * Breakpoint-check microbenchmarks: time statement- and loop-heavy code
+ * compiled with the "debugging" option, so that every statement and loop
+ * iteration has a breakpoint check, when Sk.breakpoints() is called at
+ * every check, and when the checks are limited to another file (with
+ * Sk.misceval.setBreakpointFiles(), as Sk.Debugger does).  The "plain"
+ * column is without "debugging", for reference.  Sk.breakpoints() never
+ * asks to stop.
+ *
+ *     node test/bench/breakpoints.js [--trials N] [--iterations N]
+ */
+
+const program = require("commander");
+const { runMicrobenchmarks } = require("./microbench");
+
+const benchCases = (nIterations) => [
+    { label: "while loop", body: ["i = 0", "while i < n:", "    i += 1", "    t += i"] },
+    { label: "for loop", body: ["for i in range(n):", "    t += i"] },
+    {
+        label: "statements",
+        body: ["for i in range(n):", "    a = i", "    b = a + 1", "    t += b - a"],
+    },
+].map(({ label, body }) => ({
+    label,
+    code: [
+        "def run(n):",
+        "    t = 0",
+        ...body.map((line) => "    " + line),
+        "    return t",
+        `run(${nIterations})`,
+        "",
+    ].join("\n"),
+}));
+
+program
+    .option("--trials <n>", "number of trials per case", (x) => parseInt(x, 10), 5)
+    .option("--iterations <n>", "loop iterations per trial", (x) => parseInt(x, 10), 200000)
+    .parse(process.argv);
+
+const breakpoints = { "<other>.py-1": true };
+const neverBreak = (filename, lineno, colno) => {
+    const key = filename + "-" + lineno;
+    return (key in breakpoints) && breakpoints[key] === true;
+};
+
+const configurations = [
+    {
+        label: "every check",
+        options: { debugging: true, breakpoints: neverBreak },
+        setup: () => Sk.misceval.setBreakpointFiles(null),
+    },
+    {
+        label: "plain",
+        options: { debugging: false },
+        setup: () => Sk.misceval.setBreakpointFiles(null),
+    },
+    {
+        label: "other file",
+        options: { debugging: true, breakpoints: neverBreak },
+        setup: () => Sk.misceval.setBreakpointFiles(["<other>.py"]),
+    },
+];
+
+runMicrobenchmarks(benchCases(program.iterations), configurations, program.trials).catch((err) => {
+    console.log(err.toString());
+    process.exit(1);
+});
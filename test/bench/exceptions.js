@@ -0,0 +1,88 @@
+/**
+ * Exception microbenchmarks: time code which raises and catches many
+ * exceptions, as in the "try: d[k] except KeyError:" idiom, exceptions
+ * passing up through several calls, and iterators ending with
+ * StopIteration, with the traceback line numbers kept up to date
+ * statement by statement, and found from source maps (the
+ * "sourceMapLineNumbers" option).
+ *
+ *     node test/bench/exceptions.js [--trials N] [--iterations N]
+ */
+
+const program = require("commander");
+const { runMicrobenchmarks } = require("./microbench");
+
+const benchCases = (nIterations) => [
+    {
+        label: "missing keys",
+        body: ["d = {}", "for i in range(n):", "    try:", "        t += d[i]", "    except KeyError:", "        t += 1"],
+    },
+    {
+        label: "raise in callee",
+        body: [
+            "def inner(i):",
+            "    raise ValueError(i)",
+            "def outer(i):",
+            "    return inner(i)",
+            "for i in range(n):",
+            "    try:",
+            "        outer(i)",
+            "    except ValueError:",
+            "        t += 1",
+        ],
+    },
+    {
+        label: "class iterators",
+        body: [
+            "class Countdown:",
+            "    def __init__(self, k):",
+            "        self.k = k",
+            "    def __iter__(self):",
+            "        return self",
+            "    def __next__(self):",
+            "        if self.k == 0:",
+            "            raise StopIteration",
+            "        self.k -= 1",
+            "        return self.k",
+            "for i in range(n // 4):",
+            "    for x in Countdown(3):",
+            "        t += x",
+        ],
+    },
+    {
+        label: "next() at end",
+        body: [
+            "for i in range(n):",
+            "    it = iter(())",
+            "    try:",
+            "        next(it)",
+            "    except StopIteration:",
+            "        t += 1",
+        ],
+    },
+].map(({ label, body }) => ({
+    label,
+    code: [
+        "def run(n):",
+        "    t = 0",
+        ...body.map((line) => "    " + line),
+        "    return t",
+        `run(${nIterations})`,
+        "",
+    ].join("\n"),
+}));
+
+const configurations = [
+    { label: "per-line", options: { sourceMapLineNumbers: false } },
+    { label: "source map", options: { sourceMapLineNumbers: true } },
+];
+
+program
+    .option("--trials <n>", "number of trials per case", (x) => parseInt(x, 10), 5)
+    .option("--iterations <n>", "loop iterations per trial", (x) => parseInt(x, 10), 50000)
+    .parse(process.argv);
+
+runMicrobenchmarks(benchCases(program.iterations), configurations, program.trials).catch((err) => {
+    console.log(err.toString());
+    process.exit(1);
+});
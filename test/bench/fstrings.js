@@ -0,0 +1,44 @@
+/**
+ * f-string microbenchmarks: time building f-strings like those of
+ * "say()" calls and watchers, compiled with and without building them
+ * from the JS strings of their parts (the "fastFStrings" option).
+ *
+ *     node test/bench/fstrings.js [--trials N] [--iterations N]
+ */
+
+const program = require("commander");
+const { runMicrobenchmarks } = require("./microbench");
+
+const benchCases = (nIterations) => [
+    { label: "str value", body: ["name = 'Banana'", "for i in range(n):", "    s = f'Hello {name}!'"] },
+    { label: "int value", body: ["for i in range(n):", "    s = f'Score: {i}'"] },
+    { label: "float value", body: ["x = 1.5", "for i in range(n):", "    s = f'x = {x}'"] },
+    {
+        label: "several values",
+        body: ["name = 'Banana'", "x = 1.5", "for i in range(n):", "    s = f'{name} at ({i}, {x}) has {i} points'"],
+    },
+    { label: "format spec", body: ["x = 1.5", "for i in range(n):", "    s = f'{x:.2f} / {i:>5}'"] },
+].map(({ label, body }) => ({
+    label,
+    code: [
+        "def run(n):",
+        ...body.map((line) => "    " + line),
+        `run(${nIterations})`,
+        "",
+    ].join("\n"),
+}));
+
+const configurations = [
+    { label: "concat", options: { fastFStrings: false } },
+    { label: "joined", options: { fastFStrings: true } },
+];
+
+program
+    .option("--trials <n>", "number of trials per case", (x) => parseInt(x, 10), 5)
+    .option("--iterations <n>", "loop iterations per trial", (x) => parseInt(x, 10), 100000)
+    .parse(process.argv);
+
+runMicrobenchmarks(benchCases(program.iterations), configurations, program.trials).catch((err) => {
+    console.log(err.toString());
+    process.exit(1);
+});
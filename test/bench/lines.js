@@ -0,0 +1,63 @@
+/**
+ * Line-number microbenchmarks: time statement-heavy code compiled with
+ * per-statement updates of $currLineNo and $currColNo, and with a source
+ * map instead (the "sourceMapLineNumbers" option).  The "caught
+ * exceptions" case measures the other side of the trade: with a source
+ * map, each exception captures the JS stack.
+ *
+ *     node test/bench/lines.js [--trials N] [--iterations N]
+ */
+
+const program = require("commander");
+const { runMicrobenchmarks } = require("./microbench");
+
+const benchCases = (nIterations) => [
+    {
+        label: "simple statements",
+        body: ["a = i", "b = a", "c = b", "t += c"],
+    },
+    {
+        label: "branches",
+        body: ["if i % 3 == 0:", "    t += 1", "elif i % 3 == 1:", "    t += 2", "else:", "    t -= 1"],
+    },
+    {
+        label: "function calls",
+        body: ["t += f(i)", "t += f(t)"],
+    },
+    {
+        label: "caught exceptions",
+        body: ["try:", "    t += d[i % 2]", "except KeyError:", "    t -= 1"],
+    },
+].map(({ label, body }) => ({
+    label,
+    code: [
+        "def f(x):",
+        "    y = x & 7",
+        "    return y",
+        "d = {0: 1}",
+        "def run(n):",
+        "    t = 0",
+        "    i = 0",
+        "    while i < n:",
+        ...body.map((line) => "        " + line),
+        "        i += 1",
+        "    return t",
+        `run(${nIterations})`,
+        "",
+    ].join("\n"),
+}));
+
+const configurations = [
+    { label: "stores", options: { sourceMapLineNumbers: false } },
+    { label: "source map", options: { sourceMapLineNumbers: true } },
+];
+
+program
+    .option("--trials <n>", "number of trials per case", (x) => parseInt(x, 10), 5)
+    .option("--iterations <n>", "loop iterations per trial", (x) => parseInt(x, 10), 200000)
+    .parse(process.argv);
+
+runMicrobenchmarks(benchCases(program.iterations), configurations, program.trials).catch((err) => {
+    console.log(err.toString());
+    process.exit(1);
+});
@@ -0,0 +1,52 @@
+/**
+ * Loop microbenchmarks: time "for ... in range(...)" loops, compiled with
+ * and without lowering to native counting loops (the "nativeRangeLoops"
+ * option).  In the "unused variable" case, the loop variable need only
+ * be stored when the loop ends; the "shadowed range" case measures the
+ * cost of the run-time check when "range" is not the builtin.
+ *
+ *     node test/bench/loops.js [--trials N] [--iterations N]
+ */
+
+const program = require("commander");
+const { runMicrobenchmarks } = require("./microbench");
+
+const benchCases = (nIterations) => [
+    { label: "sum of range", body: ["for i in range(n):", "    t += i"] },
+    { label: "unused variable", body: ["for _ in range(n):", "    t += 1"] },
+    { label: "stepped range", body: ["for i in range(n, 0, -2):", "    t += i"] },
+    {
+        label: "nested loops",
+        body: ["for i in range(n // 100):", "    for j in range(100):", "        t += j"],
+    },
+    {
+        label: "shadowed range",
+        body: ["range = lambda k: builtin_range(k)", "for i in range(n):", "    t += i"],
+    },
+].map(({ label, body }) => ({
+    label,
+    code: [
+        "builtin_range = range",
+        "def run(n):",
+        "    t = 0",
+        ...body.map((line) => "    " + line),
+        "    return t",
+        `run(${nIterations})`,
+        "",
+    ].join("\n"),
+}));
+
+const configurations = [
+    { label: "iterator", options: { nativeRangeLoops: false } },
+    { label: "native", options: { nativeRangeLoops: true } },
+];
+
+program
+    .option("--trials <n>", "number of trials per case", (x) => parseInt(x, 10), 5)
+    .option("--iterations <n>", "loop iterations per trial", (x) => parseInt(x, 10), 200000)
+    .parse(process.argv);
+
+runMicrobenchmarks(benchCases(program.iterations), configurations, program.trials).catch((err) => {
+    console.log(err.toString());
+    process.exit(1);
+});
@@ -0,0 +1,87 @@
+/**
+ * Shared support for microbenchmarks which time small Python programs,
+ * each under several sets of Sk.configure() options, so that an
+ * optimisation can be compared against running without it.
+ *
+ * A benchmark script describes its cases and configurations, and calls
+ * runMicrobenchmarks(), which prints the median run time of each case
+ * under each configuration, and the speed-up of the last configuration
+ * relative to the first.
+ */
+
+const fs = require("fs");
+const path = require("path");
+
+const root = path.resolve(__dirname, "../..");
+
+function median(xs) {
+    const sorted = xs.slice().sort((a, b) => a - b);
+    const mid = Math.floor(sorted.length / 2);
+    return (sorted.length % 2) ? sorted[mid] : (sorted[mid - 1] + sorted[mid]) / 2;
+}
+
+function configureSkulpt(options) {
+    Sk.configure(Object.assign({
+        __future__: Sk.python3,
+        read: (fname) => fs.readFileSync(path.resolve(root, fname), "utf8"),
+        output: (text) => {},
+    }, options));
+}
+
+/**
+ * Compile and run the given Python code, returning the time in ms which
+ * running it took, excluding compilation.
+ */
+async function timeOneRun(codeText) {
+    const compiled = Sk.compile(codeText, "<bench>.py", "exec", true);
+    const modfunc = Sk.global["eval"](compiled.code);
+    const module = new Sk.builtin.module();
+    module.$d = { __name__: new Sk.builtin.str("__main__") };
+    const t0 = process.hrtime.bigint();
+    await Sk.misceval.asyncToPromise(() => modfunc(module.$d));
+    const t1 = process.hrtime.bigint();
+    return Number(t1 - t0) / 1.0e6;
+}
+
+/**
+ * Each of "cases" is an object with properties "label" and "code", and
+ * optionally "time", an async function to use instead of timeOneRun() to
+ * time that code, and "options", extra options for Sk.configure() under
+ * every configuration; each of "configurations" is an object with
+ * properties "label" and "options", the latter being extra options for
+ * Sk.configure(), and optionally "setup", a function to call after
+ * configuring.
+ */
+async function runMicrobenchmarks(cases, configurations, nTrials) {
+    const requireSkulpt = require("../../support/run/require-skulpt").requireSkulpt;
+    if (requireSkulpt(false, false) === null) {
+        process.exit(1);
+    }
+
+    const labelWidth = Math.max(...cases.map((c) => c.label.length)) + 2;
+    const header = ("case".padEnd(labelWidth)
+                    + configurations.map((c) => c.label.padStart(12)).join("")
+                    + "speed-up".padStart(10));
+    console.log(header);
+
+    for (const benchCase of cases) {
+        let medians = [];
+        for (const configuration of configurations) {
+            configureSkulpt(Object.assign({}, benchCase.options, configuration.options));
+            if (configuration.setup) {
+                configuration.setup();
+            }
+            let times = [];
+            for (let i = 0; i < nTrials; ++i) {
+                times.push(await (benchCase.time || timeOneRun)(benchCase.code));
+            }
+            medians.push(median(times));
+        }
+        const speedUp = medians[0] / medians[medians.length - 1];
+        console.log(benchCase.label.padEnd(labelWidth)
+                    + medians.map((ms) => (ms.toFixed(1) + " ms").padStart(12)).join("")
+                    + (speedUp.toFixed(2) + "x").padStart(10));
+    }
+}
+
+module.exports = { runMicrobenchmarks, configureSkulpt, timeOneRun };
@@ -0,0 +1,52 @@
+/**
+ * Name-lookup microbenchmarks: time loops dominated by loads of builtin
+ * and module-level names, compiled with and without inline caches for
+ * global loads (the "cacheGlobalLoads" option).  The last case rebinds a
+ * global on every iteration, so measures the cost of cache misses.
+ *
+ *     node test/bench/names.js [--trials N] [--iterations N]
+ */
+
+const program = require("commander");
+const { runMicrobenchmarks } = require("./microbench");
+
+const benchCases = (nIterations) => [
+    { label: "builtin calls", body: ["t = len(xs) + abs(t - 1)"] },
+    { label: "isinstance", body: ["if isinstance(t, int):", "    t = t + 1"] },
+    { label: "module constants", body: ["t = t + STEP * SCALE"] },
+    { label: "module function", body: ["t = helper(t)"] },
+    { label: "rebinding global", body: ["global COUNTER", "COUNTER = COUNTER + len(xs)"] },
+].map(({ label, body }) => ({
+    label,
+    code: [
+        "STEP = 2",
+        "SCALE = 3",
+        "COUNTER = 0",
+        "def helper(x):",
+        "    return x",
+        "def run():",
+        "    xs = [1, 2, 3]",
+        "    t = 0",
+        "    i = 0",
+        `    while i < ${nIterations}:`,
+        ...body.map((line) => "        " + line),
+        "        i = i + 1",
+        "run()",
+        "",
+    ].join("\n"),
+}));
+
+const configurations = [
+    { label: "uncached", options: { cacheGlobalLoads: false } },
+    { label: "cached", options: { cacheGlobalLoads: true } },
+];
+
+program
+    .option("--trials <n>", "number of trials per case", (x) => parseInt(x, 10), 5)
+    .option("--iterations <n>", "loop iterations per trial", (x) => parseInt(x, 10), 200000)
+    .parse(process.argv);
+
+runMicrobenchmarks(benchCases(program.iterations), configurations, program.trials).catch((err) => {
+    console.log(err.toString());
+    process.exit(1);
+});
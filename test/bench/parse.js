@@ -0,0 +1,121 @@
+/**
+ * Parser benchmark: over the Python files of the standard library
+ * (src/lib) and of test/unit3, report the median time per trial to parse
+ * them with Sk.parse(), and to parse them to their ASTs both via the whole
+ * CST (Sk.parse() then Sk.astFromParse()) and statement by statement
+ * (Sk.parseToAst()), and the heap held by the results of each of those.
+ *
+ *     node test/bench/parse.js [--trials N] [--repeat N]
+ */
+
+const fs = require("fs");
+const path = require("path");
+const v8 = require("v8");
+const vm = require("vm");
+const program = require("commander");
+
+const root = path.resolve(__dirname, "../..");
+
+v8.setFlagsFromString("--expose-gc");
+const gc = vm.runInNewContext("gc");
+
+function pythonSources(dir) {
+    let sources = [];
+    for (const name of fs.readdirSync(dir).sort()) {
+        const fullPath = path.join(dir, name);
+        if (fs.statSync(fullPath).isDirectory()) {
+            sources = sources.concat(pythonSources(fullPath));
+        } else if (name.endsWith(".py")) {
+            sources.push(fs.readFileSync(fullPath, "utf8"));
+        }
+    }
+    return sources;
+}
+
+function median(xs) {
+    const sorted = xs.slice().sort((a, b) => a - b);
+    const mid = Math.floor(sorted.length / 2);
+    return (sorted.length % 2) ? sorted[mid] : (sorted[mid - 1] + sorted[mid]) / 2;
+}
+
+const parseCst = (source) => Sk.parse("<bench>.py", source);
+
+const astViaCst = (source) => {
+    const parse = Sk.parse("<bench>.py", source);
+    // Until the AST is done, the CST is held too.
+    return { cst: parse.cst, ast: Sk.astFromParse(parse.cst, "<bench>.py", parse.flags) };
+};
+
+const astStreaming = (source) => Sk.parseToAst("<bench>.py", source);
+
+/** Whether the source parses to an AST (e.g., not a Python 2 module). */
+function parsesToAst(source) {
+    try {
+        astViaCst(source);
+        return true;
+    } catch (err) {
+        if (!(err instanceof Sk.builtin.SyntaxError)) {
+            throw err;
+        }
+        return false;
+    }
+}
+
+function medianTime(sources, fn) {
+    let times = [];
+    for (let i = 0; i < program.trials; ++i) {
+        const t0 = process.hrtime.bigint();
+        for (let j = 0; j < program.repeat; ++j) {
+            for (const source of sources) {
+                fn(source);
+            }
+        }
+        const t1 = process.hrtime.bigint();
+        times.push(Number(t1 - t0) / 1.0e6);
+    }
+    return median(times);
+}
+
+/** The heap held by the results of fn() for all the sources at once. */
+function heapHeld(sources, fn) {
+    gc();
+    const before = process.memoryUsage().heapUsed;
+    const results = sources.map(fn);
+    gc();
+    const after = process.memoryUsage().heapUsed;
+    if (results.length !== sources.length) {
+        throw new Error("lost results");
+    }
+    return after - before;
+}
+
+program
+    .option("--trials <n>", "number of trials", (x) => parseInt(x, 10), 7)
+    .option("--repeat <n>", "times to parse the sources per trial", (x) => parseInt(x, 10), 1)
+    .parse(process.argv);
+
+const requireSkulpt = require("../../support/run/require-skulpt").requireSkulpt;
+if (requireSkulpt(false, false) === null) {
+    process.exit(1);
+}
+Sk.configure({ __future__: Sk.python3, output: (text) => {} });
+
+const sources = pythonSources(path.join(root, "src/lib"))
+      .concat(pythonSources(path.join(root, "test/unit3")))
+      .filter(parsesToAst);
+const nChars = sources.reduce((n, source) => n + source.length, 0);
+console.log(`${sources.length} files, ${(nChars / 1.0e6).toFixed(2)}M chars`);
+
+const modes = [["parse to CST", parseCst], ["parse to AST via CST", astViaCst]];
+if (Sk.parseToAst !== undefined) {
+    modes.push(["parse to AST streaming", astStreaming]);
+}
+
+for (const [label, fn] of modes) {
+    // Warm up.
+    medianTime(sources, fn);
+    const ms = medianTime(sources, fn) / program.repeat;
+    const mb = heapHeld(sources, fn) / 1.0e6;
+    console.log(`${label}: median ${ms.toFixed(1)} ms (${(nChars / ms / 1.0e3).toFixed(2)}M chars/s), `
+                + `holding ${mb.toFixed(1)} MB`);
+}
@@ -0,0 +1,87 @@
+/**
+ * Rebuild benchmark: report the median time to compile a Python file
+ * (by default src/lib/pytch/actor.py) afresh, and with the
+ * "incrementalCompile" option after the same file was last compiled,
+ * when it is unchanged, when one line within a method has been edited,
+ * and when a line has been inserted there.
+ *
+ *     node test/bench/rebuild.js [--trials N] [--file FILE]
+ */
+
+const fs = require("fs");
+const path = require("path");
+const program = require("commander");
+
+const root = path.resolve(__dirname, "../..");
+
+function median(xs) {
+    const sorted = xs.slice().sort((a, b) => a - b);
+    const mid = Math.floor(sorted.length / 2);
+    return (sorted.length % 2) ? sorted[mid] : (sorted[mid - 1] + sorted[mid]) / 2;
+}
+
+function compile(source) {
+    Sk.resetCompiler();
+    return Sk.compile(source, "<bench>.py", "exec", true);
+}
+
+/** Median time of compiling sourceOf(i) for trial i, after a warm-up. */
+function medianTime(sourceOf) {
+    let times = [];
+    for (let i = -program.trials; i < program.trials; ++i) {
+        const source = sourceOf(i);
+        const t0 = process.hrtime.bigint();
+        compile(source);
+        const t1 = process.hrtime.bigint();
+        if (i >= 0) {
+            times.push(Number(t1 - t0) / 1.0e6);
+        }
+    }
+    return median(times);
+}
+
+program
+    .option("--trials <n>", "number of trials", (x) => parseInt(x, 10), 50)
+    .option("--file <path>", "Python file to compile", path.join(root, "src/lib/pytch/actor.py"))
+    .parse(process.argv);
+
+const requireSkulpt = require("../../support/run/require-skulpt").requireSkulpt;
+if (requireSkulpt(false, false) === null) {
+    process.exit(1);
+}
+Sk.configure({ __future__: Sk.python3, output: (text) => {}, yieldLimit: 100 });
+
+const lines = fs.readFileSync(program.file, "utf8").split("\n");
+// An assignment within a method, about half way down.
+const editLine = lines.findIndex((line, i) => (i >= lines.length / 2 && /^ {8}\w+ = /.test(line)));
+if (editLine === -1) {
+    console.log("no assignment within a method to edit");
+    process.exit(1);
+}
+console.log(`${lines.length} lines; editing line ${editLine + 1}`);
+
+const unchanged = (i) => lines.join("\n");
+const edited = (i) => {
+    const editedLines = lines.slice();
+    editedLines[editLine] += ` + ${i}`;
+    return editedLines.join("\n");
+};
+// Alternately with and without an extra line, so that what follows it
+// moves each time.
+const inserted = (i) => {
+    const editedLines = lines.slice();
+    if (i % 2 === 0) {
+        editedLines.splice(editLine, 0, editedLines[editLine]);
+    }
+    return editedLines.join("\n");
+};
+
+Sk.incrementalCompile = false;
+console.log(`afresh: median ${medianTime(unchanged).toFixed(2)} ms`);
+
+Sk.incrementalCompile = true;
+for (const [label, sourceOf] of [["unchanged", unchanged],
+                                 ["one line edited", edited],
+                                 ["one line inserted", inserted]]) {
+    console.log(`incremental, ${label}: median ${medianTime(sourceOf).toFixed(2)} ms`);
+}
@@ -0,0 +1,132 @@
+/**
+ * Startup benchmark: time each phase of booting Skulpt and a small Pytch
+ * project, as recorded by Sk.startupTrace, and fail if any phase has
+ * regressed against a stored baseline.
+ *
+ * Each trial runs in a fresh Node process, so that loading Skulpt itself
+ * is measured too.  The median of each phase's duration across trials is
+ * compared against the baseline.
+ *
+ *     node test/bench/startup.js [--trials N] [--tolerance F]
+ *                                [--baseline FILE] [--update-baseline]
+ */
+
+const fs = require("fs");
+const path = require("path");
+const child_process = require("child_process");
+const program = require("commander");
+const chalk = require("chalk");
+
+const defaultBaselinePath = "support/tmp/startup-baseline.json";
+
+// Phases below this many milliseconds are too noisy to compare.
+const minComparableMs = 5;
+
+async function runTrial() {
+    const skulpt = require("../../support/run/require-skulpt").requireSkulpt(false, false);
+    if (skulpt === null) {
+        process.exit(1);
+    }
+
+    const imageSizes = {
+        "sunny-sky.png": [480, 360],
+        "balloon.png": [100, 200],
+        "yellow-banana.png": [80, 30],
+    };
+
+    Sk.configure({
+        __future__: Sk.python3,
+        read: (fname) => fs.readFileSync(fname, "utf8"),
+        output: (args) => {},
+        pytch: {
+            async_load_image: async (url) => {
+                const [width, height] = imageSizes[url];
+                return { url, width, height };
+            },
+        },
+    });
+
+    const codeText = fs.readFileSync(path.join(__dirname, "startup_project.py"), "utf8");
+    const module = await Sk.pytchsupport.import_with_auto_configure(codeText);
+    const project = module.$d.$auto_created_project.js_project;
+
+    project.on_green_flag_clicked();
+    project.one_frame();
+
+    process.stdout.write(JSON.stringify(Sk.startupTrace.summary()));
+}
+
+function median(xs) {
+    const sorted = xs.slice().sort((a, b) => a - b);
+    const mid = Math.floor(sorted.length / 2);
+    return (sorted.length % 2) ? sorted[mid] : (sorted[mid - 1] + sorted[mid]) / 2;
+}
+
+function runBenchmark(nTrials, tolerance, baselinePath, updateBaseline) {
+    // Trials must run with the repository root as working directory, so
+    // that the standard library is found under "src/lib".
+    const root = path.resolve(__dirname, "../..");
+
+    let samples = {};
+    for (let i = 0; i < nTrials; ++i) {
+        const output = child_process.execFileSync(
+            process.execPath, [__filename, "--trial"], { cwd: root, encoding: "utf8" }
+        );
+        Object.entries(JSON.parse(output)).forEach(([phase, ms]) => {
+            (samples[phase] || (samples[phase] = [])).push(ms);
+        });
+    }
+
+    let medians = {};
+    Object.keys(samples).sort().forEach((phase) => {
+        medians[phase] = median(samples[phase]);
+    });
+
+    const baselineFullPath = path.resolve(root, baselinePath);
+    const baseline = fs.existsSync(baselineFullPath)
+        ? JSON.parse(fs.readFileSync(baselineFullPath, "utf8"))
+        : null;
+
+    let regressions = [];
+    Object.entries(medians).forEach(([phase, ms]) => {
+        let line = phase.padEnd(32) + ms.toFixed(1).padStart(8) + " ms";
+        if (baseline !== null && baseline[phase] !== undefined) {
+            const limit = Math.max(baseline[phase] * (1 + tolerance), minComparableMs);
+            line += "   (baseline " + baseline[phase].toFixed(1) + " ms)";
+            if (ms > limit) {
+                regressions.push(phase);
+                line = chalk.red(line + "  REGRESSED");
+            }
+        }
+        console.log(line);
+    });
+
+    if (baseline === null || updateBaseline) {
+        fs.mkdirSync(path.dirname(baselineFullPath), { recursive: true });
+        fs.writeFileSync(baselineFullPath, JSON.stringify(medians, null, 2) + "\n", "utf8");
+        console.log("Wrote baseline to " + baselinePath);
+        return;
+    }
+
+    if (regressions.length > 0) {
+        console.log(chalk.red("Startup regressed in: " + regressions.join(", ")));
+        process.exit(1);
+    }
+}
+
+program
+    .option("--trial", "run one trial and print its phase durations as JSON")
+    .option("--trials <n>", "number of trials", (x) => parseInt(x, 10), 9)
+    .option("--tolerance <f>", "allowed fractional slowdown per phase", parseFloat, 0.25)
+    .option("--baseline <file>", "baseline phase durations", defaultBaselinePath)
+    .option("--update-baseline", "overwrite the baseline with this run's results")
+    .parse(process.argv);
+
+if (program.trial) {
+    runTrial().catch((err) => {
+        console.log(err.toString());
+        process.exit(1);
+    });
+} else {
+    runBenchmark(program.trials, program.tolerance, program.baseline, program.updateBaseline);
+}
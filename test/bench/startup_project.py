@@ -0,0 +1,37 @@
+import pytch
+from pytch import (
+    Stage,
+    Sprite,
+    when_green_flag_clicked,
+    when_I_receive,
+    when_this_sprite_clicked,
+)
+
+
+class Sky(Stage):
+    Backdrops = [('sunny', 'sunny-sky.png')]
+
+
+class Balloon(Sprite):
+    Costumes = [('balloon', 'balloon.png', 50, 100)]
+
+    @when_green_flag_clicked
+    def float_upwards(self):
+        self.go_to_xy(0, -150)
+        for _ in range(40):
+            self.change_y(5)
+        pytch.broadcast("popped")
+
+    @when_this_sprite_clicked
+    def pop(self):
+        self.hide()
+
+
+class Banana(Sprite):
+    Costumes = [('banana', 'yellow-banana.png', 40, 15)]
+
+    @when_I_receive("popped")
+    def celebrate(self):
+        for i in range(10):
+            self.turn_degrees(36)
+            self.say(f"Hooray {i}")
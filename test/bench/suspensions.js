@@ -0,0 +1,84 @@
+/**
+ * Suspension microbenchmarks: time Pytch projects whose threads yield
+ * every frame from some depth of Python calls, with and without reusing
+ * each function activation's suspension when it suspends again (the
+ * "reuseSuspensionFrames" option).  Each yield suspends every function on
+ * the thread's call stack, and the next frame resumes them all.
+ *
+ *     node test/bench/suspensions.js [--trials N] [--frames N]
+ */
+
+const program = require("commander");
+const { runMicrobenchmarks } = require("./microbench");
+
+const nThreads = 20;
+
+// A sprite with "nThreads" green-flag handlers, each calling down a chain
+// of "depth" methods, the innermost of which loops forever.  Pytch makes
+// each iteration of that loop yield until the next frame.
+const projectCode = (depth, nLocals) => {
+    const locals = Array.from({ length: nLocals }, (_, i) => `v${i}`);
+    const lines = ["import pytch", "", "class Worker(pytch.Sprite):", "    Costumes = []", ""];
+    for (let level = 1; level <= depth; ++level) {
+        lines.push(`    def level${level}(self, k):`);
+        locals.forEach((v, i) => lines.push(`        ${v} = k + ${i}`));
+        if (level < depth) {
+            lines.push(`        self.level${level + 1}(k + 1)`);
+        } else {
+            lines.push("        while True:");
+            lines.push("            self.n += 1");
+        }
+        lines.push("        return " + (nLocals > 0 ? locals.join(" + ") : "k"));
+        lines.push("");
+    }
+    for (let t = 0; t < nThreads; ++t) {
+        lines.push("    @pytch.when_green_flag_clicked");
+        lines.push(`    def run${t}(self):`);
+        lines.push("        self.n = 0");
+        lines.push("        self.level1(0)");
+        lines.push("");
+    }
+    return lines.join("\n");
+};
+
+/**
+ * Build the project, and return the time in ms which running the given
+ * number of frames took.
+ */
+const timeFrames = (nFrames) => async (codeText) => {
+    const module = await Sk.pytchsupport.import_with_auto_configure(codeText);
+    const project = module.$d.$auto_created_project.js_project;
+    project.on_green_flag_clicked();
+    const t0 = process.hrtime.bigint();
+    for (let i = 0; i < nFrames; ++i) {
+        project.one_frame();
+    }
+    const t1 = process.hrtime.bigint();
+    return Number(t1 - t0) / 1.0e6;
+};
+
+const benchCases = (nFrames) => [
+    { label: "depth 1", depth: 1, nLocals: 0 },
+    { label: "depth 3", depth: 3, nLocals: 0 },
+    { label: "depth 3, 6 locals", depth: 3, nLocals: 6 },
+    { label: "depth 8, 2 locals", depth: 8, nLocals: 2 },
+].map(({ label, depth, nLocals }) => ({
+    label,
+    code: projectCode(depth, nLocals),
+    time: timeFrames(nFrames),
+}));
+
+const configurations = [
+    { label: "new", options: { pytch: {}, reuseSuspensionFrames: false } },
+    { label: "reused", options: { pytch: {}, reuseSuspensionFrames: true } },
+];
+
+program
+    .option("--trials <n>", "number of trials per case", (x) => parseInt(x, 10), 5)
+    .option("--frames <n>", "frames to run per trial", (x) => parseInt(x, 10), 2000)
+    .parse(process.argv);
+
+runMicrobenchmarks(benchCases(program.frames), configurations, program.trials).catch((err) => {
+    console.log(err.toString());
+    process.exit(1);
+});
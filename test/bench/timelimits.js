@@ -0,0 +1,63 @@
+/**
+ * Time-limit microbenchmarks: time call- and loop-heavy code, compiled
+ * to check Sk.execLimit and Sk.yieldLimit by reading the clock at every
+ * check, or only when a countdown of checks runs out (the
+ * "clockCheckBudget" option).  The limits are set high enough that
+ * nothing times out, but low enough that yielding is exercised; with
+ * "--no-limits", they are left unset, which still compiles the checks.
+ *
+ *     node test/bench/timelimits.js [--trials N] [--iterations N] [--no-limits]
+ */
+
+const program = require("commander");
+const { runMicrobenchmarks } = require("./microbench");
+
+const benchCases = (nIterations) => [
+    { label: "while loop", body: ["i = 0", "while i < n:", "    i += 1", "    t += i"] },
+    { label: "for loop", body: ["for i in range(n):", "    t += i"] },
+    {
+        label: "function calls",
+        body: ["f = lambda x: x + 1", "for i in range(n):", "    t = f(t)"],
+    },
+    {
+        label: "method calls",
+        body: [
+            "class C:",
+            "    def inc(self, x):",
+            "        return x + 1",
+            "c = C()",
+            "for i in range(n):",
+            "    t = c.inc(t)",
+        ],
+    },
+].map(({ label, body }) => ({
+    label,
+    code: [
+        "def run(n):",
+        "    t = 0",
+        ...body.map((line) => "    " + line),
+        "    return t",
+        `run(${nIterations})`,
+        "",
+    ].join("\n"),
+}));
+
+program
+    .option("--trials <n>", "number of trials per case", (x) => parseInt(x, 10), 5)
+    .option("--iterations <n>", "loop iterations per trial", (x) => parseInt(x, 10), 200000)
+    .option("--no-limits", "leave execLimit and yieldLimit unset")
+    .parse(process.argv);
+
+const limits = (program.limits
+                ? { execLimit: 1.0e9, yieldLimit: 100 }
+                : { execLimit: Number.POSITIVE_INFINITY, yieldLimit: Number.POSITIVE_INFINITY });
+
+const configurations = [
+    { label: "clock", options: Object.assign({ clockCheckBudget: false }, limits) },
+    { label: "countdown", options: Object.assign({ clockCheckBudget: true }, limits) },
+];
+
+runMicrobenchmarks(benchCases(program.iterations), configurations, program.trials).catch((err) => {
+    console.log(err.toString());
+    process.exit(1);
+});
@@ -0,0 +1,95 @@
+/**
+ * Tokenizer throughput benchmark: time Sk._tokenize() over the Python
+ * files of the standard library (src/lib), as Sk.parse() feeds it, and
+ * report the median time per trial, and the throughput in source
+ * characters and tokens per second.
+ *
+ *     node test/bench/tokenize.js [--trials N] [--repeat N]
+ */
+
+const fs = require("fs");
+const path = require("path");
+const program = require("commander");
+
+const root = path.resolve(__dirname, "../..");
+
+function pythonSources(dir) {
+    let sources = [];
+    for (const name of fs.readdirSync(dir).sort()) {
+        const fullPath = path.join(dir, name);
+        if (fs.statSync(fullPath).isDirectory()) {
+            sources = sources.concat(pythonSources(fullPath));
+        } else if (name.endsWith(".py")) {
+            sources.push(fs.readFileSync(fullPath, "utf8"));
+        }
+    }
+    return sources;
+}
+
+function median(xs) {
+    const sorted = xs.slice().sort((a, b) => a - b);
+    const mid = Math.floor(sorted.length / 2);
+    return (sorted.length % 2) ? sorted[mid] : (sorted[mid - 1] + sorted[mid]) / 2;
+}
+
+// As in Sk.parse().
+function readline(input) {
+    const lines = input.split("\n").reverse().map((l) => l + "\n");
+    return () => {
+        if (lines.length === 0) {
+            throw new Sk.builtin.Exception("EOF");
+        }
+        return lines.pop();
+    };
+}
+
+/**
+ * Tokenize each of the sources, returning the number of tokens.  A source
+ * which does not tokenize (e.g., a Python 2 module) counts the tokens
+ * before the error.
+ */
+function tokenizeAll(sources) {
+    let nTokens = 0;
+    for (const source of sources) {
+        try {
+            Sk._tokenize("<bench>.py", readline(source), "utf-8", (tokenInfo) => { ++nTokens; });
+        } catch (err) {
+            if (!(err instanceof Sk.builtin.SyntaxError)) {
+                throw err;
+            }
+        }
+    }
+    return nTokens;
+}
+
+program
+    .option("--trials <n>", "number of trials", (x) => parseInt(x, 10), 7)
+    .option("--repeat <n>", "times to tokenize the sources per trial", (x) => parseInt(x, 10), 5)
+    .parse(process.argv);
+
+const requireSkulpt = require("../../support/run/require-skulpt").requireSkulpt;
+if (requireSkulpt(false, false) === null) {
+    process.exit(1);
+}
+Sk.configure({ __future__: Sk.python3, output: (text) => {} });
+
+const sources = pythonSources(path.join(root, "src/lib"));
+const nChars = sources.reduce((n, source) => n + source.length, 0) * program.repeat;
+
+// Warm up.
+let nTokens = tokenizeAll(sources) * program.repeat;
+
+let times = [];
+for (let i = 0; i < program.trials; ++i) {
+    const t0 = process.hrtime.bigint();
+    for (let j = 0; j < program.repeat; ++j) {
+        tokenizeAll(sources);
+    }
+    const t1 = process.hrtime.bigint();
+    times.push(Number(t1 - t0) / 1.0e6);
+}
+
+const ms = median(times);
+console.log(`${sources.length} files, ${(nChars / 1.0e6).toFixed(2)}M chars, ${nTokens} tokens per trial`);
+console.log(`median ${ms.toFixed(1)} ms: ${(nChars / ms / 1.0e3).toFixed(2)}M chars/s, `
+            + `${(nTokens / ms / 1.0e3).toFixed(2)}M tokens/s`);
@@ -0,0 +1,47 @@
+/**
+ * Yield microbenchmarks: time loops run with a short Sk.yieldLimit, so
+ * that Sk.misceval.asyncToPromise() is asked to yield to the event loop
+ * often, with every yield giving way (a "yieldDutyCycle" of 0) and with
+ * yields batched to keep to the default duty cycle.  The "killable" case
+ * suspends at every loop iteration (the "killableWhile" option).
+ *
+ *     node test/bench/yields.js [--trials N] [--iterations N] [--yield-limit MS]
+ */
+
+const program = require("commander");
+const { runMicrobenchmarks } = require("./microbench");
+
+program
+    .option("--trials <n>", "number of trials per case", (x) => parseInt(x, 10), 5)
+    .option("--iterations <n>", "loop iterations per trial", (x) => parseInt(x, 10), 200000)
+    .option("--yield-limit <ms>", "Sk.yieldLimit", (x) => parseFloat(x), 1)
+    .parse(process.argv);
+
+const loopCode = (body) => [
+    "def run(n):",
+    "    t = 0",
+    ...body.map((line) => "    " + line),
+    "    return t",
+    `run(${program.iterations})`,
+    "",
+].join("\n");
+
+const benchCases = [
+    { label: "for loop", code: loopCode(["for i in range(n):", "    t += i"]) },
+    { label: "while loop", code: loopCode(["i = 0", "while i < n:", "    i += 1", "    t += i"]) },
+    {
+        label: "killable",
+        code: loopCode(["i = 0", "while i < n // 20:", "    i += 1", "    t += i"]),
+        options: { killableWhile: true },
+    },
+];
+
+const configurations = [
+    { label: "every yield", options: { yieldLimit: program.yieldLimit, yieldDutyCycle: 0 } },
+    { label: "batched", options: { yieldLimit: program.yieldLimit } },
+];
+
+runMicrobenchmarks(benchCases, configurations, program.trials).catch((err) => {
+    console.log(err.toString());
+    process.exit(1);
+});
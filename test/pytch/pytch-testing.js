@@ -589,15 +589,23 @@ const assertSyntaxError = (gotErr, gotErrIdx, expErr) => {
 
 ////////////////////////////////////////////////////////////////////////////////
 //
-// Assert that a Tiger Python analysis report is as expected.  (Curried.)
-
-const assertTigerPythonAnalysis = (expErrors) => (err) => {
-    assert.ok(err instanceof Sk.pytchsupport.PytchBuildError);
+// Assert that the given import fails with a SyntaxError, and that the
+// Tiger Python analysis report, found afterwards, is as expected.
+
+const assertTigerPythonAnalysis = async (do_import, expErrors) => {
+    let err = null;
+    try {
+        await do_import;
+    } catch (e) {
+        err = e;
+    }
+    assertBuildError(err, "import", Sk.builtin.SyntaxError);
 
-    assert.equal(err.phase, "import");
-    assert.equal(err.innerError.tp$name, "TigerPythonSyntaxAnalysis");
+    const analysis = await err.TigerPython_analysis();
+    assert.notStrictEqual(analysis, null, "expecting a TigerPython analysis");
+    assert.equal(analysis.tp$name, "TigerPythonSyntaxAnalysis");
 
-    const got_errors = err.innerError.syntax_errors;
+    const got_errors = analysis.syntax_errors;
 
     assert.equal(
         got_errors.length,
@@ -608,9 +616,6 @@ const assertTigerPythonAnalysis = (expErrors) => (err) => {
     expErrors.forEach((expErr, i) => {
         assertSyntaxError(got_errors[i], i, expErr);
     });
-
-    // Allow usage as validation function for assert.rejects():
-    return true;
 };
 
 
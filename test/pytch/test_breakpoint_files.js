@@ -0,0 +1,98 @@
+"use strict";
+
+const {
+    configure_mocha,
+    assert,
+} = require("./pytch-testing.js");
+configure_mocha();
+
+
+////////////////////////////////////////////////////////////////////////////////
+//
+// The breakpoint checks emitted with "debugging", "killableWhile" or
+// "killableFor" only call Sk.breakpoints() in files which might have a
+// breakpoint.
+
+const compile = (code_text, filename) => {
+    const compiled = Sk.compile(code_text, filename, "exec", true);
+    return Sk.global["eval"](compiled.code);
+};
+
+const run = (modfunc) => {
+    const module = new Sk.builtin.module();
+    module.$d = { __name__: new Sk.builtin.str("__main__") };
+    return Sk.misceval.asyncToPromise(() => modfunc(module.$d));
+};
+
+describe("Breakpoint files", () => {
+    let saved;
+    let checks;
+    beforeEach(() => {
+        saved = [Sk.breakpoints, Sk.killableWhile, Sk.killableFor, Sk.debugging];
+        checks = [];
+        Sk.breakpoints = (filename, lineno) => {
+            checks.push(`${filename}:${lineno}`);
+            return false;
+        };
+    });
+    afterEach(() => {
+        [Sk.breakpoints, Sk.killableWhile, Sk.killableFor, Sk.debugging] = saved;
+        Sk.misceval.setBreakpointFiles(null);
+    });
+
+    const loops_code = ("n = 0\n"
+                        + "while n < 3:\n"
+                        + "    n += 1\n"
+                        + "for i in range(2):\n"
+                        + "    pass\n");
+
+    it("checks every file by default", async () => {
+        Sk.killableWhile = Sk.killableFor = true;
+        await run(compile(loops_code, "<a>.py"));
+        assert.strictEqual(checks.length, 6);
+        assert.strictEqual(checks[0], "<a>.py:2");
+    });
+
+    it("skips checks in files without breakpoints", async () => {
+        Sk.killableWhile = Sk.killableFor = true;
+        const modfunc_a = compile(loops_code, "<a>.py");
+        const modfunc_b = compile(loops_code, "<b>.py");
+
+        Sk.misceval.setBreakpointFiles(["<b>.py"]);
+        await run(modfunc_a);
+        assert.strictEqual(checks.length, 0);
+        await run(modfunc_b);
+        assert.strictEqual(checks.length, 6);
+
+        Sk.misceval.setBreakpointFiles([]);
+        await run(modfunc_b);
+        assert.strictEqual(checks.length, 6);
+
+        Sk.misceval.setBreakpointFiles(null);
+        await run(modfunc_a);
+        assert.strictEqual(checks.length, 12);
+    });
+
+    it("applies to modules compiled later", async () => {
+        Sk.debugging = true;
+        Sk.misceval.setBreakpointFiles(["<c>.py"]);
+        await run(compile("x = 1\ny = 2\n", "<d>.py"));
+        assert.strictEqual(checks.length, 0);
+        await run(compile("x = 1\ny = 2\n", "<c>.py"));
+        assert.deepStrictEqual(checks, ["<c>.py:1", "<c>.py:2"]);
+    });
+
+    it("still suspends at a breakpoint", async () => {
+        Sk.debugging = true;
+        Sk.misceval.setBreakpointFiles(["<e>.py"]);
+        Sk.breakpoints = (filename, lineno) => (lineno === 2);
+        const module = new Sk.builtin.module();
+        module.$d = { __name__: new Sk.builtin.str("__main__") };
+        const modfunc = compile("x = 1\ny = 2\n", "<e>.py");
+        const susp = modfunc(module.$d);
+        assert.ok(susp instanceof Sk.misceval.Suspension);
+        assert.strictEqual(susp.data.type, "Sk.debug");
+        assert.strictEqual(module.$d.x.v, 1);
+        assert.strictEqual(module.$d.y, undefined);
+    });
+});
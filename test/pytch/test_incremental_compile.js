@@ -0,0 +1,143 @@
+"use strict";
+
+const {
+    configure_mocha,
+    assert,
+} = require("./pytch-testing.js");
+configure_mocha();
+
+
+////////////////////////////////////////////////////////////////////////////////
+//
+// With the "incrementalCompile" option, Sk.compile() reuses what it can
+// from the last compilation of the same file.  The result must be the same
+// code, and the same errors, as compiling the file afresh.
+
+// The compiler numbers its scopes and temporaries across compilations.
+const renumbered = (code) => {
+    const numbers = new Map();
+    return code.replace(/\$\w*?\d+\b/g, (name) => {
+        if (!numbers.has(name)) {
+            numbers.set(name, `$v${numbers.size}`);
+        }
+        return numbers.get(name);
+    });
+};
+
+const compileWith = (incremental, code_text, filename) => {
+    const saved = Sk.incrementalCompile;
+    try {
+        Sk.incrementalCompile = incremental;
+        Sk.resetCompiler();
+        return Sk.compile(code_text, filename, "exec", true).code;
+    } finally {
+        Sk.incrementalCompile = saved;
+    }
+};
+
+const errorOf = (fn) => {
+    try {
+        fn();
+    } catch (err) {
+        return err;
+    }
+    assert.fail("no error");
+};
+
+const errorSummary = (err) => {
+    assert.ok(err instanceof Sk.builtin.SyntaxError);
+    return [err.tp$name, String(err), err.traceback];
+};
+
+const scopeNameOf = (code, funcname) => {
+    const match = new RegExp(`var (\\$scope\\d+)=\\(function \\$${funcname}\\d+\\$`).exec(code);
+    assert.ok(match !== null, `no scope for ${funcname}`);
+    return match[1];
+};
+
+describe("Incremental compilation", () => {
+    const code_text = ("import pytch\n"
+                       + "\n"
+                       + "def helper(x):\n"
+                       + "    return x + 1\n"
+                       + "\n"
+                       + "def caller(y):\n"
+                       + "    return helper(y) * 2\n"
+                       + "\n"
+                       + "class Banana(pytch.Sprite):\n"
+                       + "    Costumes = ['yellow-banana.png']\n"
+                       + "\n"
+                       + "    def __init__(self):\n"
+                       + "        super().__init__()\n"
+                       + "        self.__n = 0\n"
+                       + "\n"
+                       + "    @pytch.when_this_sprite_clicked\n"
+                       + "    def count(self):\n"
+                       + "        for i in range(3):\n"
+                       + "            self.__n += i\n"
+                       + "        return f'{self.__n!r:>{3}}'\n"
+                       + "\n"
+                       + "    if True:\n"
+                       + "        z = 1\n"
+                       + "    else:\n"
+                       + "        z = 2\n"
+                       + "\n"
+                       + "try:\n"
+                       + "    import foo\n"
+                       + "except ImportError:\n"
+                       + "    pass\n");
+
+    const edits = [
+        ["nothing", (text) => text],
+        ["a method", (text) => text.replace("self.__n += i", "self.__n -= i")],
+        ["a line count", (text) => text.replace("def caller", "\n\ndef caller")],
+        ["a function called by another",
+         (text) => text.replace("return x + 1", "while x < 9:\n        x += 1\n    return x")],
+        ["the meaning of a builtin", (text) => "range = list\n" + text],
+        ["a class name", (text) => text.replace("class Banana", "class Apple")],
+        ["Pytch threading", (text) => text.replace("import pytch\n", "")],
+    ];
+
+    it("gives the same code as compiling afresh", () => {
+        const filename = "<incremental-same-code>.py";
+        let text = code_text;
+        for (const [label, edit] of edits) {
+            text = edit(text);
+            assert.strictEqual(renumbered(compileWith(true, text, filename)),
+                               renumbered(compileWith(false, text, filename)),
+                               `after editing ${label}`);
+        }
+    });
+
+    it("reuses the code of unchanged functions", () => {
+        const filename = "<incremental-reuse>.py";
+        const first = compileWith(true, code_text, filename);
+        const edited = code_text.replace("return x + 1", "return x + 2");
+        const second = compileWith(true, edited, filename);
+        assert.strictEqual(scopeNameOf(second, "caller"), scopeNameOf(first, "caller"));
+        assert.strictEqual(scopeNameOf(second, "count"), scopeNameOf(first, "count"));
+        assert.notStrictEqual(scopeNameOf(second, "helper"), scopeNameOf(first, "helper"));
+
+        // Newly-compiled code must not use names of the code reused.
+        const declared = second.match(/var \$scope\d+=/g);
+        assert.strictEqual(new Set(declared).size, declared.length);
+    });
+
+    it("gives the same errors as compiling afresh", () => {
+        const filename = "<incremental-errors>.py";
+        compileWith(true, code_text, filename);
+        for (const bad_text of [
+            code_text.replace("return x + 1", "return x +"),
+            code_text.replace("    pass\n", "    del f()\n"),
+            code_text.replace("import pytch\n", "    import pytch\n"),
+        ]) {
+            const err = errorOf(() => compileWith(true, bad_text, filename));
+            assert.deepStrictEqual(
+                errorSummary(err),
+                errorSummary(errorOf(() => compileWith(false, bad_text, filename)))
+            );
+        }
+        assert.strictEqual(renumbered(compileWith(true, code_text, filename)),
+                           renumbered(compileWith(false, code_text, filename)));
+    });
+});
@@ -0,0 +1,118 @@
+"use strict";
+
+const {
+    configure_mocha,
+    import_deindented,
+    assert,
+    js_getattr,
+    one_frame,
+} = require("./pytch-testing.js");
+configure_mocha();
+
+
+////////////////////////////////////////////////////////////////////////////////
+//
+// Omitting the auto-inserted frame yield from small unobservable loops
+
+describe("Elision of loop yields", () => {
+    const project_with_loop = (loop_code, extra_code = "") => import_deindented(`
+
+        import pytch
+        ${extra_code}
+
+        class Counter(pytch.Sprite):
+            Costumes = []
+            total = None
+
+            @pytch.when_green_flag_clicked
+            def count(self):
+                total = 0
+                ${loop_code}
+                self.total = total
+    `);
+
+    // Number of frames until the green-flag thread sets "total", or
+    // null if it has not done so within ten frames.
+    const n_frames_to_finish = async (loop_code, extra_code) => {
+        const project = await project_with_loop(loop_code, extra_code);
+        const counter = project.instance_0_by_class_name("Counter");
+        project.on_green_flag_clicked();
+        for (let n_frames = 1; n_frames <= 10; ++n_frames) {
+            one_frame(project);
+            const total = js_getattr(counter.py_object, "total");
+            if (total !== null)
+                return { n_frames, total };
+        }
+        return null;
+    };
+
+    const body = (lines) => lines.join("\n                ");
+
+    [
+        {
+            label: "small literal range",
+            loop_code: ["for i in range(4):", "    total += i"],
+            exp_total: 6,
+        },
+        {
+            label: "literal range with start and step",
+            loop_code: ["for i in range(10, 0, -3):", "    total += i"],
+            exp_total: 22,
+        },
+        {
+            label: "literal tuple",
+            loop_code: ["for x in (3, 4, 5):", "    if x > 3:", "        total += x"],
+            exp_total: 9,
+        },
+        {
+            label: "nested literal loops",
+            loop_code: ["for i in range(3):", "    for j in [1, 2]:", "        total += i * j"],
+            exp_total: 9,
+        },
+    ].forEach(spec => {
+        it(`runs ${spec.label} within one frame`, async () => {
+            const result = await n_frames_to_finish(body(spec.loop_code));
+            assert.deepStrictEqual(result, { n_frames: 1, total: spec.exp_total });
+        });
+    });
+
+    [
+        {
+            label: "attribute-changing body",
+            loop_code: ["for i in range(4):", "    self.change_x(1)", "    total += i"],
+        },
+        {
+            label: "global-changing body",
+            loop_code: ["global g", "for i in range(4):", "    g += i", "    total += i"],
+            extra_code: "g = 0",
+        },
+        {
+            label: "non-literal range",
+            loop_code: ["n = 4", "for i in range(n):", "    total += i"],
+        },
+        {
+            label: "rebound range",
+            loop_code: ["for i in range(4):", "    total += i"],
+            extra_code: "range = lambda n: [0, 1, 2, 3]",
+        },
+        {
+            label: "while loop",
+            loop_code: ["i = 0", "while i < 4:", "    total += i", "    i += 1"],
+        },
+    ].forEach(spec => {
+        it(`keeps yields for ${spec.label}`, async () => {
+            const result = await n_frames_to_finish(body(spec.loop_code), spec.extra_code);
+            assert.deepStrictEqual(result, { n_frames: 4, total: 6 });
+        });
+    });
+
+    describe("when disabled", () => {
+        beforeEach(() => { Sk.elidePytchLoopYields = false; });
+        afterEach(() => { Sk.elidePytchLoopYields = true; });
+
+        it("keeps yields for small literal range", async () => {
+            const result = await n_frames_to_finish(body(["for i in range(4):", "    total += i"]));
+            assert.deepStrictEqual(result, { n_frames: 4, total: 6 });
+        });
+    });
+});
@@ -0,0 +1,72 @@
+"use strict";
+
+const {
+    configure_mocha,
+    import_deindented,
+    assert,
+    js_getattr,
+    one_frame,
+} = require("./pytch-testing.js");
+configure_mocha();
+
+
+////////////////////////////////////////////////////////////////////////////////
+//
+// "for i in range(...)" loops compiled to count natively must keep their
+// state across the suspensions of Pytch threads.
+
+describe("Native range loops", () => {
+    const run_frames = (project, n_frames, attr) => {
+        const counter = project.instance_0_by_class_name("Counter");
+        project.on_green_flag_clicked();
+        let values = [];
+        for (let i = 0; i < n_frames; ++i) {
+            one_frame(project);
+            values.push(js_getattr(counter.py_object, attr));
+        }
+        return values;
+    };
+
+    it("keeps the counter across loop yields", async () => {
+        const project = await import_deindented(`
+            import pytch
+
+            class Counter(pytch.Sprite):
+                Costumes = []
+                seen = None
+
+                @pytch.when_green_flag_clicked
+                def run(self):
+                    self.seen = []
+                    for i in range(10, 0, -3):
+                        self.seen.append(i)
+                        self.change_x(1)
+        `);
+        const history = run_frames(project, 5, "seen");
+        assert.deepStrictEqual(history[history.length - 1], [10, 7, 4, 1]);
+        assert.deepStrictEqual(history[0], [10]);
+    });
+
+    it("keeps an unused loop variable across waits", async () => {
+        const project = await import_deindented(`
+            import pytch
+
+            class Counter(pytch.Sprite):
+                Costumes = []
+                n = 0
+                last = None
+
+                @pytch.when_green_flag_clicked
+                def run(self):
+                    self.n = 0
+                    for i in range(3):
+                        pytch.wait_seconds(0)
+                        self.n += 1
+                    self.last = i
+        `);
+        const ns = run_frames(project, 10, "n");
+        assert.deepStrictEqual(ns.slice(-2), [3, 3]);
+        const counter = project.instance_0_by_class_name("Counter");
+        assert.strictEqual(js_getattr(counter.py_object, "last"), 2);
+    });
+});
@@ -0,0 +1,299 @@
+"use strict";
+
+const {
+    configure_mocha,
+    import_deindented,
+    assert,
+    js_getattr,
+    one_frame,
+} = require("./pytch-testing.js");
+configure_mocha();
+
+
+////////////////////////////////////////////////////////////////////////////////
+//
+// Compiling functions which cannot suspend without suspension support
+
+describe("Non-suspending function inference", () => {
+    const deindent = (code) => {
+        const lines = code.split("\n").filter(line => line.trim() !== "");
+        const indent = Math.min(...lines.map(line => line.search(/\S/)));
+        return lines.map(line => line.substring(indent)).join("\n") + "\n";
+    };
+
+    // Names of the functions found to be non-suspending in the given code.
+    const non_suspending_names = (code) => {
+        const source = deindent(code);
+        const parse = Sk.parse("<test>", source);
+        const ast = Sk.astFromParse(parse.cst, "<test>", parse.flags);
+        const st = Sk.symboltable(ast, "<test>");
+        const funs = Sk.findNonSuspendingFunctions(ast, st);
+        return Array.from(funs).map(f => f.name.v).sort();
+    };
+
+    it("finds arithmetic and string helpers", () => {
+        const names = non_suspending_names(`
+            import math
+
+            def to_radians(angle):
+                return math.pi * angle / 180.0
+
+            def clamp(x, lo, hi):
+                if x < lo:
+                    return lo
+                return hi if x > hi else x
+
+            def label(name, score):
+                if name == "":
+                    name = "?"
+                return f"{name}: {round(abs(score))}"
+
+            def wrapped(angle):
+                return clamp(to_radians(angle), -1.0, 1.0)
+        `);
+        assert.deepStrictEqual(names, ["clamp", "label", "to_radians", "wrapped"]);
+    });
+
+    it("rejects functions which might suspend", () => {
+        const names = non_suspending_names(`
+            import time
+
+            def sleeper():
+                time.sleep(1)
+
+            def indirect():
+                return sleeper()
+
+            def looper(xs):
+                for x in xs:
+                    pass
+
+            def keyed(xs):
+                return sorted(xs, key=lambda x: -x)
+
+            def counted(xs):
+                return len(xs)
+
+            def largest(xs):
+                return max(xs)
+
+            def via_local(f):
+                return f()
+
+            def gen():
+                yield 1
+
+            def attribute(x):
+                return x.total
+
+            def subscript(xs):
+                return xs[0]
+
+            def store(x):
+                x.total = 1
+
+            def slow(f):
+                return f
+
+            @slow
+            def decorated(x):
+                return x
+
+            def calls_decorated(x):
+                return decorated(x)
+        `);
+        // (The body of decorated() is fine, but calls to it call what slow()
+        // returned.)
+        assert.deepStrictEqual(names, ["decorated", "slow"]);
+    });
+
+    it("does not trust rebound names", () => {
+        const names = non_suspending_names(`
+            def helper(x):
+                return abs(x)
+
+            def caller(x):
+                return helper(x)
+
+            def abs(x):
+                return 0
+
+            def helper2():
+                return 1
+
+            helper2 = None
+
+            def caller2():
+                return helper2()
+        `);
+        assert.deepStrictEqual(names, ["abs", "caller", "helper", "helper2"]);
+    });
+
+    it("gives up on wildcard imports", () => {
+        const names = non_suspending_names(`
+            from math import *
+
+            def double(x):
+                return 2 * x
+        `);
+        assert.deepStrictEqual(names, []);
+    });
+
+    it("runs inferred helpers from Pytch threads", async () => {
+        const project = await import_deindented(`
+            import pytch
+
+            def scaled(x):
+                return 3 * x + 1
+
+            def describe(x):
+                return "value " + str(scaled(x))
+
+            class Counter(pytch.Sprite):
+                Costumes = []
+                result = None
+
+                @pytch.when_green_flag_clicked
+                def run(self):
+                    self.result = describe(4)
+        `);
+        const counter = project.instance_0_by_class_name("Counter");
+        project.on_green_flag_clicked();
+        one_frame(project);
+        assert.strictEqual(js_getattr(counter.py_object, "result"), "value 13");
+    });
+
+    // Run the green-flag handler of the only Counter, and return the
+    // "result" it sets, after enough frames for it to finish.
+    const green_flag_result = async (code) => {
+        const project = await import_deindented(code);
+        const counter = project.instance_0_by_class_name("Counter");
+        project.on_green_flag_clicked();
+        for (let i = 0; i < 60; ++i) {
+            one_frame(project);
+        }
+        return js_getattr(counter.py_object, "result");
+    };
+
+    it("keeps suspension for calls to decorated functions", async () => {
+        const result = await green_flag_result(`
+            import pytch
+
+            def slow(f):
+                def wrapper(*args):
+                    pytch.wait_seconds(0)
+                    return f(*args)
+                return wrapper
+
+            @slow
+            def helper(x):
+                return x + 1
+
+            def caller(x):
+                return helper(x)
+
+            class Counter(pytch.Sprite):
+                Costumes = []
+                result = None
+
+                @pytch.when_green_flag_clicked
+                def run(self):
+                    self.result = caller(1)
+        `);
+        assert.strictEqual(result, 2);
+    });
+
+    it("keeps suspension for builtins which iterate or call __len__", async () => {
+        const result = await green_flag_result(`
+            import pytch
+
+            def numbers():
+                for i in range(3):
+                    pytch.wait_seconds(0)
+                    yield i
+
+            class Sized:
+                def __len__(self):
+                    pytch.wait_seconds(0)
+                    return 7
+
+            def in_order(g):
+                return sorted(g)
+
+            def size(x):
+                return len(x)
+
+            def collected():
+                return [tuple(numbers()), sorted(set(numbers())),
+                        sorted(frozenset(numbers())),
+                        dict((i, i) for i in numbers()),
+                        min(numbers()), max(numbers())]
+
+            class Counter(pytch.Sprite):
+                Costumes = []
+                result = None
+
+                @pytch.when_green_flag_clicked
+                def run(self):
+                    self.result = [in_order(numbers()), size(Sized()), collected()]
+        `);
+        assert.deepStrictEqual(
+            result,
+            [[0, 1, 2], 7, [[0, 1, 2], [0, 1, 2], [0, 1, 2], { 0: 0, 1: 1, 2: 2 }, 0, 2]]
+        );
+    });
+
+    it("keeps suspension for attributes which might be properties", async () => {
+        const result = await green_flag_result(`
+            import pytch
+
+            class Box:
+                def __init__(self, n):
+                    self.n = n
+
+                @property
+                def total(self):
+                    t = 0
+                    for i in range(self.n):
+                        t += i
+                    return t
+
+            def get_total(b):
+                return b.total
+
+            class Counter(pytch.Sprite):
+                Costumes = []
+                result = None
+
+                @pytch.when_green_flag_clicked
+                def run(self):
+                    self.result = get_total(Box(5))
+        `);
+        assert.strictEqual(result, 10);
+    });
+
+    it("keeps suspension for helpers using Pytch syscalls", async () => {
+        const project = await import_deindented(`
+            import pytch
+
+            def pause():
+                pytch.wait_seconds(0)
+
+            class Counter(pytch.Sprite):
+                Costumes = []
+                result = None
+
+                @pytch.when_green_flag_clicked
+                def run(self):
+                    pause()
+                    self.result = 42
+        `);
+        const counter = project.instance_0_by_class_name("Counter");
+        project.on_green_flag_clicked();
+        one_frame(project);
+        assert.strictEqual(js_getattr(counter.py_object, "result"), null);
+        one_frame(project);
+        one_frame(project);
+        assert.strictEqual(js_getattr(counter.py_object, "result"), 42);
+    });
+});
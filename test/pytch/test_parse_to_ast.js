@@ -0,0 +1,116 @@
+"use strict";
+
+const {
+    configure_mocha,
+    assert,
+} = require("./pytch-testing.js");
+configure_mocha();
+
+
+////////////////////////////////////////////////////////////////////////////////
+//
+// Sk.parseToAst() converts each top-level statement to its AST as soon as
+// it has been parsed.  It must give the same AST, and the same errors, as
+// converting the CST of the whole module.
+
+const astViaCst = (code_text) => {
+    const parse = Sk.parse("<test>.py", code_text);
+    return Sk.astFromParse(parse.cst, "<test>.py", parse.flags);
+};
+
+// The AST as JSON, with the type of each node, and with str objects as
+// their JS strings.
+const astJson = (ast) => JSON.stringify(ast, function (key, value) {
+    if (value instanceof Sk.builtin.str) {
+        return value.v;
+    }
+    if (value && value._astname !== undefined) {
+        return Object.assign({ _astname: value._astname }, value);
+    }
+    return value;
+});
+
+// The compiler numbers its scopes and temporaries across compilations.
+const renumbered = (code) => {
+    const numbers = new Map();
+    return code.replace(/\$[a-z_]*\d+/g, (name) => {
+        if (!numbers.has(name)) {
+            numbers.set(name, `$v${numbers.size}`);
+        }
+        return numbers.get(name);
+    });
+};
+
+const errorOf = (fn) => {
+    try {
+        fn();
+    } catch (err) {
+        return err;
+    }
+    assert.fail("no error");
+};
+
+const errorSummary = (err) => {
+    assert.ok(err instanceof Sk.builtin.SyntaxError);
+    return [err.tp$name, String(err), err.traceback];
+};
+
+describe("Parsing to AST statement by statement", () => {
+    const code_text = ("import pytch\n"
+                       + "x = 1; y = 2\n"
+                       + "\n"
+                       + "@pytch.when_green_flag_clicked\n"
+                       + "def go(a, *args, b=3, **kwargs):\n"
+                       + "    return f'{a!r:>{b}} {x + y}'\n"
+                       + "class Banana(pytch.Sprite):\n"
+                       + "    Costumes = [n for n in range(3) if n]\n"
+                       + "    def f(self): pass\n"
+                       + "if x:\n"
+                       + "    del y\n"
+                       + "else: z = lambda: (yield)\n");
+
+    it("gives the same AST", () => {
+        assert.strictEqual(astJson(Sk.parseToAst("<test>.py", code_text)),
+                           astJson(astViaCst(code_text)));
+    });
+
+    it("hands each top-level statement to the caller", () => {
+        const stmts = [];
+        const parse = Sk.parse("<test>.py", code_text, (n) => stmts.push(n));
+        assert.deepStrictEqual(
+            stmts.map((n) => [Sk.ParseTables.number2symbol[n.type], n.lineno]),
+            [["stmt", 1], ["stmt", 2], ["stmt", 4], ["stmt", 7], ["stmt", 10]]
+        );
+        const rest = parse.cst.children.map((n) => Sk.token.tok_name[n.type]);
+        assert.deepStrictEqual(rest, ["T_ENDMARKER"]);
+    });
+
+    it("reports the first error in the AST", () => {
+        const bad_code = "x = 1\ndel f()\nf() = 2\n";
+        const err = errorOf(() => Sk.parseToAst("<test>.py", bad_code));
+        assert.deepStrictEqual(errorSummary(err),
+                               errorSummary(errorOf(() => astViaCst(bad_code))));
+        assert.strictEqual(err.traceback[0].lineno, 2);
+    });
+
+    it("reports a parse error before an earlier error in the AST", () => {
+        const bad_code = "del f()\nx = 1 +\n";
+        const err = errorOf(() => Sk.parseToAst("<test>.py", bad_code));
+        assert.deepStrictEqual(errorSummary(err),
+                               errorSummary(errorOf(() => astViaCst(bad_code))));
+        assert.strictEqual(err.traceback[0].lineno, 2);
+    });
+
+    it("compiles to the same code", () => {
+        const saved = Sk.streamingAst;
+        try {
+            Sk.streamingAst = true;
+            const streamed = Sk.compile(code_text, "<test>.py", "exec", true).code;
+            Sk.streamingAst = false;
+            const viaCst = Sk.compile(code_text, "<test>.py", "exec", true).code;
+            assert.strictEqual(renumbered(streamed), renumbered(viaCst));
+        } finally {
+            Sk.streamingAst = saved;
+        }
+    });
+});
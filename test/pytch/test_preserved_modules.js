@@ -0,0 +1,65 @@
+"use strict";
+
+const {
+    configure_mocha,
+    import_deindented,
+    assert,
+    many_frames,
+    pytch_stdout,
+} = require("./pytch-testing.js");
+configure_mocha();
+
+
+////////////////////////////////////////////////////////////////////////////////
+//
+// Keeping already-imported modules across builds, as done by the VM pool.
+
+describe("preserved modules", () => {
+    const s_pytch = new Sk.builtin.str("pytch");
+    const s_main = new Sk.builtin.str("__main__");
+
+    beforeEach(async () => {
+        await import_deindented(`
+            import pytch
+        `);
+        Sk.sysmodules.pop$item(s_main);
+        Sk.preserveCurrentModules();
+    });
+
+    afterEach(() => {
+        Sk.forgetPreservedModules();
+    });
+
+    it("re-uses preserved modules", async () => {
+        const pytch_module = Sk.sysmodules.mp$lookup(s_pytch);
+        const n_modules = Sk.sysmodules.get$size();
+
+        const project = await import_deindented(`
+            import pytch
+
+            class Hello(pytch.Stage):
+                Backdrops = ["solid-white-stage.png"]
+
+                @pytch.when_green_flag_clicked
+                def say_hello(self):
+                    print("hello")
+        `);
+
+        assert.strictEqual(Sk.sysmodules.mp$lookup(s_pytch), pytch_module);
+        assert.ok(Sk.sysmodules.mp$lookup(s_main) !== undefined);
+
+        project.on_green_flag_clicked();
+        many_frames(project, 2);
+        assert.strictEqual(pytch_stdout.drain_stdout(), "hello\n");
+
+        Sk.resetSysModules();
+        assert.strictEqual(Sk.sysmodules.mp$lookup(s_main), undefined);
+        assert.strictEqual(Sk.sysmodules.get$size(), n_modules);
+    });
+
+    it("starts afresh once preserved modules are forgotten", async () => {
+        Sk.forgetPreservedModules();
+        Sk.resetSysModules();
+        assert.strictEqual(Sk.sysmodules.get$size(), 0);
+    });
+});
@@ -3,6 +3,7 @@
 const {
     configure_mocha,
     with_project,
+    import_deindented,
     assert,
     many_frames,
     one_frame,
@@ -187,6 +188,66 @@ describe("scheduling", () => {
             actors.assert_has_steps_and_events(2, 2);
         })});
 
+    it("wakes nested broadcast/wait chains", async () => {
+        const project = await import_deindented(`
+
+            import pytch
+
+            log = []
+
+            class Outer(pytch.Sprite):
+                @pytch.when_green_flag_clicked
+                def start(self):
+                    log.append("outer-start")
+                    pytch.broadcast_and_wait("nobody-listens")
+                    log.append("outer-unheard")
+                    pytch.broadcast_and_wait("middle")
+                    log.append("outer-end")
+
+            class Middle(pytch.Sprite):
+                @pytch.when_I_receive("middle")
+                def run(self):
+                    log.append("middle-start")
+                    pytch.create_clone_of(Inner)
+                    pytch.broadcast_and_wait("inner")
+                    log.append("middle-end")
+
+            class Inner(pytch.Sprite):
+                @pytch.when_I_receive("inner")
+                def run(self):
+                    log.append("inner")
+                    pytch.wait_seconds(0)
+        `);
+
+        const log = () => Sk.ffi.remapToJs(project.$containingModule.$d.log);
+
+        // New log entries after each frame.  A thread waiting for
+        // a group with no threads wakes on the next frame; otherwise, a
+        // waiting thread wakes on the frame after the last thread of the
+        // awaited group finishes.
+        const exp_new_entries = [
+            ["outer-start"],
+            ["outer-unheard"],
+            ["middle-start"],
+            [],  // create_clone_of() yields
+            ["inner", "inner"],
+            [],  // inner threads finish
+            ["middle-end"],
+            ["outer-end"],
+            [],
+        ];
+
+        project.on_green_flag_clicked();
+        let exp_log = [];
+        exp_new_entries.forEach(new_entries => {
+            one_frame(project);
+            exp_log = exp_log.concat(new_entries);
+            assert.deepStrictEqual(log(), exp_log);
+        });
+
+        assert.strictEqual(project.threads_to_wake.length, 0);
+    });
+
     with_project("py/project/wait_seconds.py", (import_project) => {
         it("can pause for a number of seconds", async () => {
             let project = await import_project();
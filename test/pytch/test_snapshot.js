@@ -0,0 +1,193 @@
+"use strict";
+
+const {
+    configure_mocha,
+    import_deindented,
+    assert,
+    many_frames,
+    one_frame,
+    js_getattr,
+    call_method,
+} = require("./pytch-testing.js");
+configure_mocha();
+
+
+////////////////////////////////////////////////////////////////////////////////
+//
+// Snapshot and restore of a built project
+
+describe("project snapshots", () => {
+    const import_counting_project = () => import_deindented(`
+
+        import pytch
+
+        n_clicks = 0
+        history = []
+        settings = {"step": 10}
+
+        class Counter(pytch.Sprite):
+            Costumes = ["ball.png"]
+            max_clones = 2
+
+            def __init__(self):
+                pytch.Sprite.__init__(self)
+                self.seen = []
+                self.shared = history
+
+            @pytch.when_green_flag_clicked
+            def count(self):
+                global n_clicks, history
+                n_clicks += 1
+                self.seen.append(n_clicks)
+                self.shared.append("go")
+                settings["step"] += 1
+                settings["new"] = True
+                Counter.max_clones = 5
+                self.go_to_xy(settings["step"], 0)
+                history = ["replaced"]
+                pytch.create_clone_of(self)
+    `);
+
+    const module_of = (project) => project.$containingModule;
+    const global_value = (project, name) => Sk.ffi.remapToJs(module_of(project).$d[name]);
+
+    it("restores globals, attributes, and instances", async () => {
+        const project = await import_counting_project();
+        project.take_snapshot();
+
+        const counter = project.actor_by_class_name("Counter");
+        const original = counter.instances[0];
+
+        const assert_pristine = () => {
+            assert.strictEqual(global_value(project, "n_clicks"), 0);
+            assert.deepStrictEqual(global_value(project, "history"), []);
+            assert.deepStrictEqual(global_value(project, "settings"), { step: 10 });
+            assert.strictEqual(js_getattr(counter.py_cls, "max_clones"), 2);
+            assert.deepStrictEqual(original.js_attr("seen"), []);
+            assert.strictEqual(original.js_attr("_x"), 0);
+            assert.strictEqual(counter.instances.length, 1);
+            assert.strictEqual(counter.instances[0], original);
+        };
+
+        assert_pristine();
+
+        project.on_green_flag_clicked();
+        many_frames(project, 3);
+
+        assert.strictEqual(global_value(project, "n_clicks"), 1);
+        assert.deepStrictEqual(global_value(project, "history"), ["replaced"]);
+        assert.deepStrictEqual(global_value(project, "settings"), { step: 11, new: true });
+        assert.strictEqual(js_getattr(counter.py_cls, "max_clones"), 5);
+        assert.strictEqual(original.js_attr("_x"), 11);
+        assert.strictEqual(counter.instances.length, 2);
+
+        project.restore_snapshot();
+        assert_pristine();
+
+        // The instance's alias of the global "history" list is preserved.
+        const py_history = module_of(project).$d.history;
+        assert.strictEqual(
+            Sk.builtin.getattr(original.py_object, new Sk.builtin.str("shared")),
+            py_history
+        );
+
+        // Running again from the restored state gives the same results,
+        // and the snapshot can be restored more than once.
+        project.on_green_flag_clicked();
+        many_frames(project, 3);
+        assert.strictEqual(global_value(project, "n_clicks"), 1);
+        assert.deepStrictEqual(original.js_attr("seen"), [1]);
+
+        project.restore_snapshot();
+        assert_pristine();
+        assert.strictEqual(project.thread_groups.length, 0);
+    });
+
+    it("stops running threads on restore", async () => {
+        const project = await import_deindented(`
+
+            import pytch
+
+            class Spinner(pytch.Sprite):
+                @pytch.when_green_flag_clicked
+                def spin(self):
+                    while True:
+                        self.turn_degrees(1)
+        `);
+        project.take_snapshot();
+
+        project.on_green_flag_clicked();
+        one_frame(project);
+        assert.strictEqual(project.thread_groups.length, 1);
+
+        project.restore_snapshot();
+        assert.strictEqual(project.thread_groups.length, 0);
+
+        const spinner = project.instance_0_by_class_name("Spinner");
+        assert.strictEqual(spinner.js_attr("_rotation"), 0);
+    });
+
+    it("restores globals read through load caches", async () => {
+        const project = await import_deindented(`
+
+            import pytch
+
+            counter = 0
+
+            class Counter(pytch.Sprite):
+                def get_counter(self):
+                    return counter
+
+                @pytch.when_green_flag_clicked
+                def bump(self):
+                    global counter
+                    counter = 5
+        `);
+        const counter = project.instance_0_by_class_name("Counter");
+        const get_counter = () => call_method(counter.py_object, "get_counter", []);
+
+        assert.strictEqual(get_counter(), 0);
+        project.take_snapshot();
+
+        project.on_green_flag_clicked();
+        one_frame(project);
+        assert.strictEqual(get_counter(), 5);
+
+        project.restore_snapshot();
+        assert.strictEqual(get_counter(), 0);
+    });
+
+    it("restores class attributes read through attribute caches", async () => {
+        const project = await import_deindented(`
+
+            import pytch
+
+            class Car(pytch.Sprite):
+                speed = 1
+
+                def get_speed(self):
+                    return self.speed
+
+                @pytch.when_green_flag_clicked
+                def speed_up(self):
+                    Car.speed = 5
+        `);
+        const car = project.instance_0_by_class_name("Car");
+        const get_speed = () => call_method(car.py_object, "get_speed", []);
+
+        assert.strictEqual(get_speed(), 1);
+        project.take_snapshot();
+
+        project.on_green_flag_clicked();
+        one_frame(project);
+        assert.strictEqual(get_speed(), 5);
+
+        project.restore_snapshot();
+        assert.strictEqual(get_speed(), 1);
+    });
+
+    it("rejects restore without snapshot", async () => {
+        const project = await import_counting_project();
+        assert.throws(() => project.restore_snapshot(), /no snapshot/);
+    });
+});
@@ -0,0 +1,129 @@
+"use strict";
+
+const {
+    configure_mocha,
+    import_deindented,
+    assert,
+    pytch_errors,
+} = require("./pytch-testing.js");
+configure_mocha();
+
+
+////////////////////////////////////////////////////////////////////////////////
+//
+// With the "sourceMapLineNumbers" option, the lines of traceback entries
+// are found from the JS stack, or the block being run, rather than kept
+// up to date statement by statement.  They must come out the same.
+
+describe("Source-mapped line numbers", () => {
+    afterEach(() => { Sk.sourceMapLineNumbers = false; });
+
+    const traceback = async (code_text, sourceMapLineNumbers) => {
+        Sk.sourceMapLineNumbers = sourceMapLineNumbers;
+        const project = await import_deindented(code_text);
+        project.on_green_flag_clicked();
+        for (let i = 0; i < 10; ++i) {
+            if (project.one_frame().exception_was_raised) {
+                break;
+            }
+        }
+        const err = pytch_errors.sole_error();
+        return err.err.traceback;
+    };
+
+    const traceback_lines = async (code_text, sourceMapLineNumbers) => {
+        const entries = await traceback(code_text, sourceMapLineNumbers);
+        return entries.map((entry) => entry.lineno);
+    };
+
+    const assert_traceback_lines = async (code_text, exp_lines) => {
+        assert.deepStrictEqual(await traceback_lines(code_text, false), exp_lines);
+        assert.deepStrictEqual(await traceback_lines(code_text, true), exp_lines);
+    };
+
+    it("reports the lines of nested calls", async () => {
+        await assert_traceback_lines(`
+            import pytch
+
+            def inner(xs):
+                total = 0
+                for x in xs:
+                    total += x
+                return total / 0
+
+            def outer():
+                xs = [1, 2, 3]
+                return inner(xs)
+
+            class Banana(pytch.Sprite):
+                Costumes = []
+
+                @pytch.when_green_flag_clicked
+                def go(self):
+                    self.n = 1
+                    outer()
+        `, [7, 11, 19]);
+    });
+
+    it("reports the lines of frames resumed after waiting", async () => {
+        await assert_traceback_lines(`
+            import pytch
+
+            def countdown(n):
+                if n == 0:
+                    pytch.wait_seconds(0)
+                    return {}["missing"]
+                return countdown(n - 1)
+
+            class Banana(pytch.Sprite):
+                Costumes = []
+
+                @pytch.when_green_flag_clicked
+                def go(self):
+                    self.n = 1
+                    countdown(2)
+        `, [6, 7, 7, 15]);
+    });
+
+    it("reports the line of a re-raised exception", async () => {
+        await assert_traceback_lines(`
+            import pytch
+
+            problem = ValueError("made earlier")
+
+            def fail():
+                x = 1
+                raise problem
+
+            class Banana(pytch.Sprite):
+                Costumes = []
+
+                @pytch.when_green_flag_clicked
+                def go(self):
+                    try:
+                        fail()
+                    except KeyError:
+                        pass
+        `, [7, 15, 15]);
+    });
+
+    it("serialises traceback entries", async () => {
+        const code_text = `
+            import pytch
+
+            def fail():
+                return 1 / 0
+
+            class Banana(pytch.Sprite):
+                Costumes = []
+
+                @pytch.when_green_flag_clicked
+                def go(self):
+                    fail()
+        `;
+        const as_json = async (sourceMapLineNumbers) => JSON.parse(JSON.stringify(
+            await traceback(code_text, sourceMapLineNumbers)
+        ));
+        assert.deepStrictEqual(await as_json(true), await as_json(false));
+    });
+});
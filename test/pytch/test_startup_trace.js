@@ -0,0 +1,70 @@
+"use strict";
+
+const {
+    configure_mocha,
+    with_project,
+    assert,
+    one_frame,
+    import_deindented,
+} = require("./pytch-testing.js");
+configure_mocha();
+
+
+////////////////////////////////////////////////////////////////////////////////
+//
+// Recording the phases of starting up a project.
+
+describe("startup trace", () => {
+    with_project("py/project/single_sprite.py", (import_project) => {
+        it("records the phases of building and running a project", async () => {
+            Sk.startupTrace.reset();
+
+            let project = await import_project();
+            project.on_green_flag_clicked();
+            one_frame(project);
+            one_frame(project);
+
+            const phases = Sk.startupTrace.phases();
+            const phase_names = phases.map(p => p.phase);
+
+            ["import", "import:pytch", "asset-load", "first-frame"].forEach(name => {
+                assert.ok(phase_names.includes(name), `no "${name}" phase`);
+            });
+
+            const n_first_frames = phase_names.filter(n => n === "first-frame").length;
+            assert.strictEqual(n_first_frames, 1);
+
+            phases.forEach(p => {
+                assert.ok(p.duration >= 0, `negative duration for "${p.phase}"`);
+            });
+
+            const summary = Sk.startupTrace.summary();
+            assert.ok(summary["import"] >= summary["import:pytch"]);
+        });
+
+        it("forgets the phases of earlier builds", async () => {
+            for (let i = 0; i < 3; ++i) {
+                let project = await import_project();
+                project.on_green_flag_clicked();
+                one_frame(project);
+            }
+
+            const phase_names = Sk.startupTrace.phases().map(p => p.phase);
+            ["import", "first-frame"].forEach(name => {
+                const n_records = phase_names.filter(n => n === name).length;
+                assert.strictEqual(n_records, 1, `"${name}" phase recorded ${n_records} times`);
+            });
+        });
+    });
+
+    it("records the phase of an import which fails", async () => {
+        await assert.rejects(import_deindented(`
+
+            import pytch
+            1 / 0
+        `));
+
+        const phase_names = Sk.startupTrace.phases().map(p => p.phase);
+        assert.ok(phase_names.includes("import:__main__"));
+    });
+});
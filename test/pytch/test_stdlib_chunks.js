@@ -0,0 +1,90 @@
+"use strict";
+
+const fs = require("fs");
+
+const {
+    configure_mocha,
+    assert,
+} = require("./pytch-testing.js");
+configure_mocha();
+
+
+////////////////////////////////////////////////////////////////////////////////
+//
+// Importing from a standard library split into lazily-fetched chunks.
+
+describe("split standard library", () => {
+    let saved_read, saved_builtinFiles, saved_loadStdlibChunk;
+    let n_chunk_loads;
+
+    const chunk_files = {
+        "src/lib/chunky/__init__.py": "from .inner import value\n",
+        "src/lib/chunky/inner.py": "value = 42\n",
+    };
+
+    beforeEach(() => {
+        saved_read = Sk.read;
+        saved_builtinFiles = Sk.builtinFiles;
+        saved_loadStdlibChunk = Sk.loadStdlibChunk;
+
+        n_chunk_loads = 0;
+        Sk.read = Sk.readBuiltinFile;
+        Sk.builtinFiles = {
+            files: {
+                "src/lib/_sk_fail.py": fs.readFileSync("src/lib/_sk_fail.py", "utf8"),
+            },
+            chunks: {
+                "src/lib/chunky/__init__.py": "chunky",
+                "src/lib/chunky/inner.py": "chunky",
+            },
+            failStubs: {
+                "src/lib/unsupported.py": "unsupported",
+            },
+            prefetch: ["chunky"],
+        };
+        Sk.loadStdlibChunk = (chunkName) => {
+            assert.strictEqual(chunkName, "chunky");
+            ++n_chunk_loads;
+            return Promise.resolve({ files: chunk_files });
+        };
+        Sk.stdlibChunkPromises.clear();
+        Sk.sysmodules.pop$item(new Sk.builtin.str("chunky"));
+        Sk.sysmodules.pop$item(new Sk.builtin.str("chunky.inner"));
+    });
+
+    afterEach(() => {
+        Sk.sysmodules.pop$item(new Sk.builtin.str("chunky"));
+        Sk.sysmodules.pop$item(new Sk.builtin.str("chunky.inner"));
+        Sk.stdlibChunkPromises.clear();
+        Sk.read = saved_read;
+        Sk.builtinFiles = saved_builtinFiles;
+        Sk.loadStdlibChunk = saved_loadStdlibChunk;
+    });
+
+    const import_from_text = (code_text) => Sk.misceval.asyncToPromise(
+        () => Sk.importMainWithBody("<stdin>", false, code_text, true)
+    );
+
+    it("fetches a package's chunk once, on demand", async () => {
+        const module = await import_from_text("import chunky\nx = chunky.value\n");
+        assert.strictEqual(module.$d.x.v, 42);
+        assert.strictEqual(n_chunk_loads, 1);
+    });
+
+    it("does not re-fetch a prefetched chunk", async () => {
+        await Sk.prefetchStdlib();
+        assert.strictEqual(n_chunk_loads, 1);
+
+        const module = await import_from_text("import chunky\nx = chunky.value\n");
+        assert.strictEqual(module.$d.x.v, 42);
+        assert.strictEqual(n_chunk_loads, 1);
+    });
+
+    it("synthesises not-implemented stubs", async () => {
+        await assert.rejects(
+            import_from_text("import unsupported\n"),
+            /unsupported is not yet implemented/
+        );
+        assert.strictEqual(n_chunk_loads, 0);
+    });
+});
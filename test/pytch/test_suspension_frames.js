@@ -0,0 +1,70 @@
+"use strict";
+
+const {
+    configure_mocha,
+    import_deindented,
+    assert,
+    js_getattr,
+    many_frames,
+} = require("./pytch-testing.js");
+configure_mocha();
+
+
+////////////////////////////////////////////////////////////////////////////////
+//
+// A function which suspends again after being resumed may refill the
+// suspension it was resumed from; each activation must still keep its own
+// locals across frames.
+
+describe("Reused suspension frames", () => {
+    afterEach(() => { Sk.reuseSuspensionFrames = true; });
+
+    const log_after_frames = async (reuse) => {
+        Sk.reuseSuspensionFrames = reuse;
+        const project = await import_deindented(`
+            import pytch
+
+            def countdown(n, log):
+                if n == 0:
+                    for i in range(3):
+                        log.append(("leaf", i))
+                        pytch.yield_until_next_frame()
+                    return 0
+                mine = n * 10
+                total = countdown(n - 1, log)
+                pytch.yield_until_next_frame()
+                log.append(("back", n, mine))
+                return total + mine
+
+            def numbers(log):
+                for i in range(2):
+                    pytch.yield_until_next_frame()
+                    yield i
+
+            class Counter(pytch.Sprite):
+                Costumes = []
+                log = []
+
+                @pytch.when_green_flag_clicked
+                def run(self):
+                    self.log = []
+                    total = countdown(3, self.log)
+                    self.log.append(("total", total))
+                    self.log.append(("gen", list(numbers(self.log))))
+        `);
+        const counter = project.instance_0_by_class_name("Counter");
+        project.on_green_flag_clicked();
+        many_frames(project, 15);
+        return js_getattr(counter.py_object, "log");
+    };
+
+    it("keeps each activation's state", async () => {
+        const expected = [
+            ["leaf", 0], ["leaf", 1], ["leaf", 2],
+            ["back", 1, 10], ["back", 2, 20], ["back", 3, 30],
+            ["total", 60], ["gen", [0, 1]],
+        ];
+        assert.deepStrictEqual(await log_after_frames(true), expected);
+        assert.deepStrictEqual(await log_after_frames(false), expected);
+    });
+});
@@ -1,5 +1,9 @@
 "use strict";
 
+const fs = require("fs");
+const path = require("path");
+const vm = require("vm");
+
 const {
     configure_mocha,
     import_deindented,
@@ -23,14 +27,11 @@ describe("Syntax errors", () => {
                     foo = bar(]
         `);
 
-        await assert.rejects(
-            do_import,
-            assertTigerPythonAnalysis([
-                { re: /colon .* is required/, line: 4, offset: 22 },
-                { re: /body .* missing/, line: 4, offset: 22 },
-                { re: /mismatched bracket/, line: 5, offset: 18 },
-            ])
-        );
+        await assertTigerPythonAnalysis(do_import, [
+            { re: /colon .* is required/, line: 4, offset: 22 },
+            { re: /body .* missing/, line: 4, offset: 22 },
+            { re: /mismatched bracket/, line: 5, offset: 18 },
+        ]);
     });
 
     it("gives Skulpt error for double-f prefix", async () => {
@@ -51,27 +52,38 @@ describe("Syntax errors", () => {
             /bad input/);
 
         await assert.rejects(do_import, assertDetails);
+
+        const err = await do_import.catch((e) => e);
+        assert.strictEqual(await err.TigerPython_analysis(), null);
     });
 
     [
         {
             label: "TigerPython",
             disableTigerPython: false,
-            validationFun: assertTigerPythonAnalysis([
-                               { re: /extra symbol/, line: 5, offset: 4 },
-                           ]),
+            validate: (import_project) => assertTigerPythonAnalysis(
+                import_project,
+                [{ re: /extra symbol/, line: 5, offset: 4 }]
+            ),
         },
         {
             label: "Skulpt",
             disableTigerPython: true,
-            validationFun: (e) => assertSyntaxError(
-                                      e.innerError,
-                                      0,
-                                      { re: /bad input/, line: 5, offset: 4 }
-                                  ),
+            validate: (import_project) => assert.rejects(
+                import_project,
+                (e) => {
+                    assertSyntaxError(
+                        e.innerError,
+                        0,
+                        { re: /bad input/, line: 5, offset: 4 }
+                    );
+                    assert.strictEqual(e.TigerPython_analysis, undefined);
+                    return true;
+                }
+            ),
         },
     ].forEach(spec => {
-        it("raises SyntaxError with correct indexing (TigerPython)", async () => {
+        it(`raises SyntaxError with correct indexing (${spec.label})`, async () => {
             // Lines should be numbered from 1, offset is measured
             // from 0.  So program text below has an error at location
             // as follows:
@@ -93,8 +105,11 @@ describe("Syntax errors", () => {
             `);
 
             Sk.pytch._disable_TigerPython = spec.disableTigerPython;
-            await assert.rejects(import_project, spec.validationFun);
-            Sk.pytch._disable_TigerPython = false;
+            try {
+                await spec.validate(import_project);
+            } finally {
+                Sk.pytch._disable_TigerPython = false;
+            }
         });
     });
 
@@ -112,11 +127,123 @@ describe("Syntax errors", () => {
                 <
         `);
 
-        await assert.rejects(
-            import_project,
-            assertTigerPythonAnalysis([
-                { re: /extra symbol/, line: 10, offset: 4 }
-            ])
+        await assertTigerPythonAnalysis(import_project, [
+            { re: /extra symbol/, line: 10, offset: 4 }
+        ]);
+    });
+});
+
+
+////////////////////////////////////////////////////////////////////////////////
+//
+// The TigerPython analysis is only found when asked for, and is kept.
+
+// Run "tigerpython-worker.js" in its own context, with the interface of a
+// Worker.
+const fake_TigerPython_worker = () => {
+    const src_dir = path.resolve(__dirname, "../../src");
+    const listeners = [];
+    const context = vm.createContext({
+        console,
+        importScripts: (name) => vm.runInContext(
+            fs.readFileSync(path.join(src_dir, name), "utf8"), context
+        ),
+        postMessage: (data) => setImmediate(
+            () => listeners.forEach((listener) => listener({ data }))
+        ),
+    });
+    context.self = context;
+    vm.runInContext(
+        fs.readFileSync(path.join(src_dir, "tigerpython-worker.js"), "utf8"),
+        context
+    );
+
+    let n_messages = 0;
+    return {
+        addEventListener: (kind, listener) => {
+            if (kind === "message")
+                listeners.push(listener);
+        },
+        postMessage: (data) => {
+            ++n_messages;
+            setImmediate(() => context.onmessage({ data }));
+        },
+        n_messages: () => n_messages,
+    };
+};
+
+describe("TigerPython analysis", () => {
+    let saved_findAllErrors;
+    let n_analyses;
+    beforeEach(() => {
+        saved_findAllErrors = globalThis.TPyParser.findAllErrors;
+        n_analyses = 0;
+        globalThis.TPyParser.findAllErrors = (code_text) => {
+            ++n_analyses;
+            return saved_findAllErrors.call(globalThis.TPyParser, code_text);
+        };
+    });
+    afterEach(() => {
+        globalThis.TPyParser.findAllErrors = saved_findAllErrors;
+        Sk.pytch.TigerPython_worker = null;
+    });
+
+    it("is not found until asked for", async () => {
+        const import_project = import_deindented(`
+            import pytch
+            x = (1, 2]
+        `);
+
+        const err = await import_project.catch((e) => e);
+        assertSyntaxError(
+            err.innerError, 0, { re: /bad input/, line: 2, offset: 9 }
+        );
+        assert.strictEqual(n_analyses, 0);
+
+        const analysis = await err.TigerPython_analysis();
+        assert.strictEqual(n_analyses, 1);
+        assertSyntaxError(
+            analysis.syntax_errors[0],
+            0,
+            { re: /mismatched brackets/, line: 2, offset: 9 }
+        );
+
+        assert.strictEqual(await err.TigerPython_analysis(), analysis);
+        assert.strictEqual(n_analyses, 1);
+    });
+
+    it("is kept per code text", async () => {
+        const code_text = "import pytch\nif True\n    pass\n";
+        const first = await Sk.pytchsupport.TigerPython_analysis(code_text);
+        const other = await Sk.pytchsupport.TigerPython_analysis(code_text + "\n");
+        const again = await Sk.pytchsupport.TigerPython_analysis(code_text);
+        assert.strictEqual(n_analyses, 2);
+        assert.strictEqual(again, first);
+        assert.notStrictEqual(other, first);
+    });
+
+    it("can be found in a worker", async () => {
+        const worker = fake_TigerPython_worker();
+        Sk.pytch.TigerPython_worker = worker;
+
+        await assertTigerPythonAnalysis(
+            import_deindented(`
+                import pytch
+                class Apple(pytch.Sprite):
+                    def peel(self)
+                        pass
+            `),
+            [{ re: /colon .* is required/, line: 3, offset: 18 }]
         );
+        assert.strictEqual(worker.n_messages(), 1);
+        assert.strictEqual(n_analyses, 0);
+
+        const analyses = await Promise.all([
+            Sk.pytchsupport.TigerPython_analysis("import pytch\nx = ]\n"),
+            Sk.pytchsupport.TigerPython_analysis("import pytch\nx = 1\n"),
+        ]);
+        assert.strictEqual(worker.n_messages(), 3);
+        assert.strictEqual(analyses[0].syntax_errors.length, 1);
+        assert.strictEqual(analyses[1], null);
     });
 });
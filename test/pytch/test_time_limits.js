@@ -0,0 +1,123 @@
+"use strict";
+
+const {
+    configure_mocha,
+    assert,
+} = require("./pytch-testing.js");
+configure_mocha();
+
+
+////////////////////////////////////////////////////////////////////////////////
+//
+// Sk.execLimit and Sk.yieldLimit, checked by reading the clock either at
+// every check, or only when a countdown of checks runs out.
+
+const run = (code_text, suspHandlers) => {
+    const compiled = Sk.compile(code_text, "<limits>.py", "exec", true);
+    const modfunc = Sk.global["eval"](compiled.code);
+    const module = new Sk.builtin.module();
+    module.$d = { __name__: new Sk.builtin.str("__main__") };
+    Sk.execStart = Sk.lastYield = Date.now();
+    return Sk.misceval.asyncToPromise(() => modfunc(module.$d), suspHandlers);
+};
+
+describe("Time limits", () => {
+    let savedLimits;
+    beforeEach(() => {
+        savedLimits = [Sk.execLimit, Sk.yieldLimit, Sk.clockCheckBudget];
+    });
+    afterEach(() => {
+        [Sk.execLimit, Sk.yieldLimit, Sk.clockCheckBudget] = savedLimits;
+    });
+
+    [true, false].forEach((clockCheckBudget) => {
+        const label = clockCheckBudget ? "with a countdown" : "reading the clock each time";
+
+        it(`times out ${label}`, async () => {
+            Sk.clockCheckBudget = clockCheckBudget;
+            Sk.execLimit = 100;
+            const t0 = Date.now();
+            await assert.rejects(
+                run("def spin():\n    while True:\n        pass\nspin()\n"),
+                (err) => err instanceof Sk.builtin.TimeoutError
+            );
+            const elapsed = Date.now() - t0;
+            assert.ok(elapsed >= 100 && elapsed < 1000, `timed out after ${elapsed}ms`);
+        });
+
+        it(`times out during slow iterations after fast ones ${label}`, async () => {
+            Sk.clockCheckBudget = clockCheckBudget;
+            Sk.execLimit = 200;
+            const code = ("import random\n"
+                          + "big = [random.random() for _ in range(5000)]\n"
+                          + "i = 0\n"
+                          + "while i < 200000:\n"
+                          + "    i += 1\n"
+                          + "while True:\n"
+                          + "    sorted(big)\n");
+            const t0 = Date.now();
+            await assert.rejects(
+                run(code),
+                (err) => err instanceof Sk.builtin.TimeoutError
+            );
+            const elapsed = Date.now() - t0;
+            assert.ok(elapsed >= 200 && elapsed < 1000, `timed out after ${elapsed}ms`);
+        });
+
+        it(`yields ${label}`, async () => {
+            Sk.clockCheckBudget = clockCheckBudget;
+            Sk.yieldLimit = 10;
+            let nYields = 0;
+            const handlers = { "Sk.yield": () => { ++nYields; } };
+            const code = ("import time\n"
+                          + "t0 = time.time()\n"
+                          + "while time.time() - t0 < 0.1:\n"
+                          + "    pass\n");
+            await run(code, handlers);
+            assert.ok(nYields >= 3, `yielded ${nYields} times`);
+        });
+    });
+});
+
+
+////////////////////////////////////////////////////////////////////////////////
+//
+// Yields which come too soon after the last one, for the "yieldDutyCycle"
+// option, are skipped by Sk.misceval.asyncToPromise().
+
+describe("Yield duty cycle", () => {
+    let savedOptions;
+    beforeEach(() => {
+        savedOptions = [Sk.yieldLimit, Sk.yieldDutyCycle];
+        Sk.misceval.resetYieldStats();
+    });
+    afterEach(() => {
+        [Sk.yieldLimit, Sk.yieldDutyCycle] = savedOptions;
+    });
+
+    const code = ("import time\n"
+                  + "t0 = time.time()\n"
+                  + "n = 0\n"
+                  + "while time.time() - t0 < 0.1:\n"
+                  + "    n += 1\n");
+
+    it("gives way at every yield with a duty cycle of 0", async () => {
+        Sk.yieldLimit = 0;
+        Sk.yieldDutyCycle = 0;
+        await run(code);
+        const stats = Sk.misceval.yieldStats;
+        assert.ok(stats.yields > 0);
+        assert.strictEqual(stats.batchedYields, 0);
+    });
+
+    it("batches yields with a high duty cycle", async () => {
+        Sk.yieldLimit = 0;
+        Sk.yieldDutyCycle = 0.99;
+        await run(code);
+        const stats = Sk.misceval.yieldStats;
+        assert.ok(stats.yields > 0);
+        assert.ok(stats.batchedYields > 0);
+        assert.ok(stats.executingMs > stats.yieldedMs,
+                  `executing ${stats.executingMs}ms; yielded ${stats.yieldedMs}ms`);
+    });
+});
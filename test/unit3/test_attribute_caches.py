@@ -0,0 +1,155 @@
+""" Attribute loads and stores, which compiled code may cache per site """
+
+import unittest
+
+
+def get_x(obj):
+    return obj.x
+
+
+def set_x(obj, value):
+    obj.x = value
+
+
+def call_m(obj):
+    return obj.m()
+
+
+class Plain:
+    def __init__(self, x):
+        self.x = x
+
+    def m(self):
+        return "Plain.m"
+
+
+class Derived(Plain):
+    pass
+
+
+class WithProperty:
+    def __init__(self):
+        self.log = []
+
+    @property
+    def x(self):
+        return "property"
+
+    @x.setter
+    def x(self, value):
+        self.log.append(value)
+
+
+class AttributeCachesTest(unittest.TestCase):
+
+    def test_instance_and_class_attributes(self):
+        p = Plain(1)
+        for i in range(3):
+            self.assertEqual(get_x(p), i + 1)
+            set_x(p, i + 2)
+        del p.x
+        self.assertRaises(AttributeError, get_x, p)
+        Plain.x = "class"
+        try:
+            self.assertEqual(get_x(p), "class")
+            set_x(p, "instance")
+            self.assertEqual(get_x(p), "instance")
+        finally:
+            del Plain.x
+
+    def test_changing_method_of_base(self):
+        objs = [Plain(0), Derived(0)]
+        for obj in objs:
+            self.assertEqual(call_m(obj), "Plain.m")
+        original = Plain.m
+        Plain.m = lambda self: "replaced"
+        try:
+            for obj in objs:
+                self.assertEqual(call_m(obj), "replaced")
+        finally:
+            Plain.m = original
+        Derived.m = lambda self: "Derived.m"
+        try:
+            self.assertEqual([call_m(obj) for obj in objs], ["Plain.m", "Derived.m"])
+        finally:
+            del Derived.m
+        self.assertEqual(call_m(objs[1]), "Plain.m")
+
+    def test_data_descriptor_added_later(self):
+        class Later:
+            pass
+
+        obj = Later()
+        set_x(obj, 1)
+        self.assertEqual(get_x(obj), 1)
+        Later.x = property(lambda self: "property")
+        try:
+            self.assertEqual(get_x(obj), "property")
+            self.assertRaises(AttributeError, set_x, obj, 2)
+        finally:
+            del Later.x
+        self.assertEqual(get_x(obj), 1)
+
+    def test_property(self):
+        obj = WithProperty()
+        for i in range(3):
+            self.assertEqual(get_x(obj), "property")
+            set_x(obj, i)
+        self.assertEqual(obj.log, [0, 1, 2])
+
+    def test_polymorphic_site(self):
+        objs = [Plain(1), Derived(2), WithProperty(), Plain(3)]
+        self.assertEqual([get_x(obj) for obj in objs], [1, 2, "property", 3])
+
+    def test_class_assignment(self):
+        class Other:
+            x = "Other.x"
+
+        obj = Plain(1)
+        self.assertEqual(call_m(obj), "Plain.m")
+        del obj.x
+        obj.__class__ = Other
+        self.assertEqual(get_x(obj), "Other.x")
+        self.assertRaises(AttributeError, call_m, obj)
+
+    def test_getattr_added_later(self):
+        class Dynamic:
+            pass
+
+        obj = Dynamic()
+        self.assertRaises(AttributeError, get_x, obj)
+        Dynamic.__getattr__ = lambda self, name: "dynamic " + name
+        self.assertEqual(get_x(obj), "dynamic x")
+
+    def test_setattr_override(self):
+        class Recording:
+            def __init__(self):
+                self.__dict__["log"] = []
+
+            def __setattr__(self, name, value):
+                self.log.append((name, value))
+
+        obj = Recording()
+        set_x(obj, 1)
+        set_x(obj, 2)
+        self.assertEqual(obj.log, [("x", 1), ("x", 2)])
+
+    def test_replaced_instance_dict(self):
+        obj = Plain(1)
+        self.assertEqual(get_x(obj), 1)
+        obj.__dict__ = {"x": 2}
+        self.assertEqual(get_x(obj), 2)
+        set_x(obj, 3)
+        self.assertEqual(obj.__dict__, {"x": 3})
+
+    def test_slots(self):
+        class Slotted:
+            __slots__ = ("x",)
+
+        obj = Slotted()
+        set_x(obj, 1)
+        self.assertEqual(get_x(obj), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
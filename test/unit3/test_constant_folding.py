@@ -0,0 +1,119 @@
+""" Constant expressions, which the compiler may evaluate ahead of time """
+
+import unittest
+import math
+
+
+class ConstantFoldingTest(unittest.TestCase):
+
+    def test_arithmetic(self):
+        self.assertEqual(2 + 3 * 4, 14)
+        self.assertEqual(7 // 2, 3)
+        self.assertEqual(-7 // 2, -4)
+        self.assertEqual(7 % -3, -2)
+        self.assertEqual(1 / 4, 0.25)
+        self.assertEqual(2 ** 10, 1024)
+        self.assertEqual(2 ** -1, 0.5)
+        self.assertEqual(1 << 70, 1180591620717411303424)
+        self.assertEqual(0xF0 | 0x0F, 255)
+        self.assertEqual(~5, -6)
+        self.assertEqual(2.0 * 3.141592653589793, 6.283185307179586)
+        self.assertEqual(0.1 + 0.2, 0.30000000000000004)
+        self.assertIsInstance(6 / 3, float)
+        self.assertIsInstance(2 * 3, int)
+
+    def test_signed_zero(self):
+        self.assertEqual(math.copysign(1.0, -0.0 * 1), -1.0)
+        self.assertEqual(math.copysign(1.0, 0.0 * -1), -1.0)
+
+    def test_large_results(self):
+        self.assertEqual(len(str(10 ** 200)), 201)
+        self.assertEqual((1 << 1000) >> 999, 2)
+        self.assertEqual(len("ab" * 5000), 10000)
+
+    def test_errors_raised_at_run_time(self):
+        def divide():
+            return 1 / 0
+
+        def concatenate():
+            return "a" + 1
+
+        self.assertRaises(ZeroDivisionError, divide)
+        self.assertRaises(TypeError, concatenate)
+
+    def test_strings(self):
+        self.assertEqual("abc" + "def", "abcdef")
+        self.assertEqual("ab" * 3, "ababab")
+        self.assertEqual("ab" * -1, "")
+
+    def test_comparisons(self):
+        self.assertIs(1 < 2, True)
+        self.assertIs(1 < 2 < 1, False)
+        self.assertIs(1 == 1.0, True)
+        self.assertIs("a" < "b", True)
+
+    def test_boolean_operators(self):
+        self.assertIs(not 0, True)
+        self.assertIs(not "", True)
+        self.assertEqual(0 or "x", "x")
+        self.assertEqual(3 and 4, 4)
+        self.assertEqual(0 and 4, 0)
+        self.assertEqual("a" if 1 else "b", "a")
+        x = []
+        self.assertIs(True and x, x)
+        self.assertIs(False or x, x)
+
+    def test_double_not_in_tests(self):
+        calls = []
+
+        class Truthy:
+            def __bool__(self):
+                calls.append(1)
+                return True
+
+        if not not Truthy():
+            result = "yes"
+        else:
+            result = "no"
+        self.assertEqual(result, "yes")
+        self.assertEqual(len(calls), 1)
+        self.assertIs(not not Truthy(), True)
+
+    def test_constant_branches(self):
+        def f():
+            if False:
+                return "dead"
+            while True:
+                return "live"
+
+        self.assertEqual(f(), "live")
+
+    def test_generator_with_dead_yield(self):
+        def gen():
+            if False:
+                yield 1
+            return
+
+        self.assertEqual(list(gen()), [])
+
+    def test_conditional_keeps_generator(self):
+        def gen():
+            x = (yield) if False else 1
+            return
+
+        self.assertEqual(list(gen()), [])
+
+    def test_boolean_operator_keeps_generator(self):
+        def gen():
+            return False and (yield 1)
+
+        def gen2():
+            return True or (yield 1)
+
+        self.assertEqual(type(gen()).__name__, "generator")
+        self.assertEqual(type(gen2()).__name__, "generator")
+        self.assertEqual(list(gen()), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
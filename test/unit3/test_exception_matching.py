@@ -0,0 +1,84 @@
+""" Raising, matching and constructing exceptions, which have fast paths """
+
+import unittest
+
+
+class AppError(Exception):
+    pass
+
+
+class DoubledError(AppError):
+    def __init__(self, value):
+        super().__init__(value * 2)
+
+
+class ExceptionMatchingTest(unittest.TestCase):
+
+    def matched(self, exc, handler_type):
+        try:
+            raise exc
+        except handler_type:
+            return True
+        except BaseException:
+            return False
+
+    def test_classes(self):
+        self.assertTrue(self.matched(KeyError("k"), KeyError))
+        self.assertTrue(self.matched(KeyError("k"), LookupError))
+        self.assertTrue(self.matched(AppError(), Exception))
+        self.assertFalse(self.matched(AppError(), KeyError))
+        self.assertFalse(self.matched(SystemExit(), Exception))
+
+    def test_tuples(self):
+        self.assertTrue(self.matched(KeyError("k"), (ValueError, KeyError)))
+        self.assertTrue(self.matched(DoubledError(1), (ValueError, AppError)))
+        self.assertFalse(self.matched(KeyError("k"), (ValueError, AttributeError)))
+        self.assertFalse(self.matched(KeyError("k"), ()))
+
+    def test_handler_type_computed(self):
+        handlers = [ValueError, KeyError]
+        self.assertTrue(self.matched(KeyError("k"), handlers[1]))
+        self.assertFalse(self.matched(KeyError("k"), handlers[0]))
+
+    def test_args(self):
+        self.assertEqual(KeyError("k").args, ("k",))
+        self.assertEqual(ValueError(1, 2).args, (1, 2))
+        self.assertEqual(DoubledError(3).args, (6,))
+        e = ValueError(1)
+        Exception.__init__(e, 4, 5)
+        self.assertEqual(e.args, (4, 5))
+        Exception.__init__(e, 4, 5)
+        self.assertEqual(e.args, (4, 5))
+
+    def test_missing_keys(self):
+        d = {"a": 1}
+        found = []
+        for k in ["a", "b", "a"]:
+            try:
+                found.append(d[k])
+            except KeyError as e:
+                found.append(e.args)
+        self.assertEqual(found, [1, ("b",), 1])
+
+    def test_stop_iteration(self):
+        class Countdown:
+            def __init__(self, k):
+                self.k = k
+
+            def __iter__(self):
+                return self
+
+            def __next__(self):
+                if self.k == 0:
+                    raise StopIteration
+                self.k -= 1
+                return self.k
+
+        self.assertEqual(list(Countdown(3)), [2, 1, 0])
+        it = iter(())
+        with self.assertRaises(StopIteration):
+            next(it)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+""" f-strings, whose parts may be formatted without calling __format__ """
+
+import unittest
+
+
+class Formatted:
+    def __format__(self, spec):
+        return "F<" + spec + ">"
+
+    def __str__(self):
+        return "str"
+
+    def __repr__(self):
+        return "repr"
+
+
+class MyInt(int):
+    def __format__(self, spec):
+        return "MyInt"
+
+
+class MyStr(str):
+    def __format__(self, spec):
+        return "MyStr"
+
+
+class FStringPartsTest(unittest.TestCase):
+
+    def test_plain_values(self):
+        name, n, x = "Ann", 12, 0.1
+        self.assertEqual(f"", "")
+        self.assertEqual(f"{name}", "Ann")
+        self.assertEqual(f"{name}, {n} {x} {2 ** 70} {1e16}", "Ann, 12 0.1 1180591620717411303424 1e+16")
+        self.assertEqual(f"{True} {None} {[1, 'a']}", "True None [1, 'a']")
+
+    def test_format_specs(self):
+        x, width = 2.5, 6
+        self.assertEqual(f"{x:>{width}.2f}|{7:03}|{'ab':^6}", "  2.50|007|  ab  ")
+        self.assertEqual(f"{Formatted():spec{width}}", "F<spec6>")
+
+    def test_conversions(self):
+        self.assertEqual(f"{Formatted()} {Formatted()!s} {Formatted()!r}", "F<> str repr")
+        self.assertEqual(f"{'ab'!r:>6}|{'é'!a}", "  'ab'|'\\xe9'")
+
+    def test_subclasses_format_themselves(self):
+        self.assertEqual(f"{MyInt(5)} {MyStr('s')}", "MyInt MyStr")
+
+    def test_literal_parts(self):
+        w = 1
+        self.assertEqual(f"{{x}} {w}{{", "{x} 1{")
+        self.assertEqual(f"a\n\"b\" é {w}", "a\n\"b\" é 1")
+        self.assertEqual(f'{"in" + f"{w:02}"}', "in01")
+
+    def test_evaluation_order(self):
+        order = []
+
+        def note(v):
+            order.append(v)
+            return v
+
+        self.assertEqual(f"{note(1)}{note(2)}{note(3):{note(4)}}", "12   3")
+        self.assertEqual(order, [1, 2, 3, 4])
+
+    def test_bad_spec(self):
+        with self.assertRaises(ValueError):
+            f"{1.5:q}"
+
+    def test_bytes_literals_unaffected(self):
+        self.assertEqual(b"1" b"23", b"123")
+        self.assertEqual("a" "b" f"{1}", "ab1")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+""" Loads of global and builtin names, which compiled code may cache """
+
+import unittest
+import sys
+
+LIMIT = 10
+
+
+def read_limit():
+    return LIMIT
+
+
+def length(xs):
+    return len(xs)
+
+
+class GlobalCachesTest(unittest.TestCase):
+
+    def test_rebinding_global(self):
+        global LIMIT
+        self.assertEqual(read_limit(), 10)
+        LIMIT = 20
+        self.assertEqual(read_limit(), 20)
+        LIMIT = 10
+        self.assertEqual(read_limit(), 10)
+
+    def test_shadowing_builtin(self):
+        global len
+        self.assertEqual(length([1, 2, 3]), 3)
+        len = lambda xs: -1
+        try:
+            self.assertEqual(length([1, 2, 3]), -1)
+        finally:
+            del len
+        self.assertEqual(length([1, 2, 3]), 3)
+
+    def test_setattr_on_module(self):
+        this_module = sys.modules[__name__]
+        self.assertEqual(read_limit(), 10)
+        setattr(this_module, "LIMIT", 30)
+        try:
+            self.assertEqual(read_limit(), 30)
+        finally:
+            this_module.LIMIT = 10
+        self.assertEqual(read_limit(), 10)
+
+    def test_deleted_global(self):
+        global TEMPORARY
+        TEMPORARY = 1
+
+        def read():
+            return TEMPORARY
+
+        self.assertEqual(read(), 1)
+        del TEMPORARY
+        self.assertRaises(NameError, read)
+
+    def test_class_body_loads(self):
+        class C:
+            limit = LIMIT
+            size = len("abc")
+
+        self.assertEqual(C.limit, 10)
+        self.assertEqual(C.size, 3)
+
+    def test_loop_with_rebinding(self):
+        global LIMIT
+        seen = []
+        for i in range(3):
+            seen.append(read_limit())
+            LIMIT += 1
+        LIMIT = 10
+        self.assertEqual(seen, [10, 11, 12])
+
+
+if __name__ == "__main__":
+    unittest.main()
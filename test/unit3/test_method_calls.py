@@ -0,0 +1,109 @@
+""" Calls of the form obj.name(...), which may skip making a bound method """
+
+import unittest
+
+
+class Greeter:
+    greeting = "hello"
+
+    def greet(self, name, punctuation="!"):
+        return self.greeting + " " + name + punctuation
+
+    def greet_all(self, *names, **kwargs):
+        return [self.greet(name, **kwargs) for name in names]
+
+    @staticmethod
+    def static(x):
+        return ("static", x)
+
+    @classmethod
+    def klass(cls, x):
+        return (cls.__name__, x)
+
+
+class LoudGreeter(Greeter):
+    def greet(self, name, punctuation="!"):
+        return super().greet(name.upper(), punctuation)
+
+
+class CallableAttribute:
+    def __call__(self, *args):
+        return ("called", len(args))
+
+
+class WithCallable:
+    action = CallableAttribute()
+
+
+class MethodCallsTest(unittest.TestCase):
+
+    def test_arguments(self):
+        g = Greeter()
+        self.assertEqual(g.greet("world"), "hello world!")
+        self.assertEqual(g.greet("world", "?"), "hello world?")
+        self.assertEqual(g.greet("world", punctuation="."), "hello world.")
+        names = ["a", "b"]
+        self.assertEqual(g.greet(*names), "hello ab")
+        self.assertEqual(g.greet_all(*names, punctuation="."), ["hello a.", "hello b."])
+        self.assertEqual(g.greet(**{"name": "you"}), "hello you!")
+
+    def test_other_descriptors(self):
+        g = Greeter()
+        self.assertEqual(g.static(1), ("static", 1))
+        self.assertEqual(g.klass(2), ("Greeter", 2))
+        self.assertEqual(WithCallable().action(1, 2), ("called", 2))
+
+    def test_super_and_overrides(self):
+        greeters = [Greeter(), LoudGreeter(), Greeter()]
+        self.assertEqual([g.greet("x") for g in greeters], ["hello x!", "hello X!", "hello x!"])
+
+    def test_instance_attribute_shadows_method(self):
+        g = Greeter()
+        self.assertEqual(g.greet("a"), "hello a!")
+        g.greet = lambda name: "shadowed " + name
+        self.assertEqual(g.greet("a"), "shadowed a")
+        del g.greet
+        self.assertEqual(g.greet("a"), "hello a!")
+
+    def test_instance_attribute_holding_class_function(self):
+        g = Greeter()
+        g.greet = Greeter.greet
+        self.assertRaises(TypeError, g.greet, "a")
+        self.assertEqual(g.greet(g, "a"), "hello a!")
+
+    def test_method_replaced_on_class(self):
+        g = Greeter()
+        original = Greeter.greet
+        self.assertEqual(g.greet("a"), "hello a!")
+        Greeter.greet = lambda self, name: "replaced " + name
+        try:
+            self.assertEqual(g.greet("a"), "replaced a")
+        finally:
+            Greeter.greet = original
+        self.assertEqual(g.greet("a"), "hello a!")
+
+    def test_errors(self):
+        g = Greeter()
+        with self.assertRaises(AttributeError):
+            g.no_such_method()
+        with self.assertRaises(TypeError):
+            g.greet()
+
+    def test_builtin_methods(self):
+        xs = []
+        xs.append(1)
+        xs.extend([2, 3])
+        self.assertEqual(xs, [1, 2, 3])
+        self.assertEqual("a,b".split(","), ["a", "b"])
+
+    def test_generator_method(self):
+        class Counter:
+            def count(self, n):
+                for i in range(n):
+                    yield i
+
+        self.assertEqual(list(Counter().count(3)), [0, 1, 2])
+
+
+if __name__ == "__main__":
+    unittest.main()
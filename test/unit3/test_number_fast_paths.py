@@ -0,0 +1,63 @@
+""" Arithmetic and comparisons which the compiler inlines for int and float operands """
+
+import unittest
+import math
+
+
+class MyInt(int):
+    def __add__(self, other):
+        return "MyInt.__add__"
+
+
+class MyFloat(float):
+    def __lt__(self, other):
+        return False
+
+
+class NumberFastPathsTest(unittest.TestCase):
+
+    def test_int_results_leaving_safe_range(self):
+        big = 2 ** 53 - 1
+        one = 1
+        self.assertEqual(big + one, 9007199254740992)
+        self.assertEqual(-big - one - one, -9007199254740993)
+        self.assertEqual(big * 3, 27021597764222973)
+        x = big
+        x += 2
+        self.assertEqual(x, 9007199254740993)
+        self.assertEqual(x - 2, big)
+
+    def test_signed_zero(self):
+        z = 0.0
+        m = -1.0
+        self.assertEqual(math.copysign(1.0, z * m), -1.0)
+        i = 0
+        self.assertEqual(str(i * -5), "0")
+
+    def test_bools_and_subclasses(self):
+        t = True
+        self.assertEqual(t + t, 2)
+        self.assertIs(type(t + t), int)
+        self.assertEqual(MyInt(3) + 4, "MyInt.__add__")
+        self.assertFalse(MyFloat(1.0) < 2.0)
+
+    def test_float_comparisons(self):
+        nan = float("nan")
+        self.assertFalse(nan == nan)
+        self.assertTrue(nan != nan)
+        self.assertFalse(nan < 1.0)
+        self.assertTrue(0.0 == -0.0)
+        self.assertTrue(1.5 <= 1.5 < 2.5)
+
+    def test_mixed_operands(self):
+        i = 3
+        f = 0.5
+        self.assertEqual(i + f, 3.5)
+        self.assertEqual(i * f, 1.5)
+        self.assertTrue(i > f)
+        self.assertEqual("ab" * i, "ababab")
+        self.assertEqual([1] + [2], [1, 2])
+
+
+if __name__ == "__main__":
+    unittest.main()
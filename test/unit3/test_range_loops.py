@@ -0,0 +1,130 @@
+""" for loops over range(...), which the compiler may turn into counting loops """
+
+import unittest
+
+
+class RangeLoopsTest(unittest.TestCase):
+
+    def test_values(self):
+        def loop1(n):
+            out = []
+            for i in range(n):
+                out.append(i)
+            return out
+
+        def loop3(a, b, c):
+            out = []
+            for i in range(a, b, c):
+                out.append(i)
+            return out
+
+        self.assertEqual(loop1(4), [0, 1, 2, 3])
+        self.assertEqual(loop1(-2), [])
+        self.assertEqual(loop3(10, 0, -3), [10, 7, 4, 1])
+        self.assertEqual(loop3(2, 20, 5), [2, 7, 12, 17])
+        self.assertEqual(loop3(0, 10, -1), [])
+
+    def test_loop_variable_after_loop(self):
+        def unused(n):
+            for i in range(n):
+                pass
+            return i
+
+        def broken():
+            for i in range(10):
+                if i * i > 20:
+                    break
+            return i
+
+        def continued():
+            count = 0
+            for i in range(6):
+                if i % 2:
+                    continue
+                count += 1
+            return count, i
+
+        def in_else():
+            for i in range(3):
+                pass
+            else:
+                return i
+
+        def empty():
+            i = "unchanged"
+            for i in range(0):
+                pass
+            return i
+
+        self.assertEqual(unused(5), 4)
+        self.assertIsInstance(unused(5), int)
+        self.assertEqual(broken(), 5)
+        self.assertEqual(continued(), (3, 5))
+        self.assertEqual(in_else(), 2)
+        self.assertEqual(empty(), "unchanged")
+
+    def test_loop_variable_seen_by_handler(self):
+        def f():
+            try:
+                for i in range(5):
+                    if i == 3:
+                        raise KeyError(i)
+            except KeyError:
+                return i
+
+        self.assertEqual(f(), 3)
+
+    def test_shadowed_range(self):
+        def f():
+            range = lambda n: ["a", "b"]
+            out = []
+            for x in range(3):
+                out.append(x)
+            return out
+
+        self.assertEqual(f(), ["a", "b"])
+
+    def test_unusual_arguments(self):
+        def loop(*args):
+            out = []
+            for i in range(*args):
+                out.append(i)
+            return out
+
+        def loop2(a, b):
+            out = []
+            for i in range(a, b):
+                out.append(i)
+            return out
+
+        big = 2 ** 60
+        self.assertEqual(loop2(big, big + 2), [big, big + 1])
+        self.assertEqual(loop2(True, 3), [1, 2])
+        self.assertRaises(TypeError, loop2, 0, 3.0)
+
+        def zero_step():
+            for i in range(0, 3, 0):
+                pass
+
+        self.assertRaises(ValueError, zero_step)
+
+    def test_generator(self):
+        def gen(n):
+            for i in range(n):
+                yield i * 2
+
+        self.assertEqual(list(gen(4)), [0, 2, 4, 6])
+
+    def test_bounds_fixed_at_start(self):
+        def f(n):
+            out = []
+            for i in range(n):
+                n = 0
+                out.append(i)
+            return out
+
+        self.assertEqual(f(3), [0, 1, 2])
+
+
+if __name__ == "__main__":
+    unittest.main()
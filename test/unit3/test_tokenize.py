@@ -0,0 +1,94 @@
+""" The tokens found by the tokenizer, as the tokenize module reports them """
+
+import token
+import tokenize
+import unittest
+
+
+def tokens_of(source):
+    lines = source.splitlines(True)
+    lines.reverse()
+
+    def readline():
+        if lines:
+            return lines.pop()
+        return ''
+
+    return [(token.tok_name[t[0]], t[1]) for t in tokenize.tokenize(readline)
+            if t[0] not in (token.ENCODING, token.NEWLINE, token.NL, token.ENDMARKER)]
+
+
+def strings_of(source):
+    return [t[1] for t in tokens_of(source)]
+
+
+class TokenizeTests(unittest.TestCase):
+    def test_numbers(self):
+        self.assertEqual(strings_of("1_000 0x_1f 0b101 0o17 0 00 0_0\n"),
+                         ["1_000", "0x_1f", "0b101", "0o17", "0", "00", "0_0"])
+        self.assertEqual(strings_of("1.5 1. .5 1e5 1.e-5 1.5E+3 1_0.0_1\n"),
+                         ["1.5", "1.", ".5", "1e5", "1.e-5", "1.5E+3", "1_0.0_1"])
+        self.assertEqual(strings_of("3j 1.5j 1e3J .5j\n"),
+                         ["3j", "1.5j", "1e3J", ".5j"])
+        self.assertEqual(tokens_of("1e 0x 1__0 1if\n"),
+                         [("NUMBER", "1"), ("NAME", "e"),
+                          ("NUMBER", "0"), ("NAME", "x"),
+                          ("NUMBER", "1"), ("NAME", "__0"),
+                          ("NUMBER", "1"), ("NAME", "if")])
+
+    def test_operators(self):
+        self.assertEqual(strings_of("a **= b // c ... d -> e != f >>= g\n"),
+                         ["a", "**=", "b", "//", "c", "...", "d", "->", "e",
+                          "!=", "f", ">>=", "g"])
+        self.assertEqual(strings_of("x.y[0](1)\n"),
+                         ["x", ".", "y", "[", "0", "]", "(", "1", ")"])
+
+    def test_strings(self):
+        self.assertEqual(tokens_of("'a' \"b\" r'\\d' b'x' Rb\"y\" f'{z}' rb\n"),
+                         [("STRING", "'a'"), ("STRING", '"b"'),
+                          ("STRING", "r'\\d'"), ("STRING", "b'x'"),
+                          ("STRING", 'Rb"y"'), ("STRING", "f'{z}'"),
+                          ("NAME", "rb")])
+        self.assertEqual(strings_of("'it\\'s' \"\" ''\n"),
+                         ["'it\\'s'", '""', "''"])
+
+    def test_multi_line_strings(self):
+        self.assertEqual(strings_of("x = '''a\n'' b\n'''\n"),
+                         ["x", "=", "'''a\n'' b\n'''"])
+        self.assertEqual(strings_of("x = 'a\\\nb'\n"),
+                         ["x", "=", "'a\\\nb'"])
+        self.assertEqual(strings_of('x = r"""\\"""" + 1\n'),
+                         ["x", "=", 'r"""\\""""', "+", "1"])
+
+    def test_names(self):
+        self.assertEqual(tokens_of("café = _x1 + αβ\n"),
+                         [("NAME", "café"), ("OP", "="), ("NAME", "_x1"),
+                          ("OP", "+"), ("NAME", "αβ")])
+
+    def test_positions(self):
+        lines = ["if x:\n", "    y = 'a'  # c\n", ""]
+        lines.reverse()
+        tokens = list(tokenize.tokenize(lambda: lines.pop() if lines else ''))
+        found = [(token.tok_name[t[0]], t[2], t[3]) for t in tokens[1:]]
+        self.assertEqual(found, [
+            ("NAME", (1, 0), (1, 2)),
+            ("NAME", (1, 3), (1, 4)),
+            ("OP", (1, 4), (1, 5)),
+            ("NEWLINE", (1, 5), (1, 6)),
+            ("INDENT", (2, 0), (2, 4)),
+            ("NAME", (2, 4), (2, 5)),
+            ("OP", (2, 6), (2, 7)),
+            ("STRING", (2, 8), (2, 11)),
+            ("COMMENT", (2, 13), (2, 16)),
+            ("NEWLINE", (2, 16), (2, 17)),
+            ("DEDENT", (3, 0), (3, 0)),
+            ("ENDMARKER", (3, 0), (3, 0)),
+        ])
+
+    def test_continuation(self):
+        self.assertEqual(strings_of("x = 1 + \\\n    2\n"),
+                         ["x", "=", "1", "+", "2"])
+
+
+if __name__ == '__main__':
+    unittest.main()
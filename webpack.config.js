@@ -21,6 +21,7 @@ const styleexcludes = [
     "ast.js",
     "internalpython.js",
     "tigerpython-parser.js",
+    "tigerpython-worker.js",
 ];
 
 if (!shell.which('git')) {
@@ -77,7 +78,10 @@ module.exports = (env, argv) => {
             new CleanWebpackPlugin(),
             new CopyWebpackPlugin({
                 patterns: [
-                    { from: 'debugger/debugger.js', to: 'debugger.js' }
+                    { from: 'debugger/debugger.js', to: 'debugger.js' },
+                    // For running TigerPython off the main thread.
+                    { from: 'src/tigerpython-parser.js', to: 'tigerpython-parser.js' },
+                    { from: 'src/tigerpython-worker.js', to: 'tigerpython-worker.js' },
                 ],
             }),
             new webpack.DefinePlugin({